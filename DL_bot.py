@@ -361,6 +361,7 @@ async def _offload_callable(
 ):
     """
     Attempt to run `fn(*args, **kwargs)` in (in order):
+      - run_in_worker_pool(...) on a warm pooled worker (prefer_process only)
       - run_maintenance_with_isolation(..., prefer_process=prefer_process)
       - start_callable_offload(..., prefer_process=prefer_process)
       - run_blocking_in_thread(...)
@@ -385,6 +386,32 @@ async def _offload_callable(
         run_blocking_in_thread = None  # type: ignore
 
     meta = meta or {}
+    # Warm worker pool: no interpreter start-up or re-imports per upload.
+    if prefer_process:
+        try:
+            from core.worker_pool import (
+                MAINT_POOL_JOB_TIMEOUT,
+                WorkerPoolUnavailable,
+                worker_pool_enabled,
+            )
+            from file_utils import run_in_worker_pool
+        except Exception:
+            worker_pool_enabled = None  # type: ignore
+
+        if worker_pool_enabled is not None and worker_pool_enabled():
+            try:
+                return await run_in_worker_pool(
+                    fn,
+                    args,
+                    kwargs,
+                    timeout=MAINT_POOL_JOB_TIMEOUT,
+                    name=name or getattr(fn, "__name__", None),
+                    meta=meta,
+                )
+            except WorkerPoolUnavailable:
+                # Nothing ran; fall back to the legacy chain below.
+                pass
+
     # Try maintenance isolation (preferred for DB/long-running)
     if run_maintenance_with_isolation is not None:
         try:
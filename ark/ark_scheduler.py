@@ -45,6 +45,7 @@ from ark.reminder_types import (
     REMINDER_START,
 )
 from ark.state.ark_state import ArkJsonState
+from reminder_dispatcher import ReminderHandle, get_reminder_dispatcher
 from utils import ensure_aware_utc, utcnow
 
 logger = logging.getLogger(__name__)
@@ -151,11 +152,11 @@ async def _build_dm_reminder_embed(
 
 @dataclass
 class ArkSchedulerState:
-    tasks: dict[str, asyncio.Task] = field(default_factory=dict)
+    tasks: dict[str, asyncio.Task | ReminderHandle] = field(default_factory=dict)
     match_locks: dict[int, asyncio.Lock] = field(default_factory=lambda: defaultdict(asyncio.Lock))
     reminder_state: ArkReminderState = field(default_factory=ArkReminderState.load)
 
-    def set_task(self, key: str, task: asyncio.Task) -> None:
+    def set_task(self, key: str, task: asyncio.Task | ReminderHandle) -> None:
         self.tasks[key] = task
 
     def clear_task(self, key: str) -> None:
@@ -300,7 +301,6 @@ async def _schedule_once(
 
     async def _runner():
         try:
-            await _sleep_until(when)
             await coro_factory()
         except asyncio.CancelledError:
             raise
@@ -309,7 +309,11 @@ async def _schedule_once(
         finally:
             state.clear_task(key)
 
-    state.set_task(key, asyncio.create_task(_runner(), name=f"ark:{key}"))
+    delay = (ensure_aware_utc(when) - _utcnow()).total_seconds()
+    handle = get_reminder_dispatcher().schedule(
+        delay, _runner, name=f"ark:{key}", meta={"ark_key": key}
+    )
+    state.set_task(key, handle)
 
 
 async def _send_channel_reminder(
@@ -521,8 +521,8 @@ async def _log_interaction_usage(ir: discord.Interaction):
             "latency_ms": None,
             "args_shape": None,
         }
-        # Fire-and-forget into the async tracker (which writes JSONL and batches to SQL)
-        asyncio.create_task(usage_tracker().log(evt))
+        # Hand off to the tracker (buffered JSONL + batched SQL); no task per interaction
+        usage_tracker().log_nowait(evt)
     except Exception:
         # Absolutely do not break interaction handling due to logging
         return
@@ -963,6 +963,50 @@ def _get_queue_depth_safe() -> int:
         return 0
 
 
+def _kvk_context_line() -> str:
+    """Cached KVK context state for health embeds (best-effort)."""
+    try:
+        from kvk_state import get_kvk_context_cache_info
+
+        info = get_kvk_context_cache_info()
+        if not info.get("populated"):
+            return "\n**KVK context:** not cached"
+        return (
+            f"\n**KVK context:** KVK {info.get('kvk_no')} {info.get('state')}"
+            f" • age {int(info.get('age_seconds') or 0)}s/{int(info.get('ttl_seconds') or 0)}s"
+            f" • hits {info.get('hits')} misses {info.get('misses')}"
+        )
+    except Exception:
+        return "\n**KVK context:** n/a"
+
+
+def _render_pool_line() -> str:
+    """Card render pool queue depth, fallbacks and card-cache hits for health embeds."""
+    try:
+        from core.render_cache import get_render_cache_stats
+        from core.render_service import get_render_service_stats
+
+        stats = get_render_service_stats()
+        cache = get_render_cache_stats()
+        cache_part = (
+            f" • card cache {cache.get('hits', 0) + cache.get('disk_hits', 0)}"
+            f"/{cache.get('misses', 0)} hit/miss"
+            if cache
+            else ""
+        )
+        if not stats:
+            return f"\n**Render pool:** idle{cache_part}"
+        return (
+            f"\n**Render pool:** queue {stats.get('queue_depth')}"
+            f" • in flight {stats.get('in_flight')}"
+            f" • pool {stats.get('pool_renders')} thread {stats.get('thread_renders')}"
+            f" • fallbacks {stats.get('fallbacks')} timeouts {stats.get('timeouts')}"
+            f"{cache_part}"
+        )
+    except Exception:
+        return "\n**Render pool:** n/a"
+
+
 def _summarize_tasks() -> str:
     """Short status for TaskMonitor tasks: running count + crashed count + restarts."""
     entries = task_monitor.list()
@@ -1021,7 +1065,7 @@ class HealthView(discord.ui.View):
                 f"**GSheets:** {'🟢 ' if gs_ok else '🔴 '}{gs_message}\n"
                 f"**Errors:** 10m **{err_10m}** • 60m **{err_60m}**\n"
                 f"**Queue depth:** {queue_depth}\n"
-                f"{profile_line}\n"
+                f"{profile_line}{_kvk_context_line()}{_render_pool_line()}\n"
                 f"**Tasks:** {_summarize_tasks()}\n"
             )
             if sql_ok and gs_ok and sess == "🟢 connected" and err_10m == 0 and err_60m == 0:
@@ -1189,7 +1233,7 @@ async def _update_health_embed():
         f"**GSheets:** {'🟢 ' if gs_ok else '🔴 '}{gs_message}\n"  # <-- add this line
         f"**Errors:** 10m **{err_10m}** • 60m **{err_60m}**\n"
         f"**Queue depth:** {queue_depth}\n"
-        f"{profile_line}\n"
+        f"{profile_line}{_kvk_context_line()}{_render_pool_line()}\n"
         f"**Tasks:** {_summarize_tasks()}\n"
     )
 
@@ -1493,6 +1537,21 @@ async def _graceful_teardown():
     except Exception:
         logger.exception("[SHUTDOWN] Live queue flush failed.")
 
+    # Let pending vote/survey card refreshes publish before the client goes away
+    try:
+        from voting.card_refresh import survey_card_refresh, vote_card_refresh
+
+        await asyncio.wait_for(
+            asyncio.gather(vote_card_refresh.drain(), survey_card_refresh.drain()),
+            timeout=_QUEUE_SHUTDOWN_DRAIN_SECONDS,
+        )
+    except TimeoutError:
+        logger.warning(
+            "[SHUTDOWN] Card refresh drain timed out after %.1fs.", _QUEUE_SHUTDOWN_DRAIN_SECONDS
+        )
+    except Exception:
+        logger.exception("[SHUTDOWN] Card refresh drain failed.")
+
     # Cancel supervised tasks
     try:
         await task_monitor.stop()
@@ -1552,6 +1611,33 @@ async def _graceful_teardown():
     except Exception:
         logger.exception("[SHUTDOWN] Failed stopping usage tracker.")
 
+    # Stop warm offload workers
+    try:
+        from core.worker_pool import shutdown_worker_pool
+
+        await shutdown_worker_pool()
+        logger.info("[SHUTDOWN] Offload worker pool stopped.")
+    except Exception:
+        logger.exception("[SHUTDOWN] Failed stopping offload worker pool.")
+
+    # Stop card render workers
+    try:
+        from core.render_service import shutdown_render_service
+
+        await shutdown_render_service()
+        logger.info("[SHUTDOWN] Render pool stopped.")
+    except Exception:
+        logger.exception("[SHUTDOWN] Failed stopping render pool.")
+
+    # Close idle pooled SQL sessions and emit final pool stats
+    try:
+        from core.sql_pool import close_all_pools
+
+        closed = close_all_pools()
+        logger.info("[SHUTDOWN] Closed %d pooled SQL connection(s).", closed)
+    except Exception:
+        logger.exception("[SHUTDOWN] Failed closing SQL connection pools.")
+
     # **NEW**: drop webhook/HTTP/stream handlers but keep file handlers alive
     try:
         quiesce_logging()
@@ -1828,6 +1914,24 @@ async def _run_ready_runtime_services() -> None:
     except Exception:
         logger.exception("[BOOT] Failed to start usage tracker.")
 
+    # Pre-spawn warm offload workers so the first upload skips interpreter start-up
+    try:
+        from core.worker_pool import get_worker_pool, worker_pool_enabled
+
+        if worker_pool_enabled():
+            task_monitor.create("offload_worker_pool_warmup", get_worker_pool().warm_up)
+    except Exception:
+        logger.exception("[BOOT] Failed to schedule offload worker pool warm-up.")
+
+    # Pre-spawn card render workers so the first /me card skips font and module loading
+    try:
+        from core.render_service import get_render_service, render_pool_enabled
+
+        if render_pool_enabled():
+            task_monitor.create("render_pool_warmup", get_render_service().warm_up)
+    except Exception:
+        logger.exception("[BOOT] Failed to schedule render pool warm-up.")
+
     try:
         task_monitor.create("usage_jsonl_prune", usage_jsonl_prune_loop)
         logger.info(
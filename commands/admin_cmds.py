@@ -1779,11 +1779,14 @@ def register_admin(bot: ext_commands.Bot) -> None:
             f"skipped_prefs={_v('skipped_prefs', '0')}",
             f"skipped_already_sent={_v('skipped_already_sent', '0')}",
             f"skipped_unknown_type={_v('skipped_unknown_type', '0')}",
+            f"skipped_undeliverable={_v('skipped_undeliverable', '0')}",
             f"failures={_v('failures', '0')}",
             f"failed_forbidden={_v('failed_forbidden', '0')}",
             f"failed_not_found={_v('failed_not_found', '0')}",
             f"failed_http_exception={_v('failed_http_exception', '0')}",
             f"failed_unknown={_v('failed_unknown', '0')}",
+            f"delivery_ms={_v('delivery_elapsed_ms', '0')}",
+            f"delivery_p95_ms={_v('delivery_p95_ms', '0')}",
         ]
 
         if rem.get("error_message"):
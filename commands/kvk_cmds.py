@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
 import logging
 
 import discord
@@ -13,6 +12,7 @@ from commands.kvk_history_card_posting import post_kvk_history_output
 from commands.kvk_stats_card_posting import post_kvk_stats_output
 from commands.kvk_targets_card_posting import post_kvk_targets_output
 from core.interaction_safety import safe_command, safe_defer
+from core.render_service import render_card
 from decoraters import channel_only, track_usage
 from kvk.models.kvk_rankings import HallOfFameMetric
 from kvk.rendering.kvk_rankings_card_renderer import (
@@ -116,7 +116,7 @@ async def _send_personal_kvk_stats(ctx: discord.ApplicationContext) -> None:
     accounts = account_summary.ordered_accounts
     try:
         last_kvk_map = await kvk_personal_service.load_last_kvk_map()
-        if not isinstance(last_kvk_map, dict):
+        if not isinstance(last_kvk_map, Mapping):
             last_kvk_map = {}
     except Exception:
         logger.exception("[/kvk stats] load_last_kvk_map failed")
@@ -213,7 +213,7 @@ async def _send_personal_kvk_targets(
 
     try:
         last_kvk_map = await kvk_personal_service.load_last_kvk_map()
-        if not isinstance(last_kvk_map, dict):
+        if not isinstance(last_kvk_map, Mapping):
             last_kvk_map = {}
     except Exception:
         logger.exception("[/kvk targets] load_last_kvk_map failed")
@@ -459,7 +459,7 @@ async def _send_current_rankings(ctx: discord.ApplicationContext, *, mode: str)
     rendered = None
     if can_render_current_rankings_top10_card(payload):
         try:
-            rendered = await asyncio.to_thread(render_current_rankings_top10_card, payload)
+            rendered = await render_card(render_current_rankings_top10_card, payload)
         except Exception:
             logger.exception(
                 "[/kvk rankings %s] render_current_rankings_top10_card failed", payload.mode
@@ -504,7 +504,7 @@ async def _send_hall_of_fame_rankings(ctx: discord.ApplicationContext) -> None:
     rendered = None
     if can_render_hall_of_fame_top10_card(payload):
         try:
-            rendered = await asyncio.to_thread(render_hall_of_fame_top10_card, payload)
+            rendered = await render_card(render_hall_of_fame_top10_card, payload)
         except Exception:
             logger.exception("[/kvk rankings records] render_hall_of_fame_top10_card failed")
 
@@ -6,6 +6,8 @@ import logging
 
 import discord
 
+from core.avatar_cache import fetch_avatar
+from core.render_service import render_card
 from kvk.rendering.kvk_history_renderer import (
     build_last3_text_fallback,
     render_kvk_history_last3_card,
@@ -21,10 +23,7 @@ async def _read_avatar_bytes(user) -> bytes | None:
     if avatar is None:
         return None
     try:
-        if hasattr(avatar, "with_size"):
-            avatar = avatar.with_size(128)
-        if hasattr(avatar, "read"):
-            return await avatar.read()
+        return await fetch_avatar(avatar, size=128)
     except Exception:
         logger.debug("kvk_history_card_avatar_read_failed user_id=%s", getattr(user, "id", None))
     return None
@@ -60,7 +59,7 @@ async def post_kvk_history_output(
     payload = await asyncio.to_thread(kvk_history_service.build_kvk_history_payload, governor_id)
     avatar_bytes = await _read_avatar_bytes(user)
     try:
-        rendered = await asyncio.to_thread(
+        rendered = await render_card(
             render_kvk_history_last3_card,
             payload,
             avatar_bytes=avatar_bytes,
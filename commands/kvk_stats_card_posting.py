@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from io import BytesIO
 import logging
 import os
@@ -8,6 +7,8 @@ import os
 import discord
 
 from commands.kvk_personal_posting import post_stats_message
+from core.avatar_cache import fetch_avatar
+from core.render_service import render_card
 from embed_utils import build_stats_embed
 from kvk.rendering.kvk_stats_card_renderer import render_kvk_stats_card
 from kvk.services.kvk_stats_card_service import build_kvk_stats_card_payload
@@ -30,10 +31,7 @@ async def _read_avatar_bytes(user) -> bytes | None:
     if avatar is None:
         return None
     try:
-        if hasattr(avatar, "with_size"):
-            avatar = avatar.with_size(128)
-        if hasattr(avatar, "read"):
-            return await avatar.read()
+        return await fetch_avatar(avatar, size=128)
     except Exception:
         logger.debug("kvk_stats_card_avatar_read_failed user_id=%s", getattr(user, "id", None))
     return None
@@ -44,7 +42,7 @@ async def _build_card(row: dict, user) -> tuple[discord.File, KvkStatsCardView]
         return None
     payload = await build_kvk_stats_card_payload(row)
     avatar_bytes = await _read_avatar_bytes(user)
-    rendered = await asyncio.to_thread(render_kvk_stats_card, payload, avatar_bytes=avatar_bytes)
+    rendered = await render_card(render_kvk_stats_card, payload, avatar_bytes=avatar_bytes)
     if rendered is None:
         return None
     file = discord.File(BytesIO(rendered.image_bytes.getvalue()), filename=rendered.filename)
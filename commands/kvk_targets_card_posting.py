@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import asyncio
 from io import BytesIO
 import logging
 import os
 
 import discord
 
+from core.avatar_cache import fetch_avatar
+from core.render_service import render_card
 from kvk.models.kvk_targets_card import KvkTargetsCardPayload
 from kvk.rendering.kvk_targets_card_renderer import render_kvk_targets_card
 from kvk.services.kvk_targets_card_service import build_kvk_targets_card_payload
@@ -86,10 +87,7 @@ async def _read_avatar_bytes(user) -> bytes | None:
     if avatar is None:
         return None
     try:
-        if hasattr(avatar, "with_size"):
-            avatar = avatar.with_size(128)
-        if hasattr(avatar, "read"):
-            return await avatar.read()
+        return await fetch_avatar(avatar, size=128)
     except Exception:
         logger.debug("kvk_targets_card_avatar_read_failed user_id=%s", getattr(user, "id", None))
     return None
@@ -146,7 +144,7 @@ async def post_kvk_targets_output(
     if _card_enabled():
         try:
             avatar_bytes = await _read_avatar_bytes(getattr(interaction, "user", None))
-            rendered = await asyncio.to_thread(
+            rendered = await render_card(
                 render_kvk_targets_card, payload, avatar_bytes=avatar_bytes
             )
             if rendered is not None:
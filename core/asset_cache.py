@@ -0,0 +1,253 @@
+"""Decoded image assets (card backdrops, icons) shared by the Pillow card renderers.
+
+Renderers used to open, decode, convert and rescale their static backdrop on every render. The
+cache keeps the decoded, mode-converted and pre-scaled image keyed by
+``(path, size, mode, fit, prepare, mtime_ns, file_size)``, so an edited asset file is picked up on
+the next render without a restart.
+
+- ``shared_asset()`` hands out the cached image itself; callers must treat it as read-only (e.g.
+  feed it to ``Image.alpha_composite``, which returns a new image)
+- ``load_asset()`` hands out a private ``copy()`` that the caller may draw on; copying a decoded
+  image is a memcpy, far cheaper than decoding and resampling the PNG again
+- entries are evicted least-recently-used once their pixel bytes exceed ``ASSET_CACHE_MAX_MB``
+- ``prepare`` callables are keyed by identity (the key holds the callable itself), so two
+  closures sharing a ``__qualname__`` never share an entry; pass module-level functions, since a
+  closure built per render would miss every time
+- renderer modules ``register_warm_asset()`` / ``register_warm_assets()`` their backdrops at
+  import, and the render workers
+  call ``warm_registered_assets()`` once at start-up
+- ``registered_assets_version()`` changes whenever a registered file does; the rendered-card cache
+  (``core.render_cache``) folds it into its keys
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+import hashlib
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Literal
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+ASSET_CACHE_MAX_MB = _env_float("ASSET_CACHE_MAX_MB", 128.0)
+
+Fit = Literal["resize", "thumbnail"]
+Prepare = Callable[[Image.Image], Image.Image]
+
+
+def _image_bytes(image: Image.Image) -> int:
+    return image.width * image.height * max(1, len(image.getbands()))
+
+
+def _prepare_key(prepare: Prepare | None) -> Hashable:
+    # The callable itself: identity-hashed, and referenced by the key so its id is never reused.
+    return prepare
+
+
+class DecodedAssetCache:
+    """LRU of decoded images bounded by their pixel-buffer size."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[Any, ...], Image.Image] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        size: tuple[int, int] | None = None,
+        mode: str = "RGBA",
+        fit: Fit = "resize",
+        prepare: Prepare | None = None,
+    ) -> Image.Image:
+        """Cached decoded image (shared; do not mutate). Raises like ``Image.open`` on bad files."""
+        resolved = Path(path)
+        st = resolved.stat()
+        key = (
+            str(resolved),
+            tuple(size) if size is not None else None,
+            mode,
+            fit,
+            _prepare_key(prepare),
+            st.st_mtime_ns,
+            st.st_size,
+        )
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return image
+            self.misses += 1
+
+        image = self._decode(resolved, size=size, mode=mode, fit=fit, prepare=prepare)
+        self._store(key, image)
+        return image
+
+    @staticmethod
+    def _decode(
+        path: Path,
+        *,
+        size: tuple[int, int] | None,
+        mode: str,
+        fit: Fit,
+        prepare: Prepare | None,
+    ) -> Image.Image:
+        with Image.open(path) as source:
+            image = source.convert(mode)
+        if size is not None:
+            if fit == "thumbnail":
+                image.thumbnail(size, Image.Resampling.LANCZOS)
+            elif image.size != tuple(size):
+                image = image.resize(size, Image.Resampling.LANCZOS)
+        if prepare is not None:
+            image = prepare(image)
+        return image
+
+    def _store(self, key: tuple[Any, ...], image: Image.Image) -> None:
+        cost = _image_bytes(image)
+        if cost > self.max_bytes:
+            return
+        with self._lock:
+            # Drop decodes of an older version of the same file.
+            stale = [k for k in self._entries if k[:5] == key[:5] and k != key]
+            for k in stale:
+                self._bytes -= _image_bytes(self._entries.pop(k))
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= _image_bytes(previous)
+            self._entries[key] = image
+            self._bytes += cost
+            while self._bytes > self.max_bytes and self._entries:
+                _old_key, old = self._entries.popitem(last=False)
+                self._bytes -= _image_bytes(old)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_cache = DecodedAssetCache(int(ASSET_CACHE_MAX_MB * 1024 * 1024))
+# (path, size, mode) triples renderer modules want decoded before their first render.
+_warm_assets: list[tuple[Path, tuple[int, int] | None, str]] = []
+
+
+def get_asset_cache() -> DecodedAssetCache:
+    return _cache
+
+
+def shared_asset(
+    path: str | os.PathLike[str],
+    *,
+    size: tuple[int, int] | None = None,
+    mode: str = "RGBA",
+    fit: Fit = "resize",
+    prepare: Prepare | None = None,
+) -> Image.Image:
+    """The cached decoded image itself; read-only (composite it, don't draw on it)."""
+    return _cache.get(path, size=size, mode=mode, fit=fit, prepare=prepare)
+
+
+def load_asset(
+    path: str | os.PathLike[str],
+    *,
+    size: tuple[int, int] | None = None,
+    mode: str = "RGBA",
+    fit: Fit = "resize",
+    prepare: Prepare | None = None,
+) -> Image.Image:
+    """A private copy of the cached decoded image that the caller may draw on."""
+    return shared_asset(path, size=size, mode=mode, fit=fit, prepare=prepare).copy()
+
+
+def register_warm_asset(
+    path: str | os.PathLike[str], *, size: tuple[int, int] | None = None, mode: str = "RGBA"
+) -> None:
+    global _assets_version
+    entry = (Path(path), tuple(size) if size is not None else None, mode)
+    if entry not in _warm_assets:
+        _warm_assets.append(entry)
+        _assets_version = None
+
+
+def register_warm_assets(
+    paths: Iterable[str | os.PathLike[str]],
+    *,
+    size: tuple[int, int] | None = None,
+    mode: str = "RGBA",
+) -> None:
+    for path in paths:
+        register_warm_asset(path, size=size, mode=mode)
+
+
+def warm_registered_assets() -> int:
+    """Decode every registered asset that exists; returns how many are cached."""
+    warmed = 0
+    for path, size, mode in list(_warm_assets):
+        try:
+            if path.exists():
+                shared_asset(path, size=size, mode=mode)
+                warmed += 1
+        except Exception:
+            logger.debug("[ASSET_CACHE] warm-up failed for %s", path, exc_info=True)
+    return warmed
+
+
+def get_asset_cache_stats() -> dict[str, Any]:
+    return _cache.stats()
+
+
+_assets_version: tuple[float, str] | None = None
+_ASSETS_VERSION_TTL = 5.0
+
+
+def registered_assets_version() -> str:
+    """Digest of the registered assets' paths, mtimes and sizes (re-stat at most every 5s)."""
+    global _assets_version
+    now = time.monotonic()
+    cached = _assets_version
+    if cached is not None and now - cached[0] < _ASSETS_VERSION_TTL:
+        return cached[1]
+    digest = hashlib.sha256()
+    for path, _size, _mode in list(_warm_assets):
+        try:
+            st = path.stat()
+            digest.update(f"{path}|{st.st_mtime_ns}|{st.st_size}\n".encode())
+        except OSError:
+            digest.update(f"{path}|missing\n".encode())
+    version = digest.hexdigest()[:16]
+    _assets_version = (now, version)
+    return version
@@ -0,0 +1,199 @@
+"""Process-wide cache of Discord avatar bytes and their decoded card variants.
+
+Views used to download the invoking user's avatar on every render, so paging through ``/me``
+fetched the same image several times a minute and every card waited on the CDN.
+``fetch_avatar(asset, size=...)`` now serves bytes from an LRU keyed by ``(asset.key, size)``:
+
+- Discord puts the avatar hash in ``asset.key``, so a changed avatar is a new key and is fetched
+  fresh; entries never need revalidating and there is no TTL
+- concurrent misses for the same key share one download; a caller that times out stops waiting
+  but the download still completes and fills the cache for the next view
+- failed downloads are not cached; assets without a ``key`` (test doubles) are read directly
+- the LRU is bounded by ``AVATAR_CACHE_MAX_MB`` of avatar bytes
+
+``fitted_avatar()`` and ``circle_mask()`` keep the decoded, square-fitted RGBA avatar and the
+ellipse mask that ``core.visual_contract.paste_core_avatar`` composites, so repeat renders in a
+render worker skip the decode and LANCZOS resample.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
+from io import BytesIO
+import logging
+import os
+import threading
+from typing import Any
+
+from PIL import Image, ImageDraw, ImageOps
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+AVATAR_CACHE_MAX_MB = _env_float("AVATAR_CACHE_MAX_MB", 32.0)
+# Decoded (bytes digest, size) variants kept per process for the circular card avatar.
+AVATAR_DECODED_CACHE_SIZE = max(0, _env_int("AVATAR_DECODED_CACHE_SIZE", 64))
+
+AvatarKey = tuple[str, int]
+
+
+class AvatarByteCache:
+    """LRU of avatar bytes keyed by ``(avatar hash, size)`` with single-flight downloads."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self._entries: OrderedDict[AvatarKey, bytes] = OrderedDict()
+        self._bytes = 0
+        self._inflight: dict[AvatarKey, asyncio.Task[bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def get(self, key: AvatarKey) -> bytes | None:
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return data
+
+    def put(self, key: AvatarKey, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = data
+        self._bytes += len(data)
+        while self._bytes > self.max_bytes and self._entries:
+            _old_key, old = self._entries.popitem(last=False)
+            self._bytes -= len(old)
+
+    async def fetch(self, asset: Any, *, size: int, timeout: float | None = None) -> bytes:
+        """Avatar bytes for ``asset`` at ``size``; raises whatever ``asset.read()`` raises."""
+        if hasattr(asset, "with_size"):
+            asset = asset.with_size(size)
+        avatar_hash = getattr(asset, "key", None)
+        if not isinstance(avatar_hash, str) or not avatar_hash:
+            return await asyncio.wait_for(asset.read(), timeout=timeout)
+
+        key = (avatar_hash, int(size))
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not loop:
+            self.misses += 1
+            task = loop.create_task(self._download(key, asset))
+            task.add_done_callback(_consume_result)
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+        return await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
+
+    async def _download(self, key: AvatarKey, asset: Any) -> bytes:
+        try:
+            data = bytes(await asset.read())
+            self.put(key, data)
+            return data
+        except BaseException:
+            self.errors += 1
+            raise
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+        }
+
+
+def _consume_result(task: asyncio.Task[bytes]) -> None:
+    # Every waiter may have timed out; retrieve the outcome so asyncio doesn't warn about it.
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("[AVATAR_CACHE] avatar download failed: %r", task.exception())
+
+
+_cache = AvatarByteCache(int(AVATAR_CACHE_MAX_MB * 1024 * 1024))
+
+
+def get_avatar_cache() -> AvatarByteCache:
+    return _cache
+
+
+async def fetch_avatar(asset: Any, *, size: int, timeout: float | None = None) -> bytes:
+    """Drop-in for ``asset.with_size(size).read()`` through the shared avatar cache."""
+    return await _cache.fetch(asset, size=size, timeout=timeout)
+
+
+def get_avatar_cache_stats() -> dict[str, Any]:
+    return _cache.stats()
+
+
+# ----- decoded variants (render side) -----
+_decoded: OrderedDict[tuple[bytes, int], Image.Image] = OrderedDict()
+_decoded_lock = threading.Lock()
+
+
+def fitted_avatar(avatar_bytes: bytes, size: int) -> Image.Image | None:
+    """Square RGBA avatar fitted to ``size`` (shared; do not mutate). None if undecodable."""
+    key = (hashlib.sha256(avatar_bytes).digest(), int(size))
+    with _decoded_lock:
+        image = _decoded.get(key)
+        if image is not None:
+            _decoded.move_to_end(key)
+            return image
+    try:
+        with Image.open(BytesIO(avatar_bytes)) as source:
+            image = ImageOps.fit(
+                ImageOps.exif_transpose(source).convert("RGBA"),
+                (size, size),
+                method=Image.Resampling.LANCZOS,
+            )
+    except Exception:
+        return None
+    if AVATAR_DECODED_CACHE_SIZE:
+        with _decoded_lock:
+            _decoded[key] = image
+            while len(_decoded) > AVATAR_DECODED_CACHE_SIZE:
+                _decoded.popitem(last=False)
+    return image
+
+
+@lru_cache(maxsize=16)
+def circle_mask(size: int) -> Image.Image:
+    """Ellipse mask for a ``size`` card avatar (shared; do not mutate)."""
+    mask = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, size - 1, size - 1), fill=255)
+    return mask
@@ -0,0 +1,378 @@
+"""Chunked, pipelined bulk inserts for the upload importers.
+
+The importers used to build every parameter tuple first and then send them in one
+``fast_executemany`` on one connection. ``bulk_insert`` takes an iterator of row chunks
+(``sheet_importer.iter_db_row_chunks`` or ``iter_chunks``) instead:
+
+- a producer converts chunks into a bounded queue (``BULK_LOAD_QUEUE_CHUNKS``) while they are
+  being inserted, so parsing overlaps the round trips and memory stays at a few chunks
+- ``inline`` mode sends the chunks on the caller's cursor inside the caller's transaction; used
+  when staging and merge must commit together (header FKs, TRUNCATE + replace)
+- ``parallel`` mode (a ``connect`` factory, ``BULK_LOAD_PARALLEL=1`` and ``workers > 1``) inserts
+  on up to ``BULK_LOAD_WORKERS`` connections, each chunk in its own transaction; only for staging
+  that is scoped by a token the caller can delete on failure (KVK_ALL)
+- with a ``pool`` (``core.sql_pool.SqlConnectionPool``) each worker leases one pooled session
+  (``connect`` opens new ones on a miss), the worker count is capped at the pool size, and every
+  lease goes back to the pool when its worker stops, failed or not
+- in parallel mode a chunk failing with ``sheet_importer.detect_transient_error`` is rolled back
+  and retried on a fresh connection (``BULK_LOAD_RETRIES``, exponential backoff)
+- every load emits a ``bulk_load`` telemetry event with rows/sec for the produce and insert phases
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import partial
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any
+
+from core.sql_pool import SqlConnectionPool, discard_on_release
+
+logger = logging.getLogger(__name__)
+
+ConnectionFactory = Callable[[], Any]
+
+_DONE = object()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+BULK_LOAD_CHUNK_ROWS = max(1, _env_int("BULK_LOAD_CHUNK_ROWS", 5000))
+BULK_LOAD_WORKERS = max(1, _env_int("BULK_LOAD_WORKERS", 3))
+BULK_LOAD_QUEUE_CHUNKS = max(1, _env_int("BULK_LOAD_QUEUE_CHUNKS", 4))
+BULK_LOAD_RETRIES = max(0, _env_int("BULK_LOAD_RETRIES", 3))
+BULK_LOAD_RETRY_BACKOFF = max(0.0, _env_float("BULK_LOAD_RETRY_BACKOFF", 0.5))
+
+
+def parallel_enabled() -> bool:
+    default = "0" if os.getenv("K98_TEST_MODE") == "1" else "1"
+    return os.getenv("BULK_LOAD_PARALLEL", default).strip().lower() in ("1", "true", "yes", "on")
+
+
+def iter_chunks(rows: Sequence[Any], chunk_size: int | None = None) -> Iterator[list[Any]]:
+    """Slice an already built row list into insert chunks."""
+    size = BULK_LOAD_CHUNK_ROWS if chunk_size is None else max(1, int(chunk_size))
+    for start in range(0, len(rows), size):
+        yield list(rows[start : start + size])
+
+
+@dataclass
+class BulkLoadReport:
+    label: str
+    mode: str
+    rows: int = 0
+    chunks: int = 0
+    retries: int = 0
+    connections: int = 1
+    produce_s: float = 0.0
+    insert_s: float = 0.0
+    wall_s: float = 0.0
+
+    @staticmethod
+    def _rate(rows: int, seconds: float) -> float | None:
+        return round(rows / seconds, 1) if seconds > 0 else None
+
+    def to_telemetry(self, *, status: str = "ok", error: str | None = None) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "event": "bulk_load",
+            "label": self.label,
+            "mode": self.mode,
+            "status": status,
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "retries": self.retries,
+            "connections": self.connections,
+            "produce_s": round(self.produce_s, 4),
+            "insert_s": round(self.insert_s, 4),
+            "wall_s": round(self.wall_s, 4),
+            "produce_rows_per_s": self._rate(self.rows, self.produce_s),
+            "insert_rows_per_s": self._rate(self.rows, self.insert_s),
+            "rows_per_s": self._rate(self.rows, self.wall_s),
+        }
+        if error:
+            payload["error"] = error
+        return payload
+
+
+def _emit_telemetry(payload: dict[str, Any]) -> None:
+    try:
+        from file_utils import emit_telemetry_event
+
+        emit_telemetry_event(payload)
+    except Exception:
+        logger.debug("[BULK_LOAD] telemetry emit failed", exc_info=True)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    from sheet_importer import detect_transient_error
+
+    try:
+        return detect_transient_error(exc)
+    except Exception:
+        return False
+
+
+class _Producer(threading.Thread):
+    """Pulls chunks from the caller's iterator into a bounded queue."""
+
+    def __init__(self, chunks: Iterable[list[Any]], maxsize: int, stop: threading.Event) -> None:
+        super().__init__(name="bulk-load-producer", daemon=True)
+        self.chunks = chunks
+        self.queue: queue.Queue[Any] = queue.Queue(maxsize=maxsize)
+        self.stop = stop
+        self.error: BaseException | None = None
+        self.produce_s = 0.0
+
+    def _put(self, item: Any) -> bool:
+        while not self.stop.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(self) -> None:
+        iterator = iter(self.chunks)
+        try:
+            while not self.stop.is_set():
+                started = time.perf_counter()
+                chunk = next(iterator, _DONE)
+                self.produce_s += time.perf_counter() - started
+                if chunk is _DONE:
+                    break
+                if chunk and not self._put(chunk):
+                    return
+        except BaseException as exc:
+            self.error = exc
+        finally:
+            self._put(_DONE)
+
+
+def _set_fast_executemany(cursor: Any, enabled: bool) -> None:
+    if not enabled:
+        return
+    try:
+        cursor.fast_executemany = True
+    except Exception:
+        logger.debug("[BULK_LOAD] fast_executemany unavailable", exc_info=True)
+
+
+def _run_inline(
+    sql: str,
+    producer: _Producer,
+    report: BulkLoadReport,
+    *,
+    cursor: Any,
+    commit: Callable[[], None] | None,
+) -> None:
+    while True:
+        chunk = producer.queue.get()
+        if chunk is _DONE:
+            break
+        started = time.perf_counter()
+        cursor.executemany(sql, chunk)
+        if commit is not None:
+            commit()
+        report.insert_s += time.perf_counter() - started
+        report.rows += len(chunk)
+        report.chunks += 1
+
+
+def _run_parallel(
+    sql: str,
+    producer: _Producer,
+    report: BulkLoadReport,
+    *,
+    connect: ConnectionFactory,
+    pool: SqlConnectionPool | None,
+    workers: int,
+    retries: int,
+    fast_executemany: bool,
+    stop: threading.Event,
+) -> None:
+    lock = threading.Lock()
+    lease: ConnectionFactory = connect if pool is None else partial(pool.acquire, connect)
+    errors: list[BaseException] = []
+
+    def _close(conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:
+            logger.debug("[BULK_LOAD] close failed", exc_info=True)
+
+    def _worker() -> None:
+        conn = None
+        try:
+            while not stop.is_set():
+                try:
+                    chunk = producer.queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if chunk is _DONE:
+                    # Leave the marker for the other workers.
+                    producer.queue.put(_DONE)
+                    return
+                attempt = 0
+                while True:
+                    started = time.perf_counter()
+                    try:
+                        if conn is None:
+                            conn = lease()
+                        cur = conn.cursor()
+                        _set_fast_executemany(cur, fast_executemany)
+                        cur.executemany(sql, chunk)
+                        conn.commit()
+                    except Exception as exc:
+                        if conn is not None:
+                            try:
+                                conn.rollback()
+                            except Exception:
+                                pass
+                            # A session that just failed is closed rather than pooled again.
+                            discard_on_release(conn)
+                            _close(conn)
+                            conn = None
+                        if attempt >= retries or not _is_transient(exc) or stop.is_set():
+                            raise
+                        attempt += 1
+                        delay = BULK_LOAD_RETRY_BACKOFF * (2 ** (attempt - 1))
+                        logger.warning(
+                            "[BULK_LOAD] %s chunk of %d rows failed (%s); retry %d/%d in %.1fs",
+                            report.label,
+                            len(chunk),
+                            type(exc).__name__,
+                            attempt,
+                            retries,
+                            delay,
+                        )
+                        with lock:
+                            report.retries += 1
+                        time.sleep(delay)
+                        continue
+                    elapsed = time.perf_counter() - started
+                    with lock:
+                        report.insert_s += elapsed
+                        report.rows += len(chunk)
+                        report.chunks += 1
+                    break
+        except BaseException as exc:
+            with lock:
+                errors.append(exc)
+            stop.set()
+        finally:
+            if conn is not None:
+                _close(conn)
+
+    threads = [
+        threading.Thread(target=_worker, name=f"bulk-load-{i}", daemon=True) for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def bulk_insert(
+    sql: str,
+    chunks: Iterable[list[Any]],
+    *,
+    label: str,
+    cursor: Any = None,
+    commit: Callable[[], None] | None = None,
+    connect: ConnectionFactory | None = None,
+    pool: SqlConnectionPool | None = None,
+    workers: int | None = None,
+    queue_chunks: int | None = None,
+    retries: int | None = None,
+    fast_executemany: bool = True,
+) -> BulkLoadReport:
+    """
+    Insert every chunk with ``sql``.
+
+    Runs in parallel on ``connect()`` connections (leased from ``pool`` when given) when allowed,
+    otherwise inline on ``cursor`` (calling ``commit`` after each chunk when given). A failed
+    chunk re-raises its original exception after the producer has stopped; the failure is still
+    reported to telemetry.
+    """
+    n_workers = BULK_LOAD_WORKERS if workers is None else max(1, int(workers))
+    if pool is not None:
+        n_workers = min(n_workers, pool.max_size)
+    parallel = connect is not None and n_workers > 1 and parallel_enabled()
+    if not parallel and cursor is None:
+        if connect is None:
+            raise ValueError("bulk_insert needs a cursor or a connect factory")
+        parallel, n_workers = True, 1
+
+    report = BulkLoadReport(
+        label=label,
+        mode="parallel" if parallel else "inline",
+        connections=n_workers if parallel else 1,
+    )
+    stop = threading.Event()
+    producer = _Producer(
+        chunks, BULK_LOAD_QUEUE_CHUNKS if queue_chunks is None else max(1, queue_chunks), stop
+    )
+    started = time.perf_counter()
+    producer.start()
+    try:
+        if parallel:
+            _run_parallel(
+                sql,
+                producer,
+                report,
+                connect=connect,
+                pool=pool,
+                workers=n_workers,
+                retries=BULK_LOAD_RETRIES if retries is None else max(0, retries),
+                fast_executemany=fast_executemany,
+                stop=stop,
+            )
+        else:
+            _set_fast_executemany(cursor, fast_executemany)
+            _run_inline(sql, producer, report, cursor=cursor, commit=commit)
+        producer.join()
+        if producer.error is not None:
+            raise producer.error
+    except BaseException as exc:
+        stop.set()
+        producer.join(timeout=5)
+        report.produce_s = producer.produce_s
+        report.wall_s = time.perf_counter() - started
+        error = f"{type(exc).__name__}: {exc}"
+        _emit_telemetry(report.to_telemetry(status="error", error=error))
+        logger.error("[BULK_LOAD] %s failed after %d rows: %s", label, report.rows, error)
+        raise
+
+    report.produce_s = producer.produce_s
+    report.wall_s = time.perf_counter() - started
+    _emit_telemetry(report.to_telemetry())
+    logger.info(
+        "[BULK_LOAD] %s: %d rows in %d chunks (%s, %d conn) in %.3fs",
+        label,
+        report.rows,
+        report.chunks,
+        report.mode,
+        report.connections,
+        report.wall_s,
+    )
+    return report
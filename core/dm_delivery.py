@@ -0,0 +1,308 @@
+"""Concurrent, rate-limit-aware DM delivery shared by the reminder subsystems.
+
+``DmDeliveryEngine.deliver`` takes a batch of ``DmRequest`` and sends them with bounded
+concurrency. Each request resolves its user (``bot.get_user`` then ``fetch_user``) and sends the
+content/embed, falling back to plain content when Discord rejects the rich payload.
+
+Delivery behaviour:
+- at most ``DM_DELIVERY_CONCURRENCY`` sends are in flight per engine
+- a 429 on a route (``fetch_user`` / ``dm_send``) pauses every worker on that route for the
+  advertised ``retry_after`` before retrying
+- 429 and 5xx responses are retried up to ``DM_DELIVERY_MAX_ATTEMPTS`` with jittered exponential
+  backoff
+- a Forbidden / NotFound result is remembered per recipient *and* per ``DmRequest.suppress_key``
+  for ``DM_DELIVERY_SUPPRESS_MINUTES`` (default 360, i.e. 6h); a repeat of that same request is
+  skipped as ``suppressed`` instead of being retried every cycle, while the recipient's other
+  requests are still attempted
+- every batch returns a ``DmBatchReport`` with per-request latency and the batch wall time
+
+Calendar reminders use this first; KVK, Ark and MGE DM paths can build ``DmRequest`` objects and
+call the same engine.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+import logging
+import os
+import random
+import time
+from typing import Any
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+DM_DELIVERY_CONCURRENCY = max(1, _env_int("DM_DELIVERY_CONCURRENCY", 5))
+DM_DELIVERY_MAX_ATTEMPTS = max(1, _env_int("DM_DELIVERY_MAX_ATTEMPTS", 3))
+DM_DELIVERY_BACKOFF_BASE_SECONDS = _env_float("DM_DELIVERY_BACKOFF_BASE_SECONDS", 1.0)
+DM_DELIVERY_BACKOFF_CAP_SECONDS = _env_float("DM_DELIVERY_BACKOFF_CAP_SECONDS", 30.0)
+DM_DELIVERY_SUPPRESS_MINUTES = _env_float("DM_DELIVERY_SUPPRESS_MINUTES", 360.0)
+
+STATUS_SENT = "sent"
+STATUS_FORBIDDEN = "forbidden"
+STATUS_NOT_FOUND = "not_found"
+STATUS_HTTP_EXCEPTION = "http_exception"
+STATUS_UNKNOWN = "unknown"
+STATUS_SUPPRESSED = "suppressed"
+
+ROUTE_FETCH_USER = "fetch_user"
+ROUTE_DM_SEND = "dm_send"
+
+
+@dataclass(frozen=True)
+class DmRequest:
+    user_id: int
+    content: str | None = None
+    embed: discord.Embed | None = None
+    fallback_content: str | None = None
+    # Caller-owned correlation value (e.g. a sent-state key); never sent to Discord.
+    tag: Any = None
+    # Identifies repeats of this request across batches; suppression only covers the same key.
+    suppress_key: Hashable = None
+
+
+@dataclass(frozen=True)
+class DmResult:
+    request: DmRequest
+    status: str
+    attempts: int = 0
+    latency_ms: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_SENT
+
+
+@dataclass
+class DmBatchReport:
+    results: list[DmResult] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    def count(self, status: str) -> int:
+        return sum(1 for result in self.results if result.status == status)
+
+    def latency_percentile_ms(self, pct: float) -> float:
+        latencies = sorted(r.latency_ms for r in self.results if r.status != STATUS_SUPPRESSED)
+        if not latencies:
+            return 0.0
+        index = min(len(latencies) - 1, max(0, round(pct / 100.0 * (len(latencies) - 1))))
+        return round(latencies[index], 1)
+
+
+class _RetryableDmError(Exception):
+    def __init__(self, retry_after: float | None, original: discord.HTTPException) -> None:
+        super().__init__(str(original))
+        self.retry_after = retry_after
+        self.original = original
+
+
+def _retry_after_seconds(exc: discord.HTTPException) -> float | None:
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is None:
+        headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+        retry_after = headers.get("Retry-After") or headers.get("X-RateLimit-Reset-After")
+    try:
+        return max(0.0, float(retry_after)) if retry_after is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_retryable(exc: discord.HTTPException) -> bool:
+    status = int(getattr(exc, "status", 0) or 0)
+    return status == 429 or status >= 500
+
+
+class DmDeliveryEngine:
+    """Bounded-concurrency DM sender with shared route cooldowns and a suppression list."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        concurrency: int = DM_DELIVERY_CONCURRENCY,
+        max_attempts: int = DM_DELIVERY_MAX_ATTEMPTS,
+        backoff_base_seconds: float = DM_DELIVERY_BACKOFF_BASE_SECONDS,
+        backoff_cap_seconds: float = DM_DELIVERY_BACKOFF_CAP_SECONDS,
+        suppress_seconds: float = DM_DELIVERY_SUPPRESS_MINUTES * 60.0,
+    ) -> None:
+        self.name = name
+        self.concurrency = max(1, int(concurrency))
+        self.max_attempts = max(1, int(max_attempts))
+        self.backoff_base_seconds = float(backoff_base_seconds)
+        self.backoff_cap_seconds = float(backoff_cap_seconds)
+        self.suppress_seconds = float(suppress_seconds)
+        # (user_id, suppress_key) -> (monotonic expiry, status that caused the suppression)
+        self._suppressed: dict[tuple[int, Hashable], tuple[float, str]] = {}
+        # route -> monotonic time before which no worker may call it
+        self._route_resume_at: dict[str, float] = {}
+
+    # -- suppression -------------------------------------------------------
+    def is_suppressed(self, user_id: int, key: Hashable = None) -> bool:
+        entry_key = (int(user_id), key)
+        entry = self._suppressed.get(entry_key)
+        if entry is None:
+            return False
+        if entry[0] <= time.monotonic():
+            self._suppressed.pop(entry_key, None)
+            return False
+        return True
+
+    def suppress(self, user_id: int, status: str, key: Hashable = None) -> None:
+        if self.suppress_seconds <= 0:
+            return
+        self._suppressed[(int(user_id), key)] = (time.monotonic() + self.suppress_seconds, status)
+
+    def clear_suppression(self, user_id: int | None = None) -> None:
+        if user_id is None:
+            self._suppressed.clear()
+            return
+        for entry_key in [k for k in self._suppressed if k[0] == int(user_id)]:
+            del self._suppressed[entry_key]
+
+    def _prune_suppressed(self) -> None:
+        now = time.monotonic()
+        for entry_key in [k for k, (expiry, _s) in self._suppressed.items() if expiry <= now]:
+            del self._suppressed[entry_key]
+
+    def suppressed_count(self) -> int:
+        now = time.monotonic()
+        return sum(1 for expiry, _status in self._suppressed.values() if expiry > now)
+
+    # -- delivery ----------------------------------------------------------
+    async def deliver(self, bot: discord.Client, requests: Iterable[DmRequest]) -> DmBatchReport:
+        """Send every request; results keep the input order."""
+        items = list(requests)
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        self._prune_suppressed()
+
+        async def _bounded(request: DmRequest) -> DmResult:
+            if self.is_suppressed(request.user_id, request.suppress_key):
+                return DmResult(request=request, status=STATUS_SUPPRESSED)
+            async with semaphore:
+                return await self.deliver_one(bot, request)
+
+        results = await asyncio.gather(*(_bounded(request) for request in items))
+        report = DmBatchReport(
+            results=list(results), elapsed_ms=(time.perf_counter() - started) * 1000.0
+        )
+        if items:
+            logger.info(
+                "[DM_DELIVERY] %s batch size=%d sent=%d suppressed=%d failed=%d "
+                "elapsed_ms=%.1f p50_ms=%.1f p95_ms=%.1f",
+                self.name,
+                len(items),
+                report.count(STATUS_SENT),
+                report.count(STATUS_SUPPRESSED),
+                len(items) - report.count(STATUS_SENT) - report.count(STATUS_SUPPRESSED),
+                report.elapsed_ms,
+                report.latency_percentile_ms(50),
+                report.latency_percentile_ms(95),
+            )
+        return report
+
+    async def deliver_one(self, bot: discord.Client, request: DmRequest) -> DmResult:
+        started = time.perf_counter()
+        attempts = 0
+        status = STATUS_UNKNOWN
+        error: str | None = None
+        while attempts < self.max_attempts:
+            attempts += 1
+            try:
+                await self._send(bot, request)
+                status, error = STATUS_SENT, None
+                break
+            except _RetryableDmError as exc:
+                status, error = STATUS_HTTP_EXCEPTION, str(exc.original)
+                if attempts >= self.max_attempts:
+                    break
+                await asyncio.sleep(self._backoff_seconds(attempts, exc.retry_after))
+            except discord.Forbidden as exc:
+                status, error = STATUS_FORBIDDEN, str(exc)
+                self.suppress(request.user_id, status, request.suppress_key)
+                break
+            except discord.NotFound as exc:
+                status, error = STATUS_NOT_FOUND, str(exc)
+                self.suppress(request.user_id, status, request.suppress_key)
+                break
+            except discord.HTTPException as exc:
+                status, error = STATUS_HTTP_EXCEPTION, str(exc)
+                break
+            except Exception as exc:
+                status, error = STATUS_UNKNOWN, f"{type(exc).__name__}: {exc}"
+                break
+        if status != STATUS_SENT:
+            logger.debug(
+                "[DM_DELIVERY] %s user_id=%s status=%s attempts=%d error=%s",
+                self.name,
+                request.user_id,
+                status,
+                attempts,
+                error,
+            )
+        return DmResult(
+            request=request,
+            status=status,
+            attempts=attempts,
+            latency_ms=(time.perf_counter() - started) * 1000.0,
+            error=error,
+        )
+
+    async def _send(self, bot: discord.Client, request: DmRequest) -> None:
+        user = bot.get_user(request.user_id)
+        if user is None:
+            user = await self._call_route(ROUTE_FETCH_USER, bot.fetch_user, request.user_id)
+        try:
+            await self._call_route(
+                ROUTE_DM_SEND, user.send, content=request.content, embed=request.embed
+            )
+        except (discord.Forbidden, discord.NotFound, _RetryableDmError):
+            raise
+        except discord.HTTPException:
+            fallback = request.fallback_content or request.content
+            if request.embed is None or not fallback:
+                raise
+            await self._call_route(ROUTE_DM_SEND, user.send, fallback)
+
+    async def _call_route(self, route: str, fn, *args, **kwargs):
+        resume_at = self._route_resume_at.get(route, 0.0)
+        wait = resume_at - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        try:
+            return await fn(*args, **kwargs)
+        except (discord.Forbidden, discord.NotFound):
+            raise
+        except discord.HTTPException as exc:
+            if not _is_retryable(exc):
+                raise
+            retry_after = _retry_after_seconds(exc)
+            if int(getattr(exc, "status", 0) or 0) == 429 and retry_after:
+                self._route_resume_at[route] = max(
+                    self._route_resume_at.get(route, 0.0), time.monotonic() + retry_after
+                )
+            raise _RetryableDmError(retry_after, exc) from exc
+
+    def _backoff_seconds(self, attempt: int, retry_after: float | None) -> float:
+        backoff = min(self.backoff_cap_seconds, self.backoff_base_seconds * (2 ** (attempt - 1)))
+        jittered = backoff * random.uniform(0.5, 1.5)
+        return max(jittered, retry_after or 0.0)
@@ -0,0 +1,268 @@
+"""Buffered background writer for the daily JSONL logs (command usage, metrics, alerts).
+
+``JsonlWriter.write(prefix, obj)`` only appends to an in-memory ring buffer
+(``collections.deque(maxlen=...)``, whose append/popleft are atomic), so callers on the event
+loop or any thread never take a lock, open a file or schedule a task. One daemon thread drains
+the buffer:
+
+- serialises the records and writes them in batches to ``<directory>/<prefix>YYYYMMDD.jsonl``
+- keeps each stream's file open and rotates when the UTC day of a record changes
+- flushes after every batch and fsyncs at most every ``JSONL_WRITER_FSYNC_INTERVAL`` seconds
+- wakes early once ``JSONL_WRITER_BATCH`` records are pending
+
+When the buffer is full the oldest record is dropped. ``stats()`` reports depth, high-water
+mark and drop counts (best-effort under concurrent producers); drops are logged by the writer
+thread, not on the caller's path.
+"""
+
+from __future__ import annotations
+
+import atexit
+from collections import deque
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, TextIO
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+JSONL_WRITER_CAPACITY = max(1, _env_int("JSONL_WRITER_CAPACITY", 10000))
+JSONL_WRITER_BATCH = max(1, _env_int("JSONL_WRITER_BATCH", 256))
+JSONL_WRITER_FLUSH_INTERVAL = max(0.05, _env_float("JSONL_WRITER_FLUSH_INTERVAL", 1.0))
+JSONL_WRITER_FSYNC_INTERVAL = max(0.0, _env_float("JSONL_WRITER_FSYNC_INTERVAL", 5.0))
+
+_SECONDS_PER_DAY = 86400
+
+
+def _utc_day(ts: float) -> str:
+    return time.strftime("%Y%m%d", time.gmtime(ts))
+
+
+class JsonlWriter:
+    """Ring-buffered JSONL appender with a single background writer thread."""
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        capacity: int | None = None,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+        fsync_interval: float | None = None,
+    ) -> None:
+        self.directory = directory
+        self.capacity = JSONL_WRITER_CAPACITY if capacity is None else max(1, int(capacity))
+        self.batch_size = JSONL_WRITER_BATCH if batch_size is None else max(1, int(batch_size))
+        self.flush_interval = (
+            JSONL_WRITER_FLUSH_INTERVAL if flush_interval is None else max(0.0, flush_interval)
+        )
+        self.fsync_interval = (
+            JSONL_WRITER_FSYNC_INTERVAL if fsync_interval is None else max(0.0, fsync_interval)
+        )
+
+        self._buffer: deque[tuple[str, float, Any]] = deque(maxlen=self.capacity)
+        self._wake = threading.Event()
+        self._io_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+        # stream prefix -> (UTC day, open handle)
+        self._files: dict[str, tuple[str, TextIO]] = {}
+        self._dirty = False
+        self._last_fsync = time.monotonic()
+        self._day_cache: tuple[int, str] = (-1, "")
+
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.fsyncs = 0
+        self.errors = 0
+        self.high_water = 0
+        self._reported_drops = 0
+
+    # ---------- producer side ----------
+    def write(self, prefix: str, obj: Any, *, ts: float | None = None) -> None:
+        """Queue ``obj`` for ``<prefix>YYYYMMDD.jsonl`` (day of ``ts``, default now)."""
+        buffer = self._buffer
+        depth = len(buffer)
+        if depth >= self.capacity:
+            self.dropped += 1
+        else:
+            depth += 1
+            if depth > self.high_water:
+                self.high_water = depth
+        buffer.append((prefix, time.time() if ts is None else ts, obj))
+        self.enqueued += 1
+        if self._thread is None and not self._closed:
+            self._start()
+        if depth >= self.batch_size and not self._wake.is_set():
+            self._wake.set()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "capacity": self.capacity,
+            "depth": len(self._buffer),
+            "high_water": self.high_water,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "fsyncs": self.fsyncs,
+            "errors": self.errors,
+        }
+
+    # ---------- lifecycle ----------
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is not None or self._closed:
+                return
+            self._thread = threading.Thread(target=self._run, name="jsonl-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("[JSONL] Writer loop error")
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the writer thread, write what is buffered, fsync and close the files."""
+        self._closed = True
+        atexit.unregister(self.close)
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self.flush(fsync=True)
+        with self._io_lock:
+            for _day, handle in self._files.values():
+                try:
+                    handle.close()
+                except Exception:
+                    logger.debug("[JSONL] close failed", exc_info=True)
+            self._files.clear()
+
+    # ---------- consumer side ----------
+    def flush(self, *, fsync: bool = False) -> int:
+        """Write everything buffered now; returns the number of records written."""
+        with self._io_lock:
+            batch = []
+            popleft = self._buffer.popleft
+            try:
+                while True:
+                    batch.append(popleft())
+            except IndexError:
+                pass
+            if batch:
+                self._write_batch(batch)
+            self._report_drops()
+            self._maybe_fsync(force=fsync)
+            return len(batch)
+
+    def _day(self, ts: float) -> str:
+        day_no = int(ts // _SECONDS_PER_DAY)
+        cached_no, cached = self._day_cache
+        if day_no != cached_no:
+            cached = _utc_day(ts)
+            self._day_cache = (day_no, cached)
+        return cached
+
+    def _write_batch(self, batch: list[tuple[str, float, Any]]) -> None:
+        grouped: dict[tuple[str, str], list[str]] = {}
+        for prefix, ts, obj in batch:
+            try:
+                line = json.dumps(obj, default=str, ensure_ascii=False, separators=(",", ":"))
+            except Exception:
+                self.errors += 1
+                logger.exception("[JSONL] Could not serialise %s record", prefix)
+                continue
+            grouped.setdefault((prefix, self._day(ts)), []).append(line)
+
+        for (prefix, day), lines in grouped.items():
+            try:
+                handle = self._handle(prefix, day)
+                handle.write("\n".join(lines) + "\n")
+                handle.flush()
+            except Exception:
+                self.errors += 1
+                logger.exception("[JSONL] Failed to write %d %s record(s)", len(lines), prefix)
+                continue
+            self.written += len(lines)
+            self._dirty = True
+        self.batches += 1
+
+    def _handle(self, prefix: str, day: str) -> TextIO:
+        current = self._files.get(prefix)
+        if current is not None:
+            if current[0] == day:
+                return current[1]
+            self._close_handle(current[1])
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{prefix}{day}.jsonl")
+        # held open across batches; closed on rotation or close()
+        handle = open(path, "a", encoding="utf-8")
+        self._files[prefix] = (day, handle)
+        return handle
+
+    def _close_handle(self, handle: TextIO) -> None:
+        try:
+            handle.flush()
+            os.fsync(handle.fileno())
+            self.fsyncs += 1
+        except Exception:
+            logger.debug("[JSONL] fsync on rotate failed", exc_info=True)
+        try:
+            handle.close()
+        except Exception:
+            logger.debug("[JSONL] close on rotate failed", exc_info=True)
+
+    def _maybe_fsync(self, *, force: bool) -> None:
+        if not self._dirty:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_fsync < self.fsync_interval:
+            return
+        for _day, handle in self._files.values():
+            try:
+                os.fsync(handle.fileno())
+                self.fsyncs += 1
+            except Exception:
+                logger.debug("[JSONL] fsync failed", exc_info=True)
+        self._dirty = False
+        self._last_fsync = now
+
+    def _report_drops(self) -> None:
+        dropped = self.dropped
+        if dropped != self._reported_drops:
+            logger.warning(
+                "[JSONL] Buffer full (capacity=%d, high_water=%d); dropped %d record(s), "
+                "%d in total",
+                self.capacity,
+                self.high_water,
+                dropped - self._reported_drops,
+                dropped,
+            )
+            self._reported_drops = dropped
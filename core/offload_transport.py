@@ -0,0 +1,248 @@
+"""Shared-memory argument transport and binary result frames for offloaded jobs.
+
+Offloaded imports used to copy every uploaded XLSX/CSV payload and every JSON-able row batch to a
+temp file that the worker then re-read from disk. With this module those payloads go into named
+``multiprocessing.shared_memory`` segments instead:
+
+- ``__OFFLOAD_SHM__:<kind>:<size>:<name>`` argv tokens (``kind`` is ``bytes`` or ``json``)
+  replace ``__OFFLOAD_FILE__``/``__OFFLOAD_JSON__`` temp files for spawned workers
+- ``SharedBytesRef`` replaces large ``bytes`` arguments inside warm-pool job frames
+- segments are reference counted in the creating process and unlinked when the last job using
+  them releases them (``file_utils.cleanup_temp_paths`` accepts SHM tokens)
+
+Spawned ``maintenance_worker.py`` processes also write their result payload as one binary frame to
+``MAINT_RESULT_FRAME_PATH`` instead of printing a JSON line that the parent has to scrape from
+stdout. The temp-file argument path and the stdout JSON line remain as fallbacks.
+
+This is not a zero-copy transport: the importers take ``bytes``, so a worker copies a segment
+once into its own ``bytes`` (``read_shared_bytes``), and results travel as a pickle frame file
+under ``DATA_DIR/offload_tmp`` rather than through shared memory. What it removes is the temp-file
+write/read of the arguments and the stdout scraping of results.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import json
+import logging
+import os
+import sys
+import threading
+from typing import Any
+
+from core.worker_pool import encode_frame, read_frame
+
+logger = logging.getLogger(__name__)
+
+SHM_PREFIX = "__OFFLOAD_SHM__:"
+RESULT_FRAME_ENV = "MAINT_RESULT_FRAME_PATH"
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+# Payloads smaller than this stay inline in pool frames (spawned workers always use segments).
+OFFLOAD_SHM_MIN_BYTES = max(0, _env_int("OFFLOAD_SHM_MIN_BYTES", 64 * 1024))
+
+
+def shm_transport_enabled() -> bool:
+    return os.getenv("OFFLOAD_SHM", "1").strip().lower() not in ("0", "false", "no")
+
+
+# ---------------------------
+# Segment registry (creating process)
+# ---------------------------
+_segments: dict[str, list[Any]] = {}  # name -> [SharedMemory, refcount]
+_segments_lock = threading.Lock()
+
+
+def put_shared_bytes(data: bytes | bytearray | memoryview) -> str:
+    """Copy ``data`` into a new segment (refcount 1) and return its name."""
+    from multiprocessing import shared_memory
+
+    view = memoryview(data).cast("B")
+    shm = shared_memory.SharedMemory(create=True, size=max(1, view.nbytes))
+    try:
+        shm.buf[: view.nbytes] = view
+    except Exception:
+        shm.close()
+        shm.unlink()
+        raise
+    with _segments_lock:
+        _segments[shm.name] = [shm, 1]
+    return shm.name
+
+
+def retain_segment(name: str) -> None:
+    with _segments_lock:
+        entry = _segments.get(name)
+        if entry is not None:
+            entry[1] += 1
+
+
+def release_segment(name: str) -> None:
+    """Drop one reference; the segment is unlinked when the count reaches zero."""
+    with _segments_lock:
+        entry = _segments.get(name)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _segments[name]
+    shm = entry[0]
+    try:
+        shm.close()
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.debug("[OFFLOAD_SHM] failed to unlink %s", name, exc_info=True)
+
+
+def active_segment_count() -> int:
+    with _segments_lock:
+        return len(_segments)
+
+
+def _attach(name: str):
+    """Attach to an existing segment without letting this process's tracker unlink it."""
+    from multiprocessing import shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name != "nt":
+        try:
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        except Exception:
+            pass
+    return shm
+
+
+def read_shared_bytes(name: str, size: int) -> bytes:
+    """Copy ``size`` bytes out of segment ``name`` (one copy; the segment may go away after)."""
+    with _segments_lock:
+        entry = _segments.get(name)
+        if entry is not None:
+            # Created by this process (in-thread fallback, tests): read it directly.
+            return bytes(entry[0].buf[:size])
+    shm = _attach(name)
+    try:
+        return bytes(shm.buf[:size])
+    finally:
+        shm.close()
+
+
+# ---------------------------
+# argv tokens (spawned maintenance_worker.py)
+# ---------------------------
+def make_shm_token(data: bytes, kind: str = "bytes") -> str:
+    name = put_shared_bytes(data)
+    return f"{SHM_PREFIX}{kind}:{len(data)}:{name}"
+
+
+def is_shm_token(tok: Any) -> bool:
+    return isinstance(tok, str) and tok.startswith(SHM_PREFIX)
+
+
+def _parse_token(tok: str) -> tuple[str, int, str]:
+    kind, size, name = tok[len(SHM_PREFIX) :].split(":", 2)
+    return kind, int(size), name
+
+
+def read_shm_token(tok: str) -> Any:
+    """Materialise a SHM token: ``bytes`` for kind=bytes, parsed JSON for kind=json."""
+    kind, size, name = _parse_token(tok)
+    data = read_shared_bytes(name, size)
+    if kind == "json":
+        try:
+            return json.loads(data.decode("utf-8"))
+        except Exception:
+            return data
+    return data
+
+
+def release_shm_token(tok: str) -> None:
+    try:
+        _, _, name = _parse_token(tok)
+    except Exception:
+        return
+    release_segment(name)
+
+
+# ---------------------------
+# Pool job payloads
+# ---------------------------
+@dataclass(frozen=True)
+class SharedBytesRef:
+    """Picklable stand-in for a large ``bytes`` argument held in a shared segment."""
+
+    name: str
+    size: int
+
+
+def stage_shared_payloads(
+    args: Iterable[Any], kwargs: dict[str, Any]
+) -> tuple[list[Any], dict[str, Any], list[str]]:
+    """Move large top-level bytes arguments into segments; returns (args, kwargs, names)."""
+    names: list[str] = []
+
+    def _swap(value: Any) -> Any:
+        if (
+            isinstance(value, (bytes, bytearray, memoryview))
+            and memoryview(value).nbytes >= OFFLOAD_SHM_MIN_BYTES
+        ):
+            name = put_shared_bytes(value)
+            names.append(name)
+            return SharedBytesRef(name, memoryview(value).nbytes)
+        return value
+
+    try:
+        staged_args = [_swap(a) for a in args]
+        staged_kwargs = {k: _swap(v) for k, v in kwargs.items()}
+    except Exception:
+        for name in names:
+            release_segment(name)
+        raise
+    return staged_args, staged_kwargs, names
+
+
+def resolve_shared_payloads(
+    args: Iterable[Any], kwargs: dict[str, Any]
+) -> tuple[list[Any], dict[str, Any]]:
+    def _load(value: Any) -> Any:
+        if isinstance(value, SharedBytesRef):
+            return read_shared_bytes(value.name, value.size)
+        return value
+
+    return [_load(a) for a in args], {k: _load(v) for k, v in kwargs.items()}
+
+
+# ---------------------------
+# Binary result frames (spawned maintenance_worker.py)
+# ---------------------------
+def write_result_frame(path: str, payload: dict[str, Any]) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(encode_frame(payload))
+    os.replace(tmp, path)
+
+
+def read_result_frame(path: str) -> dict[str, Any] | None:
+    try:
+        with open(path, "rb") as f:
+            payload = read_frame(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.debug("[OFFLOAD_SHM] unreadable result frame %s", path, exc_info=True)
+        return None
+    return payload if isinstance(payload, dict) else None
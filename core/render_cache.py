@@ -0,0 +1,387 @@
+"""Content-addressed cache of rendered cards.
+
+Players re-open the same ``/me`` pages, KVK rankings and stats cards between data refreshes, and
+every view used to re-render the card and re-run ``optimize=True`` PNG compression for an
+identical payload. ``core.render_service.render_card`` consults this cache first; the key is a
+SHA-256 over:
+
+- the renderer's module and qualified name, plus its source file's mtime
+- a canonical digest of the positional and keyword arguments (dataclass payloads field by field,
+  ``bytes`` such as avatars by their own SHA-256)
+- ``core.asset_cache.registered_assets_version()``, so an edited backdrop changes every key
+
+Keys are prefixed with the renderer's top-level package (``player_self_service``, ``kvk``, ...),
+its *scope*. Dataclass fields and keyword arguments named ``generated_at*`` holding a datetime
+enter the key truncated to the minute: cards draw the stamp at minute resolution, so requests
+inside the same minute share a render while a later request never shows an older stamp.
+Arguments the canonicaliser does not understand make the call uncacheable rather than risk a
+false hit. Results are stored pickled, so every hit unpickles fresh objects (a new ``BytesIO``
+the caller may close). Tiers:
+
+- memory: LRU bounded by ``RENDER_CACHE_MAX_MB`` of pickled results
+- disk (optional, ``RENDER_CACHE_DIR``): one file per key, pruned oldest-first past
+  ``RENDER_CACHE_DISK_MAX_MB``; survives restarts
+
+``invalidate_rendered_cards()`` drops both tiers, or only the entries of the given scopes; the
+profile cache refresh drops the ``player_self_service`` cards and the player-stats refreshes drop
+everything, so memory isn't held for payloads that can no longer be produced.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+import dataclasses
+from datetime import date, datetime, time as dt_time, timedelta
+from decimal import Decimal
+import enum
+import hashlib
+from io import BytesIO
+import logging
+import os
+from pathlib import Path, PurePath
+import pickle
+import sys
+import threading
+from typing import Any
+from uuid import UUID
+
+from core.asset_cache import registered_assets_version
+
+logger = logging.getLogger(__name__)
+
+KEY_VERSION = "v2"
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+RENDER_CACHE_MAX_MB = _env_float("RENDER_CACHE_MAX_MB", 64.0)
+RENDER_CACHE_DIR = os.getenv("RENDER_CACHE_DIR", "").strip()
+RENDER_CACHE_DISK_MAX_MB = _env_float("RENDER_CACHE_DISK_MAX_MB", 256.0)
+
+
+def render_cache_enabled() -> bool:
+    # Unit tests render fresh unless they opt in explicitly.
+    default = "0" if os.getenv("K98_TEST_MODE") == "1" else "1"
+    return os.getenv("RENDER_CACHE", default).strip().lower() not in ("0", "false", "no")
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+_SCALARS = (type(None), bool, int, float, str)
+# Per-request "rendered at" stamps; cards print them to the minute, so key them to the minute.
+_STAMP_PREFIX = "generated_at"
+
+
+def _keyed_stamp(name: Any, value: Any) -> Any:
+    if isinstance(name, str) and name.startswith(_STAMP_PREFIX) and isinstance(value, datetime):
+        return value.replace(second=0, microsecond=0)
+    return value
+
+
+_REPR_TYPES = (datetime, date, dt_time, timedelta, Decimal, UUID)
+
+
+def _digest(value: Any) -> bytes:
+    """Stable digest of ``value``; raises ``_Uncacheable`` for types it can't canonicalise."""
+    h = hashlib.sha256()
+    if isinstance(value, enum.Enum):
+        h.update(f"E|{type(value).__qualname__}|{value.value!r}".encode())
+    elif isinstance(value, _SCALARS):
+        h.update(f"S|{type(value).__name__}|{value!r}".encode())
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        h.update(b"B|" + hashlib.sha256(value).digest())
+    elif isinstance(value, BytesIO):
+        h.update(b"B|" + hashlib.sha256(value.getbuffer()).digest())
+    elif isinstance(value, _REPR_TYPES):
+        h.update(f"R|{value!r}".encode())
+    elif isinstance(value, PurePath):
+        h.update(f"P|{value}".encode())
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        cls = type(value)
+        h.update(f"D|{cls.__module__}.{cls.__qualname__}".encode())
+        for f in dataclasses.fields(value):
+            field_value = _keyed_stamp(f.name, getattr(value, f.name))
+            h.update(f.name.encode() + b"=" + _digest(field_value))
+    elif isinstance(value, (list, tuple)):
+        h.update(f"L|{type(value).__qualname__}|{len(value)}".encode())
+        for item in value:
+            h.update(_digest(item))
+    elif isinstance(value, dict):
+        h.update(f"M|{len(value)}".encode())
+        for pair in sorted(_digest(k) + _digest(v) for k, v in value.items()):
+            h.update(pair)
+    elif isinstance(value, (set, frozenset)):
+        h.update(f"T|{len(value)}".encode())
+        for item in sorted(_digest(item) for item in value):
+            h.update(item)
+    else:
+        raise _Uncacheable(type(value).__qualname__)
+    return h.digest()
+
+
+_code_versions: dict[str, str] = {}
+
+
+def _code_version(module_name: str) -> str:
+    version = _code_versions.get(module_name)
+    if version is None:
+        module_file = getattr(sys.modules.get(module_name), "__file__", None)
+        try:
+            version = str(os.stat(module_file).st_mtime_ns) if module_file else "-"
+        except OSError:
+            version = "-"
+        _code_versions[module_name] = version
+    return version
+
+
+def key_scope(key: str) -> str:
+    """Scope (renderer top-level package) a cache key was issued under."""
+    return key.partition(".")[0]
+
+
+def card_fingerprint(
+    fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> str | None:
+    """Cache key ``"<scope>.<sha256>"`` for ``fn(*args, **kwargs)``, or None when the call can't
+    be fingerprinted."""
+    module_name = getattr(fn, "__module__", None)
+    qualname = getattr(fn, "__qualname__", None)
+    if not module_name or not qualname or "<locals>" in qualname:
+        return None
+    h = hashlib.sha256()
+    h.update(f"{KEY_VERSION}|{module_name}:{qualname}|{_code_version(module_name)}".encode())
+    h.update(f"|assets={registered_assets_version()}|".encode())
+    try:
+        h.update(_digest(tuple(args)))
+        h.update(_digest({k: _keyed_stamp(k, v) for k, v in kwargs.items()}))
+    except _Uncacheable as exc:
+        logger.debug("[RENDER_CACHE] %s:%s not cacheable (%s)", module_name, qualname, exc)
+        return None
+    return f"{module_name.partition('.')[0]}.{h.hexdigest()}"
+
+
+class RenderedCardCache:
+    """Memory LRU of pickled render results with an optional on-disk tier."""
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        disk_dir: str | os.PathLike[str] | None = None,
+        disk_max_bytes: int = 0,
+    ) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = max(0, int(disk_max_bytes))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        self._disk_bytes: int | None = None
+        self._counters: dict[str, int] = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    @property
+    def disk_enabled(self) -> bool:
+        return self.disk_dir is not None and self.disk_max_bytes > 0
+
+    # ----- memory tier -----
+    def get(self, key: str) -> Any | None:
+        """Fresh copy of the cached result from memory, or None."""
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is None:
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+        return pickle.loads(blob)
+
+    def put(self, key: str, result: Any) -> bytes | None:
+        """Store ``result``; returns the pickled blob for ``write_disk`` (None if unpicklable)."""
+        try:
+            blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            logger.debug("[RENDER_CACHE] result not picklable; not caching", exc_info=True)
+            return None
+        self._remember(key, blob)
+        with self._lock:
+            self._counters["stores"] += 1
+        return blob
+
+    def _remember(self, key: str, blob: bytes) -> None:
+        if len(blob) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = blob
+            self._bytes += len(blob)
+            while self._bytes > self.max_bytes and self._entries:
+                _old_key, old = self._entries.popitem(last=False)
+                self._bytes -= len(old)
+                self._counters["evictions"] += 1
+
+    def miss(self) -> None:
+        with self._lock:
+            self._counters["misses"] += 1
+
+    # ----- disk tier (blocking; call via asyncio.to_thread) -----
+    def _disk_path(self, key: str) -> Path:
+        assert self.disk_dir is not None
+        scope, _, digest = key.partition(".")
+        return self.disk_dir / scope / digest[:2] / f"{digest}.pkl"
+
+    def get_disk(self, key: str) -> Any | None:
+        if not self.disk_enabled:
+            return None
+        path = self._disk_path(key)
+        try:
+            blob = path.read_bytes()
+            result = pickle.loads(blob)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning("[RENDER_CACHE] dropping unreadable disk entry %s", path.name)
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._remember(key, blob)
+        with self._lock:
+            self._counters["disk_hits"] += 1
+        return result
+
+    def write_disk(self, key: str, blob: bytes) -> None:
+        if not self.disk_enabled or len(blob) > self.disk_max_bytes:
+            return
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(blob)
+            os.replace(tmp, path)
+        except Exception:
+            logger.warning("[RENDER_CACHE] disk write failed for %s", path.name, exc_info=True)
+            return
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += len(blob)
+            over = self._disk_bytes is None or self._disk_bytes > self.disk_max_bytes
+        if over:
+            self._prune_disk()
+
+    def _disk_files(self, scopes: Iterable[str] | None = None) -> list[tuple[float, int, Path]]:
+        assert self.disk_dir is not None
+        # rglob also picks up entries from older key layouts so pruning reclaims them.
+        roots = [self.disk_dir] if scopes is None else [self.disk_dir / s for s in scopes]
+        out = []
+        for path in (p for root in roots for p in root.rglob("*.pkl")):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            out.append((st.st_mtime, st.st_size, path))
+        return out
+
+    def _prune_disk(self) -> None:
+        """Delete least-recently-used files until the tier is back under 80% of its budget."""
+        files = self._disk_files()
+        total = sum(size for _mtime, size, _path in files)
+        if total > self.disk_max_bytes:
+            target = int(self.disk_max_bytes * 0.8)
+            for _mtime, size, path in sorted(files):
+                if total <= target:
+                    break
+                try:
+                    path.unlink()
+                    total -= size
+                except OSError:
+                    continue
+        with self._lock:
+            self._disk_bytes = total
+
+    # ----- housekeeping -----
+    def invalidate(self, reason: str = "", *, scopes: Iterable[str] | None = None) -> None:
+        """Drop every entry, or only those whose key scope is in ``scopes``."""
+        scope_set = None if scopes is None else frozenset(scopes)
+        with self._lock:
+            if scope_set is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+            else:
+                doomed = [k for k in self._entries if key_scope(k) in scope_set]
+                for key in doomed:
+                    self._bytes -= len(self._entries.pop(key))
+                dropped = len(doomed)
+            self._counters["invalidations"] += 1
+        # Disk files are listed and removed without holding the lock; renders keep going meanwhile.
+        if self.disk_enabled:
+            for _mtime, _size, path in self._disk_files(scope_set):
+                path.unlink(missing_ok=True)
+            with self._lock:
+                self._disk_bytes = 0 if scope_set is None else None
+        logger.info(
+            "[RENDER_CACHE] invalidated (%s) scopes=%s dropped=%d",
+            reason or "manual",
+            ",".join(sorted(scope_set)) if scope_set is not None else "all",
+            dropped,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "disk": str(self.disk_dir) if self.disk_enabled else None,
+                "disk_bytes": self._disk_bytes,
+                **self._counters,
+            }
+
+
+_cache: RenderedCardCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_render_cache() -> RenderedCardCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = RenderedCardCache(
+                    max_bytes=int(RENDER_CACHE_MAX_MB * 1024 * 1024),
+                    disk_dir=RENDER_CACHE_DIR or None,
+                    disk_max_bytes=int(RENDER_CACHE_DISK_MAX_MB * 1024 * 1024),
+                )
+    return _cache
+
+
+def invalidate_rendered_cards(reason: str = "", *, scopes: Iterable[str] | None = None) -> None:
+    """Drop cached cards from both tiers (only ``scopes`` when given); never raises."""
+    if _cache is None and not RENDER_CACHE_DIR:
+        return
+    try:
+        get_render_cache().invalidate(reason, scopes=scopes)
+    except Exception:
+        logger.warning("[RENDER_CACHE] invalidation failed (%s)", reason, exc_info=True)
+
+
+def get_render_cache_stats() -> dict[str, Any] | None:
+    return _cache.stats() if _cache is not None else None
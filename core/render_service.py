@@ -0,0 +1,342 @@
+"""Process-pool rendering for Pillow cards.
+
+Card renderers composite, fit text and encode PNGs while holding the GIL, so running them through
+``asyncio.to_thread`` serialises concurrent renders and stalls every other thread in the bot.
+``render_card(fn, *args, **kwargs)`` runs a module-level renderer on a dedicated
+``core.worker_pool.WarmWorkerPool`` of ``maintenance_worker.py --serve`` processes instead and
+returns the renderer's own result (the ``Rendered*`` dataclass carrying the PNG bytes).
+
+Render workers import ``RENDER_POOL_PRELOAD`` once at start-up; entries written as
+``module:function`` are called after import, which ``warm_render_worker`` uses to pre-load the
+common ``core.visual_text`` fonts and the backdrops the renderer modules registered with
+``core.asset_cache``.
+
+Behaviour:
+- payloads and results travel as pickle frames, so renderers must be importable at module level
+  and take picklable arguments (dataclass payloads, ``bytes`` avatars)
+- each render has a timeout (``RENDER_POOL_TIMEOUT``); an expired render kills its worker and
+  raises ``WorkerJobTimeout``
+- when the pool is disabled, cannot start, loses a worker mid-render or cannot pickle the call,
+  the render runs on the old ``asyncio.to_thread`` path instead
+- ``get_render_service_stats()`` reports queue depth, in-flight renders and fallbacks
+- ``render_card`` answers repeat calls with an identical payload from ``core.render_cache``
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import importlib
+import logging
+import os
+import time
+from typing import Any
+
+from core.render_cache import card_fingerprint, get_render_cache, render_cache_enabled
+from core.worker_pool import (
+    WarmWorkerPool,
+    WorkerCrashed,
+    WorkerJobTimeout,
+    WorkerPoolUnavailable,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+RENDER_POOL_SIZE = max(1, _env_int("RENDER_POOL_SIZE", 2))
+RENDER_POOL_TIMEOUT = _env_float("RENDER_POOL_TIMEOUT", 30.0)
+RENDER_POOL_MAX_JOBS = max(1, _env_int("RENDER_POOL_MAX_JOBS", 500))
+RENDER_POOL_MAX_RSS_MB = _env_float("RENDER_POOL_MAX_RSS_MB", 768.0)
+# After the pool fails to start, renders use threads for this long before retrying it.
+RENDER_POOL_RETRY_SECONDS = _env_float("RENDER_POOL_RETRY_SECONDS", 300.0)
+RENDER_POOL_PRELOAD_DEFAULT = ",".join(
+    (
+        "core.visual_text",
+        "kvk.rendering.kvk_stats_card_renderer",
+        "kvk.rendering.kvk_rankings_card_renderer",
+        "kvk.rendering.kvk_targets_card_renderer",
+        "kvk.rendering.kvk_history_renderer",
+        "inventory.report_image_renderer",
+        "prekvk.report_image_renderer",
+        "leadership_player_review.renderer",
+        "player_self_service.accounts_renderer",
+        "player_self_service.dashboard_card",
+        "player_self_service.governor_dashboard_renderer",
+        "player_self_service.preferences_renderer",
+        "player_self_service.reminders_renderer",
+        "core.render_service:warm_render_worker",
+    )
+)
+
+# (size, bold) pairs warmed into core.visual_text.font's cache in every render worker.
+_WARM_FONT_SIZES = (14, 16, 18, 20, 22, 24, 28, 32, 36, 44)
+
+
+def render_pool_enabled() -> bool:
+    # Unit tests keep the in-process thread path unless they opt in explicitly.
+    default = "0" if os.getenv("K98_TEST_MODE") == "1" else "1"
+    return os.getenv("RENDER_POOL", default).strip().lower() not in ("0", "false", "no")
+
+
+def warm_render_worker() -> int:
+    """Pre-load common card fonts and registered backdrops; returns how many were loaded."""
+    from core import visual_text
+    from core.asset_cache import warm_registered_assets
+
+    loaded = 0
+    for size in _WARM_FONT_SIZES:
+        for bold in (False, True):
+            try:
+                visual_text.font(size, bold=bold)
+                loaded += 1
+            except Exception:
+                logger.debug("[RENDER_POOL] font warm-up failed size=%s bold=%s", size, bold)
+    return loaded + warm_registered_assets()
+
+
+def _callable_spec(fn: Callable[..., Any]) -> tuple[str, str] | None:
+    """(module, name) when ``fn`` can be re-imported by a worker, else None."""
+    module_name = getattr(fn, "__module__", None)
+    fn_name = getattr(fn, "__name__", None)
+    if not module_name or not fn_name or module_name == "__main__":
+        return None
+    try:
+        if getattr(importlib.import_module(module_name), fn_name, None) is fn:
+            return module_name, fn_name
+    except Exception:
+        pass
+    return None
+
+
+class RenderService:
+    """Runs card renderers on a warm render pool, falling back to threads."""
+
+    def __init__(
+        self,
+        *,
+        size: int = RENDER_POOL_SIZE,
+        timeout: float | None = RENDER_POOL_TIMEOUT,
+        preload: str | None = None,
+        worker_cmd: list[str] | None = None,
+    ) -> None:
+        self.size = max(1, int(size))
+        self.timeout = timeout
+        self.preload = (
+            preload
+            if preload is not None
+            else os.getenv("RENDER_POOL_PRELOAD", RENDER_POOL_PRELOAD_DEFAULT)
+        )
+        self.worker_cmd = worker_cmd
+        self._pool: WarmWorkerPool | None = None
+        self._unavailable_until = 0.0
+        self._waiting = 0
+        self._running = 0
+        self._counters: dict[str, int] = {
+            "pool_renders": 0,
+            "thread_renders": 0,
+            "fallbacks": 0,
+            "timeouts": 0,
+            "failed": 0,
+        }
+        self._pool_ms_total = 0.0
+
+    # ----- pool lifecycle -----
+    def _get_pool(self) -> WarmWorkerPool:
+        loop = asyncio.get_running_loop()
+        pool = self._pool
+        if pool is None or pool.loop is not loop or pool._closed:
+            if pool is not None:
+                pool.abandon()
+            pool = WarmWorkerPool(
+                size=self.size,
+                max_jobs=RENDER_POOL_MAX_JOBS,
+                max_rss_mb=RENDER_POOL_MAX_RSS_MB,
+                preload=self.preload,
+                worker_cmd=self.worker_cmd,
+            )
+            self._pool = pool
+        return pool
+
+    def _pool_usable(self) -> bool:
+        return render_pool_enabled() and time.monotonic() >= self._unavailable_until
+
+    async def warm_up(self) -> int:
+        """Pre-spawn render workers (boot task); never raises."""
+        if not self._pool_usable():
+            return 0
+        return await self._get_pool().warm_up()
+
+    async def shutdown(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        if pool.loop is asyncio.get_running_loop():
+            await pool.shutdown()
+        else:
+            pool.abandon()
+
+    # ----- rendering -----
+    async def render(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Return ``fn(*args, **kwargs)``, computed on a render worker when possible."""
+        spec = _callable_spec(fn) if self._pool_usable() else None
+        if spec is None:
+            return await self._render_in_thread(fn, args, kwargs)
+
+        module_name, fn_name = spec
+        job = {
+            "kind": "call",
+            "module": module_name,
+            "function": fn_name,
+            "args": list(args),
+            "kwargs": kwargs,
+        }
+        started = time.perf_counter()
+        assigned = False
+
+        def _on_start(_pid: int) -> None:
+            nonlocal assigned
+            assigned = True
+            self._waiting -= 1
+            self._running += 1
+
+        self._waiting += 1
+        try:
+            reply = await self._get_pool().run(
+                job,
+                timeout=self.timeout if timeout is None else timeout,
+                on_start=_on_start,
+            )
+        except WorkerJobTimeout:
+            self._counters["timeouts"] += 1
+            logger.warning(
+                "[RENDER_POOL] %s:%s timed out after %.1fms",
+                module_name,
+                fn_name,
+                (time.perf_counter() - started) * 1000.0,
+            )
+            raise
+        except WorkerPoolUnavailable as exc:
+            if "picklable" not in str(exc):
+                self._unavailable_until = time.monotonic() + RENDER_POOL_RETRY_SECONDS
+            return await self._fallback(fn, args, kwargs, f"{module_name}:{fn_name}", exc)
+        except WorkerCrashed as exc:
+            return await self._fallback(fn, args, kwargs, f"{module_name}:{fn_name}", exc)
+        finally:
+            if assigned:
+                self._running -= 1
+            else:
+                self._waiting -= 1
+
+        if reply.get("ok"):
+            self._counters["pool_renders"] += 1
+            self._pool_ms_total += (time.perf_counter() - started) * 1000.0
+            return reply.get("result")
+
+        error_type = reply.get("error_type")
+        if error_type in ("ResultNotPicklable", "PermissionError"):
+            return await self._fallback(
+                fn, args, kwargs, f"{module_name}:{fn_name}", reply.get("error")
+            )
+        self._counters["failed"] += 1
+        exc = reply.get("exc")
+        if isinstance(exc, BaseException):
+            raise exc
+        raise RuntimeError(
+            f"render {module_name}:{fn_name} failed: {error_type}: {reply.get('error')}"
+        )
+
+    async def _fallback(
+        self,
+        fn: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        spec: str,
+        reason: Any,
+    ) -> Any:
+        self._counters["fallbacks"] += 1
+        logger.warning("[RENDER_POOL] %s falling back to a thread: %s", spec, reason)
+        return await self._render_in_thread(fn, args, kwargs)
+
+    async def _render_in_thread(
+        self, fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> Any:
+        self._counters["thread_renders"] += 1
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    def stats(self) -> dict[str, Any]:
+        pool_renders = self._counters["pool_renders"]
+        return {
+            "enabled": render_pool_enabled(),
+            "available": self._pool_usable(),
+            "queue_depth": self._waiting,
+            "in_flight": self._running,
+            **self._counters,
+            "avg_pool_ms": round(self._pool_ms_total / pool_renders, 1) if pool_renders else None,
+            "pool": self._pool.stats() if self._pool is not None else None,
+        }
+
+
+_service: RenderService | None = None
+
+
+def get_render_service() -> RenderService:
+    global _service
+    if _service is None:
+        _service = RenderService()
+    return _service
+
+
+async def render_card(
+    fn: Callable[..., Any], *args: Any, timeout: float | None = None, **kwargs: Any
+) -> Any:
+    """
+    Render through the shared render service; drop-in for ``asyncio.to_thread(fn, ...)``.
+
+    Identical calls are answered from ``core.render_cache`` without rendering again.
+    """
+    cache = get_render_cache() if render_cache_enabled() else None
+    key = card_fingerprint(fn, args, kwargs) if cache is not None else None
+    if cache is not None and key is not None:
+        cached = cache.get(key)
+        if cached is None and cache.disk_enabled:
+            cached = await asyncio.to_thread(cache.get_disk, key)
+        if cached is not None:
+            return cached
+        cache.miss()
+
+    result = await get_render_service().render(fn, *args, timeout=timeout, **kwargs)
+
+    if cache is not None and key is not None:
+        blob = cache.put(key, result)
+        if blob is not None and cache.disk_enabled:
+            await asyncio.to_thread(cache.write_disk, key, blob)
+    return result
+
+
+def get_render_service_stats() -> dict[str, Any] | None:
+    return _service.stats() if _service is not None else None
+
+
+async def shutdown_render_service() -> None:
+    if _service is not None:
+        await _service.shutdown()
@@ -0,0 +1,442 @@
+"""Process-wide pooled SQL connections behind ``file_utils.get_conn_with_retries``.
+
+Each credential (``default`` -> ``constants._conn``, ``import`` -> ``constants._conn_import``,
+``trusted`` -> ``constants._conn_trusted``) gets its own bounded pool. Callers receive a
+``PooledConnection`` proxy that behaves like a pyodbc connection; ``close()`` and leaving a
+``with`` block hand the underlying connection back to the pool instead of tearing down the TDS
+session.
+
+Pool behaviour:
+- bounded size per credential; when every slot is busy a checkout waits up to
+  ``DB_POOL_CHECKOUT_TIMEOUT`` and then falls back to a short-lived overflow connection so nested
+  checkouts can never deadlock
+- idle connections older than ``DB_POOL_IDLE_TIMEOUT`` are evicted
+- connections idle for longer than ``DB_POOL_PING_AFTER`` are pinged with ``SELECT 1`` on
+  checkout; failures discard the connection and another is tried
+- released connections are rolled back and reset (autocommit/timeout plus the session SET
+  options in ``SESSION_RESET_SQL``) before reuse
+- state a reset batch cannot undo (``SET IDENTITY_INSERT``, #temp tables) must be flagged with
+  ``discard_on_release(conn)`` so the session is closed instead of pooled
+- checkout wait and hit-rate counters are emitted as ``db_pool_stats`` telemetry
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+ConnectionFactory = Callable[[], Any]
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+DB_POOL_ENABLED = os.getenv("DB_POOL_ENABLED", "1") != "0"
+DB_POOL_MAX_SIZE = max(1, _env_int("DB_POOL_MAX_SIZE", 8))
+DB_POOL_IDLE_TIMEOUT = _env_float("DB_POOL_IDLE_TIMEOUT", 300.0)
+DB_POOL_PING_AFTER = _env_float("DB_POOL_PING_AFTER", 30.0)
+DB_POOL_CHECKOUT_TIMEOUT = _env_float("DB_POOL_CHECKOUT_TIMEOUT", 5.0)
+DB_POOL_STATS_INTERVAL = _env_float("DB_POOL_STATS_INTERVAL", 300.0)
+
+# Session options callers change with plain SET statements, back to the ODBC defaults.
+SESSION_RESET_SQL = (
+    "SET LOCK_TIMEOUT -1; "
+    "SET XACT_ABORT OFF; "
+    "SET NOCOUNT OFF; "
+    "SET DEADLOCK_PRIORITY NORMAL; "
+    "SET TRANSACTION ISOLATION LEVEL READ COMMITTED;"
+)
+
+
+def _emit_telemetry(payload: dict[str, Any]) -> None:
+    # Imported lazily: file_utils imports this module.
+    try:
+        from file_utils import emit_telemetry_event
+
+        emit_telemetry_event(payload)
+    except Exception:
+        logger.debug("[DB_POOL] telemetry emit failed", exc_info=True)
+
+
+def _close_quietly(raw: Any) -> None:
+    try:
+        raw.close()
+    except Exception:
+        logger.debug("[DB_POOL] close failed", exc_info=True)
+
+
+class PooledConnection:
+    """pyodbc-compatible proxy whose ``close()`` returns the connection to its pool."""
+
+    __slots__ = ("_cursors", "_discard", "_overflow", "_pool", "_raw", "_reset_autocommit")
+
+    def __init__(self, pool: SqlConnectionPool, raw: Any, *, overflow: bool = False) -> None:
+        object.__setattr__(self, "_cursors", [])
+        object.__setattr__(self, "_discard", False)
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "_raw", raw)
+        object.__setattr__(self, "_overflow", overflow)
+        object.__setattr__(self, "_reset_autocommit", getattr(raw, "autocommit", False))
+
+    @property
+    def closed(self) -> bool:
+        return self._raw is None
+
+    def _require_raw(self) -> Any:
+        raw = self._raw
+        if raw is None:
+            raise RuntimeError("Attempt to use a pooled connection after it was closed")
+        return raw
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._require_raw(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._require_raw(), name, value)
+
+    def cursor(self) -> Any:
+        cur = self._require_raw().cursor()
+        # Tracked so unconsumed result sets are freed before the session is reused.
+        self._cursors.append(cur)
+        return cur
+
+    def execute(self, sql: str, *params: Any) -> Any:
+        return self.cursor().execute(sql, *params)
+
+    def commit(self) -> None:
+        self._require_raw().commit()
+
+    def discard_on_release(self) -> None:
+        """Close the session on release instead of pooling it (session state was changed)."""
+        object.__setattr__(self, "_discard", True)
+
+    def rollback(self) -> None:
+        self._require_raw().rollback()
+
+    def close(self) -> None:
+        raw = self._raw
+        if raw is None:
+            return
+        object.__setattr__(self, "_raw", None)
+        cursors = self._cursors
+        object.__setattr__(self, "_cursors", [])
+        for cur in cursors:
+            _close_quietly(cur)
+        self._pool._release(
+            raw,
+            overflow=self._overflow,
+            autocommit=self._reset_autocommit,
+            discard=self._discard,
+        )
+
+    def __enter__(self) -> PooledConnection:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Mirror pyodbc: commit on success, roll back on error (unless autocommit).
+        raw = self._raw
+        if raw is not None:
+            try:
+                if not getattr(raw, "autocommit", False):
+                    if exc_type is None:
+                        raw.commit()
+                    else:
+                        try:
+                            raw.rollback()
+                        except Exception:
+                            # Never mask the caller's exception; release discards the session.
+                            logger.debug("[DB_POOL] rollback on error exit failed", exc_info=True)
+            finally:
+                self.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class SqlConnectionPool:
+    """Bounded, thread-safe pool of live connections for one credential."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_size: int = DB_POOL_MAX_SIZE,
+        idle_timeout: float = DB_POOL_IDLE_TIMEOUT,
+        ping_after: float = DB_POOL_PING_AFTER,
+        checkout_timeout: float = DB_POOL_CHECKOUT_TIMEOUT,
+        stats_interval: float = DB_POOL_STATS_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.max_size = max(1, int(max_size))
+        self.idle_timeout = float(idle_timeout)
+        self.ping_after = float(ping_after)
+        self.checkout_timeout = float(checkout_timeout)
+        self.stats_interval = float(stats_interval)
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._idle: deque[tuple[Any, float]] = deque()
+        self._in_use = 0
+        self._pid = os.getpid()
+        self._last_stats_emit = clock()
+        self._counters: dict[str, float] = {
+            "checkouts": 0,
+            "hits": 0,
+            "misses": 0,
+            "overflow": 0,
+            "waits": 0,
+            "wait_ms_total": 0.0,
+            "wait_ms_max": 0.0,
+            "ping_failures": 0,
+            "evicted_idle": 0,
+            "discarded": 0,
+        }
+
+    # ----- checkout -----
+    def acquire(self, factory: ConnectionFactory) -> PooledConnection:
+        started = self._clock()
+        deadline = started + self.checkout_timeout
+        waited = False
+        while True:
+            raw = None
+            reserve_new = False
+            overflow = False
+            with self._cond:
+                self._reset_after_fork_locked()
+                self._evict_idle_locked()
+                while not self._idle and self._in_use >= self.max_size:
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        overflow = True
+                        break
+                    waited = True
+                    self._cond.wait(remaining)
+                    self._evict_idle_locked()
+                if not overflow:
+                    if self._idle:
+                        raw, last_used = self._idle.pop()
+                    else:
+                        reserve_new = True
+                    self._in_use += 1
+
+            if raw is not None:
+                if self._clock() - last_used < self.ping_after or self._ping(raw):
+                    self._record_checkout(started, waited, hit=True)
+                    return PooledConnection(self, raw)
+                self._discard_slot(raw, counter="ping_failures")
+                continue
+
+            try:
+                raw = factory()
+            except Exception:
+                if reserve_new:
+                    with self._cond:
+                        self._in_use -= 1
+                        self._cond.notify()
+                raise
+            self._record_checkout(started, waited, hit=False, overflow=overflow)
+            return PooledConnection(self, raw, overflow=overflow)
+
+    def _ping(self, raw: Any) -> bool:
+        try:
+            cur = raw.cursor()
+            try:
+                cur.execute("SELECT 1")
+                cur.fetchone()
+            finally:
+                cur.close()
+            return True
+        except Exception:
+            logger.info("[DB_POOL] %s: liveness ping failed; discarding connection", self.name)
+            return False
+
+    # ----- release -----
+    def _release(
+        self, raw: Any, *, overflow: bool, autocommit: bool, discard: bool = False
+    ) -> None:
+        if overflow or os.getpid() != self._pid:
+            _close_quietly(raw)
+            return
+        if discard:
+            self._discard_slot(raw, counter="discarded")
+            return
+        try:
+            if not getattr(raw, "autocommit", False):
+                raw.rollback()
+            if getattr(raw, "autocommit", autocommit) != autocommit:
+                raw.autocommit = autocommit
+            if getattr(raw, "timeout", 0):
+                raw.timeout = 0
+            cur = raw.cursor()
+            try:
+                cur.execute(SESSION_RESET_SQL)
+            finally:
+                cur.close()
+        except Exception:
+            logger.debug("[DB_POOL] %s: reset on release failed", self.name, exc_info=True)
+            self._discard_slot(raw, counter="discarded")
+            return
+        with self._cond:
+            self._in_use = max(0, self._in_use - 1)
+            self._idle.append((raw, self._clock()))
+            self._cond.notify()
+
+    def _discard_slot(self, raw: Any, *, counter: str) -> None:
+        _close_quietly(raw)
+        with self._cond:
+            self._in_use = max(0, self._in_use - 1)
+            self._counters[counter] += 1
+            self._cond.notify()
+
+    # ----- housekeeping -----
+    def _evict_idle_locked(self) -> None:
+        if not self._idle:
+            return
+        cutoff = self._clock() - self.idle_timeout
+        # Oldest entries sit on the left (LIFO reuse keeps the warmest on the right).
+        while self._idle and self._idle[0][1] < cutoff:
+            raw, _ = self._idle.popleft()
+            self._counters["evicted_idle"] += 1
+            _close_quietly(raw)
+
+    def _reset_after_fork_locked(self) -> None:
+        pid = os.getpid()
+        if pid != self._pid:
+            # Never reuse sockets inherited from a parent process.
+            self._idle.clear()
+            self._in_use = 0
+            self._pid = pid
+
+    def _record_checkout(
+        self, started: float, waited: bool, *, hit: bool, overflow: bool = False
+    ) -> None:
+        wait_ms = (self._clock() - started) * 1000.0
+        emit = None
+        with self._cond:
+            c = self._counters
+            c["checkouts"] += 1
+            c["hits" if hit else "misses"] += 1
+            if overflow:
+                c["overflow"] += 1
+            if waited:
+                c["waits"] += 1
+                c["wait_ms_total"] += wait_ms
+                c["wait_ms_max"] = max(c["wait_ms_max"], wait_ms)
+            now = self._clock()
+            if now - self._last_stats_emit >= self.stats_interval:
+                self._last_stats_emit = now
+                emit = self._stats_locked()
+        if overflow:
+            logger.warning(
+                "[DB_POOL] %s: pool exhausted (max=%d) after %.0fms; using overflow connection",
+                self.name,
+                self.max_size,
+                wait_ms,
+            )
+        if emit is not None:
+            _emit_telemetry({"event": "db_pool_stats", **emit})
+
+    def _stats_locked(self) -> dict[str, Any]:
+        c = self._counters
+        checkouts = int(c["checkouts"])
+        return {
+            "pool": self.name,
+            "max_size": self.max_size,
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+            "checkouts": checkouts,
+            "hits": int(c["hits"]),
+            "misses": int(c["misses"]),
+            "hit_rate": round(c["hits"] / checkouts, 4) if checkouts else None,
+            "overflow": int(c["overflow"]),
+            "waits": int(c["waits"]),
+            "wait_ms_avg": round(c["wait_ms_total"] / c["waits"], 2) if c["waits"] else 0.0,
+            "wait_ms_max": round(c["wait_ms_max"], 2),
+            "ping_failures": int(c["ping_failures"]),
+            "evicted_idle": int(c["evicted_idle"]),
+            "discarded": int(c["discarded"]),
+        }
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return self._stats_locked()
+
+    def close_idle(self) -> int:
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+        for raw, _ in idle:
+            _close_quietly(raw)
+        return len(idle)
+
+
+_pools: dict[str, SqlConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(name: str) -> SqlConnectionPool:
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = SqlConnectionPool(name)
+            _pools[name] = pool
+        return pool
+
+
+def acquire_pooled_connection(name: str, factory: ConnectionFactory) -> Any:
+    """Check out a connection for credential ``name``; ``factory`` opens a new one on a miss.
+
+    Returns the raw ``factory()`` result when pooling is disabled via ``DB_POOL_ENABLED=0``.
+    """
+    if not DB_POOL_ENABLED:
+        return factory()
+    return get_pool(name).acquire(factory)
+
+
+def discard_on_release(conn: Any) -> None:
+    """Mark ``conn`` so its session is closed instead of pooled; no-op for unpooled connections.
+
+    Use before changing session state that ``SESSION_RESET_SQL`` cannot undo, such as
+    ``SET IDENTITY_INSERT`` or creating #temp tables.
+    """
+    if isinstance(conn, PooledConnection):
+        conn.discard_on_release()
+
+
+def get_pool_stats() -> dict[str, dict[str, Any]]:
+    with _pools_lock:
+        pools = list(_pools.values())
+    return {p.name: p.stats() for p in pools}
+
+
+def close_all_pools() -> int:
+    """Close every idle pooled connection (shutdown). Returns the number closed."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    closed = 0
+    for pool in pools:
+        stats = pool.stats()
+        closed += pool.close_idle()
+        _emit_telemetry({"event": "db_pool_stats", "final": True, **stats})
+    return closed
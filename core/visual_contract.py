@@ -4,12 +4,12 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
-from io import BytesIO
 from typing import TypeAlias
 
-from PIL import Image, ImageDraw, ImageOps
+from PIL import Image, ImageDraw
 
 from core import visual_text
+from core.avatar_cache import circle_mask, fitted_avatar
 
 Colour: TypeAlias = tuple[int, int, int, int]
 Box: TypeAlias = tuple[int, int, int, int]
@@ -184,20 +184,9 @@ def paste_core_avatar(
     """Paste the invoking-user avatar or the common deterministic fallback."""
     x1, y1, x2, y2 = box
     size = min(x2 - x1, y2 - y1)
-    avatar: Image.Image | None = None
-    if avatar_bytes:
-        try:
-            with Image.open(BytesIO(avatar_bytes)) as source:
-                avatar = ImageOps.fit(
-                    ImageOps.exif_transpose(source).convert("RGBA"),
-                    (size, size),
-                    method=Image.Resampling.LANCZOS,
-                )
-        except Exception:
-            avatar = None
-
-    mask = Image.new("L", (size, size), 0)
-    ImageDraw.Draw(mask).ellipse((0, 0, size - 1, size - 1), fill=255)
+    # Decoded avatars and masks are cached per process and shared; paste reads them only.
+    avatar = fitted_avatar(avatar_bytes, size) if avatar_bytes else None
+    mask = circle_mask(size)
     actual_avatar = avatar is not None
     if avatar is None:
         avatar = Image.new("RGBA", (size, size), (5, 13, 30, 245))
@@ -223,8 +212,8 @@ def paste_core_avatar(
     try:
         canvas.paste(avatar, (x1, y1), mask)
     finally:
-        avatar.close()
-        mask.close()
+        if not actual_avatar:
+            avatar.close()
     ImageDraw.Draw(canvas, "RGBA").ellipse(
         (x1 - 2, y1 - 2, x1 + size + 1, y1 + size + 1),
         outline=(BLUE[0], BLUE[1], BLUE[2], 190),
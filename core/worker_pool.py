@@ -0,0 +1,427 @@
+"""Supervised pool of warm, pre-imported offload worker processes.
+
+Spawning ``maintenance_worker.py`` per offload re-imports pandas, pyodbc and the repo before any
+work starts. This pool keeps up to ``MAINT_POOL_SIZE`` long-lived ``maintenance_worker.py --serve``
+processes that import ``MAINT_POOL_PRELOAD`` once and then execute jobs sent over their
+stdin/stdout pipes as length-prefixed pickle frames.
+
+Pool behaviour:
+- jobs are allowlist-checked inside the worker with the ``MAINT_SPEC_ALLOWLIST`` rules used by
+  ``maintenance_worker.run_callable_spec``
+- a job that exceeds its timeout, or whose awaiting task is cancelled, kills its worker (the only
+  way to interrupt running Python code); the slot is refilled lazily with a fresh worker
+- a worker that dies mid-job (crash or ``file_utils.cancel_offload`` on its pid) fails that job
+  with ``WorkerCrashed``
+- workers are recycled after ``MAINT_POOL_MAX_JOBS`` jobs or once their RSS exceeds
+  ``MAINT_POOL_MAX_RSS_MB``
+
+Registry bookkeeping (``start_offload`` / ``mark_offload_complete``) and telemetry stay in
+``file_utils``; this module only manages processes and frames.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import itertools
+import logging
+import os
+from pathlib import Path
+import pickle
+import signal
+import struct
+import sys
+from typing import Any, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+MAINT_POOL_SIZE = max(1, _env_int("MAINT_POOL_SIZE", 2))
+MAINT_POOL_MAX_JOBS = max(1, _env_int("MAINT_POOL_MAX_JOBS", 50))
+MAINT_POOL_MAX_RSS_MB = _env_float("MAINT_POOL_MAX_RSS_MB", 1024.0)
+MAINT_POOL_START_TIMEOUT = _env_float("MAINT_POOL_START_TIMEOUT", 60.0)
+MAINT_POOL_JOB_TIMEOUT = _env_float("MAINT_POOL_JOB_TIMEOUT", 1800.0)
+MAINT_POOL_PRELOAD_DEFAULT = "pandas,pyodbc,constants,file_utils,utils"
+
+_FRAME_HEADER = struct.Struct(">I")
+_WORKER_PATH = Path(__file__).resolve().parent.parent / "maintenance_worker.py"
+
+
+def worker_pool_enabled() -> bool:
+    return os.getenv("MAINT_WORKER_POOL", "1").strip().lower() not in ("0", "false", "no")
+
+
+class WorkerPoolUnavailable(RuntimeError):
+    """The pool could not run the job (worker failed to start, payload not picklable)."""
+
+
+class WorkerCrashed(RuntimeError):
+    """The worker process exited while a job was running."""
+
+
+class WorkerJobTimeout(TimeoutError):
+    """The job exceeded its timeout; its worker was killed."""
+
+
+# ---------------------------
+# Frame protocol (shared with maintenance_worker --serve)
+# ---------------------------
+def encode_frame(obj: Any) -> bytes:
+    body = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    return _FRAME_HEADER.pack(len(body)) + body
+
+
+def _read_exact(stream: BinaryIO, n: int) -> bytes | None:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = stream.read(n - len(buf))
+        if not chunk:
+            return None
+        buf += chunk
+    return bytes(buf)
+
+
+def read_frame(stream: BinaryIO) -> Any | None:
+    """Blocking read of one frame; returns None on EOF (parent went away)."""
+    header = _read_exact(stream, _FRAME_HEADER.size)
+    if header is None:
+        return None
+    (length,) = _FRAME_HEADER.unpack(header)
+    body = _read_exact(stream, length)
+    if body is None:
+        return None
+    return pickle.loads(body)
+
+
+def write_frame(stream: BinaryIO, obj: Any) -> None:
+    stream.write(encode_frame(obj))
+    stream.flush()
+
+
+async def _read_frame_async(reader: asyncio.StreamReader) -> Any:
+    header = await reader.readexactly(_FRAME_HEADER.size)
+    (length,) = _FRAME_HEADER.unpack(header)
+    return pickle.loads(await reader.readexactly(length))
+
+
+def current_rss_mb() -> float | None:
+    try:
+        import psutil  # type: ignore
+
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except Exception:
+        return None
+
+
+# ---------------------------
+# Supervisor
+# ---------------------------
+@dataclass(eq=False)
+class _Worker:
+    proc: asyncio.subprocess.Process
+    jobs: int = 0
+    rss_mb: float | None = None
+    stderr_tail: deque[str] = field(default_factory=lambda: deque(maxlen=50))
+    drain_task: asyncio.Task | None = None
+
+    @property
+    def pid(self) -> int:
+        return self.proc.pid
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.returncode is None
+
+
+class WarmWorkerPool:
+    """Bounded set of warm worker processes bound to the running event loop."""
+
+    def __init__(
+        self,
+        *,
+        size: int = MAINT_POOL_SIZE,
+        max_jobs: int = MAINT_POOL_MAX_JOBS,
+        max_rss_mb: float = MAINT_POOL_MAX_RSS_MB,
+        start_timeout: float = MAINT_POOL_START_TIMEOUT,
+        preload: str | None = None,
+        worker_cmd: list[str] | None = None,
+    ) -> None:
+        self.size = max(1, int(size))
+        self.max_jobs = max(1, int(max_jobs))
+        self.max_rss_mb = float(max_rss_mb)
+        self.start_timeout = float(start_timeout)
+        self.preload = (
+            preload
+            if preload is not None
+            else os.getenv("MAINT_POOL_PRELOAD", MAINT_POOL_PRELOAD_DEFAULT)
+        )
+        self.worker_cmd = worker_cmd or [sys.executable, str(_WORKER_PATH), "--serve"]
+        self.loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(self.size)
+        self._idle: list[_Worker] = []
+        self._workers: set[_Worker] = set()
+        # Killed/retired workers not yet reaped; shutdown() awaits them.
+        self._exiting: list[_Worker] = []
+        self._job_ids = itertools.count(1)
+        self._closed = False
+        self._counters: dict[str, int] = {
+            "jobs": 0,
+            "spawned": 0,
+            "recycled": 0,
+            "killed": 0,
+            "crashed": 0,
+        }
+
+    # ----- process lifecycle -----
+    async def _spawn(self) -> _Worker:
+        env = os.environ.copy()
+        env["MAINT_SUBPROC"] = "1"
+        env["MAINT_POOL_WORKER"] = "1"
+        env["MAINT_POOL_PRELOAD"] = self.preload
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self.worker_cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+                cwd=str(_WORKER_PATH.parent),
+            )
+        except Exception as exc:
+            raise WorkerPoolUnavailable(f"failed to start pool worker: {exc}") from exc
+
+        worker = _Worker(proc=proc)
+        worker.drain_task = asyncio.create_task(self._drain_stderr(worker))
+        self._workers.add(worker)
+        try:
+            ready = await asyncio.wait_for(
+                _read_frame_async(proc.stdout), timeout=self.start_timeout
+            )
+        except Exception as exc:
+            self._kill(worker)
+            tail = "\n".join(worker.stderr_tail)
+            raise WorkerPoolUnavailable(f"pool worker did not become ready: {exc!r}\n{tail}")
+        if not isinstance(ready, dict) or ready.get("type") != "ready":
+            self._kill(worker)
+            raise WorkerPoolUnavailable(f"unexpected pool worker handshake: {ready!r}")
+
+        self._counters["spawned"] += 1
+        logger.info(
+            "[WORKER_POOL] worker pid=%s ready (preloaded=%s, failed=%s)",
+            worker.pid,
+            ready.get("preloaded"),
+            ready.get("preload_failed"),
+        )
+        return worker
+
+    async def _drain_stderr(self, worker: _Worker) -> None:
+        stream = worker.proc.stderr
+        if stream is None:
+            return
+        try:
+            while True:
+                line = await stream.readline()
+                if not line:
+                    return
+                worker.stderr_tail.append(line.decode("utf-8", errors="replace").rstrip())
+        except Exception:
+            return
+
+    def _kill(self, worker: _Worker) -> None:
+        self._workers.discard(worker)
+        self._exiting.append(worker)
+        if worker.alive:
+            self._counters["killed"] += 1
+            try:
+                worker.proc.kill()
+            except Exception:
+                logger.debug("[WORKER_POOL] kill pid=%s failed", worker.pid, exc_info=True)
+
+    def _retire(self, worker: _Worker) -> None:
+        self._workers.discard(worker)
+        self._exiting.append(worker)
+        self._counters["recycled"] += 1
+        try:
+            if worker.proc.stdin is not None:
+                worker.proc.stdin.write(encode_frame({"type": "shutdown"}))
+                worker.proc.stdin.close()
+        except Exception:
+            self._kill(worker)
+
+    def _should_recycle(self, worker: _Worker) -> bool:
+        if worker.jobs >= self.max_jobs:
+            return True
+        return bool(self.max_rss_mb > 0 and worker.rss_mb and worker.rss_mb > self.max_rss_mb)
+
+    async def _checkout(self) -> _Worker:
+        self._exiting = [w for w in self._exiting if w.alive]
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.alive:
+                return worker
+            self._workers.discard(worker)
+        return await self._spawn()
+
+    # ----- jobs -----
+    async def run(
+        self,
+        job: dict[str, Any],
+        *,
+        timeout: float | None = None,
+        on_start: Callable[[int], None] | None = None,
+    ) -> dict[str, Any]:
+        """Run one job on a warm worker and return its reply frame.
+
+        ``on_start`` receives the worker pid once the job is assigned (registry hook).
+        """
+        if self._closed:
+            raise WorkerPoolUnavailable("worker pool is shut down")
+        job = dict(job)
+        job.setdefault("type", "job")
+        job["job_id"] = next(self._job_ids)
+        try:
+            frame = encode_frame(job)
+        except Exception as exc:
+            raise WorkerPoolUnavailable(f"job payload is not picklable: {exc}") from exc
+
+        async with self._slots:
+            worker = await self._checkout()
+            if on_start is not None:
+                try:
+                    on_start(worker.pid)
+                except Exception:
+                    logger.debug("[WORKER_POOL] on_start hook failed", exc_info=True)
+            try:
+                worker.proc.stdin.write(frame)
+                await worker.proc.stdin.drain()
+                reply = await asyncio.wait_for(_read_frame_async(worker.proc.stdout), timeout)
+            except TimeoutError:
+                self._kill(worker)
+                raise WorkerJobTimeout(f"pool job exceeded {timeout}s; worker {worker.pid} killed")
+            except asyncio.CancelledError:
+                self._kill(worker)
+                raise
+            except (asyncio.IncompleteReadError, BrokenPipeError, ConnectionResetError) as exc:
+                self._counters["crashed"] += 1
+                self._kill(worker)
+                tail = "\n".join(worker.stderr_tail)
+                raise WorkerCrashed(f"pool worker {worker.pid} exited mid-job: {exc!r}\n{tail}")
+
+            self._counters["jobs"] += 1
+            worker.jobs += 1
+            worker.rss_mb = reply.get("rss_mb") if isinstance(reply, dict) else None
+            if self._should_recycle(worker):
+                logger.info(
+                    "[WORKER_POOL] recycling pid=%s after %d jobs (rss=%.1fMB)",
+                    worker.pid,
+                    worker.jobs,
+                    worker.rss_mb or 0.0,
+                )
+                self._retire(worker)
+            else:
+                self._idle.append(worker)
+            return reply
+
+    async def warm_up(self, count: int | None = None) -> int:
+        """Pre-spawn up to ``count`` idle workers (default: pool size); never raises."""
+        target = min(self.size, count or self.size)
+        started = 0
+        try:
+            while len(self._workers) < target:
+                self._idle.append(await self._spawn())
+                started += 1
+        except WorkerPoolUnavailable as exc:
+            logger.warning("[WORKER_POOL] warm-up stopped after %d worker(s): %s", started, exc)
+        return started
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": self.size,
+            "workers": len(self._workers),
+            "idle": len(self._idle),
+            "worker_pids": sorted(w.pid for w in self._workers),
+            **self._counters,
+        }
+
+    def abandon(self) -> None:
+        """Kill every worker without awaiting (the owning loop may already be closed)."""
+        self._closed = True
+        self._idle.clear()
+        for worker in list(self._workers):
+            self._workers.discard(worker)
+            try:
+                worker.proc.kill()
+            except Exception:
+                try:
+                    os.kill(worker.pid, signal.SIGTERM)
+                except Exception:
+                    pass
+
+    async def shutdown(self, grace: float = 5.0) -> None:
+        self._closed = True
+        self._idle.clear()
+        for worker in list(self._workers):
+            self._retire(worker)
+        exiting, self._exiting = self._exiting, []
+        for worker in exiting:
+            try:
+                await asyncio.wait_for(worker.proc.wait(), timeout=grace)
+            except Exception:
+                self._kill(worker)
+                await worker.proc.wait()
+            if worker.drain_task is not None:
+                await asyncio.gather(worker.drain_task, return_exceptions=True)
+
+
+# One pool per event loop: asyncio subprocess pipes belong to the loop that spawned them.
+_pools: dict[asyncio.AbstractEventLoop, WarmWorkerPool] = {}
+
+
+def _reap_closed_loop_pools() -> None:
+    for loop, pool in list(_pools.items()):
+        if loop.is_closed():
+            # Nothing can still be awaiting these workers; their loop is gone.
+            del _pools[loop]
+            pool.abandon()
+
+
+def get_worker_pool() -> WarmWorkerPool:
+    """Return the running loop's pool; pools owned by other live loops are left running."""
+    loop = asyncio.get_running_loop()
+    _reap_closed_loop_pools()
+    pool = _pools.get(loop)
+    if pool is None or pool._closed:
+        pool = _pools[loop] = WarmWorkerPool()
+    return pool
+
+
+def get_worker_pool_stats() -> dict[str, Any] | None:
+    try:
+        pool = _pools.get(asyncio.get_running_loop())
+    except RuntimeError:
+        pool = next(iter(_pools.values()), None)
+    return pool.stats() if pool is not None else None
+
+
+async def shutdown_worker_pool() -> None:
+    """Shut down the running loop's pool and abandon pools whose loop has closed."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    _reap_closed_loop_pools()
+    if pool is not None:
+        await pool.shutdown()
@@ -0,0 +1,226 @@
+"""Streaming XLSX reader shared by the upload importers.
+
+The importers used to go through ``pd.read_excel`` / ``pd.ExcelFile``, which wraps every cell in
+an openpyxl cell object and converts it one method call at a time; the prekvk importer re-opened
+the workbook and parsed *every* sheet whenever its preferred sheet was missing. Here:
+
+- ``open_workbook(content)`` opens the workbook once; ``sheet_names`` comes from the workbook
+  index without parsing any cells
+- ``read_sheet(name)`` streams only that sheet as plain row tuples (openpyxl read-only
+  ``values_only``), stops after ``nrows`` when asked, and ``header(name)`` reads only the header
+- rows go through pandas' own ``TextParser`` with ``read_excel``'s options, so column dtypes,
+  NA handling and ``Unnamed: n`` / duplicate headers match what the importers got before
+- with ``XLSX_ENGINE=auto`` (default) the Rust ``python-calamine`` engine is used when it is
+  installed; ``openpyxl`` forces the streaming path and ``pandas`` the old ``pd.ExcelFile`` path
+  (kept for comparison in ``scripts/benchmark_kvk_all_phase9.py``)
+
+Missing sheets raise ``ValueError("Worksheet named '<name>' not found")`` like pandas does.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timedelta
+from io import BytesIO
+import logging
+import os
+from typing import Any
+
+import pandas as pd
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
+
+logger = logging.getLogger(__name__)
+
+ENGINES = ("calamine", "openpyxl", "pandas")
+
+Source = bytes | bytearray | str | os.PathLike[str]
+
+
+def calamine_available() -> bool:
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def xlsx_engine(preferred: str | None = None) -> str:
+    """Engine for ``preferred`` or ``XLSX_ENGINE``; ``auto`` picks calamine when installed."""
+    choice = (preferred or os.getenv("XLSX_ENGINE", "auto")).strip().lower()
+    if choice == "calamine" and not calamine_available():
+        logger.warning("[XLSX] XLSX_ENGINE=calamine but python-calamine is missing; using openpyxl")
+        return "openpyxl"
+    if choice in ENGINES:
+        return choice
+    return "calamine" if calamine_available() else "openpyxl"
+
+
+def _openpyxl_rows(worksheet: Any) -> Iterator[Iterable[Any]]:
+    from openpyxl.cell.cell import ERROR_CODES
+
+    # Read-only sheets trust the stored <dimension>, which some exporters get wrong.
+    worksheet.reset_dimensions()
+    for row in worksheet.iter_rows(values_only=True):
+        # Same conversions as pandas' openpyxl reader.
+        yield [
+            (
+                ""
+                if value is None
+                else (
+                    int(value)
+                    if type(value) is float and value.is_integer()
+                    else (float("nan") if value in ERROR_CODES else value)
+                )
+            )
+            for value in row
+        ]
+
+
+def _calamine_rows(sheet: Any, limit: int | None) -> Iterator[Iterable[Any]]:
+    for row in sheet.to_python(skip_empty_area=False, nrows=limit):
+        out = []
+        for value in row:
+            # Same conversions as pandas' calamine reader.
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            elif isinstance(value, (datetime, date)):
+                value = pd.Timestamp(value)
+            elif isinstance(value, timedelta):
+                value = pd.Timedelta(value)
+            out.append(value)
+        yield out
+
+
+def _collect(rows: Iterable[Iterable[Any]], limit: int | None) -> list[list[Any]]:
+    """Rows trimmed and padded exactly like pandas' Excel readers do before parsing."""
+    data: list[list[Any]] = []
+    last_with_data = -1
+    for number, row in enumerate(rows):
+        values = list(row)
+        while values and values[-1] == "":
+            values.pop()
+        if values:
+            last_with_data = number
+        data.append(values)
+        if limit is not None and len(data) >= limit:
+            break
+    data = data[: last_with_data + 1]
+    if data:
+        width = max(len(values) for values in data)
+        data = [values + [""] * (width - len(values)) for values in data]
+    return data
+
+
+class XlsxWorkbook:
+    """An open workbook; read sheets with ``read_sheet`` and close it (or use ``with``)."""
+
+    def __init__(self, source: Source, *, engine: str | None = None) -> None:
+        self.engine = xlsx_engine(engine)
+        if isinstance(source, (bytes, bytearray)):
+            source = BytesIO(bytes(source))
+        self._book: Any
+        if self.engine == "calamine":
+            from python_calamine import CalamineWorkbook
+
+            if isinstance(source, BytesIO):
+                self._book = CalamineWorkbook.from_filelike(source)
+            else:
+                self._book = CalamineWorkbook.from_path(os.fspath(source))
+            self.sheet_names = list(self._book.sheet_names)
+        elif self.engine == "openpyxl":
+            from openpyxl import load_workbook
+
+            self._book = load_workbook(source, read_only=True, data_only=True, keep_links=False)
+            self.sheet_names = list(self._book.sheetnames)
+        else:
+            self._book = pd.ExcelFile(source, engine="openpyxl")
+            self.sheet_names = list(self._book.sheet_names)
+
+    def __enter__(self) -> XlsxWorkbook:
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        book, self._book = self._book, None
+        if book is None:
+            return
+        try:
+            book.close()
+        except Exception:
+            logger.debug("[XLSX] workbook close failed", exc_info=True)
+
+    def _sheet_title(self, sheet_name: str | int) -> str:
+        if isinstance(sheet_name, int):
+            if not 0 <= sheet_name < len(self.sheet_names):
+                raise ValueError(
+                    f"Worksheet index {sheet_name} is invalid, "
+                    f"{len(self.sheet_names)} worksheets found"
+                )
+            return self.sheet_names[sheet_name]
+        if sheet_name not in self.sheet_names:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+        return sheet_name
+
+    def _rows(self, title: str, limit: int | None) -> list[list[Any]]:
+        if self.engine == "calamine":
+            sheet = self._book.get_sheet_by_name(title)
+            return _collect(_calamine_rows(sheet, limit), limit)
+        return _collect(_openpyxl_rows(self._book[title]), limit)
+
+    def header(self, sheet_name: str | int = 0, *, header: int = 0) -> list[Any]:
+        """Header cells of ``sheet_name`` (blanks as ``""``); reads only up to the header row."""
+        title = self._sheet_title(sheet_name)
+        if self.engine == "pandas":
+            return list(self._book.parse(title, header=header, nrows=0).columns)
+        rows = self._rows(title, header + 1)
+        return list(rows[header]) if len(rows) > header else []
+
+    def read_sheet(
+        self,
+        sheet_name: str | int = 0,
+        *,
+        header: int | None = 0,
+        nrows: int | None = None,
+    ) -> pd.DataFrame:
+        """One sheet as a DataFrame, parsed like ``pd.read_excel(sheet_name=..., header=...)``."""
+        title = self._sheet_title(sheet_name)
+        if self.engine == "pandas":
+            return self._book.parse(title, header=header, nrows=nrows)
+
+        limit = None if nrows is None else (header or 0) + 1 + nrows
+        data = self._rows(title, limit)
+        if not data:
+            return pd.DataFrame()
+        try:
+            parser = TextParser(
+                data,
+                header=header,
+                index_col=None,
+                has_index_names=False,
+                nrows=nrows,
+                skip_blank_lines=False,
+            )
+            return parser.read(nrows=nrows)
+        except EmptyDataError:
+            return pd.DataFrame()
+
+
+def open_workbook(source: Source, *, engine: str | None = None) -> XlsxWorkbook:
+    """Open ``source`` (bytes or a path); raises whatever the engine raises for bad files."""
+    return XlsxWorkbook(source, engine=engine)
+
+
+def read_xlsx_sheet(
+    source: Source,
+    sheet_name: str | int = 0,
+    *,
+    header: int | None = 0,
+    nrows: int | None = None,
+    engine: str | None = None,
+) -> pd.DataFrame:
+    """Drop-in for ``pd.read_excel(source, sheet_name=..., header=...)`` reading one sheet."""
+    with open_workbook(source, engine=engine) as workbook:
+        return workbook.read_sheet(sheet_name, header=header, nrows=nrows)
@@ -7,6 +7,7 @@ import json
 import logging
 from typing import Any
 
+from core.sql_pool import discard_on_release
 from file_utils import get_conn_with_retries
 
 logger = logging.getLogger(__name__)
@@ -364,6 +365,8 @@ def write_event_instances(*, conn, instances: list[dict[str, Any]]) -> int:
     cur.execute("DELETE FROM dbo.EventInstances")
 
     if preserved_pairs:
+        # IDENTITY_INSERT stays ON if we fail before the OFF; never pool that session.
+        discard_on_release(conn)
         cur.execute("SET IDENTITY_INSERT dbo.EventInstances ON")
         for preserved_id, instance in preserved_pairs:
             _insert_event_instance(cur, instance, instance_id=preserved_id)
@@ -62,6 +62,16 @@ def parse_event_start_utc(event: Mapping[str, Any]) -> datetime | None:
         return None
 
 
+def parse_event_end_utc(event: Mapping[str, Any]) -> datetime | None:
+    raw = str(event.get("end_utc") or "").strip()
+    if not raw:
+        return parse_event_start_utc(event)
+    try:
+        return as_utc(datetime.fromisoformat(raw.replace("Z", "+00:00")))
+    except Exception:
+        return parse_event_start_utc(event)
+
+
 def event_display_name(event: Mapping[str, Any]) -> str:
     title = str(event.get("title") or event.get("Title") or "(untitled)").strip()
     variant = str(event.get("variant") or event.get("Variant") or "").strip()
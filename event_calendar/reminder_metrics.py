@@ -28,11 +28,14 @@ class ReminderStatusService:
             "skipped_prefs": 0,
             "skipped_already_sent": 0,
             "skipped_unknown_type": 0,
+            "skipped_undeliverable": 0,
             "failures": 0,
             "failed_forbidden": 0,
             "failed_not_found": 0,
             "failed_http_exception": 0,
             "failed_unknown": 0,
+            "delivery_elapsed_ms": 0.0,
+            "delivery_p95_ms": 0.0,
         }
 
     def record_summary(self, *, summary: Any, dry_run: bool) -> None:
@@ -47,11 +50,14 @@ class ReminderStatusService:
             "skipped_prefs": int(getattr(summary, "skipped_prefs", 0) or 0),
             "skipped_already_sent": int(getattr(summary, "skipped_already_sent", 0) or 0),
             "skipped_unknown_type": int(getattr(summary, "skipped_unknown_type", 0) or 0),
+            "skipped_undeliverable": int(getattr(summary, "skipped_undeliverable", 0) or 0),
             "failures": int(getattr(summary, "failures", 0) or 0),
             "failed_forbidden": int(getattr(summary, "failed_forbidden", 0) or 0),
             "failed_not_found": int(getattr(summary, "failed_not_found", 0) or 0),
             "failed_http_exception": int(getattr(summary, "failed_http_exception", 0) or 0),
             "failed_unknown": int(getattr(summary, "failed_unknown", 0) or 0),
+            "delivery_elapsed_ms": float(getattr(summary, "delivery_elapsed_ms", 0.0) or 0.0),
+            "delivery_p95_ms": float(getattr(summary, "delivery_p95_ms", 0.0) or 0.0),
         }
         with self._lock:
             self._last = payload
@@ -1,17 +1,45 @@
+"""Sent-state for calendar reminder DMs.
+
+Sent markers (``instance|user|type`` -> sent-at ISO) live in an append-only JSONL log next to the
+legacy JSON file (``event_calendar_reminder_state.jsonl``). ``mark_sent`` updates the in-memory
+index and ``save()`` appends only the new markers. The log is compacted (rewritten with just the
+live markers) once dead lines outnumber live ones, and at least daily; markers for instances whose
+end time has passed are dropped then. A legacy ``{"sent": {...}}`` JSON file is migrated into the
+log once by ``migrate_legacy_state()`` (run at reminder-loop startup under the writer lock) and
+renamed to ``*.migrated``.
+
+Parsed logs are cached per path and extended by reading only the appended tail. ``load()`` is the
+read path: it returns read-only views over the cached index without copying it, and never writes.
+The dispatcher uses ``load_for_update()``, which returns private copies it can mark and save.
+Tail reads publish new dicts rather than mutating ones a view may still be iterating.
+"""
+
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
 import json
+import logging
+import os
 from pathlib import Path
+import threading
+from types import MappingProxyType
 from typing import Any
 
 from constants import DATA_DIR
-from file_utils import atomic_write_json
 
-STATE_SCHEMA_VERSION = 1
+logger = logging.getLogger(__name__)
+
 DEFAULT_REMINDER_STATE_PATH = Path(DATA_DIR) / "event_calendar_reminder_state.json"
 
+# Markers written without an instance end time (e.g. migrated ones) expire this long after sending.
+DEFAULT_MARKER_RETENTION = timedelta(days=30)
+# Compaction runs once the log holds at least this many dead lines and more dead than live lines,
+# and at least this often so markers for finished instances are dropped.
+COMPACT_MIN_DEAD_LINES = 256
+COMPACT_INTERVAL = timedelta(hours=24)
+
 
 def _utcnow() -> datetime:
     return datetime.now(UTC)
@@ -31,36 +59,241 @@ def make_key(event_instance_id: str, user_id: int, reminder_type: str) -> str:
     return f"{str(event_instance_id).strip()}|{int(user_id)}|{str(reminder_type).strip().lower()}"
 
 
+def log_path_for(path: Path) -> Path:
+    return path.with_suffix(".jsonl")
+
+
+@dataclass
+class _LogIndex:
+    inode: int
+    offset: int
+    lines: int
+    sent: dict[str, str]
+    expires: dict[str, str]
+    compacted_at: str | None = None
+
+
+_INDEX_CACHE: dict[Path, _LogIndex] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def _apply_lines(raw: bytes, index: _LogIndex) -> int:
+    """Apply complete JSONL lines to ``index``; returns the bytes consumed."""
+    end = raw.rfind(b"\n") + 1
+    for line in raw[:end].splitlines():
+        if not line.strip():
+            continue
+        try:
+            rec = json.loads(line)
+        except Exception:
+            logger.warning("[CALENDAR][STATE] skipping unreadable sent-log line")
+            continue
+        if not isinstance(rec, dict):
+            continue
+        if rec.get("compacted_at"):
+            index.compacted_at = str(rec["compacted_at"])
+            continue
+        key = rec.get("k")
+        if not key:
+            continue
+        index.sent[key] = str(rec.get("t") or "")
+        if rec.get("x"):
+            index.expires[key] = str(rec["x"])
+        index.lines += 1
+    return end
+
+
+def _read_log(log_path: Path) -> _LogIndex | None:
+    """Return the cached index for ``log_path``; its dicts must be treated as immutable."""
+    try:
+        st = log_path.stat()
+    except FileNotFoundError:
+        return None
+
+    with _INDEX_LOCK:
+        index = _INDEX_CACHE.get(log_path)
+        if index is None or index.inode != st.st_ino or index.offset > st.st_size:
+            index = _LogIndex(inode=st.st_ino, offset=0, lines=0, sent={}, expires={})
+        if index.offset < st.st_size:
+            with log_path.open("rb") as f:
+                f.seek(index.offset)
+                raw = f.read()
+            index = replace(index, sent=dict(index.sent), expires=dict(index.expires))
+            index.offset += _apply_lines(raw, index)
+        _INDEX_CACHE[log_path] = index
+        return index
+
+
+def _read_legacy(path: Path) -> dict[str, str]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    sent = raw.get("sent", {}) if isinstance(raw, dict) else {}
+    if not isinstance(sent, dict):
+        return {}
+    return {str(k): str(v) for k, v in sent.items()}
+
+
+def migrate_legacy_state(path: Path | None = None) -> bool:
+    """Fold a legacy JSON sent-state into the log once; call with the writer lock held."""
+    resolved = path or DEFAULT_REMINDER_STATE_PATH
+    if log_path_for(resolved).exists() or not resolved.exists():
+        return False
+    CalendarReminderState._migrate_legacy(resolved)
+    return True
+
+
+def _record(key: str, sent_at: str, expires_at: str | None) -> str:
+    rec: dict[str, Any] = {"k": key, "t": sent_at}
+    if expires_at:
+        rec["x"] = expires_at
+    return json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
 @dataclass
 class CalendarReminderState:
     path: Path = field(default_factory=lambda: DEFAULT_REMINDER_STATE_PATH)
-    sent: dict[str, str] = field(default_factory=dict)
+    sent: Mapping[str, str] = field(default_factory=dict)
+    expires: Mapping[str, str] = field(default_factory=dict)
+    _pending: list[str] = field(default_factory=list, repr=False)
+    _log_lines: int = field(default=0, repr=False)
+    _compacted_at: str | None = field(default=None, repr=False)
+    _read_only: bool = field(default=False, repr=False)
+
+    @property
+    def log_path(self) -> Path:
+        return log_path_for(self.path)
 
     @classmethod
     def load(cls, path: Path | None = None) -> CalendarReminderState:
+        """Return a read-only view of the sent markers; never copies the index or writes."""
+        resolved = path or DEFAULT_REMINDER_STATE_PATH
+        index = cls._read_index(resolved)
+        if index is not None:
+            return cls(
+                path=resolved,
+                sent=MappingProxyType(index.sent),
+                expires=MappingProxyType(index.expires),
+                _log_lines=index.lines,
+                _compacted_at=index.compacted_at,
+                _read_only=True,
+            )
+        legacy = _read_legacy(resolved) if resolved.exists() else {}
+        return cls(path=resolved, sent=MappingProxyType(legacy), _read_only=True)
+
+    @classmethod
+    def load_for_update(cls, path: Path | None = None) -> CalendarReminderState:
+        """Return a private, writable copy for the dispatcher (which holds the writer lock)."""
         resolved = path or DEFAULT_REMINDER_STATE_PATH
-        if not resolved.exists():
-            return cls(path=resolved)
+        index = cls._read_index(resolved)
+        if index is not None:
+            return cls(
+                path=resolved,
+                sent=dict(index.sent),
+                expires=dict(index.expires),
+                _log_lines=index.lines,
+                _compacted_at=index.compacted_at,
+            )
+        if resolved.exists():
+            return cls._migrate_legacy(resolved)
+        return cls(path=resolved)
 
+    @staticmethod
+    def _read_index(path: Path) -> _LogIndex | None:
+        log_path = log_path_for(path)
         try:
-            raw = json.loads(resolved.read_text(encoding="utf-8"))
+            return _read_log(log_path)
         except Exception:
-            return cls(path=resolved)
+            logger.exception("[CALENDAR][STATE] failed to read sent-log %s", log_path)
+            return None
 
-        sent = raw.get("sent", {})
-        if not isinstance(sent, dict):
-            sent = {}
-        return cls(path=resolved, sent=sent)
+    @classmethod
+    def _migrate_legacy(cls, path: Path) -> CalendarReminderState:
+        state = cls(path=path, sent=_read_legacy(path))
+        try:
+            state.compact(now=_utcnow())
+            os.replace(path, path.with_name(path.name + ".migrated"))
+            logger.info(
+                "[CALENDAR][STATE] migrated %d sent markers from %s to %s",
+                len(state.sent),
+                path,
+                state.log_path,
+            )
+        except Exception:
+            logger.exception("[CALENDAR][STATE] legacy sent-state migration failed for %s", path)
+        return state
+
+    def save(self, *, now: datetime | None = None) -> None:
+        """Append markers recorded since the last save; compact when the log is mostly dead."""
+        self._writable()
+        if self._pending:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.log_path.open("a", encoding="utf-8") as f:
+                f.writelines(self._pending)
+                f.flush()
+                os.fsync(f.fileno())
+            self._log_lines += len(self._pending)
+            self._pending.clear()
+
+        dead = self._log_lines - len(self.sent)
+        current = now or _utcnow()
+        if (dead >= COMPACT_MIN_DEAD_LINES and dead > len(self.sent)) or self._compaction_overdue(
+            current
+        ):
+            self.compact(now=current)
+
+    def compact(self, *, now: datetime | None = None) -> int:
+        """Rewrite the log with live markers only; returns how many expired markers were dropped."""
+        sent, expires = self._writable()
+        current = now or _utcnow()
+        expired = [key for key in sent if self._is_expired(key, current)]
+        for key in expired:
+            sent.pop(key, None)
+            expires.pop(key, None)
 
-    def save(self) -> None:
-        payload: dict[str, Any] = {
-            "schema_version": STATE_SCHEMA_VERSION,
-            "sent": self.sent,
-        }
-        atomic_write_json(self.path, payload)
+        lines = [_record(k, v, self.expires.get(k)) for k, v in self.sent.items()]
+        self._compacted_at = _to_iso(current)
+        log_path = self.log_path
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = log_path.with_suffix(log_path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            f.write(json.dumps({"compacted_at": self._compacted_at}) + "\n")
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, log_path)
+        self._pending.clear()
+        self._log_lines = len(lines)
 
-    def mark_sent(self, key: str, sent_at: datetime | None = None) -> None:
-        self.sent[key] = _to_iso(sent_at or _utcnow())
+        with _INDEX_LOCK:
+            _INDEX_CACHE.pop(log_path, None)
+        logger.info(
+            "[CALENDAR][STATE] compacted sent-log live=%d dropped_expired=%d",
+            len(lines),
+            len(expired),
+        )
+        return len(expired)
+
+    def mark_sent(
+        self,
+        key: str,
+        sent_at: datetime | None = None,
+        *,
+        expires_at: datetime | None = None,
+    ) -> None:
+        sent, expires = self._writable()
+        sent_iso = _to_iso(sent_at or _utcnow())
+        expires_iso = _to_iso(expires_at) if expires_at is not None else None
+        sent[key] = sent_iso
+        if expires_iso:
+            expires[key] = expires_iso
+        self._pending.append(_record(key, sent_iso, expires_iso))
+
+    def _writable(self) -> tuple[dict[str, str], dict[str, str]]:
+        if self._read_only or not isinstance(self.sent, dict) or not isinstance(self.expires, dict):
+            raise RuntimeError("CalendarReminderState.load() is read-only; use load_for_update()")
+        return self.sent, self.expires
 
     def was_sent(self, key: str) -> bool:
         return key in self.sent
@@ -74,6 +307,24 @@ class CalendarReminderState:
         except Exception:
             return None
 
+    def _compaction_overdue(self, now: datetime) -> bool:
+        if not self._compacted_at:
+            return self._log_lines > 0
+        try:
+            return _from_iso(self._compacted_at) + COMPACT_INTERVAL < now
+        except Exception:
+            return True
+
+    def _is_expired(self, key: str, now: datetime) -> bool:
+        try:
+            raw = self.expires.get(key)
+            if raw:
+                return _from_iso(raw) < now
+            sent = self.sent_at(key)
+            return sent is not None and sent + DEFAULT_MARKER_RETENTION < now
+        except Exception:
+            return False
+
     def should_send_with_grace(
         self,
         *,
@@ -13,6 +13,15 @@ from constants import (
     EVENT_CALENDAR_REMINDER_LOOP_SECONDS,
     EVENT_CALENDAR_REMINDERS_DRY_RUN,
 )
+from core.dm_delivery import (
+    STATUS_FORBIDDEN,
+    STATUS_HTTP_EXCEPTION,
+    STATUS_NOT_FOUND,
+    STATUS_SENT,
+    STATUS_SUPPRESSED,
+    DmDeliveryEngine,
+    DmRequest,
+)
 from core.interaction_safety import get_operation_lock
 from event_calendar.reminder_candidates import (
     CalendarEligibility,
@@ -21,15 +30,25 @@ from event_calendar.reminder_candidates import (
     evaluate_calendar_alert_windows,
     event_display_name,
     filter_calendar_dispatch_events,
+    parse_event_end_utc,
 )
 from event_calendar.reminder_metrics import get_reminder_status_service
 from event_calendar.reminder_prefs_store import load_all_user_prefs
-from event_calendar.reminder_state import CalendarReminderState
+from event_calendar.reminder_state import CalendarReminderState, migrate_legacy_state
 from event_calendar.runtime_cache import filter_events, list_event_types, load_runtime_cache
 from file_utils import emit_telemetry_event
 
 logger = logging.getLogger(__name__)
 
+_dm_engine: DmDeliveryEngine | None = None
+
+
+def _get_dm_engine() -> DmDeliveryEngine:
+    global _dm_engine
+    if _dm_engine is None:
+        _dm_engine = DmDeliveryEngine("calendar_reminders")
+    return _dm_engine
+
 
 @dataclass
 class ReminderDispatchSummary:
@@ -41,11 +60,14 @@ class ReminderDispatchSummary:
     skipped_prefs: int = 0
     skipped_already_sent: int = 0
     skipped_unknown_type: int = 0
+    skipped_undeliverable: int = 0
     failures: int = 0
     failed_forbidden: int = 0
     failed_not_found: int = 0
     failed_http_exception: int = 0
     failed_unknown: int = 0
+    delivery_elapsed_ms: float = 0.0
+    delivery_p95_ms: float = 0.0
 
 
 def _now_utc() -> datetime:
@@ -151,13 +173,14 @@ async def dispatch_due_calendar_reminders(bot: discord.Client) -> ReminderDispat
         return summary
 
     known_types = set(list_event_types(cache_state))
-    state = CalendarReminderState.load(path=None)
+    state = CalendarReminderState.load_for_update(path=None)
 
     summary = ReminderDispatchSummary(
         ok=True,
         status="completed",
         candidates=len(due_windows),
     )
+    requests: list[DmRequest] = []
 
     for user_id_raw, raw_prefs in all_prefs.items():
         try:
@@ -195,9 +218,10 @@ async def dispatch_due_calendar_reminders(bot: discord.Client) -> ReminderDispat
                 continue
             instance_id = str(event.get("instance_id") or "").strip()
             et = str(event.get("type") or "").strip().lower()
+            ends_at = parse_event_end_utc(event)
 
-            summary.attempted += 1
             if EVENT_CALENDAR_REMINDERS_DRY_RUN:
+                summary.attempted += 1
                 logger.info(
                     "[CALENDAR][REMINDER][DRY_RUN] user_id=%s instance_id=%s type=%s event_type=%s",
                     user_id,
@@ -205,42 +229,63 @@ async def dispatch_due_calendar_reminders(bot: discord.Client) -> ReminderDispat
                     reminder_type,
                     et,
                 )
-                state.mark_sent(key, sent_at=now)
+                state.mark_sent(key, sent_at=now, expires_at=ends_at)
                 summary.sent += 1
                 continue
 
             try:
-                user = bot.get_user(user_id) or await bot.fetch_user(user_id)
-                msg_text = build_reminder_dm_content(event=event, reminder_type=reminder_type)
-                msg_embed = build_reminder_dm_embed(event=event, reminder_type=reminder_type)
-
-                try:
-                    await user.send(content=msg_text, embed=msg_embed)
-                except discord.HTTPException:
-                    await user.send(msg_text)
+                requests.append(
+                    DmRequest(
+                        user_id=user_id,
+                        content=build_reminder_dm_content(event=event, reminder_type=reminder_type),
+                        embed=build_reminder_dm_embed(event=event, reminder_type=reminder_type),
+                        tag=(key, ends_at),
+                        suppress_key=key,
+                    )
+                )
+            except Exception:
+                # One malformed event must not abort the pass for every other recipient.
+                logger.exception(
+                    "[CALENDAR][REMINDER] build failed user_id=%s instance_id=%s type=%s",
+                    user_id,
+                    instance_id,
+                    reminder_type,
+                )
+                summary.attempted += 1
+                summary.failures += 1
+                summary.failed_unknown += 1
 
-                state.mark_sent(key, sent_at=now)
+    if requests:
+        report = await _get_dm_engine().deliver(bot, requests)
+        summary.delivery_elapsed_ms = round(report.elapsed_ms, 1)
+        summary.delivery_p95_ms = report.latency_percentile_ms(95)
+        for result in report.results:
+            if result.status == STATUS_SUPPRESSED:
+                summary.skipped_undeliverable += 1
+                continue
+            summary.attempted += 1
+            if result.status == STATUS_SENT:
+                key, ends_at = result.request.tag
+                state.mark_sent(key, sent_at=now, expires_at=ends_at)
                 summary.sent += 1
-            except discord.Forbidden:
-                summary.failures += 1
+                continue
+            summary.failures += 1
+            if result.status == STATUS_FORBIDDEN:
                 summary.failed_forbidden += 1
-            except discord.NotFound:
-                summary.failures += 1
+            elif result.status == STATUS_NOT_FOUND:
                 summary.failed_not_found += 1
-            except discord.HTTPException:
-                summary.failures += 1
+            elif result.status == STATUS_HTTP_EXCEPTION:
                 summary.failed_http_exception += 1
-            except Exception:
-                summary.failures += 1
+            else:
                 summary.failed_unknown += 1
 
-    state.save()
+    state.save(now=now)
     get_reminder_status_service().record_summary(
         summary=summary, dry_run=EVENT_CALENDAR_REMINDERS_DRY_RUN
     )
 
     logger.info(
-        "[CALENDAR][REMINDER] status=%s candidates=%s attempted=%s sent=%s skipped_prefs=%s skipped_already_sent=%s skipped_unknown_type=%s failures=%s forbidden=%s not_found=%s http=%s unknown=%s dry_run=%s",
+        "[CALENDAR][REMINDER] status=%s candidates=%s attempted=%s sent=%s skipped_prefs=%s skipped_already_sent=%s skipped_unknown_type=%s skipped_undeliverable=%s failures=%s forbidden=%s not_found=%s http=%s unknown=%s delivery_ms=%s p95_ms=%s dry_run=%s",
         summary.status,
         summary.candidates,
         summary.attempted,
@@ -248,11 +293,14 @@ async def dispatch_due_calendar_reminders(bot: discord.Client) -> ReminderDispat
         summary.skipped_prefs,
         summary.skipped_already_sent,
         summary.skipped_unknown_type,
+        summary.skipped_undeliverable,
         summary.failures,
         summary.failed_forbidden,
         summary.failed_not_found,
         summary.failed_http_exception,
         summary.failed_unknown,
+        summary.delivery_elapsed_ms,
+        summary.delivery_p95_ms,
         EVENT_CALENDAR_REMINDERS_DRY_RUN,
     )
 
@@ -267,11 +315,14 @@ async def dispatch_due_calendar_reminders(bot: discord.Client) -> ReminderDispat
             "skipped_prefs": summary.skipped_prefs,
             "skipped_already_sent": summary.skipped_already_sent,
             "skipped_unknown_type": summary.skipped_unknown_type,
+            "skipped_undeliverable": summary.skipped_undeliverable,
             "failures": summary.failures,
             "failed_forbidden": summary.failed_forbidden,
             "failed_not_found": summary.failed_not_found,
             "failed_http_exception": summary.failed_http_exception,
             "failed_unknown": summary.failed_unknown,
+            "delivery_elapsed_ms": summary.delivery_elapsed_ms,
+            "delivery_p95_ms": summary.delivery_p95_ms,
             "dry_run": EVENT_CALENDAR_REMINDERS_DRY_RUN,
         }
     )
@@ -286,6 +337,12 @@ async def run_calendar_reminder_loop(
     if interval < 1:
         raise ValueError("interval_seconds must be >= 1")
 
+    try:
+        async with get_operation_lock("calendar_reminders"):
+            await asyncio.to_thread(migrate_legacy_state)
+    except Exception:
+        logger.exception("[CALENDAR][REMINDER] legacy sent-state migration failed")
+
     while True:
         try:
             async with get_operation_lock("calendar_reminders"):
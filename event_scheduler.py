@@ -28,6 +28,7 @@ from embed_utils import LocalTimeToggleView, fmt_short
 from event_cache import get_all_upcoming_events
 from file_utils import atomic_write_json, read_json_safe, run_blocking_in_thread
 from registry.governor_registry import load_registry
+from reminder_dispatcher import ReminderHandle, get_reminder_dispatcher
 from reminder_domain.kvk_candidates import (
     build_kvk_alert_projection,
     is_fight_event as _is_fight_event,
@@ -237,6 +238,62 @@ async def _save_trackers_coalesced_async(*, sent: bool = False, scheduled: bool
         await save_dm_scheduled_tracker_async()
 
 
+# Subscriber user objects resolved by the DM scheduler. Entries are (expires_at, user); a None
+# user is a negative entry for deleted accounts or users the bot can no longer see.
+SUBSCRIBER_USER_TTL_SECONDS = 3600.0
+SUBSCRIBER_USER_MISS_TTL_SECONDS = 900.0
+_subscriber_user_cache: dict[str, tuple[float, object | None]] = {}
+
+
+async def _resolve_subscriber_user(bot, user_id: int | str):
+    """
+    Return the discord user for a subscriber, or None when it cannot be resolved.
+
+    Prefers the gateway cache (``bot.get_user``) and only falls back to a REST ``fetch_user``
+    when the user is not cached here or by discord.py. NotFound/Forbidden results are cached
+    negatively so deleted accounts are not re-fetched every cycle.
+    """
+    uid = str(user_id)
+    now = time.monotonic()
+    cached = _subscriber_user_cache.get(uid)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    user = None
+    get_user = getattr(bot, "get_user", None)
+    if callable(get_user):
+        try:
+            user = get_user(int(uid))
+        except Exception:
+            user = None
+    if user is None:
+        try:
+            user = await bot.fetch_user(int(uid))
+        except (discord.NotFound, discord.Forbidden) as e:
+            logger.info("[DM_REMINDER] Subscriber %s is unavailable (%s) — skipping.", uid, e)
+            _subscriber_user_cache[uid] = (now + SUBSCRIBER_USER_MISS_TTL_SECONDS, None)
+            return None
+        except Exception as e:
+            # Transient (rate limit / network) — don't cache, retry next cycle.
+            logger.error("[DM_REMINDER] Failed to fetch user %s: %s", uid, e)
+            return None
+
+    if user is None:
+        _subscriber_user_cache[uid] = (now + SUBSCRIBER_USER_MISS_TTL_SECONDS, None)
+        return None
+    _subscriber_user_cache[uid] = (now + SUBSCRIBER_USER_TTL_SECONDS, user)
+    return user
+
+
+def _prune_subscriber_user_cache(active_user_ids) -> None:
+    """Drop expired entries and users who are no longer subscribed."""
+    now = time.monotonic()
+    active = {str(uid) for uid in active_user_ids}
+    for uid, (expires_at, _user) in list(_subscriber_user_cache.items()):
+        if expires_at <= now or uid not in active:
+            _subscriber_user_cache.pop(uid, None)
+
+
 def _ensure_parent(path: str):
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
 
@@ -738,15 +795,15 @@ async def expire_single_reminder(event_id, delay_seconds):
 
 async def rehydrate_dm_scheduled_tasks(bot):
     """
-    Recreate delayed_user_dm / immediate send tasks for persisted dm_scheduled_tracker entries.
+    Re-schedule persisted dm_scheduled_tracker entries onto the shared reminder dispatcher.
 
     Behavior:
       - For each event_id / uid / delta_seconds in dm_scheduled_tracker:
         - Try to find a matching event in get_all_upcoming_events().
         - If no matching event or event >48h in future or event already long-past: remove marker.
         - Else compute seconds_until = start_time - delta - now
-            - If seconds_until > 0: create delayed_user_dm task and register it
-            - If seconds_until <= 0 and >= -REHYDRATE_STALE_GRACE_SECONDS: schedule immediate send_user_reminder task
+            - If seconds_until > 0: schedule delivery at the due time and register the handle
+            - If seconds_until <= 0 and >= -REHYDRATE_STALE_GRACE_SECONDS: schedule immediate delivery
             - If seconds_until < -REHYDRATE_STALE_GRACE_SECONDS: treat as stale and remove marker
       - Save dm_scheduled_tracker after pruning/restoring.
     """
@@ -810,14 +867,12 @@ async def rehydrate_dm_scheduled_tasks(bot):
 
                         # Case: in future -> recreate a delayed task
                         if seconds_until > 0:
-                            try:
-                                user = await bot.fetch_user(int(uid))
-                            except Exception as e:
+                            user = await _resolve_subscriber_user(bot, uid)
+                            if user is None:
                                 logger.warning(
-                                    "[DM_REHYDRATE] Failed to fetch user %s for %s: %s — removing marker.",
+                                    "[DM_REHYDRATE] Failed to fetch user %s for %s — removing marker.",
                                     uid,
                                     event_id,
-                                    e,
                                 )
                                 # remove the marker to avoid permanent blocking
                                 dm_scheduled_tracker.get(event_id, {}).get(uid, set()).discard(
@@ -826,14 +881,7 @@ async def rehydrate_dm_scheduled_tasks(bot):
                                 removed_any = True
                                 continue
 
-                            task = asyncio.create_task(
-                                delayed_user_dm(bot, user, event, delta, seconds_until)
-                            )
-                            register_user_task(
-                                user.id,
-                                task,
-                                meta={"event_id": event_id, "delta_seconds": int(delta_seconds)},
-                            )
+                            _schedule_user_dm(user, event, delta, seconds_until)
                             logger.info(
                                 "[DM_REHYDRATE] Restored scheduled DM for user %s for %s at T-%s in %ds",
                                 uid,
@@ -847,14 +895,12 @@ async def rehydrate_dm_scheduled_tasks(bot):
 
                         # Case: overdue but within grace window -> immediate send
                         if seconds_until >= -REHYDRATE_STALE_GRACE_SECONDS:
-                            try:
-                                user = await bot.fetch_user(int(uid))
-                            except Exception as e:
+                            user = await _resolve_subscriber_user(bot, uid)
+                            if user is None:
                                 logger.warning(
-                                    "[DM_REHYDRATE] Failed to fetch user %s for immediate send for %s: %s — removing marker.",
+                                    "[DM_REHYDRATE] Failed to fetch user %s for immediate send for %s — removing marker.",
                                     uid,
                                     event_id,
-                                    e,
                                 )
                                 dm_scheduled_tracker.get(event_id, {}).get(uid, set()).discard(
                                     delta_seconds
@@ -862,13 +908,8 @@ async def rehydrate_dm_scheduled_tasks(bot):
                                 removed_any = True
                                 continue
 
-                            # Schedule immediate send via register_user_task
-                            task = asyncio.create_task(send_user_reminder(user, event, delta))
-                            register_user_task(
-                                user.id,
-                                task,
-                                meta={"event_id": event_id, "delta_seconds": int(delta_seconds)},
-                            )
+                            # Due now: the dispatcher delivers it on its next tick
+                            _schedule_user_dm(user, event, delta, 0)
                             logger.info(
                                 "[DM_REHYDRATE] Performed immediate rehydrated DM to user %s for %s at T-%s (late by %ds)",
                                 uid,
@@ -939,7 +980,23 @@ async def rehydrate_dm_scheduled_tasks(bot):
         logger.exception("[DM_REHYDRATE] Unexpected error during DM rehydration: %s", e)
 
 
-async def delayed_user_dm(bot, user, event, delta, seconds_until):
+def _schedule_user_dm(user, event, delta, seconds_until) -> ReminderHandle:
+    """Queue one KVK DM on the shared dispatcher and register its handle for cancellation."""
+    event_id = make_event_id(event)
+    delta_seconds = int(delta.total_seconds())
+    meta = {"event_id": event_id, "delta_seconds": delta_seconds}
+    handle = get_reminder_dispatcher().schedule(
+        seconds_until,
+        lambda: delayed_user_dm(user, event, delta),
+        name=f"kvk_dm:{user.id}:{event_id}:{delta_seconds}",
+        meta=meta,
+    )
+    register_user_task(user.id, handle, meta=meta)
+    return handle
+
+
+async def delayed_user_dm(user, event, delta):
+    """Deliver a dispatcher-scheduled DM; the scheduled marker is cleared either way."""
     event_id = make_event_id(event)
     uid = str(user.id)
     delta_seconds = int(delta.total_seconds())
@@ -955,11 +1012,10 @@ async def delayed_user_dm(bot, user, event, delta, seconds_until):
         return
 
     try:
-        await asyncio.sleep(seconds_until)
         await send_user_reminder(user, event, delta)
     except Exception as e:
         logger.error(
-            "[DM_REMINDER_DELAYED_FAILED] Error while waiting/sending DM to %s for %s at T-%s: %s",
+            "[DM_REMINDER_DELAYED_FAILED] Error while sending DM to %s for %s at T-%s: %s",
             user.id,
             event_id,
             delta,
@@ -1084,6 +1140,7 @@ async def schedule_event_reminders(bot, notify_channel_id, test_mode=False, test
         subscribers = get_all_subscribers()
         logger.debug("[DM_REMINDER_SCHEDULER] Loaded %d subscribers", len(subscribers))
 
+        dm_events: dict[str, dict] = {}
         for event in all_events:
             event_type = _normalized_event_type(event)
             if event_type not in {"ruins", "altars", "major", "chronicle"}:
@@ -1095,6 +1152,7 @@ async def schedule_event_reminders(bot, notify_channel_id, test_mode=False, test
             if start_time - now > timedelta(hours=48):
                 continue
 
+            dm_events.setdefault(event_id, event)
             if event_id not in sent_reminders:
                 sent_reminders[event_id] = set()
 
@@ -1111,106 +1169,87 @@ async def schedule_event_reminders(bot, notify_channel_id, test_mode=False, test
                 sent_reminders[event_id].add(delta)
                 logger.debug("[SCHEDULE_CACHE] Reminder for %s scheduled at T-%s", event_id, delta)
 
-            # yield a tick between events to keep the loop responsive
-            await asyncio.sleep(0)
+        # yield a tick between the channel and DM passes to keep the loop responsive
+        await asyncio.sleep(0)
 
-            for user_id, config in subscribers.items():
-                try:
-                    user = await bot.fetch_user(int(user_id))
-                    logger.debug("[DM_REMINDER_USER] USER ID found %s", user_id)
-                except Exception as e:
-                    logger.error("[DM_REMINDER] Failed to fetch user %s: %s", user_id, e)
-                    continue
+        # One projection per subscriber across every in-horizon event; the user object is only
+        # resolved when that subscriber has something new to schedule.
+        projection_events = tuple(dm_events.values())
+        scheduled_changed = False
+        for user_id, config in subscribers.items():
+            if not projection_events:
+                break
+            projection = build_kvk_alert_projection(
+                events=projection_events,
+                config=config,
+                user_id=user_id,
+                sent_tracker=dm_sent_tracker,
+                scheduled_tracker=dm_scheduled_tracker,
+                now_utc=now,
+            )
+            pending = [c for c in projection.candidates if not c.pending_scheduled]
+            if not pending:
+                continue
 
-                if not user:
-                    logger.error("[DM_REMINDER] Could not fetch user object for ID %s", user_id)
-                    continue
+            user = await _resolve_subscriber_user(bot, user_id)
+            if user is None:
+                continue
+            uid = str(user.id)
 
-                projection = build_kvk_alert_projection(
-                    events=(event,),
-                    config=config,
-                    user_id=user.id,
-                    sent_tracker=dm_sent_tracker,
-                    scheduled_tracker=dm_scheduled_tracker,
-                    now_utc=now,
-                )
-                for candidate in projection.candidates:
-                    delta = REMINDER_MAP[candidate.lead_time_key]
+            for candidate in pending:
+                event_id = candidate.event_identity
+                event = dm_events[event_id]
+                delta = REMINDER_MAP[candidate.lead_time_key]
+                delta_seconds = int(delta.total_seconds())
 
-                    # Ensure per-user buckets exist
-                    dm_sent_tracker.setdefault(event_id, {}).setdefault(str(user.id), [])
-                    dm_scheduled_tracker.setdefault(event_id, {}).setdefault(str(user.id), set())
+                # Ensure per-user buckets exist
+                user_sent = dm_sent_tracker.setdefault(event_id, {}).setdefault(uid, [])
+                user_sched = dm_scheduled_tracker.setdefault(event_id, {}).setdefault(uid, set())
 
-                    delta_seconds = int(delta.total_seconds())
-                    user_sent = dm_sent_tracker[event_id][str(user.id)]
-                    user_sched = dm_scheduled_tracker[event_id][str(user.id)]
+                if delta_seconds in user_sent or delta_seconds in user_sched:
+                    logger.debug(
+                        "[DM_REMINDER_DUPLICATE] Skipping %s for %s at T-%s — already handled.",
+                        user_id,
+                        event_id,
+                        delta,
+                    )
+                    continue
 
-                    if delta_seconds in user_sent:
-                        logger.debug(
-                            "[DM_REMINDER_DUPLICATE] Skipping %s for %s at T-%s — already sent.",
-                            user_id,
-                            event_id,
-                            delta,
-                        )
-                        continue
+                seconds_until = (candidate.scheduled_for_utc - now).total_seconds()
+                logger.debug(
+                    "[DM_REMINDER_DEBUG] User %s | Event: %s | Delta: %s | Seconds until: %d",
+                    user_id,
+                    event_id,
+                    delta,
+                    int(seconds_until),
+                )
 
-                    if delta_seconds in user_sched:
-                        logger.debug(
-                            "[DM_REMINDER_DUPLICATE_TASK] Already scheduled for %s at %s T-%s",
-                            user_id,
-                            event_id,
-                            delta,
-                        )
-                        continue
+                user_sched.add(delta_seconds)
+                scheduled_changed = True
 
-                    seconds_until = (candidate.scheduled_for_utc - now).total_seconds()
+                if seconds_until <= 0:
+                    logger.info(
+                        "[DM_REMINDER_LATE] Sending immediate DM to %s for %s at T-%s",
+                        user_id,
+                        event_id,
+                        delta,
+                    )
+                else:
                     logger.debug(
-                        "[DM_REMINDER_DEBUG] User %s | Event: %s | Delta: %s | Seconds until: %d",
+                        "[DM_REMINDER_SCHEDULED] Scheduling DM to %s for %s at T-%s in %ds",
                         user_id,
                         event_id,
                         delta,
                         int(seconds_until),
                     )
+                _schedule_user_dm(user, event, delta, seconds_until)
 
-                    user_sched.add(delta_seconds)
-                    save_dm_scheduled_tracker()
-
-                    if seconds_until <= 0:
-                        logger.info(
-                            "[DM_REMINDER_LATE] Sending immediate DM to %s for %s at T-%s",
-                            user_id,
-                            event_id,
-                            delta,
-                        )
-                        register_user_task(
-                            user.id,
-                            asyncio.create_task(send_user_reminder(user, event, delta)),
-                            meta={
-                                "event_id": event_id,
-                                "delta_seconds": int(delta.total_seconds()),
-                            },
-                        )
-                    else:
-                        logger.debug(
-                            "[DM_REMINDER_SCHEDULED] Scheduling DM to %s for %s at T-%s in %ds",
-                            user_id,
-                            event_id,
-                            delta,
-                            int(seconds_until),
-                        )
-                        register_user_task(
-                            user.id,
-                            asyncio.create_task(
-                                delayed_user_dm(bot, user, event, delta, seconds_until)
-                            ),
-                            meta={
-                                "event_id": event_id,
-                                "delta_seconds": int(delta.total_seconds()),
-                            },
-                        )
+            # small yield within the per-user loop to avoid long bursts
+            await asyncio.sleep(0)
 
-                # small yield within the per-user loop to avoid long bursts
-                await asyncio.sleep(0)
+        if scheduled_changed:
+            await _save_trackers_coalesced_async(scheduled=True)
+        _prune_subscriber_user_cache(subscribers.keys())
 
         reminder_stats["dm_success"] = 0
         reminder_stats["dm_dm_disabled"] = 0
@@ -50,8 +50,26 @@ import uuid
 
 import aiofiles
 
-# Use the repo canonical connector
-from constants import DATA_DIR, _conn
+# Use the repo canonical connectors
+from constants import DATA_DIR, _conn, _conn_import, _conn_trusted
+from core.offload_transport import (
+    RESULT_FRAME_ENV,
+    is_shm_token,
+    make_shm_token,
+    read_result_frame,
+    release_segment,
+    release_shm_token,
+    shm_transport_enabled,
+    stage_shared_payloads,
+)
+from core.sql_pool import acquire_pooled_connection
+from core.worker_pool import (
+    WorkerCrashed,
+    WorkerJobTimeout,
+    WorkerPoolUnavailable,
+    get_worker_pool,
+    worker_pool_enabled,
+)
 from utils import utcnow  # ensure we have utcnow for telemetry timestamps
 
 # Optional enhanced process handling
@@ -233,11 +251,14 @@ def get_conn_with_retries(
     backoff_base: float | None = None,
     backoff_max: float | None = None,
     meta: dict | None = None,
+    credential: str = "default",
 ):
     """
-    Attempt to create a DB connection using constants._conn() with retry/backoff and
-    full jitter for transient failures. Returns a live pyodbc.Connection or raises
-    the last exception after retries.
+    Check out a pooled DB connection (see core.sql_pool) with retry/backoff and full
+    jitter for transient failures. New connections come from constants._conn() (or
+    _conn_import / _conn_trusted for credential="import" / "trusted"). Returns a live
+    pyodbc-compatible connection or raises the last exception after retries; close()
+    or leaving a `with` block returns it to the pool.
 
     Optional `meta` is attached to telemetry (best-effort).
     """
@@ -251,6 +272,11 @@ def get_conn_with_retries(
     attempts = 0
     last_exc: Exception | None = None
 
+    factories = {"default": _conn, "import": _conn_import, "trusted": _conn_trusted}
+    if credential not in factories:
+        raise ValueError(f"Unknown DB credential: {credential!r}")
+    factory = factories[credential]
+
     max_retries = retries if retries is not None else _DB_RETRIES
     base = backoff_base if backoff_base is not None else _DB_BACKOFF_BASE
     cap = backoff_max if backoff_max is not None else _DB_BACKOFF_MAX
@@ -258,8 +284,8 @@ def get_conn_with_retries(
     while attempts < max_retries:
         attempts += 1
         try:
-            # _conn is the canonical factory in constants
-            return _conn()
+            # constants factories open new sessions; the pool reuses live ones
+            return acquire_pooled_connection(credential, factory)
         except Exception as e:
             # Detect if this is a pyodbc.OperationalError if pyodbc is available.
             is_operational = False
@@ -1071,6 +1097,127 @@ def find_offload_by_meta(meta: dict | None = None, window_seconds: int = 3600) -
     return candidates[0]
 
 
+# ---------------------------
+# Warm worker pool offloads (core.worker_pool)
+# ---------------------------
+def _resolve_pool_spec(command: Any) -> tuple[str, str]:
+    """Return (module, function) for a module-level callable or 'module:function' string."""
+    if callable(command):
+        mod_name = getattr(command, "__module__", None)
+        fn_name = getattr(command, "__name__", None)
+        try:
+            importable = bool(mod_name and fn_name) and (
+                getattr(importlib.import_module(mod_name), fn_name, None) is command
+            )
+        except Exception:
+            importable = False
+        if not importable or mod_name == "__main__":
+            raise WorkerPoolUnavailable(f"{command!r} is not importable at module level")
+        return mod_name, fn_name
+    if isinstance(command, str) and ":" in command:
+        mod_name, fn_name = command.split(":", 1)
+        return mod_name, fn_name
+    raise WorkerPoolUnavailable(f"{command!r} is not a callable spec")
+
+
+async def run_in_worker_pool(
+    command: Any,
+    args: list[Any] | tuple[Any, ...] | None = None,
+    kwargs: dict[str, Any] | None = None,
+    *,
+    timeout: float | None = 300,
+    name: str | None = None,
+    meta: dict | None = None,
+) -> Any:
+    """
+    Run `command(*args, **kwargs)` on a warm pooled worker and return its result.
+
+    Exceptions raised by the callable are re-raised here (the original exception when it
+    pickles, RuntimeError otherwise). WorkerPoolUnavailable means nothing ran and the caller
+    should fall back to a spawned process or a thread. The job is recorded in the offload
+    registry against the worker pid, so cancel_offload() still works (it kills that worker).
+    """
+    meta = meta or {}
+    module, function = _resolve_pool_spec(command)
+    spec = f"{module}:{function}"
+    state: dict[str, Any] = {"offload_id": None, "pid": None}
+
+    def _on_start(pid: int) -> None:
+        state["pid"] = pid
+        state["offload_id"] = start_offload(meta=meta)
+        record_process_offload(state["offload_id"], pid, ["worker_pool", spec])
+
+    def _finish(status: str, ok: bool, snippet: str, **extra: Any) -> None:
+        emit_telemetry_event(
+            {
+                "event": "worker_pool_job",
+                "status": status,
+                "spec": spec,
+                "name": name,
+                "meta": meta,
+                "offload_id": state["offload_id"],
+                "pid": state["pid"],
+                **extra,
+            }
+        )
+        if state["offload_id"]:
+            try:
+                mark_offload_complete(state["offload_id"], ok, snippet[:4000], worker_parsed=None)
+            except Exception:
+                logger.debug("[WORKER_POOL] failed to mark offload complete", exc_info=True)
+
+    call_args, call_kwargs = list(args or ()), dict(kwargs or {})
+    segments: list[str] = []
+    if shm_transport_enabled():
+        try:
+            call_args, call_kwargs, segments = stage_shared_payloads(call_args, call_kwargs)
+        except Exception:
+            logger.debug("[WORKER_POOL] shared memory unavailable; sending inline", exc_info=True)
+    job = {
+        "kind": "call",
+        "module": module,
+        "function": function,
+        "args": call_args,
+        "kwargs": call_kwargs,
+    }
+    try:
+        reply = await get_worker_pool().run(job, timeout=timeout, on_start=_on_start)
+    except WorkerPoolUnavailable as exc:
+        _finish("unavailable", False, str(exc))
+        raise
+    except WorkerJobTimeout as exc:
+        _finish("timeout", False, str(exc))
+        raise
+    except WorkerCrashed as exc:
+        _finish("crashed", False, str(exc))
+        raise
+    except asyncio.CancelledError:
+        _finish("cancelled", False, "cancelled by caller")
+        raise
+    finally:
+        for segment in segments:
+            release_segment(segment)
+
+    if reply.get("ok"):
+        _finish(
+            "success",
+            True,
+            f"result_type={type(reply.get('result')).__name__}",
+            duration_ms=reply.get("duration_ms"),
+            rss_mb=reply.get("rss_mb"),
+        )
+        return reply.get("result")
+
+    error = f"{reply.get('error_type')}: {reply.get('error')}"
+    _finish("failed", False, error, duration_ms=reply.get("duration_ms"))
+    exc = reply.get("exc")
+    if isinstance(exc, BaseException):
+        raise exc
+    if reply.get("error_type") == "PermissionError":
+        raise PermissionError(f"{spec} not allowed by MAINT_SPEC_ALLOWLIST")
+    raise RuntimeError(f"pooled callable {spec} failed: {error}\n{reply.get('traceback') or ''}")
+
+
 def build_callable_cmd(module: str, function: str, args: list | None = None) -> list[str]:
     worker_path = Path(__file__).resolve().parent / "scripts" / "callable_worker.py"
     cmd = [sys.executable, str(worker_path), "--module", module, "--function", function]
@@ -1166,6 +1313,33 @@ async def run_callable_subprocess(
         if build_only:
             return cmd
 
+        if worker_pool_enabled():
+            try:
+                result = await run_in_worker_pool(
+                    f"{module}:{function}", args, timeout=timeout, name=_evt_name, meta=meta
+                )
+            except WorkerPoolUnavailable:
+                logger.info("[CALLABLE] worker pool unavailable; spawning %s.%s", module, function)
+            except TimeoutError:
+                return False, f"Timed out after {timeout}s (worker pool)."
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                # The callable's own exception (or WorkerCrashed with the worker's stderr tail).
+                return False, f"{type(exc).__name__}: {exc}"
+            else:
+                # Same marker shape scripts/callable_worker.py prints.
+                payload = {
+                    "worker_result": True,
+                    "command": "callable",
+                    "module": module,
+                    "function": function,
+                    "status": "success",
+                    "return": result,
+                    "returncode": 0,
+                }
+                return True, json.dumps(payload, default=str)
+
         proc = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
@@ -1500,7 +1674,23 @@ def _write_bytes_to_tempfile(b: bytes, tmp_dir: str | None = None) -> str:
     return os.path.abspath(path)
 
 
-def _serialize_single_arg(arg: Any, tmp_dir: str | None = None) -> tuple[str, str | None]:
+def _stage_offload_payload(
+    b: bytes, *, json_payload: bool, tmp_dir: str | None, transport: str
+) -> tuple[str, str]:
+    """Return (argv token, cleanup key) for a payload; shm falls back to a temp file."""
+    if transport == "shm":
+        try:
+            tok = make_shm_token(b, "json" if json_payload else "bytes")
+            return tok, tok
+        except Exception:
+            logger.debug("[OFFLOAD] shared memory unavailable; using temp file", exc_info=True)
+    p = _write_bytes_to_tempfile(b, tmp_dir=tmp_dir)
+    return (OFFLOAD_JSON_PREFIX if json_payload else OFFLOAD_FILE_PREFIX) + p, p
+
+
+def _serialize_single_arg(
+    arg: Any, tmp_dir: str | None = None, transport: str = "file"
+) -> tuple[str, str | None]:
     try:
         if callable(arg):
             mod = getattr(arg, "__module__", None)
@@ -1515,8 +1705,9 @@ def _serialize_single_arg(arg: Any, tmp_dir: str | None = None) -> tuple[str, st
             return os.fspath(arg), None
 
         if isinstance(arg, (bytes, bytearray, memoryview)):
-            p = _write_bytes_to_tempfile(bytes(arg), tmp_dir=tmp_dir)
-            return (OFFLOAD_FILE_PREFIX + p, p)
+            return _stage_offload_payload(
+                bytes(arg), json_payload=False, tmp_dir=tmp_dir, transport=transport
+            )
 
         if isinstance(arg, str):
             return arg, None
@@ -1528,8 +1719,9 @@ def _serialize_single_arg(arg: Any, tmp_dir: str | None = None) -> tuple[str, st
                 seq = None
             if seq is not None and seq and all(isinstance(x, int) and 0 <= x <= 255 for x in seq):
                 try:
-                    p = _write_bytes_to_tempfile(bytes(seq), tmp_dir=tmp_dir)
-                    return (OFFLOAD_FILE_PREFIX + p, p)
+                    return _stage_offload_payload(
+                        bytes(seq), json_payload=False, tmp_dir=tmp_dir, transport=transport
+                    )
                 except Exception:
                     pass
 
@@ -1537,8 +1729,9 @@ def _serialize_single_arg(arg: Any, tmp_dir: str | None = None) -> tuple[str, st
             j = json.dumps(arg, ensure_ascii=False, separators=(",", ":"), default=str).encode(
                 "utf-8"
             )
-            p = _write_bytes_to_tempfile(j, tmp_dir=tmp_dir)
-            return (OFFLOAD_JSON_PREFIX + p, p)
+            return _stage_offload_payload(
+                j, json_payload=True, tmp_dir=tmp_dir, transport=transport
+            )
         except Exception:
             return str(arg), None
     except Exception:
@@ -1590,7 +1783,16 @@ def serialize_args_for_subprocess(
     args: list[Any] | None = None,
     kwargs: dict[str, Any] | None = None,
     tmp_dir: str | None = None,
+    transport: str = "file",
 ) -> tuple[list[str], list[str]]:
+    """
+    Turn args/kwargs into maintenance_worker argv tokens.
+
+    Bytes and JSON-able payloads are staged out of argv: transport="file" writes temp files
+    (__OFFLOAD_FILE__/__OFFLOAD_JSON__), transport="shm" uses shared-memory segments
+    (__OFFLOAD_SHM__) and falls back to temp files. Pass the returned cleanup keys to
+    cleanup_temp_paths() once the worker is done.
+    """
     argv_tokens: list[str] = []
     temp_paths: list[str] = []
     args = args or []
@@ -1600,8 +1802,10 @@ def serialize_args_for_subprocess(
     if _can_group_offloadable_rows(args):
         try:
             j = json.dumps(args, ensure_ascii=False, default=str).encode("utf-8")
-            p = _write_bytes_to_tempfile(j, tmp_dir=tmp_dir)
-            argv_tokens.append(OFFLOAD_JSON_PREFIX + p)
+            tok, p = _stage_offload_payload(
+                j, json_payload=True, tmp_dir=tmp_dir, transport=transport
+            )
+            argv_tokens.append(tok)
             temp_paths.append(p)
             try:
                 emit_telemetry_event(
@@ -1625,14 +1829,16 @@ def serialize_args_for_subprocess(
                     b = bytes(args)  # type: ignore[arg-type]
                 else:
                     b = bytes(int(a) for a in args)  # type: ignore[arg-type]
-                p = _write_bytes_to_tempfile(b, tmp_dir=tmp_dir)
-                argv_tokens.append(OFFLOAD_FILE_PREFIX + p)
+                tok, p = _stage_offload_payload(
+                    b, json_payload=False, tmp_dir=tmp_dir, transport=transport
+                )
+                argv_tokens.append(tok)
                 temp_paths.append(p)
             except Exception:
                 pass
         else:
             for a in args:
-                tok, tmp = _serialize_single_arg(a, tmp_dir=tmp_dir)
+                tok, tmp = _serialize_single_arg(a, tmp_dir=tmp_dir, transport=transport)
                 argv_tokens.append(tok)
                 if tmp:
                     temp_paths.append(tmp)
@@ -1654,9 +1860,11 @@ def serialize_args_for_subprocess(
         if isinstance(v, list) and _can_group_offloadable_rows(v):
             try:
                 j = json.dumps(v, ensure_ascii=False, default=str).encode("utf-8")
-                p = _write_bytes_to_tempfile(j, tmp_dir=tmp_dir)
+                tok, p = _stage_offload_payload(
+                    j, json_payload=True, tmp_dir=tmp_dir, transport=transport
+                )
                 argv_tokens.append(flag)
-                argv_tokens.append(OFFLOAD_JSON_PREFIX + p)
+                argv_tokens.append(tok)
                 temp_paths.append(p)
                 try:
                     emit_telemetry_event(
@@ -1678,7 +1886,7 @@ def serialize_args_for_subprocess(
                 # fallback to per-value serialization
                 pass
 
-        tok, tmp = _serialize_single_arg(v, tmp_dir=tmp_dir)
+        tok, tmp = _serialize_single_arg(v, tmp_dir=tmp_dir, transport=transport)
         argv_tokens.append(flag)
         argv_tokens.append(tok)
         if tmp:
@@ -1687,10 +1895,52 @@ def serialize_args_for_subprocess(
     return argv_tokens, temp_paths
 
 
+# A result frame only lives for one subprocess run; anything older was left by a killed bot.
+RESULT_FRAME_STALE_SECONDS = 6 * 3600
+_result_frames_swept = False
+
+
+def sweep_stale_result_frames(directory: str, max_age: float = RESULT_FRAME_STALE_SECONDS) -> int:
+    """Delete ``result_*.bin`` frames in ``directory`` older than ``max_age`` seconds."""
+    removed = 0
+    cutoff = time.time() - max_age
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return 0
+    for name in names:
+        if not (name.startswith("result_") and name.endswith(".bin")):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.unlink(path)
+                removed += 1
+        except OSError:
+            pass
+    if removed:
+        logger.info("[OFFLOAD] Removed %d stale result frame(s) from %s", removed, directory)
+    return removed
+
+
+def _new_result_frame_path() -> str:
+    """Return a fresh result frame path, sweeping stale frames on the first call."""
+    global _result_frames_swept
+    directory = os.path.join(DATA_DIR or tempfile.gettempdir(), "offload_tmp")
+    os.makedirs(directory, exist_ok=True)
+    if not _result_frames_swept:
+        _result_frames_swept = True
+        sweep_stale_result_frames(directory)
+    return os.path.join(directory, f"result_{uuid.uuid4().hex}.bin")
+
+
 def cleanup_temp_paths(paths: list[str]) -> None:
     for p in paths:
         try:
-            os.unlink(p)
+            if is_shm_token(p):
+                release_shm_token(p)
+            else:
+                os.unlink(p)
         except Exception:
             pass
 
@@ -1728,6 +1978,7 @@ def build_maintenance_cmd(
     args: list[Any] | None = None,
     kwargs: dict[str, Any] | None = None,
     tmp_dir: str | None = None,
+    transport: str = "file",
 ) -> tuple[list[str], list[str]]:
     worker_path = Path(__file__).resolve().parent / "maintenance_worker.py"
     if callable(command):
@@ -1741,7 +1992,7 @@ def build_maintenance_cmd(
         command_str = str(command)
     base_cmd = [sys.executable, str(worker_path), command_str]
     argv_tokens, temp_paths = serialize_args_for_subprocess(
-        args=args, kwargs=kwargs, tmp_dir=tmp_dir
+        args=args, kwargs=kwargs, tmp_dir=tmp_dir, transport=transport
     )
     full_cmd = base_cmd + argv_tokens
     full_cmd = [str(c) for c in full_cmd]
@@ -1770,6 +2021,89 @@ def _try_parse_worker_json(stdout_text: str) -> dict | None:
     return None
 
 
+async def _run_maintenance_spec_in_pool(
+    spec: str, argv_tokens: list[str], *, timeout: float | None, meta: dict
+) -> tuple[bool, str] | tuple[Any, dict] | None:
+    """
+    Run a 'module:function' maintenance spec on a warm pooled worker.
+
+    Returns the same shapes as run_maintenance_subprocess, or None when the pool is
+    unavailable and the caller should spawn maintenance_worker.py instead.
+    """
+    state: dict[str, Any] = {"offload_id": None, "pid": None}
+
+    def _on_start(pid: int) -> None:
+        state["pid"] = pid
+        state["offload_id"] = start_offload(meta=meta)
+        record_process_offload(state["offload_id"], pid, ["worker_pool", spec, *argv_tokens])
+        emit_telemetry_event(
+            {
+                "event": "maintenance_subproc.registered",
+                "command": spec,
+                "mode": "pool",
+                "offload_id": state["offload_id"],
+                "pid": pid,
+                "meta": meta,
+            }
+        )
+
+    job = {"kind": "spec", "spec": spec, "argv": list(argv_tokens)}
+    try:
+        reply = await get_worker_pool().run(job, timeout=timeout, on_start=_on_start)
+    except WorkerPoolUnavailable as exc:
+        logger.info("[MAINT] worker pool unavailable (%s); spawning %s", exc, spec)
+        return None
+    except (WorkerJobTimeout, WorkerCrashed) as exc:
+        status = "timeout" if isinstance(exc, WorkerJobTimeout) else "failed"
+        emit_telemetry_event(
+            {
+                "event": "maintenance_subproc",
+                "status": status,
+                "mode": "pool",
+                "command": spec,
+                "meta": meta,
+                "offload_id": state["offload_id"],
+                "pid": state["pid"],
+            }
+        )
+        try:
+            mark_offload_complete(state["offload_id"] or "", False, str(exc)[:4000])
+        except Exception:
+            pass
+        if status == "timeout":
+            return False, f"Timed out after {timeout}s. Output:\n{exc}"
+        return False, f"Worker exited. Output:\n{exc}"
+
+    worker_parsed = reply.get("worker_parsed")
+    rc = reply.get("returncode", 3)
+    output = json.dumps(worker_parsed, default=str) if worker_parsed else str(reply.get("error"))
+    snippet = output[: int(os.getenv("MAINT_SUBPROC_TELEMETRY_SNIPPET", "4000"))]
+    emit_payload = {
+        "event": "maintenance_subproc",
+        "status": "success" if rc == 0 else "failed",
+        "mode": "pool",
+        "command": spec,
+        "returncode": rc,
+        "meta": meta,
+        "output_snippet": snippet,
+        "duration_ms": reply.get("duration_ms"),
+        "offload_id": state["offload_id"],
+        "pid": state["pid"],
+    }
+    if worker_parsed:
+        emit_payload["worker_parsed"] = worker_parsed
+    emit_telemetry_event(emit_payload)
+    try:
+        mark_offload_complete(state["offload_id"] or "", rc == 0, snippet, worker_parsed)
+    except Exception:
+        pass
+    if rc != 0:
+        return False, f"Return code {rc}. Output:\n{output}"
+    if isinstance(worker_parsed, dict) and "result" in worker_parsed:
+        return worker_parsed["result"], worker_parsed
+    return True, output
+
+
 # ---------------------------
 # Normalization helper (root fix)
 # ---------------------------
@@ -1820,6 +2154,9 @@ async def run_maintenance_subprocess(
     meta = meta or {}
     offload_id = None
     temp_paths: list[str] = []
+    result_frame_path: str | None = None
+    # build_only callers run the command later, so staged payloads must outlive this call.
+    transport = "shm" if not build_only and shm_transport_enabled() else "file"
     try:
         worker_path = Path(__file__).resolve().parent / "maintenance_worker.py"
         if not worker_path.exists():
@@ -1836,7 +2173,9 @@ async def run_maintenance_subprocess(
             return False, msg
 
         # Build command and robustly serialize args
-        cmd, temp_paths = build_maintenance_cmd(command, args=args, kwargs=kwargs, tmp_dir=tmp_dir)
+        cmd, temp_paths = build_maintenance_cmd(
+            command, args=args, kwargs=kwargs, tmp_dir=tmp_dir, transport=transport
+        )
 
         emit_telemetry_event(
             {
@@ -1851,10 +2190,20 @@ async def run_maintenance_subprocess(
         if build_only:
             return cmd
 
+        if worker_pool_enabled() and ":" in cmd[2]:
+            pooled = await _run_maintenance_spec_in_pool(
+                cmd[2], cmd[3:], timeout=timeout, meta=meta
+            )
+            if pooled is not None:
+                return pooled
+
         # Prepare environment for child: copy current env and set marker
         child_env = os.environ.copy()
         # Marker used by cache builders and other callables to detect subprocess context.
         child_env["MAINT_SUBPROC"] = "1"
+        # The worker writes its result as a binary frame here instead of a stdout JSON line.
+        result_frame_path = _new_result_frame_path()
+        child_env[RESULT_FRAME_ENV] = result_frame_path
 
         proc = await asyncio.create_subprocess_exec(
             *cmd,
@@ -1918,7 +2267,7 @@ async def run_maintenance_subprocess(
         rc = proc.returncode if proc.returncode is not None else -1
 
         MAX_SNIPPET = int(os.getenv("MAINT_SUBPROC_TELEMETRY_SNIPPET", "4000"))
-        worker_parsed = _try_parse_worker_json(out)
+        worker_parsed = read_result_frame(result_frame_path) or _try_parse_worker_json(out)
 
         if worker_parsed:
             try:
@@ -2004,6 +2353,11 @@ async def run_maintenance_subprocess(
         except Exception:
             pass
         return False, f"Error spawning subprocess: {exc}"
+    finally:
+        if not build_only:
+            cleanup_temp_paths(temp_paths)
+        if result_frame_path:
+            cleanup_temp_paths([result_frame_path])
 
 
 # --------------------------- New wrapper: run maintenance with isolation (root-fix applied) ---------------------------
@@ -2455,6 +2809,7 @@ __all__ = [
     "pid_alive",
     "record_process_offload",
     "run_callable_subprocess",
+    "run_in_worker_pool",
     "run_maintenance_with_isolation",
     "run_step",
     "start_callable_offload",
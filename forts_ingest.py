@@ -7,6 +7,7 @@ import pandas as pd
 import pyodbc
 
 from constants import DATABASE, IMPORT_PASSWORD, IMPORT_USERNAME, SERVER
+from core.xlsx_reader import read_xlsx_sheet
 from file_utils import fetch_one_dict
 
 
@@ -82,7 +83,7 @@ def import_rally_daily_xlsx(path: str):
     as_of = dt.datetime.strptime(m.group(1), "%d-%m-%Y").date()
 
     try:
-        df_raw = pd.read_excel(path, engine="openpyxl")
+        df_raw = read_xlsx_sheet(path)
     except ModuleNotFoundError as e:
         raise RuntimeError("openpyxl is required to read .xlsx; install it in the bot venv") from e
     df = _normalise_cols(df_raw)
@@ -146,7 +147,7 @@ def import_rally_daily_xlsx(path: str):
 
 def import_rally_alltime_xlsx(path: str):
     try:
-        df_raw = pd.read_excel(path, engine="openpyxl")
+        df_raw = read_xlsx_sheet(path)
     except ModuleNotFoundError as e:
         raise RuntimeError("openpyxl is required to read .xlsx; install it in the bot venv") from e
     df = _normalise_cols(df_raw)
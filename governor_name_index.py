@@ -0,0 +1,231 @@
+# governor_name_index.py
+"""
+Shared in-memory search index over governor names.
+
+Every governor name search (target autocomplete / lookup, the profile cache search, the leadership
+review directory and the Ark fuzzy select that sits on top of ``lookup_governor_id``) builds a
+``GovernorNameIndex`` once per cache refresh instead of scanning and fuzzy-scoring every governor
+per keystroke. An index holds:
+
+- the distinct normalised names in first-seen order, each mapped to every entry carrying that name
+  (duplicate names are kept, one entry per governor row)
+- a sorted copy of the normalised names for ``bisect`` prefix lookups
+- a padded-trigram inverted index used to shortlist fuzzy candidates
+- a GovernorID map for numeric queries
+
+Scoring stays with the callers: they run their existing rapidfuzz scorer over ``shortlist()``,
+which is bounded by ``SHORTLIST_SIZE`` however many governors are indexed. Indexes smaller than
+the shortlist return every name, so small caches score exactly as before.
+
+Indexes are immutable. ``NameIndexSlot`` rebuilds one when the owning cache object is replaced
+and publishes it with a single reference swap, so readers always see one consistent snapshot.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on names handed to a fuzzy scorer per query.
+SHORTLIST_SIZE = 256
+NGRAM_SIZE = 3
+
+Normalizer = Callable[[str], str]
+
+
+@dataclass(frozen=True, slots=True)
+class IndexEntry:
+    name: str
+    norm: str
+    governor_id: str
+    payload: Any = None
+
+
+def name_grams(norm: str) -> set[str]:
+    """Padded character trigrams, so two-character queries still hit name starts."""
+    padded = f" {norm} "
+    if len(padded) <= NGRAM_SIZE:
+        return {padded}
+    return {padded[i : i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+
+
+class GovernorNameIndex:
+    """Immutable name/ID index; see the module docstring."""
+
+    def __init__(
+        self,
+        items: Iterable[tuple[str, Any, Any]],
+        *,
+        normalize: Normalizer,
+    ) -> None:
+        """``items`` yields ``(display_name, governor_id, payload)``; blank names are skipped."""
+        entries: list[IndexEntry] = []
+        norm_entries: dict[str, list[int]] = {}
+        by_id: dict[str, list[int]] = {}
+        for name, governor_id, payload in items:
+            display = str(name or "").strip()
+            if not display:
+                continue
+            entry = IndexEntry(
+                name=display,
+                norm=normalize(display),
+                governor_id=str(governor_id if governor_id is not None else "").strip(),
+                payload=payload,
+            )
+            pos = len(entries)
+            entries.append(entry)
+            norm_entries.setdefault(entry.norm, []).append(pos)
+            if entry.governor_id:
+                by_id.setdefault(entry.governor_id, []).append(pos)
+
+        self.normalize = normalize
+        self.entries: tuple[IndexEntry, ...] = tuple(entries)
+        # Distinct names in first-seen order; shortlist positions refer to this list.
+        self.norms: tuple[str, ...] = tuple(norm_entries)
+        self._norm_entries = {norm: tuple(pos) for norm, pos in norm_entries.items()}
+        self._by_id = {gid: tuple(pos) for gid, pos in by_id.items()}
+        order = sorted(range(len(self.norms)), key=self.norms.__getitem__)
+        self._sorted_norms = [self.norms[nid] for nid in order]
+        self._sorted_nids = order
+
+        postings: dict[str, list[int]] = {}
+        for nid, norm in enumerate(self.norms):
+            for gram in name_grams(norm):
+                postings.setdefault(gram, []).append(nid)
+        self._postings = {gram: tuple(ids) for gram, ids in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def entries_for(self, norm: str) -> tuple[IndexEntry, ...]:
+        """Every entry whose normalised name is exactly ``norm`` (duplicates in source order)."""
+        return tuple(self.entries[pos] for pos in self._norm_entries.get(norm, ()))
+
+    def first_for(self, norm: str) -> IndexEntry | None:
+        positions = self._norm_entries.get(norm)
+        return self.entries[positions[0]] if positions else None
+
+    def by_governor_id(self, governor_id: str | int) -> tuple[IndexEntry, ...]:
+        gid = str(governor_id or "").strip()
+        return tuple(self.entries[pos] for pos in self._by_id.get(gid, ()))
+
+    def prefix(self, norm_prefix: str, limit: int) -> list[str]:
+        """Distinct names starting with ``norm_prefix``, alphabetically, at most ``limit``."""
+        return [self.norms[nid] for nid in self._prefix_ids(norm_prefix, limit)]
+
+    def _prefix_ids(self, norm_prefix: str, limit: int) -> list[int]:
+        if not norm_prefix or limit <= 0:
+            return []
+        out: list[int] = []
+        pos = bisect_left(self._sorted_norms, norm_prefix)
+        while pos < len(self._sorted_norms) and len(out) < limit:
+            if not self._sorted_norms[pos].startswith(norm_prefix):
+                break
+            out.append(self._sorted_nids[pos])
+            pos += 1
+        return out
+
+    def shortlist(self, query_norm: str, size: int = SHORTLIST_SIZE) -> list[str]:
+        """
+        Distinct names worth fuzzy-scoring for ``query_norm``, in first-seen order.
+
+        Names sharing the most trigrams with the query are kept, topped up with prefix matches.
+        """
+        if len(self.norms) <= size:
+            return list(self.norms)
+        if not query_norm:
+            return list(self.norms[:size])
+
+        counts: Counter[int] = Counter()
+        for gram in name_grams(query_norm):
+            posting = self._postings.get(gram)
+            if posting:
+                counts.update(posting)
+        picked = {nid for nid, _hits in counts.most_common(size)}
+        picked.update(self._prefix_ids(query_norm, size))
+        return [self.norms[nid] for nid in sorted(picked)]
+
+
+class NameIndexSlot:
+    """
+    Current index for one cache, rebuilt when the cache's source object (or version) changes.
+
+    Readers call ``get(source, items)``; the first reader after a refresh builds the index under
+    a lock and every later reader gets the published snapshot without locking.
+    """
+
+    def __init__(self, label: str, *, normalize: Normalizer) -> None:
+        self.label = label
+        self.normalize = normalize
+        self._lock = threading.Lock()
+        # (source, version, index), replaced as one reference so readers never see a mix.
+        self._state: tuple[Any, Hashable, GovernorNameIndex] | None = None
+
+    def _current(self, source: Any, version: Hashable) -> GovernorNameIndex | None:
+        state = self._state
+        if state is not None and state[0] is source and state[1] == version:
+            return state[2]
+        return None
+
+    @property
+    def index(self) -> GovernorNameIndex | None:
+        state = self._state
+        return state[2] if state is not None else None
+
+    def get(
+        self,
+        source: Any,
+        items: Callable[[], Iterable[tuple[str, Any, Any]]],
+        *,
+        version: Hashable = None,
+    ) -> GovernorNameIndex:
+        index = self._current(source, version)
+        if index is not None:
+            return index
+        with self._lock:
+            index = self._current(source, version)
+            if index is not None:
+                return index
+            return self._build(source, items, version)
+
+    def publish(
+        self,
+        source: Any,
+        items: Iterable[tuple[str, Any, Any]],
+        *,
+        version: Hashable = None,
+    ) -> GovernorNameIndex:
+        """Build eagerly (e.g. from a refresh worker) so the next search doesn't pay for it."""
+        with self._lock:
+            return self._build(source, lambda: items, version)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._state = None
+
+    def _build(
+        self,
+        source: Any,
+        items: Callable[[], Iterable[tuple[str, Any, Any]]],
+        version: Hashable,
+    ) -> GovernorNameIndex:
+        started = time.perf_counter()
+        index = GovernorNameIndex(items(), normalize=self.normalize)
+        self._state = (source, version, index)
+        logger.debug(
+            "[NAME_INDEX] %s rebuilt entries=%d names=%d grams=%d build_ms=%.1f",
+            self.label,
+            len(index),
+            len(index.norms),
+            len(index._postings),
+            (time.perf_counter() - started) * 1000.0,
+        )
+        return index
@@ -0,0 +1,309 @@
+# gsheet_delta.py
+"""
+Delta sync for Google Sheets exports.
+
+``gsheet_module.export_dataframe_to_sheet`` used to ``clear()`` every worksheet and rewrite every
+cell, and ``transfer_and_sort`` then sorted the whole tab server-side, even when only a handful of
+governors changed. With delta sync a fingerprint of the last grid written to each worksheet is
+kept on disk (``DATA_DIR/gsheet_delta/``):
+
+- the header digest, column count and one short digest per data row, in sheet order
+- ``plan_sheet_delta`` compares a new grid with it and returns the changed row runs, which the
+  exporter sends as a single ``values:batchUpdate``; rows that disappeared are blanked
+- sorting happens in pandas before the diff (``sort_frame_like_sheet``), so row positions in
+  the fingerprint always match the sheet and no ``sortRange`` call is needed
+- a missing, stale (``GSHEET_DELTA_MAX_AGE_HOURS``) or differently-shaped fingerprint, a changed
+  header or ``GSHEET_FORCE_FULL_REWRITE=1`` falls back to the clear-and-rewrite path
+- ``GSHEET_DELTA_SYNC=0`` restores the old behaviour entirely
+
+This module is pure: it never talks to Google, so plans can be produced for dry runs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import time
+from typing import Any
+
+from constants import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_DIR = Path(DATA_DIR) / "gsheet_delta"
+FINGERPRINT_VERSION = 1
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+def delta_sync_enabled() -> bool:
+    return _env_flag("GSHEET_DELTA_SYNC", "1")
+
+
+def force_full_rewrite() -> bool:
+    return _env_flag("GSHEET_FORCE_FULL_REWRITE", "0")
+
+
+GSHEET_DELTA_MAX_AGE_HOURS = _env_float("GSHEET_DELTA_MAX_AGE_HOURS", 24.0)
+# Changed-row runs closer than this many unchanged rows are sent as one range.
+GSHEET_DELTA_MERGE_GAP = max(0, _env_int("GSHEET_DELTA_MERGE_GAP", 3))
+
+
+def row_digest(row: list[Any]) -> str:
+    raw = json.dumps(row, ensure_ascii=False, default=str, separators=(",", ":"))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def column_letter(n: int) -> str:
+    """1-based column number -> A1 letters (1 -> A, 27 -> AA)."""
+    letters = ""
+    while n > 0:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def a1_range(title: str, first_row: int, last_row: int, n_cols: int) -> str:
+    """A1 range for 1-based sheet rows ``first_row..last_row`` across ``n_cols`` columns."""
+    quoted = "'" + title.replace("'", "''") + "'"
+    return f"{quoted}!A{first_row}:{column_letter(max(1, n_cols))}{last_row}"
+
+
+@dataclass(frozen=True)
+class SheetFingerprint:
+    header: str
+    n_cols: int
+    rows: tuple[str, ...]
+    written_at: float
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "version": FINGERPRINT_VERSION,
+            "header": self.header,
+            "n_cols": self.n_cols,
+            "rows": list(self.rows),
+            "written_at": self.written_at,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> SheetFingerprint | None:
+        if not isinstance(data, dict) or data.get("version") != FINGERPRINT_VERSION:
+            return None
+        return cls(
+            header=str(data.get("header") or ""),
+            n_cols=int(data.get("n_cols") or 0),
+            rows=tuple(str(r) for r in data.get("rows") or ()),
+            written_at=float(data.get("written_at") or 0.0),
+        )
+
+
+def grid_fingerprint(
+    values: list[list[Any]], *, written_at: float | None = None
+) -> SheetFingerprint:
+    """Fingerprint of a header-first grid as written to the sheet."""
+    header = values[0] if values else []
+    return SheetFingerprint(
+        header=row_digest(list(header)),
+        n_cols=len(header),
+        rows=tuple(row_digest(list(row)) for row in values[1:]),
+        written_at=time.time() if written_at is None else written_at,
+    )
+
+
+@dataclass
+class DeltaPlan:
+    """What an export would change; ``mode`` is ``full``, ``delta`` or ``noop``."""
+
+    mode: str
+    reason: str
+    total_rows: int
+    n_cols: int
+    # (first 0-based data row, rows) runs to write; blanked rows are included as "" rows.
+    runs: list[tuple[int, list[list[Any]]]] = field(default_factory=list)
+    changed_rows: int = 0
+    appended_rows: int = 0
+    removed_rows: int = 0
+
+    @property
+    def cells(self) -> int:
+        return sum(len(rows) for _start, rows in self.runs) * self.n_cols
+
+    def value_ranges(self, title: str) -> list[dict[str, Any]]:
+        """``data`` entries for ``values:batchUpdate`` (row 1 is the header, data starts at 2)."""
+        return [
+            {
+                "range": a1_range(title, start + 2, start + 1 + len(rows), self.n_cols),
+                "values": rows,
+            }
+            for start, rows in self.runs
+        ]
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "reason": self.reason,
+            "rows": self.total_rows,
+            "cols": self.n_cols,
+            "changed_rows": self.changed_rows,
+            "appended_rows": self.appended_rows,
+            "removed_rows": self.removed_rows,
+            "ranges": len(self.runs),
+            "cells": self.cells,
+        }
+
+
+def plan_sheet_delta(
+    values: list[list[Any]],
+    previous: SheetFingerprint | None,
+    *,
+    force_full: bool = False,
+    max_age_hours: float | None = None,
+    merge_gap: int | None = None,
+    now: float | None = None,
+) -> DeltaPlan:
+    """Compare a header-first grid with the last written fingerprint."""
+    header = list(values[0]) if values else []
+    data = [list(row) for row in values[1:]]
+    n_cols = len(header)
+    total = len(data)
+
+    def full(reason: str) -> DeltaPlan:
+        return DeltaPlan(
+            mode="full", reason=reason, total_rows=total, n_cols=n_cols, changed_rows=total
+        )
+
+    max_age = GSHEET_DELTA_MAX_AGE_HOURS if max_age_hours is None else max_age_hours
+    current = time.time() if now is None else now
+    if force_full:
+        return full("forced")
+    if previous is None:
+        return full("no fingerprint")
+    if max_age > 0 and current - previous.written_at > max_age * 3600:
+        return full("fingerprint expired")
+    if previous.n_cols != n_cols or previous.header != row_digest(header):
+        return full("header changed")
+
+    old_rows = previous.rows
+    changed = [
+        i for i, row in enumerate(data) if i >= len(old_rows) or old_rows[i] != row_digest(row)
+    ]
+    blank = [""] * n_cols
+    removed = list(range(total, len(old_rows)))
+    dirty = changed + removed
+    if not dirty:
+        return DeltaPlan(mode="noop", reason="unchanged", total_rows=total, n_cols=n_cols)
+
+    gap = GSHEET_DELTA_MERGE_GAP if merge_gap is None else max(0, merge_gap)
+    runs: list[tuple[int, list[list[Any]]]] = []
+    run_start = run_end = dirty[0]
+    for idx in dirty[1:] + [None]:
+        if idx is not None and idx - run_end <= gap + 1:
+            run_end = idx
+            continue
+        rows = [data[i] if i < total else blank for i in range(run_start, run_end + 1)]
+        runs.append((run_start, rows))
+        if idx is not None:
+            run_start = run_end = idx
+
+    return DeltaPlan(
+        mode="delta",
+        reason="rows changed",
+        total_rows=total,
+        n_cols=n_cols,
+        runs=runs,
+        changed_rows=sum(1 for i in changed if i < len(old_rows)),
+        appended_rows=max(0, total - len(old_rows)),
+        removed_rows=len(removed),
+    )
+
+
+# ----- fingerprint store -----
+def fingerprint_key(spreadsheet_id: str, sheet_id: Any) -> str:
+    return f"{spreadsheet_id}_{sheet_id}"
+
+
+def _fingerprint_path(key: str) -> Path:
+    return FINGERPRINT_DIR / (re.sub(r"[^A-Za-z0-9_.-]", "_", key) + ".json")
+
+
+def load_fingerprint(key: str) -> SheetFingerprint | None:
+    try:
+        with _fingerprint_path(key).open(encoding="utf-8") as f:
+            return SheetFingerprint.from_json(json.load(f))
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning("[GSHEET_DELTA] unreadable fingerprint %s; full rewrite", key)
+        return None
+
+
+def save_fingerprint(key: str, fingerprint: SheetFingerprint) -> None:
+    from file_utils import atomic_write_json
+
+    try:
+        atomic_write_json(_fingerprint_path(key), fingerprint.to_json())
+    except Exception:
+        # Without a fingerprint the next export simply rewrites the tab.
+        logger.warning("[GSHEET_DELTA] failed to save fingerprint %s", key, exc_info=True)
+        forget_fingerprint(key)
+
+
+def forget_fingerprint(key: str) -> None:
+    try:
+        _fingerprint_path(key).unlink(missing_ok=True)
+    except Exception:
+        logger.debug("[GSHEET_DELTA] failed to remove fingerprint %s", key, exc_info=True)
+
+
+# ----- local sorting -----
+def sort_frame_like_sheet(df, sort_specs: list[tuple[int, str]]):
+    """
+    Sort ``df`` the way a Sheets ``sortRange`` over its data rows would (stable, blanks last,
+    text case-insensitive), so rows can be written in their final order.
+    """
+    import pandas as pd
+    from pandas.api import types as ptypes
+
+    if df is None or df.empty or not sort_specs:
+        return df
+    by = []
+    ascending = []
+    for idx, order in sort_specs:
+        if 0 <= idx < len(df.columns):
+            by.append(df.columns[idx])
+            ascending.append(str(order).upper() != "DESCENDING")
+    if not by:
+        return df
+
+    def _key(col: pd.Series) -> pd.Series:
+        if ptypes.is_numeric_dtype(col):
+            return col
+        numeric = pd.to_numeric(col, errors="coerce")
+        if numeric.notna().sum() == col.notna().sum():
+            return numeric
+        return col.where(col.isna(), col.astype(str).str.lower())
+
+    return df.sort_values(
+        by=by, ascending=ascending, kind="mergesort", na_position="last", key=_key
+    ).reset_index(drop=True)
@@ -16,8 +16,8 @@ import platform
 import random
 import ssl
 import sys
+import threading
 import time
-import traceback
 from typing import Any
 import uuid
 
@@ -37,6 +37,19 @@ from sqlalchemy import create_engine
 from urllib3.util.retry import Retry
 
 from constants import CONFIG_FILE, CREDENTIALS_FILE
+from gsheet_delta import (
+    DeltaPlan,
+    delta_sync_enabled,
+    fingerprint_key,
+    force_full_rewrite,
+    forget_fingerprint,
+    grid_fingerprint,
+    load_fingerprint,
+    plan_sheet_delta,
+    save_fingerprint,
+    sort_frame_like_sheet,
+)
+from gsheet_scheduler import ExportJob, defer_quota, run_export_jobs, throttle
 from kvk.services.kvk_export_service import (
     KVK_EXPORT_SECTION_NAMES,
     KvkExportBindingError,
@@ -289,6 +302,28 @@ def _pagination_miss_delay() -> float:
     return 2.0 + random.random() * 3.0
 
 
+def _rate_limit_retry_after(exc: Exception) -> float | None:
+    """Seconds Google asked us to wait when ``exc`` is a 429 (0.0 if it gave no Retry-After)."""
+    resp = getattr(exc, "response", None) or getattr(exc, "resp", None)
+    status = getattr(resp, "status_code", None) or getattr(resp, "status", None)
+    try:
+        if int(status) != 429:
+            return None
+    except Exception:
+        return None
+    headers = getattr(resp, "headers", None) or (resp if isinstance(resp, dict) else {})
+    try:
+        return float(headers.get("Retry-After") or headers.get("retry-after") or 0.0)
+    except Exception:
+        return 0.0
+
+
+def _quota_for_action(action_desc: str) -> str:
+    """Sheets quota bucket an action draws from (see ``gsheet_scheduler``)."""
+    reads = ("open_spreadsheet", "open_by_key", "get_worksheet")
+    return "read" if action_desc.startswith(reads) else "write"
+
+
 def _is_retryable_gspread_details(details: dict) -> bool:
     sc = details.get("status_code")
     status = details.get("status")
@@ -319,13 +354,22 @@ def _is_retryable_gspread_details(details: dict) -> bool:
 # Central safe execute for googleapiclient requests
 # -------------------------
 def _safe_execute(
-    request: Any, *, retries: int = 5, base_sleep: float = 0.5, max_sleep: float = 20.0
+    request: Any,
+    *,
+    retries: int = 5,
+    base_sleep: float = 0.5,
+    max_sleep: float = 20.0,
+    quota: str | None = "write",
 ):
     """
     Execute googleapiclient request with bounded retries + full-jitter.
+    Each attempt takes a token from the ``quota`` bucket: ``"write"`` (the default) for
+    updates/batchUpdate, ``"read"`` for values().get and other reads, None for non-Sheets APIs
+    such as Drive.
     """
     attempt = 0
     while True:
+        throttle(quota)
         try:
             return request.execute(num_retries=0)
         except Exception as exc:
@@ -358,6 +402,11 @@ def _safe_execute(
                 )
                 raise
             sleep_s = _full_jitter_sleep(attempt, base_sleep, max_sleep)
+            retry_after = _rate_limit_retry_after(exc)
+            if retry_after is not None:
+                # Quota exhausted: hold back every worker sharing the bucket, not just this one.
+                sleep_s = max(sleep_s, retry_after)
+                defer_quota(quota, sleep_s)
             logger.info(
                 "[GSHEET] Transient error (%s). Retry %d/%d in %.2fs",
                 type(exc).__name__,
@@ -379,13 +428,17 @@ def _retry_gspread_call(
     retries: int = 5,
     base_sleep: float = 1.0,
     max_sleep: float = 20.0,
+    quota: str | None = None,
 ):
     """
     Generic wrapper to perform a gspread operation with retries on transient server errors.
+    Each attempt takes a quota token; ``quota`` defaults to the bucket implied by action_desc.
     """
+    quota = quota or _quota_for_action(action_desc)
     attempt = 0
     while True:
         attempt += 1
+        throttle(quota)
         start = time.time()
         try:
             result = fn()
@@ -456,6 +509,7 @@ def _retry_gspread_call(
             retry_after = details.get("retry_after")
             if retry_after and isinstance(retry_after, (int, float)):
                 sleep_s = float(retry_after)
+                defer_quota(quota, sleep_s)
             elif _is_spreadsheet_not_found_transient(exc):
                 # Give the Drive listing cache time to refresh (2–5 s with jitter)
                 sleep_s = _pagination_miss_delay()
@@ -737,10 +791,10 @@ def _prepare_kvk_export_df(df: pd.DataFrame, kvk_no: int) -> pd.DataFrame:
 # -------------------------
 # gspread convenience helpers
 # -------------------------
-def _get_or_create_ws(ss: gspread.Spreadsheet, title: str, cols: int = 26) -> gspread.Worksheet:
+def _find_ws(ss: gspread.Spreadsheet, title: str) -> gspread.Worksheet | None:
     """
-    Return a worksheet by title; create if not found.
-    Normalizes titles for fallback search and tolerates race-create.
+    Return a worksheet by title (exact, then whitespace/case-insensitive), or None.
+    Never creates anything, so it is safe for dry runs.
     """
     try:
         return ss.worksheet(title)
@@ -754,6 +808,17 @@ def _get_or_create_ws(ss: gspread.Spreadsheet, title: str, cols: int = 26) -> gs
     for ws in ss.worksheets():
         if norm(ws.title) == wanted:
             return ws
+    return None
+
+
+def _get_or_create_ws(ss: gspread.Spreadsheet, title: str, cols: int = 26) -> gspread.Worksheet:
+    """
+    Return a worksheet by title; create if not found.
+    Normalizes titles for fallback search and tolerates race-create.
+    """
+    ws = _find_ws(ss, title)
+    if ws is not None:
+        return ws
 
     try:
         return _retry_gspread_call(
@@ -766,26 +831,64 @@ def _get_or_create_ws(ss: gspread.Spreadsheet, title: str, cols: int = 26) -> gs
         raise
 
 
+def _write_delta(
+    ws: gspread.Worksheet,
+    plan: DeltaPlan,
+    service=None,
+    correlation_id: str | None = None,
+) -> bool:
+    """Send a delta plan as one values:batchUpdate; returns True if the grid had to grow."""
+    grew = False
+    needed_rows = plan.total_rows + 1
+    row_count = getattr(ws, "row_count", None)
+    if isinstance(row_count, int) and needed_rows > row_count:
+        _retry_gspread_call(
+            lambda: ws.add_rows(needed_rows - row_count),
+            action_desc=f"sheet.add_rows:{getattr(ws, 'title', '')}",
+            correlation_id=correlation_id,
+        )
+        grew = True
+
+    data = plan.value_ranges(ws.title)
+    if service and getattr(service, "_authorized_session", None):
+        req = (
+            service.spreadsheets()
+            .values()
+            .batchUpdate(
+                spreadsheetId=ws.spreadsheet.id,
+                body={"valueInputOption": "RAW", "data": data},
+            )
+        )
+        _safe_execute(req, quota="write")
+    else:
+        _retry_gspread_call(
+            lambda: ws.batch_update(data, value_input_option="RAW"),
+            action_desc=f"sheet.batch_update:{getattr(ws, 'title', '')}",
+            correlation_id=correlation_id,
+        )
+    return grew
+
+
 def export_dataframe_to_sheet(
     ws: gspread.Worksheet,
     df: pd.DataFrame,
     service=None,
     format_columns: list[int] | list[str] | None = None,
     correlation_id: str | None = None,
-):
+    *,
+    force_full: bool | None = None,
+    dry_run: bool = False,
+) -> DeltaPlan | None:
     """
     Export DataFrame to worksheet with retries around gspread update operations.
     Uses batch update via Google Sheets API if service is provided (to get timeouts).
     Preserves numeric types. Auto-applies integer formatting for integer-like columns unless overridden.
-    """
-    # clear then update
-    _retry_gspread_call(
-        lambda: ws.clear(),
-        action_desc=f"sheet.clear:{getattr(ws, 'title', '')}",
-        correlation_id=correlation_id,
-    )
-    time.sleep(random.uniform(0.1, 0.6))
 
+    With delta sync (see gsheet_delta) only rows that changed since the last export are written,
+    in one values:batchUpdate; the first export, a header change or force_full rewrites the tab.
+    dry_run returns the plan without touching the sheet. Returns the plan, or None when delta
+    sync is disabled.
+    """
     # Work on a copy
     df_local = df.copy()
 
@@ -802,6 +905,47 @@ def export_dataframe_to_sheet(
     for _, row in df_local.iterrows():
         values.append([_coerce_cell_for_sheet(v) for v in row.tolist()])
 
+    sheet_label = f"{getattr(ws.spreadsheet, 'title', '?')}/{getattr(ws, 'title', '?')}"
+    plan: DeltaPlan | None = None
+    delta_key: str | None = None
+    if delta_sync_enabled() or dry_run:
+        delta_key = fingerprint_key(ws.spreadsheet.id, ws.id)
+        plan = plan_sheet_delta(
+            values,
+            load_fingerprint(delta_key),
+            force_full=force_full_rewrite() if force_full is None else force_full,
+        )
+        logger.info(
+            "[GSHEET_DELTA] %s%s %s",
+            "dry-run " if dry_run else "",
+            sheet_label,
+            plan.summary(),
+        )
+        if dry_run or plan.mode == "noop":
+            return plan
+        if plan.mode == "delta":
+            try:
+                grew = _write_delta(ws, plan, service=service, correlation_id=correlation_id)
+            except Exception:
+                # The tab is in an unknown state now; make the next export rewrite it.
+                forget_fingerprint(delta_key)
+                logger.exception("[GSHEET] Delta export failed for %s", sheet_label)
+                raise
+            save_fingerprint(delta_key, grid_fingerprint(values))
+            if grew:
+                _apply_export_number_formats(ws, df, df_local, service, format_columns)
+            return plan
+
+    # Full rewrite: clear then update
+    if delta_key is not None:
+        forget_fingerprint(delta_key)
+    _retry_gspread_call(
+        lambda: ws.clear(),
+        action_desc=f"sheet.clear:{getattr(ws, 'title', '')}",
+        correlation_id=correlation_id,
+    )
+    time.sleep(random.uniform(0.1, 0.6))
+
     # Prefer Sheets API batch update if available
     try:
         if service and getattr(service, "_authorized_session", None):
@@ -818,7 +962,7 @@ def export_dataframe_to_sheet(
                     body=body,
                 )
             )
-            _safe_execute(req)
+            _safe_execute(req, quota="write")
         else:
 
             def _do_update():
@@ -837,6 +981,19 @@ def export_dataframe_to_sheet(
         )
         raise
 
+    if delta_key is not None:
+        save_fingerprint(delta_key, grid_fingerprint(values))
+    _apply_export_number_formats(ws, df, df_local, service, format_columns)
+    return plan
+
+
+def _apply_export_number_formats(
+    ws: gspread.Worksheet,
+    df: pd.DataFrame,
+    df_local: pd.DataFrame,
+    service,
+    format_columns: list[int] | list[str] | None,
+) -> None:
     # Determine columns to format as integers ("0" pattern)
     # 1) Auto-detect integer-like columns using the ORIGINAL df (pre-stringify)
     auto_int_idxs = _detect_integer_like_columns(df)
@@ -961,7 +1118,7 @@ def set_number_format(
         )
     body = {"requests": requests_payload}
     req = service.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body=body)
-    _safe_execute(req)
+    _safe_execute(req, quota="write")
 
 
 def sort_worksheet_multi(
@@ -1000,7 +1157,7 @@ def sort_worksheet_multi(
         ]
     }
     req = service.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body=body)
-    _safe_execute(req, retries=retries)
+    _safe_execute(req, retries=retries, quota="write")
 
 
 def _reorder_sheet_tabs(
@@ -1033,28 +1190,20 @@ def _reorder_sheet_tabs(
 
     body = {"requests": requests_payload}
     req = service.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body=body)
-    _safe_execute(req, retries=3)
+    _safe_execute(req, retries=3, quota="write")
 
 
-def _sort_kvk_export_sheet(
-    service,
-    spreadsheet_id: str,
-    ws: gspread.Worksheet,
-    df_to_write: pd.DataFrame,
-    sheet_name: str,
-    tab_name: str,
-) -> None:
-    if not service or df_to_write is None or df_to_write.empty:
-        return
+def _kvk_sort_specs(
+    df_to_write: pd.DataFrame, sheet_name: str, tab_name: str
+) -> list[tuple[int, str]]:
+    if df_to_write is None or df_to_write.empty:
+        return []
 
     dkp_idx = _find_col_index_case_insensitive(df_to_write, ["dkp", "dkp_score"])
     last_scan_idx = _find_col_index_case_insensitive(df_to_write, ["last_scan_id", "lastscanid"])
 
     if dkp_idx is None:
-        return
-
-    total_rows = len(df_to_write.index) + 1
-    total_cols = len(df_to_write.columns)
+        return []
 
     windowed_tabs = {
         "KVK_Player_Windowed",
@@ -1067,23 +1216,40 @@ def _sort_kvk_export_sheet(
         and tab_name in windowed_tabs
         and last_scan_idx is not None
     ):
-        sort_worksheet_multi(
-            service,
-            spreadsheet_id,
-            ws.id,
-            total_rows,
-            total_cols,
-            [(last_scan_idx, "ASCENDING"), (dkp_idx, "DESCENDING")],
-        )
-    else:
-        sort_worksheet_multi(
-            service,
-            spreadsheet_id,
-            ws.id,
-            total_rows,
-            total_cols,
-            [(dkp_idx, "DESCENDING")],
-        )
+        return [(last_scan_idx, "ASCENDING"), (dkp_idx, "DESCENDING")]
+    return [(dkp_idx, "DESCENDING")]
+
+
+def _presort_kvk_export(df_to_write: pd.DataFrame, sheet_name: str, tab_name: str) -> pd.DataFrame:
+    """Under delta sync KVK tabs are sorted before writing instead of by a sortRange after."""
+    if not delta_sync_enabled():
+        return df_to_write
+    return sort_frame_like_sheet(df_to_write, _kvk_sort_specs(df_to_write, sheet_name, tab_name))
+
+
+def _sort_kvk_export_sheet(
+    service,
+    spreadsheet_id: str,
+    ws: gspread.Worksheet,
+    df_to_write: pd.DataFrame,
+    sheet_name: str,
+    tab_name: str,
+) -> None:
+    # Delta-synced tabs were written in sorted order (_presort_kvk_export); a server-side sort
+    # could order ties differently and desync the row fingerprint.
+    if not service or delta_sync_enabled():
+        return
+    sort_specs = _kvk_sort_specs(df_to_write, sheet_name, tab_name)
+    if not sort_specs:
+        return
+    sort_worksheet_multi(
+        service,
+        spreadsheet_id,
+        ws.id,
+        len(df_to_write.index) + 1,
+        len(df_to_write.columns),
+        sort_specs,
+    )
 
 
 # -------------------------
@@ -1100,11 +1266,19 @@ def transfer_and_sort(
     date_cols: list[str] | None = None,
     sort_order: str = "ASCENDING",
     format_columns: list[int] | None = None,
-):
+    *,
+    force_full: bool | None = None,
+    dry_run: bool = False,
+    df: pd.DataFrame | None = None,
+) -> DeltaPlan | None:
+    """
+    Export ``query`` to ``sheet_name > tab_name``. ``df`` is the query's already-fetched result
+    (run_all_exports loads each job's frame on its worker); it is not modified.
+    """
     correlation_id = str(uuid.uuid4())
     start_total = time.time()
 
-    df = pd.read_sql(query, engine)
+    df = pd.read_sql(query, engine) if df is None else df.copy()
     if date_cols:
         for col in date_cols:
             if col in df.columns:
@@ -1114,6 +1288,11 @@ def transfer_and_sort(
                     .dt.strftime("%Y-%m-%d %H:%M:%S")
                 )
 
+    # Delta sync writes rows in their final order, so the sort happens here rather than in Sheets.
+    presorted = sort_column_index is not None and delta_sync_enabled()
+    if presorted:
+        df = sort_frame_like_sheet(df, [(sort_column_index, sort_order)])
+
     ss = _retry_gspread_call(
         lambda: client.open(sheet_name),
         action_desc=f"open_spreadsheet:{sheet_name}",
@@ -1127,13 +1306,35 @@ def transfer_and_sort(
             correlation_id=correlation_id,
         )
     except gspread.WorksheetNotFound:
-        ws = _get_or_create_ws(ss, tab_name, cols=max(1, len(df.columns)))
+        if dry_run:
+            ws = _find_ws(ss, tab_name)
+            if ws is None:
+                # A real run would create the tab and write everything.
+                plan = DeltaPlan(
+                    mode="full",
+                    reason="tab missing",
+                    total_rows=len(df.index),
+                    n_cols=len(df.columns),
+                    changed_rows=len(df.index),
+                )
+                logger.info("[GSHEET_DELTA] dry-run %s/%s %s", sheet_name, tab_name, plan.summary())
+                return plan
+        else:
+            ws = _get_or_create_ws(ss, tab_name, cols=max(1, len(df.columns)))
 
-    export_dataframe_to_sheet(
-        ws, df, service=service, format_columns=format_columns or [], correlation_id=correlation_id
+    plan = export_dataframe_to_sheet(
+        ws,
+        df,
+        service=service,
+        format_columns=format_columns or [],
+        correlation_id=correlation_id,
+        force_full=force_full,
+        dry_run=dry_run,
     )
+    if dry_run:
+        return plan
 
-    if sort_column_index is not None and service:
+    if sort_column_index is not None and service and not presorted:
         try:
             # Ensure we sort only the data rows (exclude header row at index 0)
             # Compute the row/column bounds based on the exported dataframe
@@ -1159,7 +1360,7 @@ def transfer_and_sort(
                 ]
             }
             req = service.spreadsheets().batchUpdate(spreadsheetId=ss.id, body=spa)
-            _safe_execute(req, retries=3)
+            _safe_execute(req, retries=3, quota="write")
         except Exception:
             logger.exception("[GSHEET] Sorting failed for %s/%s", sheet_name, tab_name)
 
@@ -1176,6 +1377,7 @@ def transfer_and_sort(
         GOOGLE_API_CLIENT_VERSION,
     )
     print(f"[SUCCESS] Exported to {sheet_name} > {tab_name}")
+    return plan
 
 
 # -------------------------
@@ -1218,6 +1420,7 @@ def run_all_exports(
     engine = get_sql_engine(server, database, username, password)
     client = get_gsheet_client(credentials_file)
     service = get_sort_service(credentials_file)
+    clients = _per_thread_clients(credentials_file, client, service)
 
     log_messages: list[str] = []
 
@@ -1225,123 +1428,85 @@ def run_all_exports(
         print(msg)
         log_messages.append(msg)
 
-    def wrapped_transfer(*args, **kwargs):
-        retries = 5
-        base_delay = 2.0
-        sheet_name = kwargs.get("sheet_name", "")
-        tab_name = kwargs.get("tab_name", "")
-        notify = kwargs.get("notify_channel", notify_channel)
-        loop = kwargs.get("bot_loop", bot_loop)
-        correlation_id = str(uuid.uuid4())
-
-        e = None
-        tb = ""
-
-        for attempt in range(1, retries + 1):
+    def _retry_delay(job: ExportJob, ex: BaseException) -> float | None:
+        details = _extract_api_error_details(ex)
+        retryable = _is_retryable_gspread_details(details)
+        # SpreadsheetNotFound with a 2xx HTTP response = Drive listing pagination miss → retryable.
+        # A None/absent status_code is excluded by _is_spreadsheet_not_found_transient()
+        # and is treated as a genuine missing-sheet error.
+        if _is_spreadsheet_not_found_transient(ex):
+            retryable = True
+        kind = "APIError" if isinstance(ex, APIError) else "General error"
+        _append_log(f"[⚠️ RETRY {job.attempts}] {job.name}: {kind}: {ex}")
+        _append_log(job.traceback)
+        logger.info(
+            "[wrapped_transfer] correlation=%s attempt=%d job=%s exception=%s",
+            job.meta["correlation_id"],
+            job.attempts,
+            job.name,
+            type(ex).__name__,
+        )
+        if not retryable or job.attempts >= job.max_attempts:
+            return None
+
+        retry_after = details.get("retry_after")
+        if retry_after and isinstance(retry_after, (int, float)):
+            delay = float(retry_after)
+            # Google is throttling this service account; every spreadsheet backs off.
+            defer_quota("write", delay)
+        elif _is_spreadsheet_not_found_transient(ex):
+            # Give the Drive listing cache time to refresh (2–5 s with jitter)
+            delay = _pagination_miss_delay()
+        else:
+            delay = _full_jitter_sleep(job.attempts, 2.0, 60.0)
+        _append_log(
+            f"[INFO] {job.name} retrying in {delay:.2f}s ({job.attempts + 1}/{job.max_attempts})"
+        )
+        return delay
+
+    def _give_up(job: ExportJob, e: BaseException) -> None:
+        # give up and optionally alert via discord
+        _append_log(f"[ERROR] Giving up on {job.name}: {e}")
+        sheet_name, tab_name = job.meta["sheet"], job.meta["tab"]
+        notify = notify_channel
+        loop = bot_loop
+        tb = job.traceback
+        if notify:
             try:
-                safe_kwargs = {
-                    k: v for k, v in kwargs.items() if k not in ("notify_channel", "bot_loop")
-                }
-                transfer_and_sort(*args, **safe_kwargs)
-                msg = f"[OK] {sheet_name} > {tab_name}"
-                _append_log(msg)
-                return
-            except APIError as ex:
-                e = ex
-                tb = traceback.format_exc()
-                details = _extract_api_error_details(ex)
-                retryable = _is_retryable_gspread_details(details)
-                # SpreadsheetNotFound with 2xx/no status = Drive pagination miss → retryable
-                if _is_spreadsheet_not_found_transient(ex):
-                    retryable = True
-                msg = f"[⚠️ RETRY {attempt}] {sheet_name} > {tab_name}: APIError: {ex}"
-                logger.info(
-                    "[wrapped_transfer] correlation=%s attempt=%d sheet=%s tab=%s exception=%s",
-                    correlation_id,
-                    attempt,
-                    sheet_name,
-                    tab_name,
-                    type(ex).__name__,
-                )
-            except Exception as ex:
-                e = ex
-                tb = traceback.format_exc()
-                details = _extract_api_error_details(ex)
-                retryable = _is_retryable_gspread_details(details)
-                # SpreadsheetNotFound with a 2xx HTTP response = Drive listing pagination miss → retryable.
-                # A None/absent status_code is excluded by _is_spreadsheet_not_found_transient()
-                # and is treated as a genuine missing-sheet error.
-                if _is_spreadsheet_not_found_transient(ex):
-                    retryable = True
-                msg = f"[⚠️ RETRY {attempt}] {sheet_name} > {tab_name}: General error: {ex}"
-                logger.info(
-                    "[wrapped_transfer] correlation=%s attempt=%d sheet=%s tab=%s exception=%s",
-                    correlation_id,
-                    attempt,
-                    sheet_name,
-                    tab_name,
-                    type(ex).__name__,
-                )
-
-            _append_log(msg)
-            _append_log(tb)
+                # build embed (lightweight fallback)
+                embed = None
+                try:
+                    import discord as _discord
 
-            if attempt < retries and retryable:
-                retry_after = details.get("retry_after")
-                if retry_after and isinstance(retry_after, (int, float)):
-                    delay = float(retry_after)
-                elif _is_spreadsheet_not_found_transient(e):
-                    # Give the Drive listing cache time to refresh (2–5 s with jitter)
-                    delay = _pagination_miss_delay()
-                else:
-                    delay = _full_jitter_sleep(attempt, base_delay, 60.0)
-                _append_log(f"[INFO] sleeping {delay:.2f}s before retry {attempt + 1}/{retries}")
-                time.sleep(delay)
-                continue
-            else:
-                # give up and optionally alert via discord
-                _append_log(f"[ERROR] Giving up on {sheet_name} > {tab_name}: {e}")
-                if notify:
+                    embed = _discord.Embed(
+                        title="KVK Export Failure",
+                        description=f"Sheet: {sheet_name}\nTab: {tab_name}\nAttempts: {job.attempts}\ncorrelation_id: {job.meta['correlation_id']}",
+                        color=_discord.Color.red(),
+                    )
+                    embed.add_field(name="Error", value=f"```{str(e)[:1000]}```", inline=False)
+                    tb_text = tb if tb else "no traceback"
+                    embed.add_field(
+                        name="Traceback", value=f"```{tb_text[-1000:]}```", inline=False
+                    )
+                    embed.set_footer(
+                        text=f"gsheet_module.py export failure | gspread={GSPREAD_VERSION} google-client={GOOGLE_API_CLIENT_VERSION}"
+                    )
+                except Exception:
+                    # notify via simple message
+                    embed = None
+                # send via bot_loop thread-safe if possible
+                if loop and embed:
                     try:
-                        # build embed (lightweight fallback)
-                        embed = None
+                        coro = notify.send(embed=embed)
+                        asyncio.run_coroutine_threadsafe(coro, loop)
+                    except Exception:
                         try:
-                            import discord as _discord
-
-                            embed = _discord.Embed(
-                                title="KVK Export Failure",
-                                description=f"Sheet: {sheet_name}\nTab: {tab_name}\nAttempts: {attempt}\ncorrelation_id: {correlation_id}",
-                                color=_discord.Color.red(),
-                            )
-                            embed.add_field(
-                                name="Error", value=f"```{str(e)[:1000]}```", inline=False
-                            )
-                            tb_text = tb if tb else "no traceback"
-                            embed.add_field(
-                                name="Traceback", value=f"```{tb_text[-1000:]}```", inline=False
-                            )
-                            embed.set_footer(
-                                text=f"gsheet_module.py export failure | gspread={GSPREAD_VERSION} google-client={GOOGLE_API_CLIENT_VERSION}"
-                            )
+                            # best effort direct send
+                            notify.send(embed=embed)
                         except Exception:
-                            # notify via simple message
-                            embed = None
-                        # send via bot_loop thread-safe if possible
-                        if loop and embed:
-                            try:
-                                coro = notify.send(embed=embed)
-                                asyncio.run_coroutine_threadsafe(coro, loop)
-                            except Exception:
-                                try:
-                                    # best effort direct send
-                                    notify.send(embed=embed)
-                                except Exception:
-                                    logger.exception(
-                                        "[wrapped_transfer] failed to send discord alert"
-                                    )
-                    except Exception:
-                        logger.exception("[wrapped_transfer] alerting failure")
-                return
+                            logger.exception("[wrapped_transfer] failed to send discord alert")
+            except Exception:
+                logger.exception("[wrapped_transfer] alerting failure")
 
     # Load config file and run jobs
     try:
@@ -1371,21 +1536,53 @@ def run_all_exports(
         job.setdefault("order", None)
         job.setdefault("dates", [])
         job.setdefault("format_numbers", [])
-        wrapped_transfer(
-            engine,
-            client,
-            service,
-            query=job["query"],
-            sheet_name=job["sheet"],
-            tab_name=job["tab"],
-            sort_column_index=job.get("sort"),
-            sort_order=job.get("order", "ASCENDING"),
-            date_cols=job.get("dates", []),
-            format_columns=job.get("format_numbers", []),
-            notify_channel=notify_channel,
-            bot_loop=bot_loop,
+
+    def _make_load(job: dict) -> Callable[[], pd.DataFrame]:
+        return lambda: pd.read_sql(job["query"], engine)
+
+    def _make_run(job: dict) -> Callable[[pd.DataFrame], None]:
+        def _run(df: pd.DataFrame) -> None:
+            started = time.perf_counter()
+            job_client, job_service = clients()
+            transfer_and_sort(
+                engine,
+                job_client,
+                job_service,
+                query=job["query"],
+                sheet_name=job["sheet"],
+                tab_name=job["tab"],
+                sort_column_index=job.get("sort"),
+                sort_order=job.get("order", "ASCENDING"),
+                date_cols=job.get("dates", []),
+                format_columns=job.get("format_numbers", []),
+                df=df,
+            )
+            _append_log(
+                f"[OK] {job['sheet']} > {job['tab']} ({time.perf_counter() - started:.1f}s)"
+            )
+
+        return _run
+
+    # Each job queries on its worker right before writing (and again on retry), so only the
+    # frames of the spreadsheets currently being written are held in memory.
+    scheduled: list[ExportJob] = []
+    for job in export_jobs:
+        scheduled.append(
+            ExportJob(
+                name=f"{job['sheet']} > {job['tab']}",
+                group=job["sheet"],
+                run=_make_run(job),
+                load=_make_load(job),
+                meta={
+                    "sheet": job["sheet"],
+                    "tab": job["tab"],
+                    "correlation_id": str(uuid.uuid4()),
+                },
+            )
         )
 
+    run_export_jobs(scheduled, retry_delay=_retry_delay, on_give_up=_give_up)
+
     # Return success flag and collected logs as a single joined string so callers that do .strip() work
     return True, "\n".join(log_messages)
 
@@ -1411,9 +1608,45 @@ def get_sort_service(credentials_file: str, timeout: int | None = None):
     return _build_sheets_with_timeout(creds, timeout=timeout)
 
 
+def _per_thread_clients(
+    credentials_file: str | None, client, service
+) -> Callable[[], tuple[Any, Any]]:
+    """
+    Returns a getter for the calling thread's (client, service). The discovery service sits on
+    httplib2, which is not thread-safe, so export worker threads build their own pair from
+    credentials_file; the creating thread (and everyone, without credentials_file) shares
+    ``client``/``service``.
+    """
+    owner = threading.get_ident()
+    local = threading.local()
+
+    def _get() -> tuple[Any, Any]:
+        if not credentials_file or threading.get_ident() == owner:
+            return client, service
+        pair = getattr(local, "pair", None)
+        if pair is None:
+            pair = (get_gsheet_client(credentials_file), get_sort_service(credentials_file))
+            local.pair = pair
+        return pair
+
+    return _get
+
+
 def run_single_export(
-    server, database, username, password, config_path, credentials_file=CREDENTIALS_FILE
+    server,
+    database,
+    username,
+    password,
+    config_path,
+    credentials_file=CREDENTIALS_FILE,
+    *,
+    force_full: bool | None = None,
+    dry_run: bool = False,
 ):
+    """
+    Run the export jobs in config_path. dry_run returns {"sheet > tab": plan summary} describing
+    what a delta export would write, without touching any sheet; force_full rewrites every tab.
+    """
     assert all(
         [server, database, username, password, credentials_file]
     ), "One or more required parameters are missing"
@@ -1426,9 +1659,10 @@ def run_single_export(
 
     validate_export_config(export_jobs)
 
+    report: dict[str, dict[str, Any]] = {}
     for job in export_jobs:
         job.setdefault("format_numbers", [])
-        transfer_and_sort(
+        plan = transfer_and_sort(
             engine,
             client,
             service,
@@ -1439,9 +1673,13 @@ def run_single_export(
             sort_order=job.get("order", "ASCENDING"),
             date_cols=job.get("dates", []),
             format_columns=job["format_numbers"],
+            force_full=force_full,
+            dry_run=dry_run,
         )
+        if plan is not None:
+            report[f"{job['sheet']} > {job['tab']}"] = plan.summary()
 
-    return True
+    return report if dry_run else True
 
 
 # -------------------------
@@ -1524,6 +1762,7 @@ def get_sheet_values(
         )
 
         # Use module default for retries
+        throttle("read")
         res = req.execute(num_retries=DEFAULT_SHEETS_MAX_RETRIES)
         rows = res.get("values", []) or []
 
@@ -1563,7 +1802,7 @@ def get_spreadsheet_modified_time(drive_service, spreadsheet_id: str) -> str | N
     try:
         req = drive_service.files().get(fileId=spreadsheet_id, fields="modifiedTime")
         try:
-            resp = _safe_execute(req, retries=3)
+            resp = _safe_execute(req, retries=3, quota=None)
         except Exception:
             resp = req.execute(num_retries=0)
         return resp.get("modifiedTime")
@@ -1691,7 +1930,9 @@ def run_kvk_export_test(
                 _sort_kvk_export_sheet(service, ss.id, ws, df_to_write, sheet_name, tab)
                 skipped_tabs.append(tab)
             else:
-                df_to_write = _prepare_kvk_export_df(df_local, kvk_no)
+                df_to_write = _presort_kvk_export(
+                    _prepare_kvk_export_df(df_local, kvk_no), sheet_name, tab
+                )
                 ws = _get_or_create_ws(ss, tab, cols=max(1, len(df_to_write.columns)))
                 export_dataframe_to_sheet(
                     ws,
@@ -1828,19 +2069,26 @@ def run_kvk_proc_exports(
     kvk_no: int,
     sheet_name: str = "KVK LIST",
     credentials_file=CREDENTIALS_FILE,
+    *,
+    dfs: list[pd.DataFrame] | None = None,
 ):
     """
     Executes KVK.sp_KVK_Get_Exports @KVK_NO=? and publishes the 10 result sets
     into tabs of `sheet_name` with matching names in _KVK_TABS_IN_ORDER.
+    Pass ``dfs`` when the proc has already been run for this KVK.
     """
     assert all([server, database, username, password, credentials_file])
 
-    engine = get_sql_engine(server, database, username, password)
     client = get_gsheet_client(credentials_file)
     service = get_sort_service(credentials_file)
 
     # 1) Run proc and capture all result sets in order
-    dfs = _dfs_from_proc(engine, "EXEC KVK.sp_KVK_Get_Exports @KVK_NO = ?", (kvk_no,))
+    if dfs is None:
+        engine = get_sql_engine(server, database, username, password)
+        dfs = _dfs_from_proc(engine, "EXEC KVK.sp_KVK_Get_Exports @KVK_NO = ?", (kvk_no,))
+    else:
+        # The tabs below are cleaned in place; leave the caller's frames untouched.
+        dfs = [df.copy() for df in dfs]
     try:
         export_sections = bind_kvk_export_sections(dfs)
     except KvkExportBindingError as exc:
@@ -1856,7 +2104,7 @@ def run_kvk_proc_exports(
         df.replace([float("inf"), float("-inf")], pd.NA, inplace=True)
         _stringify_datetimes_inplace(df)
 
-        df_to_write = _prepare_kvk_export_df(df, kvk_no)
+        df_to_write = _presort_kvk_export(_prepare_kvk_export_df(df, kvk_no), sheet_name, tab)
         ws = _get_or_create_ws(ss, tab, cols=len(df_to_write.columns))
 
         export_dataframe_to_sheet(
@@ -2042,6 +2290,8 @@ def create_additional_kvk_spreadsheets(
     kvk_no: int,
     notify_channel=None,
     bot_loop=None,
+    *,
+    credentials_file: str | None = None,
 ):
     """
     Create/Update the PASS4, 1ST_ALTAR, PASS7 style spreadsheets based on dfs from the proc.
@@ -2054,9 +2304,19 @@ def create_additional_kvk_spreadsheets(
       }
     This function does NOT send Discord notifications by itself unless notify_channel and bot_loop are provided;
     it will still return metadata so callers (or tests) can assert on results.
+    Spreadsheets are written concurrently (gsheet_scheduler) when credentials_file is given, so
+    each worker thread can build its own Sheets client; otherwise they are written in order.
     """
     results = {}
     export_sections = dfs if isinstance(dfs, dict) else bind_kvk_export_sections(dfs)
+    clients = _per_thread_clients(credentials_file, client, service)
+    pending: list[ExportJob] = []
+
+    def _schedule(target_ss_name: str, write: Callable[[], dict]) -> dict:
+        pending.append(
+            ExportJob(name=target_ss_name, group=target_ss_name, run=write, max_attempts=1)
+        )
+        return {"created": False, "reason": "pending", "written_tabs": [], "skipped_tabs": []}
 
     def _section_df(section_ref: str | int | None) -> pd.DataFrame:
         section_name = section_ref_to_name(section_ref)
@@ -2078,6 +2338,7 @@ def create_additional_kvk_spreadsheets(
         Only creates the spreadsheet and tabs if there is at least one non-empty DF among the tabs_to_write.
         Returns a metadata dict.
         """
+        client, service = clients()
         # Pre-evaluate which specs would produce data
         to_write_results = []
         for spec in tabs_to_write:
@@ -2231,7 +2492,9 @@ def create_additional_kvk_spreadsheets(
                                 filtered_format_cols.append(fc)
                         format_cols = filtered_format_cols
 
-                    df_to_write = _prepare_kvk_export_df(df_to_write, kvk_no)
+                    df_to_write = _presort_kvk_export(
+                        _prepare_kvk_export_df(df_to_write, kvk_no), target_ss_name, target_tab
+                    )
 
                     # Export using the filtered format columns (reduces spurious warnings)
                     export_dataframe_to_sheet(
@@ -2270,6 +2533,9 @@ def create_additional_kvk_spreadsheets(
         }
         return out
 
+    def _create_and_write_later(target_ss_name: str, tabs_to_write: list[dict]) -> dict:
+        return _schedule(target_ss_name, lambda: _create_and_write(target_ss_name, tabs_to_write))
+
     # Build specs for each of the spreadsheets to create
 
     # 1) KVK_PASS4_ALL_PLAYER_OUTPUT (Pass 4 only)
@@ -2298,7 +2564,7 @@ def create_additional_kvk_spreadsheets(
         has_pass4_player = False
 
     if has_pass4_player:
-        pass4_result = _create_and_write("KVK_PASS4_ALL_PLAYER_OUTPUT", pass4_specs)
+        pass4_result = _create_and_write_later("KVK_PASS4_ALL_PLAYER_OUTPUT", pass4_specs)
     else:
         # No primary data => skip creating spreadsheet
         pass4_result = {
@@ -2368,7 +2634,7 @@ def create_additional_kvk_spreadsheets(
         has_altar_player = False
 
     if has_altar_player:
-        altar_result = _create_and_write("KVK_1ST_ALTAR_ALL_PLAYER_OUTPUT", altar_specs)
+        altar_result = _create_and_write_later("KVK_1ST_ALTAR_ALL_PLAYER_OUTPUT", altar_specs)
     else:
         altar_result = {
             "created": False,
@@ -2434,7 +2700,7 @@ def create_additional_kvk_spreadsheets(
         has_2nd_altar_player = False
 
     if has_2nd_altar_player:
-        second_altar_result = _create_and_write(
+        second_altar_result = _create_and_write_later(
             "KVK_2ND_ALTAR_ALL_PLAYER_OUTPUT", second_altar_specs
         )
     else:
@@ -2502,7 +2768,9 @@ def create_additional_kvk_spreadsheets(
         has_3rd_altar_player = False
 
     if has_3rd_altar_player:
-        third_altar_result = _create_and_write("KVK_3RD_ALTAR_ALL_PLAYER_OUTPUT", third_altar_specs)
+        third_altar_result = _create_and_write_later(
+            "KVK_3RD_ALTAR_ALL_PLAYER_OUTPUT", third_altar_specs
+        )
     else:
         third_altar_result = {
             "created": False,
@@ -2562,7 +2830,7 @@ def create_additional_kvk_spreadsheets(
         has_pass7_player = False
 
     if has_pass7_player:
-        pass7_result = _create_and_write("KVK_PASS7_ALL_PLAYER_OUTPUT", pass7_specs)
+        pass7_result = _create_and_write_later("KVK_PASS7_ALL_PLAYER_OUTPUT", pass7_specs)
     else:
         pass7_result = {
             "created": False,
@@ -2620,7 +2888,7 @@ def create_additional_kvk_spreadsheets(
         has_pass8_player = False
 
     if has_pass8_player:
-        pass8_result = _create_and_write("KVK_PASS8_ALL_PLAYER_OUTPUT", pass8_specs)
+        pass8_result = _create_and_write_later("KVK_PASS8_ALL_PLAYER_OUTPUT", pass8_specs)
     else:
         pass8_result = {
             "created": False,
@@ -2712,7 +2980,7 @@ def create_additional_kvk_spreadsheets(
         has_greatzig_player = False
 
     if has_greatzig_player:
-        greatzig_result = _create_and_write("KVK_GREATZIG_ALL_PLAYER_OUTPUT", greatzig_specs)
+        greatzig_result = _create_and_write_later("KVK_GREATZIG_ALL_PLAYER_OUTPUT", greatzig_specs)
     else:
         greatzig_result = {
             "created": False,
@@ -2797,7 +3065,7 @@ def create_additional_kvk_spreadsheets(
         has_pass9_player = False
 
     if has_pass9_player:
-        pass9_result = _create_and_write("KVK_PASS9_ALL_PLAYER_OUTPUT", pass9_specs)
+        pass9_result = _create_and_write_later("KVK_PASS9_ALL_PLAYER_OUTPUT", pass9_specs)
     else:
         pass9_result = {
             "created": False,
@@ -3015,112 +3283,133 @@ def create_additional_kvk_spreadsheets(
             "skipped_tabs": [t["tab_name"] for (t, _, _) in comp_to_write],
         }
     else:
-        # Create/open spreadsheet
         target_name = "ALL_WINDOW_COMPARISON"
-        try:
+
+        def _write_comparison_sheet() -> dict:
+            # Create/open spreadsheet
+            client, service = clients()
             try:
-                target_ss = _retry_gspread_call(
-                    lambda: client.open(target_name), action_desc=f"open_spreadsheet:{target_name}"
-                )
-                created_new = False
-            except SpreadsheetNotFound:
-                target_ss = _retry_gspread_call(
-                    lambda: client.create(target_name),
-                    action_desc=f"create_spreadsheet:{target_name}",
-                )
-                created_new = True
-        except Exception as e:
-            logger.exception("Could not open/create spreadsheet %s: %s", target_name, e)
-            results["ALL_WINDOW_COMPARISON"] = {
-                "created": False,
-                "reason": "create_failed",
-                "error": str(e),
-                "written_tabs": [],
-                "skipped_tabs": [t["tab_name"] for (t, _, _) in comp_to_write],
-            }
-        else:
-            spreadsheet_id = getattr(target_ss, "id", None) or getattr(
-                target_ss, "_properties", {}
-            ).get("spreadsheetId")
-            spreadsheet_url = (
-                f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
-                if spreadsheet_id
-                else None
-            )
-            written = []
-            skipped = []
-            for t, df_comp, has_data in comp_to_write:
-                target_tab = t["tab_name"]
-                if not has_data:
-                    skipped.append(target_tab)
-                    logger.info("Skipping comparison tab %s because no data.", target_tab)
-                    continue
                 try:
-                    df_to_write = df_comp.copy()
-                    df_to_write.replace([float("inf"), float("-inf")], pd.NA, inplace=True)
-                    _stringify_datetimes_inplace(df_to_write)
-                    df_to_write = _prepare_kvk_export_df(df_to_write, kvk_no)
-
-                    ws = _get_or_create_ws(
-                        target_ss, target_tab, cols=max(1, len(df_to_write.columns))
+                    target_ss = _retry_gspread_call(
+                        lambda: client.open(target_name),
+                        action_desc=f"open_spreadsheet:{target_name}",
+                    )
+                    created_new = False
+                except SpreadsheetNotFound:
+                    target_ss = _retry_gspread_call(
+                        lambda: client.create(target_name),
+                        action_desc=f"create_spreadsheet:{target_name}",
                     )
+                    created_new = True
+            except Exception as e:
+                logger.exception("Could not open/create spreadsheet %s: %s", target_name, e)
+                return {
+                    "created": False,
+                    "reason": "create_failed",
+                    "error": str(e),
+                    "written_tabs": [],
+                    "skipped_tabs": [t["tab_name"] for (t, _, _) in comp_to_write],
+                }
+            else:
+                spreadsheet_id = getattr(target_ss, "id", None) or getattr(
+                    target_ss, "_properties", {}
+                ).get("spreadsheetId")
+                spreadsheet_url = (
+                    f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
+                    if spreadsheet_id
+                    else None
+                )
+                written = []
+                skipped = []
+                for t, df_comp, has_data in comp_to_write:
+                    target_tab = t["tab_name"]
+                    if not has_data:
+                        skipped.append(target_tab)
+                        logger.info("Skipping comparison tab %s because no data.", target_tab)
+                        continue
+                    try:
+                        df_to_write = df_comp.copy()
+                        df_to_write.replace([float("inf"), float("-inf")], pd.NA, inplace=True)
+                        _stringify_datetimes_inplace(df_to_write)
+                        df_to_write = _prepare_kvk_export_df(df_to_write, kvk_no)
 
-                    # Format numeric columns; attempt to use metric name as numeric for formatting heuristics
-                    format_cols = []
-                    if t["agg_type"] == "player":
-                        format_cols = _KVK_FORMAT_NUMBERS.get("KVK_Player_Windowed", [])
-                    elif t["agg_type"] == "kingdom":
-                        format_cols = _KVK_FORMAT_NUMBERS.get("KVK_Kingdom_Windowed", [])
-                    elif t["agg_type"] == "camp":
-                        format_cols = _KVK_FORMAT_NUMBERS.get("KVK_Camp_Windowed", [])
-                    if t["metric"] not in format_cols:
-                        format_cols = format_cols + [t["metric"]]
+                        ws = _get_or_create_ws(
+                            target_ss, target_tab, cols=max(1, len(df_to_write.columns))
+                        )
 
-                    if format_cols:
-                        df_cols_lower = {str(c).lower(): c for c in df_to_write.columns}
-                        filtered_format_cols: list[Any] = []
-                        for fc in format_cols:
-                            if isinstance(fc, int):
-                                if 0 <= fc < len(df_to_write.columns):
+                        # Format numeric columns; attempt to use metric name as numeric for formatting heuristics
+                        format_cols = []
+                        if t["agg_type"] == "player":
+                            format_cols = _KVK_FORMAT_NUMBERS.get("KVK_Player_Windowed", [])
+                        elif t["agg_type"] == "kingdom":
+                            format_cols = _KVK_FORMAT_NUMBERS.get("KVK_Kingdom_Windowed", [])
+                        elif t["agg_type"] == "camp":
+                            format_cols = _KVK_FORMAT_NUMBERS.get("KVK_Camp_Windowed", [])
+                        if t["metric"] not in format_cols:
+                            format_cols = format_cols + [t["metric"]]
+
+                        if format_cols:
+                            df_cols_lower = {str(c).lower(): c for c in df_to_write.columns}
+                            filtered_format_cols: list[Any] = []
+                            for fc in format_cols:
+                                if isinstance(fc, int):
+                                    if 0 <= fc < len(df_to_write.columns):
+                                        filtered_format_cols.append(fc)
+                                elif isinstance(fc, str):
+                                    match = df_cols_lower.get(fc.lower())
+                                    if match is not None:
+                                        filtered_format_cols.append(match)
+                                else:
                                     filtered_format_cols.append(fc)
-                            elif isinstance(fc, str):
-                                match = df_cols_lower.get(fc.lower())
-                                if match is not None:
-                                    filtered_format_cols.append(match)
-                            else:
-                                filtered_format_cols.append(fc)
-                        format_cols = filtered_format_cols
+                            format_cols = filtered_format_cols
 
-                    # Sort by Overall column DESC in pandas (last column)
-                    if not df_to_write.empty:
-                        overall_col = df_to_write.columns[-1]
-                        df_to_write = df_to_write.sort_values(
-                            by=overall_col, ascending=False, kind="mergesort"
-                        )
+                        # Sort by Overall column DESC in pandas (last column)
+                        if not df_to_write.empty:
+                            overall_col = df_to_write.columns[-1]
+                            df_to_write = df_to_write.sort_values(
+                                by=overall_col, ascending=False, kind="mergesort"
+                            )
 
-                    export_dataframe_to_sheet(
-                        ws, df_to_write, service=service, format_columns=format_cols
-                    )
+                        export_dataframe_to_sheet(
+                            ws, df_to_write, service=service, format_columns=format_cols
+                        )
 
-                    written.append(target_tab)
+                        written.append(target_tab)
+                    except Exception:
+                        logger.exception("Failed to write comparison tab %s", target_tab)
+                        skipped.append(target_tab)
+                # Reorder tabs to match explicit comparison_tabs order
+                try:
+                    if spreadsheet_id:
+                        title_to_id = {ws.title: ws.id for ws in target_ss.worksheets()}
+                        desired_titles = [t["tab_name"] for t in comparison_tabs]
+                        _reorder_sheet_tabs(service, spreadsheet_id, title_to_id, desired_titles)
                 except Exception:
-                    logger.exception("Failed to write comparison tab %s", target_tab)
-                    skipped.append(target_tab)
-            # Reorder tabs to match explicit comparison_tabs order
-            try:
-                if spreadsheet_id:
-                    title_to_id = {ws.title: ws.id for ws in target_ss.worksheets()}
-                    desired_titles = [t["tab_name"] for t in comparison_tabs]
-                    _reorder_sheet_tabs(service, spreadsheet_id, title_to_id, desired_titles)
-            except Exception:
-                logger.exception("Failed to reorder ALL_WINDOW_COMPARISON tabs")
-            results["ALL_WINDOW_COMPARISON"] = {
-                "created": True,
-                "created_new": created_new,
-                "spreadsheet_id": spreadsheet_id,
-                "spreadsheet_url": spreadsheet_url,
-                "written_tabs": written,
-                "skipped_tabs": skipped,
+                    logger.exception("Failed to reorder ALL_WINDOW_COMPARISON tabs")
+                return {
+                    "created": True,
+                    "created_new": created_new,
+                    "spreadsheet_id": spreadsheet_id,
+                    "spreadsheet_url": spreadsheet_url,
+                    "written_tabs": written,
+                    "skipped_tabs": skipped,
+                }
+
+        results[target_name] = _schedule(target_name, _write_comparison_sheet)
+
+    # Each spreadsheet is independent: write them side by side, tabs in order within each.
+    run_export_jobs(pending, concurrency=None if credentials_file else 1)
+    for job in pending:
+        if job.status == "ok" and isinstance(job.result, dict):
+            results[job.group] = job.result
+        else:
+            logger.error("Failed to write %s: %s", job.group, job.error)
+            results[job.group] = {
+                "created": False,
+                "reason": "write_failed",
+                "error": str(job.error),
+                "written_tabs": [],
+                "skipped_tabs": [],
             }
 
     # --- NEW: log metadata for verification (IDs/URLs etc)
@@ -3214,19 +3503,19 @@ def run_kvk_proc_exports_with_alerts(
 ):
     retries = 3
     last_exc = None
+    dfs = None
     for attempt in range(1, retries + 1):
         try:
+            # The proc runs once; the primary sheet and the additional outputs share its results.
+            if dfs is None:
+                engine = get_sql_engine(server, database, username, password)
+                dfs = _dfs_from_proc(engine, "EXEC KVK.sp_KVK_Get_Exports @KVK_NO = ?", (kvk_no,))
             ok = run_kvk_proc_exports(
-                server, database, username, password, kvk_no, sheet_name, credentials_file
+                server, database, username, password, kvk_no, sheet_name, credentials_file, dfs=dfs
             )
             if ok:
                 # After successful creation of primary sheet, also create the PASS4 + 1st Altar + PASS7 spreadsheets.
                 try:
-                    engine = get_sql_engine(server, database, username, password)
-                    dfs = _dfs_from_proc(
-                        engine, "EXEC KVK.sp_KVK_Get_Exports @KVK_NO = ?", (kvk_no,)
-                    )
-
                     client = get_gsheet_client(credentials_file)
                     service = get_sort_service(credentials_file)
 
@@ -3238,6 +3527,7 @@ def run_kvk_proc_exports_with_alerts(
                         kvk_no,
                         notify_channel=notify_channel,
                         bot_loop=bot_loop,
+                        credentials_file=credentials_file,
                     )
 
                     return True
@@ -0,0 +1,341 @@
+# gsheet_scheduler.py
+"""
+Parallel, quota-aware scheduling for Google Sheets exports.
+
+``gsheet_module.run_all_exports`` and ``create_additional_kvk_spreadsheets`` used to write one
+spreadsheet after another, and a retry slept the whole run. Now:
+
+- ``run_export_jobs()`` groups jobs by spreadsheet and runs up to ``GSHEET_EXPORT_CONCURRENCY``
+  spreadsheets at once on worker threads; tabs of one spreadsheet still run in order on one
+  thread, so export wall-clock is bounded by the slowest spreadsheet rather than the sum
+- every job keeps its own retry state (attempts, last error, next eligible time); a job waiting
+  to retry lets the other tabs of its spreadsheet run first
+- every Sheets call made through ``gsheet_module._safe_execute`` / ``_retry_gspread_call`` takes
+  a token from a process-wide bucket per quota (``read`` / ``write``) sized by
+  ``GSHEET_READ_QPM`` / ``GSHEET_WRITE_QPM``, so parallel workers stay under the per-minute
+  quota instead of collecting 429s
+- a ``retry_after`` from Google pauses the whole bucket (``defer_quota``), not only the caller
+- a job's query runs on its worker right before the write (``ExportJob.load``), so at most
+  ``GSHEET_EXPORT_CONCURRENCY`` result frames are held at once and each is released as soon as
+  its tab is written
+- each job records sql / run / quota-wait / retry-wait seconds, logged as ``[GSHEET_SCHED]``
+
+``GSHEET_EXPORT_CONCURRENCY=1`` runs everything in the calling thread, in order.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import logging
+import os
+import threading
+import time
+import traceback
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+# Sheets allows 60 read and 60 write requests per minute per user; stay a little under.
+GSHEET_READ_QPM = _env_float("GSHEET_READ_QPM", 55.0)
+GSHEET_WRITE_QPM = _env_float("GSHEET_WRITE_QPM", 55.0)
+GSHEET_QUOTA_BURST = max(1, _env_int("GSHEET_QUOTA_BURST", 10))
+GSHEET_EXPORT_CONCURRENCY = max(1, _env_int("GSHEET_EXPORT_CONCURRENCY", 4))
+
+
+def rate_limit_enabled() -> bool:
+    # Unit tests call the Sheets helpers with fakes and must not wait on the bucket.
+    default = "0" if os.getenv("K98_TEST_MODE") == "1" else "1"
+    return os.getenv("GSHEET_RATE_LIMIT", default).strip().lower() not in ("0", "false", "no")
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers reserve a token and sleep until it is theirs."""
+
+    def __init__(
+        self,
+        name: str,
+        rate_per_minute: float,
+        burst: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.name = name
+        self.rate = max(0.001, float(rate_per_minute)) / 60.0
+        self.capacity = float(max(1, burst))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self.acquired = 0
+        self.waits = 0
+        self.waited_s = 0.0
+        self.deferrals = 0
+
+    def reserve(self) -> float:
+        """Take a token; returns how long the caller must wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Tokens may go negative: later callers queue behind earlier reservations.
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            wait = max(wait, self._blocked_until - now)
+            self.acquired += 1
+            if wait > 0:
+                self.waits += 1
+                self.waited_s += wait
+            return wait
+
+    def acquire(self) -> float:
+        wait = self.reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def defer(self, seconds: float) -> None:
+        """Hand out no tokens for ``seconds`` (Google asked us to back off)."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+            self.deferrals += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "rate_per_minute": round(self.rate * 60.0, 2),
+                "burst": int(self.capacity),
+                "acquired": self.acquired,
+                "waits": self.waits,
+                "waited_s": round(self.waited_s, 3),
+                "deferrals": self.deferrals,
+            }
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_quota_bucket(kind: str) -> TokenBucket:
+    bucket = _buckets.get(kind)
+    if bucket is None:
+        with _buckets_lock:
+            bucket = _buckets.get(kind)
+            if bucket is None:
+                qpm = GSHEET_READ_QPM if kind == "read" else GSHEET_WRITE_QPM
+                bucket = TokenBucket(kind, qpm, GSHEET_QUOTA_BURST)
+                _buckets[kind] = bucket
+    return bucket
+
+
+def throttle(kind: str | None) -> float:
+    """Wait for a ``kind`` quota token; returns seconds waited (0 when limiting is off)."""
+    if not kind or not rate_limit_enabled():
+        return 0.0
+    waited = get_quota_bucket(kind).acquire()
+    if waited:
+        _local.quota_wait = getattr(_local, "quota_wait", 0.0) + waited
+    return waited
+
+
+def defer_quota(kind: str | None, seconds: float) -> None:
+    if kind and rate_limit_enabled():
+        get_quota_bucket(kind).defer(seconds)
+
+
+def thread_quota_wait() -> float:
+    """Seconds the current thread has spent waiting on quota buckets."""
+    return getattr(_local, "quota_wait", 0.0)
+
+
+def get_quota_stats() -> dict[str, dict[str, Any]]:
+    return {kind: bucket.stats() for kind, bucket in list(_buckets.items())}
+
+
+@dataclass
+class ExportJob:
+    """One unit of export work plus its retry state and timing breakdown."""
+
+    name: str
+    group: str
+    # Called with ``load()``'s value when ``load`` is set, with no arguments otherwise.
+    run: Callable[..., Any]
+    # Fetches the job's input (its SQL query) on every attempt; timed as ``sql_s``.
+    load: Callable[[], Any] | None = None
+    max_attempts: int = 5
+    sql_s: float = 0.0
+    attempts: int = 0
+    status: str = "pending"
+    result: Any = None
+    error: BaseException | None = None
+    traceback: str = ""
+    not_before: float = 0.0
+    run_s: float = 0.0
+    quota_wait_s: float = 0.0
+    retry_wait_s: float = 0.0
+    meta: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def total_s(self) -> float:
+        return self.sql_s + self.run_s + self.retry_wait_s
+
+    def timing_line(self) -> str:
+        return (
+            f"{self.name} status={self.status} attempts={self.attempts} "
+            f"sql={self.sql_s:.2f}s run={self.run_s:.2f}s quota_wait={self.quota_wait_s:.2f}s "
+            f"retry_wait={self.retry_wait_s:.2f}s total={self.total_s:.2f}s"
+        )
+
+
+# (job, exc) -> seconds to wait before the next attempt, or None to give up.
+RetryPolicy = Callable[[ExportJob, BaseException], float | None]
+
+
+def _attempt(job: ExportJob, clock: Callable[[], float]) -> BaseException | None:
+    job.attempts += 1
+    waited_before = thread_quota_wait()
+    started = clock()
+    try:
+        if job.load is None:
+            job.result = job.run()
+        else:
+            try:
+                data = job.load()
+            finally:
+                loaded = clock()
+                job.sql_s += loaded - started
+                started = loaded
+            job.result = job.run(data)
+        job.status = "ok"
+        job.error = None
+        return None
+    except Exception as exc:
+        job.traceback = traceback.format_exc()
+        # The traceback's frames would keep the loaded frame alive while the job waits to retry.
+        job.error = exc.with_traceback(None)
+        return exc
+    finally:
+        job.run_s += clock() - started
+        job.quota_wait_s += thread_quota_wait() - waited_before
+
+
+def _run_group(
+    jobs: list[ExportJob],
+    retry_delay: RetryPolicy | None,
+    on_retry: Callable[[ExportJob, BaseException, float], None] | None,
+    on_give_up: Callable[[ExportJob, BaseException], None] | None,
+    clock: Callable[[], float],
+    sleep: Callable[[float], None],
+) -> None:
+    queue = list(jobs)
+    while queue:
+        # Earliest eligible job first; ties keep config order.
+        job = min(queue, key=lambda j: j.not_before)
+        delay = job.not_before - clock()
+        if delay > 0:
+            sleep(delay)
+            job.retry_wait_s += delay
+        queue.remove(job)
+
+        exc = _attempt(job, clock)
+        if exc is None:
+            continue
+        wait = None
+        if retry_delay is not None:
+            # Consulted on every failure (it may log); max_attempts still has the final word.
+            try:
+                wait = retry_delay(job, exc)
+            except Exception:
+                logger.exception("[GSHEET_SCHED] retry policy failed for %s", job.name)
+        if wait is None or job.attempts >= job.max_attempts:
+            job.status = "failed"
+            if on_give_up is not None:
+                try:
+                    on_give_up(job, exc)
+                except Exception:
+                    logger.exception("[GSHEET_SCHED] give-up handler failed for %s", job.name)
+            continue
+        job.status = "retrying"
+        job.not_before = clock() + max(0.0, wait)
+        if on_retry is not None:
+            try:
+                on_retry(job, exc, wait)
+            except Exception:
+                logger.exception("[GSHEET_SCHED] retry handler failed for %s", job.name)
+        queue.append(job)
+
+
+def run_export_jobs(
+    jobs: Iterable[ExportJob],
+    *,
+    concurrency: int | None = None,
+    retry_delay: RetryPolicy | None = None,
+    on_retry: Callable[[ExportJob, BaseException, float], None] | None = None,
+    on_give_up: Callable[[ExportJob, BaseException], None] | None = None,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> list[ExportJob]:
+    """
+    Run ``jobs`` with spreadsheets (``job.group``) in parallel and tabs in order; returns the jobs
+    with their final status. Never raises for a failed job: see ``job.status`` / ``job.error``.
+    """
+    job_list = list(jobs)
+    groups: dict[str, list[ExportJob]] = {}
+    for job in job_list:
+        groups.setdefault(job.group, []).append(job)
+    workers = min(
+        len(groups), GSHEET_EXPORT_CONCURRENCY if concurrency is None else max(1, concurrency)
+    )
+
+    started = clock()
+    if workers <= 1:
+        for group_jobs in groups.values():
+            _run_group(group_jobs, retry_delay, on_retry, on_give_up, clock, sleep)
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gsheet-export") as pool:
+            futures = [
+                pool.submit(_run_group, group_jobs, retry_delay, on_retry, on_give_up, clock, sleep)
+                for group_jobs in groups.values()
+            ]
+            for future in futures:
+                future.result()
+    wall = clock() - started
+
+    for job in job_list:
+        logger.info("[GSHEET_SCHED] %s", job.timing_line())
+    busy = sum(job.run_s + job.retry_wait_s for job in job_list)
+    logger.info(
+        "[GSHEET_SCHED] %d job(s) in %d spreadsheet(s) workers=%d wall=%.2fs serial=%.2fs "
+        "ok=%d failed=%d quota=%s",
+        len(job_list),
+        len(groups),
+        max(1, workers),
+        wall,
+        busy,
+        sum(1 for job in job_list if job.status == "ok"),
+        sum(1 for job in job_list if job.status == "failed"),
+        get_quota_stats() or "-",
+    )
+    return job_list
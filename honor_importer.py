@@ -3,12 +3,13 @@ from __future__ import annotations
 
 import datetime as dt
 import hashlib
-import io
 import logging
 
 import pandas as pd
 
+from core.xlsx_reader import read_xlsx_sheet
 from file_utils import fetch_one_dict
+from sheet_importer import to_db_rows
 from utils import ensure_aware_utc, utcnow
 
 logger = logging.getLogger(__name__)
@@ -109,7 +110,7 @@ def parse_honor_xlsx(xlsx_bytes: bytes) -> pd.DataFrame:
      - HonorPoints or "Honor Points"
     """
     # Read sheet named "honor"
-    df = pd.read_excel(io.BytesIO(xlsx_bytes), sheet_name="honor")
+    df = read_xlsx_sheet(xlsx_bytes, "honor")
 
     # Normalize potential column names
     cols = set(df.columns.astype(str).tolist())
@@ -232,16 +233,12 @@ def ingest_honor_snapshot(
                     INSERT INTO dbo.KVK_Honor_AllPlayers_Raw (KVK_NO, ScanID, GovernorID, GovernorName, HonorPoints)
                     VALUES (?,?,?,?,?)
                 """,
-                    [
-                        (
-                            kvk_no,
-                            scan_id,
-                            int(r.GovernorID),
-                            r.GovernorName,
-                            int(r.HonorPoints or 0),
-                        )
-                        for r in df.itertuples(index=False)
-                    ],
+                    to_db_rows(
+                        df[["GovernorID", "GovernorName", "HonorPoints"]].fillna(
+                            {"HonorPoints": 0}
+                        ),
+                        prefix=(kvk_no, scan_id),
+                    ),
                 )
 
             cn.commit()
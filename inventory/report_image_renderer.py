@@ -11,6 +11,7 @@ from typing import Any
 from PIL import Image, ImageDraw, ImageFont, ImageOps, UnidentifiedImageError
 
 from core import visual_contract, visual_text
+from core.asset_cache import load_asset, register_warm_assets, shared_asset
 from inventory.capacity_calculations import (
     rss_healing_capacity,
     rss_training_capacity,
@@ -65,6 +66,7 @@ REPORT_BACKDROP_PATHS = {
     InventoryReportView.SPEEDUPS: (CARD_ASSET_DIR / "inventory_speedups_governoros_backdrop.png"),
     InventoryReportView.MATERIALS: (CARD_ASSET_DIR / "inventory_materials_governoros_backdrop.png"),
 }
+register_warm_assets(REPORT_BACKDROP_PATHS.values())
 
 REPORT_ACCENTS = {
     InventoryReportView.RESOURCES: RESOURCE_ACCENT,
@@ -86,12 +88,10 @@ def _report_canvas(view: InventoryReportView) -> Image.Image:
 
     path = REPORT_BACKDROP_PATHS[view]
     try:
-        with Image.open(path) as source:
-            if source.size != (WIDTH, HEIGHT):
-                raise ValueError(
-                    f"Inventory backdrop must be {WIDTH}x{HEIGHT}; received {source.size}"
-                )
-            return source.convert("RGBA")
+        canvas = load_asset(path)
+        if canvas.size != (WIDTH, HEIGHT):
+            raise ValueError(f"Inventory backdrop must be {WIDTH}x{HEIGHT}; received {canvas.size}")
+        return canvas
     except (OSError, ValueError, UnidentifiedImageError):
         logger.warning(
             "inventory_report_backdrop_unavailable view=%s path=%s",
@@ -123,31 +123,39 @@ def _delta_text(
     return visual_contract.format_compact_number(delta, signed=True), GREEN if delta >= 0 else RED
 
 
+def _is_light_neutral(pixel: tuple[int, ...]) -> bool:
+    rgb = pixel[:3]
+    return min(rgb) >= 235 and max(rgb) - min(rgb) <= 8
+
+
+def _clear_light_icon_background(icon: Image.Image) -> Image.Image:
+    """Make a flat near-white icon background transparent (applied once per cached icon)."""
+    corners = (
+        icon.getpixel((0, 0)),
+        icon.getpixel((max(icon.width - 1, 0), 0)),
+        icon.getpixel((0, max(icon.height - 1, 0))),
+        icon.getpixel((max(icon.width - 1, 0), max(icon.height - 1, 0))),
+    )
+    if sum(_is_light_neutral(pixel) for pixel in corners) >= 3:
+        pixels = icon.load()
+        for y in range(icon.height):
+            for x in range(icon.width):
+                pixel = pixels[x, y]
+                if _is_light_neutral(pixel):
+                    pixels[x, y] = (*pixel[:3], 0)
+    return icon
+
+
 def _paste_icon(canvas: Image.Image, path: Path, box: tuple[int, int, int, int]) -> None:
     if not path.exists():
         return
     try:
-        with Image.open(path) as source:
-            icon = source.convert("RGBA")
-        icon.thumbnail((box[2] - box[0], box[3] - box[1]), Image.Resampling.LANCZOS)
-        corners = (
-            icon.getpixel((0, 0)),
-            icon.getpixel((max(icon.width - 1, 0), 0)),
-            icon.getpixel((0, max(icon.height - 1, 0))),
-            icon.getpixel((max(icon.width - 1, 0), max(icon.height - 1, 0))),
+        icon = shared_asset(
+            path,
+            size=(box[2] - box[0], box[3] - box[1]),
+            fit="thumbnail",
+            prepare=_clear_light_icon_background,
         )
-
-        def is_light_neutral(pixel: tuple[int, ...]) -> bool:
-            rgb = pixel[:3]
-            return min(rgb) >= 235 and max(rgb) - min(rgb) <= 8
-
-        if sum(is_light_neutral(pixel) for pixel in corners) >= 3:
-            pixels = icon.load()
-            for y in range(icon.height):
-                for x in range(icon.width):
-                    pixel = pixels[x, y]
-                    if is_light_neutral(pixel):
-                        pixels[x, y] = (*pixel[:3], 0)
         x = box[0] + ((box[2] - box[0]) - icon.width) // 2
         y = box[1] + ((box[3] - box[1]) - icon.height) // 2
         canvas.alpha_composite(icon, (x, y))
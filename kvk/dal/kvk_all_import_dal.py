@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 import datetime as dt
 import hashlib
 import json
@@ -14,13 +15,27 @@ import uuid
 import pandas as pd
 import pyodbc
 
+from core import sql_pool
+from core.bulk_load import bulk_insert
 from file_utils import fetch_one_dict
 from kvk.schemas.kvk_all_schema import FULL_DATA_NUMERIC_COLUMN_MAP, SCHEMA_VERSION
 from kvk.services.kvk_all_import_service import KvkAllPreparedImport
+from sheet_importer import iter_db_row_chunks, to_db_rows
 from utils import ensure_aware_utc
 
 logger = logging.getLogger(__name__)
 
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+# Rows converted and sent per staging chunk.
+KVK_ALL_STAGE_CHUNK_ROWS = max(1, _env_int("KVK_ALL_STAGE_CHUNK_ROWS", 5000))
+
 STAGE_COL_ORDER = [
     "governor_id",
     "name",
@@ -140,6 +155,15 @@ def connect_sql_server(
     )
 
 
+def stage_connection_pool(
+    *, server: str, database: str, username: str
+) -> sql_pool.SqlConnectionPool | None:
+    """Pool the parallel staging workers lease from; None when ``DB_POOL_ENABLED=0``."""
+    if not sql_pool.DB_POOL_ENABLED:
+        return None
+    return sql_pool.get_pool(f"kvk_all:{username}@{server}/{database}")
+
+
 def enable_fast_executemany(cur: Any) -> bool:
     try:
         cur.fast_executemany = True
@@ -148,24 +172,22 @@ def enable_fast_executemany(cur: Any) -> bool:
         return False
 
 
-def rows_for_stage(token: str, df: pd.DataFrame) -> list[tuple[Any, ...]]:
+def _stage_frame(df: pd.DataFrame) -> pd.DataFrame:
     df2 = df.reindex(columns=STAGE_COL_ORDER)
     logger.info("[KVK] DF staged col order: %s", list(df2.columns))
+    return df2
 
-    def _noneify(value: Any) -> Any:
-        try:
-            import numpy as np
 
-            if isinstance(value, np.floating) and np.isnan(value):
-                return None
-        except Exception:
-            pass
-        return None if pd.isna(value) else value
+def rows_for_stage(token: str, df: pd.DataFrame) -> list[tuple[Any, ...]]:
+    return to_db_rows(_stage_frame(df), prefix=(token,))
+
 
-    return [
-        (token, *(tuple(_noneify(value) for value in row)))
-        for row in df2.itertuples(index=False, name=None)
-    ]
+def iter_stage_row_chunks(
+    token: str, df: pd.DataFrame, chunk_size: int | None = None
+) -> Iterator[list[tuple[Any, ...]]]:
+    """``rows_for_stage`` in chunks, each converted only when the previous one has been sent."""
+    size = KVK_ALL_STAGE_CHUNK_ROWS if chunk_size is None else chunk_size
+    return iter_db_row_chunks(_stage_frame(df), size, prefix=(token,))
 
 
 def missing_stage_columns(cur: Any, required_columns: tuple[str, ...]) -> list[str]:
@@ -294,7 +316,16 @@ def ingest_prepared_import(
     source_filename: str,
     uploader_id: int,
     scan_ts_utc: dt.datetime,
+    connect: Callable[[], Any] | None = None,
+    pool: sql_pool.SqlConnectionPool | None = None,
 ) -> dict[str, Any]:
+    """
+    Stage, pre-check, ingest and recompute one prepared KVK_ALL import on ``con``.
+
+    With ``connect`` (a factory for connections to the same database) the staging insert may run
+    on several connections in parallel (``core.bulk_load``); with ``pool`` those connections are
+    leases from it, at most one per worker.
+    """
     df = prepared.dataframe
     staged_rows = prepared.staged_rows
     sheet_name = prepared.sheet_name
@@ -327,13 +358,29 @@ def ingest_prepared_import(
             }
 
     token = str(uuid.uuid4())
-    stage_rows_started = time.perf_counter()
-    stage_rows = rows_for_stage(token, df)
-    stage_rows_ms = (time.perf_counter() - stage_rows_started) * 1000.0
-    stage_insert_started = time.perf_counter()
-    cur.executemany(STAGE_INSERT_SQL, stage_rows)
-    con.commit()
-    stage_insert_ms = (time.perf_counter() - stage_insert_started) * 1000.0
+    stage_started = time.perf_counter()
+    try:
+        stage_load = bulk_insert(
+            STAGE_INSERT_SQL,
+            iter_stage_row_chunks(token, df),
+            label="kvk_all_stage",
+            cursor=cur,
+            connect=connect,
+            pool=pool,
+        )
+        con.commit()
+    except Exception:
+        # Parallel chunks commit on their own connections; drop whatever landed.
+        if connect is not None:
+            try:
+                con.rollback()
+                cur.execute(DELETE_STAGED_TOKEN_SQL, token)
+                con.commit()
+            except Exception:
+                logger.exception("[KVK] Failed to clean staged rows for token %s.", token)
+        raise
+    stage_rows_ms = stage_load.produce_s * 1000.0
+    stage_insert_ms = (time.perf_counter() - stage_started) * 1000.0
 
     logger.info("[KVK] Final stage col order: %s", STAGE_COL_ORDER)
     logger.info("[KVK] DF col order now: %s", list(df.columns))
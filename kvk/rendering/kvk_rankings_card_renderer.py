@@ -7,6 +7,7 @@ from typing import Any
 
 from PIL import Image, ImageDraw, ImageFont
 
+from core.asset_cache import register_warm_assets, shared_asset
 from kvk.models.kvk_rankings import RankingPayload, RankingRow, RenderedRankingCard
 from kvk.rendering.kvk_stats_card_renderer import (
     BLUE,
@@ -21,7 +22,6 @@ from kvk.rendering.kvk_stats_card_renderer import (
     _draw_text,
     _fit_font,
     _font,
-    _load_background,
     _text_width,
 )
 
@@ -37,6 +37,9 @@ CURRENT_RANKING_BACKGROUNDS = {
     "honor": HONOR_RANKINGS_BACKGROUND,
     "prekvk": PREKVK_RANKINGS_BACKGROUND,
 }
+register_warm_assets(
+    (*CURRENT_RANKING_BACKGROUNDS.values(), HALL_OF_FAME_BACKGROUND), size=(WIDTH, HEIGHT)
+)
 
 AMBER = (255, 183, 77)
 METRIC_BLUE = (76, 151, 255)
@@ -55,9 +58,8 @@ def _background_path(mode: str = "kvk") -> Path | None:
     return None
 
 
-@lru_cache(maxsize=8)
 def _ranking_background(path: Path) -> Image.Image:
-    return _load_background(path)
+    return shared_asset(path, size=(WIDTH, HEIGHT))
 
 
 def _save_png(canvas: Image.Image, buf: BytesIO) -> None:
@@ -6,6 +6,7 @@ from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
 from core import visual_text
+from core.asset_cache import load_asset, register_warm_assets
 from kvk.models.kvk_stats_card import KvkStatsCardPayload, RenderedKvkStatsCard
 from kvk.theme import normalize_kvk_mode
 
@@ -22,6 +23,7 @@ MODE_BACKGROUNDS = {
 
 WIDTH = 1180
 HEIGHT = 640
+register_warm_assets((DEFAULT_BACKGROUND, *MODE_BACKGROUNDS.values()), size=(WIDTH, HEIGHT))
 TEXT = (255, 255, 255)
 MUTED = (210, 214, 222)
 GREEN = (52, 211, 153)
@@ -83,8 +85,7 @@ def _background_for_mode(kvk_name: str | None) -> Path | None:
 
 
 def _load_background(path: Path) -> Image.Image:
-    background = Image.open(path).convert("RGBA")
-    return background.resize((WIDTH, HEIGHT), Image.Resampling.LANCZOS)
+    return load_asset(path, size=(WIDTH, HEIGHT))
 
 
 def _text_width(
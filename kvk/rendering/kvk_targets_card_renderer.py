@@ -6,6 +6,7 @@ from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
 from core import visual_text
+from core.asset_cache import load_asset
 from kvk.models.kvk_targets_card import KvkTargetsCardPayload, RenderedKvkTargetsCard
 from kvk.theme import normalize_kvk_mode
 
@@ -46,8 +47,7 @@ def _background_for_mode(kvk_name: str | None) -> Path | None:
 
 
 def _load_background(path: Path) -> Image.Image:
-    background = Image.open(path).convert("RGBA")
-    return background.resize((WIDTH, HEIGHT), Image.Resampling.LANCZOS)
+    return load_asset(path, size=(WIDTH, HEIGHT))
 
 
 def _text_width(
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from io import BytesIO
 import logging
 from typing import Any
 
 import pandas as pd
 
+from core.xlsx_reader import open_workbook
 from kvk.schemas.kvk_all_schema import (
     COLUMN_ALIASES,
     FULL_DATA_NUMERIC_COLUMN_MAP,
@@ -46,22 +46,28 @@ def _alias_key(value: str) -> str:
     return "".join(str(value).strip().lower().replace("_", " ").split())
 
 
-def apply_column_aliases(df: pd.DataFrame) -> pd.DataFrame:
-    """Apply legacy-compatible aliases before strict Full Data schema validation."""
-    if df is None:
-        return df
-
-    lookup = {_alias_key(column): column for column in df.columns}
+def column_alias_renames(columns: list[Any]) -> dict[str, str]:
+    """Original header -> canonical name for every legacy alias present in ``columns``."""
+    present = set(columns)
+    lookup = {_alias_key(column): column for column in columns}
     renames: dict[str, str] = {}
     for canonical, variants in COLUMN_ALIASES.items():
-        if canonical in df.columns:
+        if canonical in present:
             continue
         for variant in variants:
             original = lookup.get(_alias_key(variant))
             if original:
                 renames[original] = canonical
                 break
+    return renames
+
 
+def apply_column_aliases(df: pd.DataFrame) -> pd.DataFrame:
+    """Apply legacy-compatible aliases before strict Full Data schema validation."""
+    if df is None:
+        return df
+
+    renames = column_alias_renames(list(df.columns))
     if not renames:
         return df
 
@@ -88,26 +94,38 @@ def read_full_data_workbook(
         )
 
     try:
-        xl = pd.ExcelFile(BytesIO(content))
+        workbook = open_workbook(content)
     except Exception as exc:
         raise ValueError(f"Failed to open Excel file: {exc}") from exc
 
-    sheet_names = xl.sheet_names or []
-    if not sheet_names:
-        raise ValueError("Excel file contains no sheets")
+    with workbook:
+        sheet_names = workbook.sheet_names or []
+        if not sheet_names:
+            raise ValueError("Excel file contains no sheets")
 
-    chosen_sheet = select_full_data_sheet(sheet_names)
+        chosen_sheet = select_full_data_sheet(sheet_names)
 
-    try:
-        df = xl.parse(chosen_sheet)
-    except Exception as exc:
-        raise ValueError(f"Failed to parse sheet '{chosen_sheet}': {exc}") from exc
+        try:
+            df = workbook.read_sheet(chosen_sheet)
+        except Exception as exc:
+            raise ValueError(f"Failed to parse sheet '{chosen_sheet}': {exc}") from exc
 
     if df is None:
         raise ValueError("Parsed sheet is empty or invalid")
 
+    # Strip and alias only after pandas has suffixed exact duplicates (X, X.1).
     df.columns = [str(column).strip() for column in df.columns]
     df = apply_column_aliases(df)
+    duplicated = sorted({str(column) for column in df.columns[df.columns.duplicated()]})
+    if duplicated:
+        raise KvkAllSchemaValidationError(
+            code="duplicate_full_data_columns",
+            message=(
+                "KVK_ALL Full Data sheet has column(s) that collide after trimming spaces and "
+                "applying aliases: " + ", ".join(duplicated)
+            ),
+            sheet_name=chosen_sheet,
+        )
     schema_result = validate_full_data_columns(df.columns, sheet_name=chosen_sheet)
     logger.info("[KVK] Read sheet '%s' from uploaded file %s", chosen_sheet, source_filename)
     return df, chosen_sheet, schema_result.to_dict()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+import threading
 from typing import Any
 
 from kvk.combat_metrics import calculate_combat_metrics
@@ -358,8 +360,155 @@ def _filter_kvk_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
     ]
 
 
-def build_kvk_rankings_payload_from_rows(
-    rows: list[dict[str, Any]] | None,
+@dataclass(frozen=True)
+class RankingIndex:
+    """Ranked rows plus a governor -> position map, built once per ranking source."""
+
+    rows: tuple[RankingRow, ...]
+    positions: dict[int, int]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[RankingRow]) -> RankingIndex:
+        ordered = tuple(rows)
+        positions: dict[int, int] = {}
+        for index, row in enumerate(ordered):
+            positions.setdefault(row.governor_id, index)
+        return cls(rows=ordered, positions=positions)
+
+    def top(self, limit: int | None = None) -> list[RankingRow]:
+        return list(self.rows if limit is None else self.rows[:limit])
+
+    def position(self, governor_id: int) -> int | None:
+        return self.positions.get(governor_id)
+
+    def covers(self, rows: list[RankingRow]) -> bool:
+        """True when ``rows`` are this index's own row objects (payloads built from it)."""
+        if len(rows) != len(self.rows):
+            return False
+        return not rows or (rows[0] is self.rows[0] and rows[-1] is self.rows[-1])
+
+
+class KvkRankingSnapshot:
+    """One stats-cache load: filtered rows plus a lazily built rank index per KVK metric."""
+
+    def __init__(self, rows: list[dict[str, Any]] | None) -> None:
+        raw_rows = list(rows or [])
+        self.raw_row_count = len(raw_rows)
+        self.filtered = tuple(_filter_kvk_rows(raw_rows))
+        self.freshness_label = _latest_refresh_label(list(self.filtered) or raw_rows)
+        self._details: list[tuple[int, str, dict[str, Any], dict[str, Any]]] | None = None
+        self._indexes: dict[str, RankingIndex] = {}
+        self._lock = threading.Lock()
+
+    def cached_index(self, metric: str) -> RankingIndex | None:
+        with self._lock:
+            return self._indexes.get(metric)
+
+    def index(self, metric: str) -> RankingIndex:
+        with self._lock:
+            index = self._indexes.get(metric)
+            if index is None:
+                index = self._indexes[metric] = self._build_index(metric)
+            return index
+
+    def _row_details(self) -> list[tuple[int, str, dict[str, Any], dict[str, Any]]]:
+        # Shared by every metric's RankingRow; RankingRow is frozen and nothing mutates these.
+        if self._details is None:
+            self._details = [
+                (
+                    _row_governor_id(raw),
+                    _display_name(raw, id_keys=("GovernorID", "Gov_ID")),
+                    {
+                        "Power": _kvk_power(raw),
+                        "Kills": _kvk_kills(raw),
+                        "% K/T": _kvk_pct_kill_target(raw),
+                        "Deads": _kvk_deads(raw),
+                        "DKP": _kvk_dkp(raw),
+                        "Acclaim": _kvk_acclaim(raw),
+                        "Tanking Score": _kvk_tanking_score_supporting_value(raw),
+                        "Kill Points": _kvk_kill_points(raw),
+                        "KP Loss": _kvk_kp_loss(raw),
+                        "Healed": _kvk_healed(raw),
+                    },
+                    dict(raw),
+                )
+                for raw in self.filtered
+            ]
+        return self._details
+
+    def _build_index(self, metric: str) -> RankingIndex:
+        getter = _kvk_metric_getter(metric)
+        if metric == "tanking_score":
+            rankable = [i for i, row in enumerate(self.filtered) if _kvk_has_tanking_score(row)]
+        elif metric == "healed":
+            rankable = [i for i, row in enumerate(self.filtered) if _kvk_has_healed(row)]
+        else:
+            rankable = list(range(len(self.filtered)))
+        details = self._row_details()
+        values = {i: getter(self.filtered[i]) for i in rankable}
+        direction = 1 if metric == "healed" else -1
+        rankable.sort(key=lambda i: (direction * values[i], -details[i][2]["Power"], details[i][0]))
+        ranking_rows: list[RankingRow] = []
+        previous_value: int | float | None = None
+        competition_rank = 0
+        for position, i in enumerate(rankable, start=1):
+            value = values[i]
+            if previous_value is None or value != previous_value:
+                competition_rank = position
+                previous_value = value
+            governor_id, governor_name, supporting_values, raw = details[i]
+            ranking_rows.append(
+                RankingRow(
+                    rank=competition_rank,
+                    governor_id=governor_id,
+                    governor_name=governor_name,
+                    value=value,
+                    supporting_values=supporting_values,
+                    raw=raw,
+                )
+            )
+        return RankingIndex.from_rows(ranking_rows)
+
+
+_snapshot_lock = threading.Lock()
+_kvk_snapshot: KvkRankingSnapshot | None = None
+_kvk_snapshot_source: dict[str, Any] | None = None
+# mode -> (source key, index) for honor/prekvk; a given imported scan never changes.
+_source_indexes: dict[str, tuple[tuple[Any, ...], RankingIndex]] = {}
+
+
+def _current_kvk_snapshot() -> KvkRankingSnapshot:
+    """Return the snapshot for the current stats cache, rebuilding when the file was reloaded."""
+    global _kvk_snapshot, _kvk_snapshot_source
+    cache = load_stat_cache()
+    with _snapshot_lock:
+        if _kvk_snapshot is not None and _kvk_snapshot_source is cache:
+            return _kvk_snapshot
+    snapshot = KvkRankingSnapshot([row for key, row in cache.items() if key != "_meta"])
+    with _snapshot_lock:
+        _kvk_snapshot, _kvk_snapshot_source = snapshot, cache
+    return snapshot
+
+
+def _cached_source_index(
+    mode: str,
+    key: tuple[Any, ...] | None,
+    build: Callable[[], list[RankingRow]],
+) -> RankingIndex:
+    if key is not None:
+        with _snapshot_lock:
+            cached = _source_indexes.get(mode)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+    index = RankingIndex.from_rows(build())
+    if key is not None:
+        with _snapshot_lock:
+            _source_indexes[mode] = (key, index)
+    return index
+
+
+def build_kvk_rankings_payload_from_snapshot(
+    snapshot: KvkRankingSnapshot,
     *,
     metric: str = "kills",
     limit: int = 10,
@@ -367,56 +516,10 @@ def build_kvk_rankings_payload_from_rows(
 ) -> RankingPayload:
     normalized_limit = normalize_ranking_limit(limit)
     normalized_metric = normalize_current_ranking_metric("kvk", metric, limit=normalized_limit)
-    raw_rows = list(rows or [])
-    filtered = _filter_kvk_rows(raw_rows)
-    getter = _kvk_metric_getter(normalized_metric)
-    if normalized_metric == "tanking_score":
-        rankable_rows = [row for row in filtered if _kvk_has_tanking_score(row)]
-    elif normalized_metric == "healed":
-        rankable_rows = [row for row in filtered if _kvk_has_healed(row)]
-    else:
-        rankable_rows = filtered
-    sort_key: Callable[[dict[str, Any]], tuple[int | float, int | float, int]]
-    if normalized_metric == "healed":
-        sort_key = lambda row: (getter(row), -_kvk_power(row), _row_governor_id(row))
-    else:
-        sort_key = lambda row: (-getter(row), -_kvk_power(row), _row_governor_id(row))
-    sorted_rows = sorted(
-        rankable_rows,
-        key=sort_key,
-    )
-    ranking_rows: list[RankingRow] = []
-    selected_rows = sorted_rows if include_all else sorted_rows[:normalized_limit]
-    previous_value: int | float | None = None
-    competition_rank = 0
-    for index, raw in enumerate(selected_rows, start=1):
-        value = getter(raw)
-        if previous_value is None or value != previous_value:
-            competition_rank = index
-            previous_value = value
-        ranking_rows.append(
-            RankingRow(
-                rank=competition_rank,
-                governor_id=_row_governor_id(raw),
-                governor_name=_display_name(raw, id_keys=("GovernorID", "Gov_ID")),
-                value=value,
-                supporting_values={
-                    "Power": _kvk_power(raw),
-                    "Kills": _kvk_kills(raw),
-                    "% K/T": _kvk_pct_kill_target(raw),
-                    "Deads": _kvk_deads(raw),
-                    "DKP": _kvk_dkp(raw),
-                    "Acclaim": _kvk_acclaim(raw),
-                    "Tanking Score": _kvk_tanking_score_supporting_value(raw),
-                    "Kill Points": _kvk_kill_points(raw),
-                    "KP Loss": _kvk_kp_loss(raw),
-                    "Healed": _kvk_healed(raw),
-                },
-                raw=dict(raw),
-            )
-        )
+    index = snapshot.index(normalized_metric)
+    ranking_rows = index.top(None if include_all else normalized_limit)
     source_state = "fresh"
-    if not raw_rows:
+    if not snapshot.raw_row_count:
         source_state = "unavailable"
     elif not ranking_rows:
         source_state = "empty"
@@ -431,43 +534,55 @@ def build_kvk_rankings_payload_from_rows(
         rows=ranking_rows,
         source_note="Stats cache",
         source_state=source_state,
-        freshness_label=_latest_refresh_label(filtered or raw_rows),
+        freshness_label=snapshot.freshness_label,
         filters=KVK_RANKING_FILTERS,
-        total_rows=len(rankable_rows),
+        total_rows=len(index.rows),
         empty_message=(
             "No KVK ranking rows match the current included-player filters."
-            if raw_rows
+            if snapshot.raw_row_count
             else "No stats cache available yet. Try again after the next scan/export."
         ),
     )
 
 
-async def build_kvk_rankings_payload(
+def build_kvk_rankings_payload_from_rows(
+    rows: list[dict[str, Any]] | None,
     *,
     metric: str = "kills",
     limit: int = 10,
     include_all: bool = False,
 ) -> RankingPayload:
-    cache = await asyncio.to_thread(load_stat_cache)
-    rows = [row for key, row in cache.items() if key != "_meta"]
-    return build_kvk_rankings_payload_from_rows(
-        rows,
+    return build_kvk_rankings_payload_from_snapshot(
+        KvkRankingSnapshot(rows),
         metric=metric,
         limit=limit,
         include_all=include_all,
     )
 
 
-def build_honor_rankings_payload_from_rows(
-    rows: list[dict[str, Any]] | None,
+def _build_current_kvk_rankings_payload(
+    metric: str, limit: int, include_all: bool
+) -> RankingPayload:
+    return build_kvk_rankings_payload_from_snapshot(
+        _current_kvk_snapshot(),
+        metric=metric,
+        limit=limit,
+        include_all=include_all,
+    )
+
+
+async def build_kvk_rankings_payload(
     *,
+    metric: str = "kills",
     limit: int = 10,
     include_all: bool = False,
 ) -> RankingPayload:
-    normalized_limit = normalize_ranking_limit(limit)
+    return await asyncio.to_thread(_build_current_kvk_rankings_payload, metric, limit, include_all)
+
+
+def _honor_ranking_rows(rows: list[dict[str, Any]]) -> list[RankingRow]:
     ranking_rows: list[RankingRow] = []
-    selected_rows = list(rows or []) if include_all else list(rows or [])[:normalized_limit]
-    for index, raw in enumerate(selected_rows, start=1):
+    for index, raw in enumerate(rows, start=1):
         governor_id = _to_int(raw.get("GovernorID"))
         name = str(raw.get("GovernorName") or governor_id or "Unknown").strip() or "Unknown"
         ranking_rows.append(
@@ -487,7 +602,40 @@ def build_honor_rankings_payload_from_rows(
                 raw=dict(raw),
             )
         )
-    first = (rows or [{}])[0] if rows else {}
+    return ranking_rows
+
+
+_HONOR_CONTENT_FIELDS = ("GovernorID", "GovernorName", "HonorPoints")
+
+
+def _honor_source_key(rows: list[dict[str, Any]]) -> tuple[Any, ...] | None:
+    """Key the honor index on the scan plus a hash of the ranked content.
+
+    A corrected re-import can keep the same ScanID and row count, so the ids alone would keep
+    serving the pre-correction ranking.
+    """
+    first = rows[0] if rows else {}
+    if first.get("ScanID") in (None, "") or first.get("KVK_NO") in (None, ""):
+        return None
+    content = hash(tuple(tuple(row.get(field) for field in _HONOR_CONTENT_FIELDS) for row in rows))
+    return (first.get("KVK_NO"), first.get("ScanID"), len(rows), content)
+
+
+def build_honor_rankings_payload_from_rows(
+    rows: list[dict[str, Any]] | None,
+    *,
+    limit: int = 10,
+    include_all: bool = False,
+) -> RankingPayload:
+    normalized_limit = normalize_ranking_limit(limit)
+    source_rows = list(rows or [])
+    index = _cached_source_index(
+        "honor",
+        _honor_source_key(source_rows),
+        lambda: _honor_ranking_rows(source_rows),
+    )
+    ranking_rows = index.top(None if include_all else normalized_limit)
+    first = source_rows[0] if source_rows else {}
     return RankingPayload(
         mode="honor",
         mode_label=CURRENT_RANKING_MODE_LABELS["honor"],
@@ -496,10 +644,10 @@ def build_honor_rankings_payload_from_rows(
         limit=normalized_limit,
         rows=ranking_rows,
         kvk_no=_to_int(first.get("KVK_NO")) if first.get("KVK_NO") not in (None, "") else None,
-        freshness_label=_latest_refresh_label(list(rows or [])),
+        freshness_label=_latest_refresh_label(source_rows),
         source_note="Latest imported honor scan",
         source_state="fresh" if ranking_rows else "empty",
-        total_rows=len(rows or []),
+        total_rows=len(source_rows),
         empty_message="No honor data found for the latest KVK.",
     )
 
@@ -529,16 +677,8 @@ def _prekvk_value(row: PreKvkReportRow, metric: str) -> int:
     return int(row.overall_points or 0)
 
 
-def build_prekvk_rankings_payload_from_report(
-    payload: PreKvkReportPayload,
-    *,
-    display_limit: int | None = None,
-) -> RankingPayload:
-    metric = normalize_current_ranking_metric("prekvk", payload.sort_by.value)
-    normalized_limit = (
-        normalize_ranking_limit(display_limit) if display_limit is not None else payload.limit
-    )
-    ranking_rows = [
+def _prekvk_ranking_rows(payload: PreKvkReportPayload, metric: str) -> list[RankingRow]:
+    return [
         RankingRow(
             rank=row.rank,
             governor_id=int(row.governor_id),
@@ -564,6 +704,33 @@ def build_prekvk_rankings_payload_from_report(
         )
         for row in payload.rows
     ]
+
+
+def build_prekvk_rankings_payload_from_report(
+    payload: PreKvkReportPayload,
+    *,
+    display_limit: int | None = None,
+) -> RankingPayload:
+    metric = normalize_current_ranking_metric("prekvk", payload.sort_by.value)
+    normalized_limit = (
+        normalize_ranking_limit(display_limit) if display_limit is not None else payload.limit
+    )
+    source_key = (
+        (
+            payload.kvk_no,
+            metric,
+            payload.scan_timestamp_utc,
+            payload.source_filename,
+            len(payload.rows),
+        )
+        if payload.scan_timestamp_utc
+        else None
+    )
+    ranking_rows = _cached_source_index(
+        "prekvk",
+        source_key,
+        lambda: _prekvk_ranking_rows(payload, metric),
+    ).top()
     filters: tuple[str, ...] = ()
     if not payload.has_stage_data:
         filters = ("Legacy total-only import",)
@@ -750,11 +917,19 @@ def _gap_to_next_rank(
     return int(gap) if gap.is_integer() else gap
 
 
-def _ranked_row_index(rows: list[RankingRow], governor_id: int) -> int | None:
-    for index, row in enumerate(rows):
-        if row.governor_id == governor_id:
+def _ranking_index_for_payload(payload: RankingPayload) -> RankingIndex:
+    """Reuse the snapshot index a full-list payload was sliced from; index other payloads."""
+    with _snapshot_lock:
+        candidates = [index for _key, index in _source_indexes.values()]
+        snapshot = _kvk_snapshot
+    if snapshot is not None and payload.mode == "kvk":
+        kvk_index = snapshot.cached_index(payload.metric)
+        if kvk_index is not None:
+            candidates.append(kvk_index)
+    for index in candidates:
+        if index.covers(payload.rows):
             return index
-    return None
+    return RankingIndex.from_rows(payload.rows)
 
 
 async def build_my_rank_lookup_result(
@@ -854,7 +1029,8 @@ async def build_my_rank_lookup_result(
             total_rows=total_rows,
         )
 
-    row_index = _ranked_row_index(payload.rows, selected_governor_id)
+    index = _ranking_index_for_payload(payload)
+    row_index = index.position(selected_governor_id)
     if row_index is None:
         safe_governor_name = _clean_rank_message_text(governor_name)
         return _my_rank_result(
@@ -873,9 +1049,9 @@ async def build_my_rank_lookup_result(
             total_rows=total_rows,
         )
 
-    row = payload.rows[row_index]
-    row_above = payload.rows[row_index - 1] if row_index > 0 else None
-    row_below = payload.rows[row_index + 1] if row_index + 1 < len(payload.rows) else None
+    row = index.rows[row_index]
+    row_above = index.rows[row_index - 1] if row_index > 0 else None
+    row_below = index.rows[row_index + 1] if row_index + 1 < len(index.rows) else None
     return _my_rank_result(
         status="found",
         mode=payload.mode,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
 from datetime import datetime
 import logging
 from typing import Any
@@ -280,7 +281,7 @@ async def build_kvk_targets_card_payload(governor_id: str | int) -> KvkTargetsCa
 
     try:
         last_kvk_map = await stats_cache_helpers.load_last_kvk_map()
-        last_kvk = last_kvk_map.get(gid) if isinstance(last_kvk_map, dict) else {}
+        last_kvk = last_kvk_map.get(gid) if isinstance(last_kvk_map, Mapping) else {}
     except Exception:
         logger.debug("kvk_targets_last_kvk_map_unavailable governor_id=%s", gid, exc_info=True)
         last_kvk = {}
@@ -119,6 +119,15 @@ def ingest_kvk_all_excel(
             source_filename=source_filename,
             uploader_id=uploader_id,
             scan_ts_utc=scan_ts_utc,
+            connect=lambda: kvk_all_import_dal.connect_sql_server(
+                server=server,
+                database=database,
+                username=username,
+                password=password,
+            ),
+            pool=kvk_all_import_dal.stage_connection_pool(
+                server=server, database=database, username=username
+            ),
         )
     finally:
         try:
@@ -1,14 +1,44 @@
 # kvk_state.py
+"""
+Current-KVK state resolution.
+
+``get_latest_kvk_details()`` / ``get_kvk_context_today()`` are served from a short-TTL
+in-process cache (KVK_CONTEXT_TTL_SECONDS). A miss is resolved by one caller while
+concurrent callers wait for its result. The scan import and ProcConfig import pipelines
+call ``invalidate_kvk_context()`` when the underlying tables change, and
+``get_kvk_context_cache_info()`` reports the cache age for diagnostics.
+
+The cache is per process. Warm offload workers (``core.worker_pool``) never see the bot's
+invalidations, so ``maintenance_worker`` drops their copy before every pooled job; within a job
+the context can be at most KVK_CONTEXT_TTL_SECONDS old.
+"""
+
 from __future__ import annotations
 
 import datetime as dt
 import logging
+import os
+import threading
+import time
 from typing import Literal, TypedDict
 
 from file_utils import fetch_one_dict, get_conn_with_retries
 
 log = logging.getLogger(__name__)
 
+
+def _parse_ttl() -> float:
+    raw = os.environ.get("KVK_CONTEXT_TTL_SECONDS", "")
+    if raw:
+        try:
+            return max(0.0, float(raw))
+        except ValueError:
+            log.warning("[kvk_state] Invalid KVK_CONTEXT_TTL_SECONDS=%r — using default 120s", raw)
+    return 120.0
+
+
+KVK_CONTEXT_TTL_SECONDS: float = _parse_ttl()
+
 State = Literal["DRAFT", "ACTIVE", "ENDED"]
 
 
@@ -125,8 +155,94 @@ def _get_max_scan_order() -> int | None:
         return None
 
 
+# ---------------------------------------------------------------------------
+# Cached details (single-flight, TTL, explicit invalidation)
+# ---------------------------------------------------------------------------
+
+# (resolved_for_date, monotonic loaded_at, details); None when empty/invalidated.
+_details_cache: tuple[dt.date, float, KVKDetails] | None = None
+_details_lock = threading.Lock()
+# Guards _details_generation and publishing/dropping _details_cache. Kept separate from
+# _details_lock (held across the SQL load) so invalidation never waits on a load.
+_generation_lock = threading.Lock()
+_details_generation = 0
+_cache_hits = 0
+_cache_misses = 0
+_last_invalidation_reason = "never_populated"
+
+
+def _fresh_details(today: dt.date) -> KVKDetails | None:
+    cached = _details_cache
+    if cached is None:
+        return None
+    for_date, loaded_at, details = cached
+    if for_date != today or time.monotonic() - loaded_at >= KVK_CONTEXT_TTL_SECONDS:
+        return None
+    return details
+
+
 def get_latest_kvk_details(today: dt.date | None = None) -> KVKDetails | None:
-    today = today or dt.date.today()
+    """
+    Latest dbo.KVK_Details row with its resolved state, cached for KVK_CONTEXT_TTL_SECONDS.
+
+    An explicit ``today`` bypasses the cache. Failed/empty lookups are not cached.
+    Returns a copy, so callers may annotate it.
+    """
+    global _details_cache, _cache_hits, _cache_misses
+
+    if today is not None:
+        return _load_latest_kvk_details(today)
+
+    current_day = dt.date.today()
+    details = _fresh_details(current_day)
+    if details is not None:
+        _cache_hits += 1
+        return KVKDetails(**details)
+
+    with _details_lock:
+        details = _fresh_details(current_day)
+        if details is not None:
+            _cache_hits += 1
+            return KVKDetails(**details)
+        _cache_misses += 1
+        with _generation_lock:
+            generation = _details_generation
+        details = _load_latest_kvk_details(current_day)
+        # Don't publish a result an invalidation raced past while we were loading.
+        with _generation_lock:
+            if details is not None and generation == _details_generation:
+                _details_cache = (current_day, time.monotonic(), details)
+    return KVKDetails(**details) if details is not None else None
+
+
+def invalidate_kvk_context(reason: str = "unspecified", *, quiet: bool = False) -> None:
+    """Drop the cached KVK details/context; call after KVK_Details, ProcConfig or scans change."""
+    global _details_cache, _details_generation, _last_invalidation_reason
+
+    with _generation_lock:
+        _details_generation += 1
+        _details_cache = None
+        _last_invalidation_reason = reason
+    if not quiet:
+        log.info("[kvk_state] KVK context cache invalidated — reason=%s", reason)
+
+
+def get_kvk_context_cache_info() -> dict[str, object]:
+    """Diagnostics: populated, age_seconds, ttl_seconds, hits, misses, last_invalidation_reason."""
+    cached = _details_cache
+    return {
+        "populated": cached is not None,
+        "age_seconds": (time.monotonic() - cached[1]) if cached is not None else None,
+        "ttl_seconds": KVK_CONTEXT_TTL_SECONDS,
+        "kvk_no": cached[2]["kvk_no"] if cached is not None else None,
+        "state": cached[2]["state"] if cached is not None else None,
+        "hits": _cache_hits,
+        "misses": _cache_misses,
+        "last_invalidation_reason": _last_invalidation_reason,
+    }
+
+
+def _load_latest_kvk_details(today: dt.date) -> KVKDetails | None:
     try:
         with get_conn_with_retries() as conn, conn.cursor() as cur:
             cur.execute("""
@@ -10,6 +10,7 @@ from pathlib import Path
 from PIL import Image, ImageDraw
 
 from core import visual_contract, visual_text
+from core.asset_cache import register_warm_asset, shared_asset
 from leadership_player_review.models import ActivityMetric, LeadershipPlayerPayload
 from leadership_player_review.record_paging import (
     RECORD_PAGE_SIZE,
@@ -23,6 +24,7 @@ HEIGHT = 924
 _BACKGROUND = (
     Path(__file__).resolve().parent.parent / "assets" / "stats" / "cards" / "stats_player.png"
 )
+register_warm_asset(_BACKGROUND, size=(WIDTH, HEIGHT))
 _TEXT = visual_contract.TEXT
 _MUTED = visual_contract.MUTED
 _BLUE = visual_contract.BLUE
@@ -899,9 +901,8 @@ def _draw_record(draw: ImageDraw.ImageDraw, payload: LeadershipPlayerPayload) ->
 
 
 def render_leadership_player(payload: LeadershipPlayerPayload) -> RenderedLeadershipPlayerCard:
-    with Image.open(_BACKGROUND) as source:
-        canvas = source.convert("RGBA").resize((WIDTH, HEIGHT), Image.Resampling.LANCZOS)
-    canvas = Image.alpha_composite(canvas, Image.new("RGBA", canvas.size, (1, 4, 13, 60)))
+    backdrop = shared_asset(_BACKGROUND, size=(WIDTH, HEIGHT))
+    canvas = Image.alpha_composite(backdrop, Image.new("RGBA", backdrop.size, (1, 4, 13, 60)))
     draw = ImageDraw.Draw(canvas, "RGBA")
     _draw_header(draw, canvas, payload)
     if payload.page == "activity":
@@ -13,6 +13,7 @@ from uuid import UUID
 
 from rapidfuzz import fuzz
 
+from governor_name_index import NameIndexSlot
 import kvk_state
 from leadership_player_review import dal
 from leadership_player_review.models import (
@@ -53,6 +54,10 @@ def normalize_name(value: str | None) -> str:
     return " ".join(normalized.split()).casefold()
 
 
+# Name index over the directory tuple; rebuilt when the directory cache refreshes.
+_directory_index = NameIndexSlot("leadership_directory", normalize=normalize_name)
+
+
 async def _lookup_directory(*, refresh: bool = False) -> tuple[LookupCandidate, ...]:
     global _directory_cache
     now = time.monotonic()
@@ -119,18 +124,20 @@ async def resolve_name(name: str, *, refresh: bool = False) -> LookupResult:
             status="invalid", error="Governor name lookup is limited to 100 characters."
         )
     directory = await _lookup_directory(refresh=refresh)
-    exact = _dedupe_candidates(
-        [row for row in directory if normalize_name(row.governor_name) == query]
+    index = _directory_index.get(
+        directory, lambda: ((row.governor_name, row.governor_id, row) for row in directory)
     )
+    exact = _dedupe_candidates([entry.payload for entry in index.entries_for(query)])
     if exact:
         return LookupResult(status="found" if len(exact) == 1 else "matches", candidates=exact)
 
     scored: list[LookupCandidate] = []
-    for row in directory:
-        candidate_name = normalize_name(row.governor_name)
+    for candidate_name in index.shortlist(query):
         score = float(max(fuzz.ratio(query, candidate_name), fuzz.WRatio(query, candidate_name)))
         if score >= _FUZZY_CUTOFF:
-            scored.append(replace(row, score=score))
+            scored.extend(
+                replace(entry.payload, score=score) for entry in index.entries_for(candidate_name)
+            )
     candidates = _dedupe_candidates(scored)
     if not candidates:
         return LookupResult(status="not_found", error="No matching governor was found.")
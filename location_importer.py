@@ -8,6 +8,7 @@ import os
 import pyodbc
 
 from constants import DATABASE, PASSWORD, SERVER, USERNAME
+from core.bulk_load import bulk_insert, iter_chunks
 from file_utils import fetch_one_dict
 
 log = logging.getLogger(__name__)
@@ -33,6 +34,14 @@ def _int_or_zero(raw: object) -> int:
     return int(text or 0)
 
 
+_STAGING_INSERT_SQL = """
+    INSERT INTO dbo.PlayerLocation_Staging
+    (player_id, player_name, player_power, player_kills, player_ch, player_alliance, x, y,
+     ShieldEndsAtUnix, ShieldEndsAtUtc)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def _get_conn():
     user = os.getenv("IMPORT_SQL_USERNAME", USERNAME)
     pwd = os.getenv("IMPORT_SQL_PASSWORD", PASSWORD)
@@ -167,15 +176,8 @@ def load_staging_and_merge(*rows_args) -> tuple[int, int]:
     try:
         with conn.cursor() as cur:
             # cur.execute("TRUNCATE TABLE dbo.PlayerLocation_Staging;")
-            cur.fast_executemany = True
-            cur.executemany(
-                """
-                INSERT INTO dbo.PlayerLocation_Staging
-                (player_id, player_name, player_power, player_kills, player_ch, player_alliance, x, y,
-                 ShieldEndsAtUnix, ShieldEndsAtUtc)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                rows,
+            bulk_insert(
+                _STAGING_INSERT_SQL, iter_chunks(rows), label="player_location_staging", cursor=cur
             )
             cur.execute("EXEC dbo.sp_ImportPlayerLocationFromStaging;")
             result = fetch_one_dict(cur)
@@ -250,15 +252,8 @@ def load_staging_and_replace(*rows_args) -> tuple[int, int]:
             # Clear staging (requires ALTER on staging for TRUNCATE; otherwise use DELETE)
             cur.execute("TRUNCATE TABLE dbo.PlayerLocation_Staging;")
 
-            cur.fast_executemany = True
-            cur.executemany(
-                """
-                INSERT INTO dbo.PlayerLocation_Staging
-                (player_id, player_name, player_power, player_kills, player_ch, player_alliance, x, y,
-                 ShieldEndsAtUnix, ShieldEndsAtUtc)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                rows,
+            bulk_insert(
+                _STAGING_INSERT_SQL, iter_chunks(rows), label="player_location_staging", cursor=cur
             )
 
             # Atomic full-replace (only if >0 rows in staging)
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import importlib
 import inspect
 import json
 import logging
 import os
+import pickle
 import sys
 import time
 import traceback
@@ -54,6 +56,22 @@ except Exception:
                 pass
 
 
+try:
+    from core.offload_transport import (
+        RESULT_FRAME_ENV,
+        SHM_PREFIX,
+        read_shm_token,
+        resolve_shared_payloads,
+        write_result_frame,
+    )
+except Exception:
+    RESULT_FRAME_ENV = "MAINT_RESULT_FRAME_PATH"
+    SHM_PREFIX = "__OFFLOAD_SHM__:"
+    read_shm_token = None  # type: ignore
+    resolve_shared_payloads = None  # type: ignore
+    write_result_frame = None  # type: ignore
+
+
 _RECOMBINE_DISABLE = os.getenv("MAINT_RECOMBINE_DISABLE", "0").strip().lower() in (
     "1",
     "true",
@@ -62,6 +80,9 @@ _RECOMBINE_DISABLE = os.getenv("MAINT_RECOMBINE_DISABLE", "0").strip().lower() i
 _RECOMBINE_MIN_RUN = int(os.getenv("MAINT_RECOMBINE_MIN_RUN", "6"))
 _MAX_RESULT_SNIPPET = int(os.getenv("MAINT_WORKER_RESULT_SNIPPET", "1000"))
 
+# Set by serve_pool_worker while a job runs so _print_result_json captures instead of printing.
+_result_sink: list[dict[str, Any]] | None = None
+
 
 def _parse_allowlist(raw: str | None) -> list[str] | None:
     if not raw:
@@ -189,6 +210,17 @@ def _print_result_json(
                 }
             except Exception:
                 payload["result_summary"] = {"type": "unserializable", "repr": "<unserializable>"}
+    if _result_sink is not None:
+        # Warm pool worker: the payload travels back in the reply frame instead of stdout.
+        _result_sink.append(payload)
+        return
+    frame_path = os.getenv(RESULT_FRAME_ENV)
+    if frame_path and write_result_frame is not None:
+        try:
+            write_result_frame(frame_path, payload)
+            return
+        except Exception:
+            logger.debug("result frame write failed; falling back to stdout JSON", exc_info=True)
     try:
         sys.__stdout__.write(json.dumps(payload, default=str) + "\n")
         sys.__stdout__.flush()
@@ -344,6 +376,13 @@ def do_test_sleep(seconds: float):
 def _reconstruct_token(tok: str) -> Any:
     if not isinstance(tok, str):
         return tok
+    if tok.startswith(SHM_PREFIX):
+        if read_shm_token is None:
+            raise RuntimeError("shared-memory offload token received but transport unavailable")
+        try:
+            return read_shm_token(tok)
+        except Exception as e:
+            raise RuntimeError(f"failed to read shared offload segment {tok}: {e!r}")
     if tok.startswith(OFFLOAD_FILE_PREFIX):
         path = tok[len(OFFLOAD_FILE_PREFIX) :]
         try:
@@ -380,6 +419,8 @@ def _sanitize_for_logging(obj: Any, *, max_collection_items: int = 8) -> str:
             return f"<bytes len={length}>"
 
         if isinstance(obj, str):
+            if obj.startswith(SHM_PREFIX):
+                return SHM_PREFIX + "<segment>"
             if obj.startswith(OFFLOAD_FILE_PREFIX) or obj.startswith(OFFLOAD_JSON_PREFIX):
                 try:
                     _, path = obj.split(":", 1)
@@ -640,7 +681,7 @@ def run_callable_spec(spec: str, remaining_args: list[str]) -> int:
         try:
             if any(
                 isinstance(a, str)
-                and (a.startswith(OFFLOAD_FILE_PREFIX) or a.startswith(OFFLOAD_JSON_PREFIX))
+                and a.startswith((OFFLOAD_FILE_PREFIX, OFFLOAD_JSON_PREFIX, SHM_PREFIX))
                 for a in call_args
             ):
                 try:
@@ -689,10 +730,148 @@ def run_callable_spec(spec: str, remaining_args: list[str]) -> int:
         return 3
 
 
+# ---------------------------
+# Warm pool worker (--serve), driven by core.worker_pool
+# ---------------------------
+def _preload_modules(raw: str | None) -> tuple[list[str], list[str]]:
+    """Import each preload entry; ``module:function`` entries are also called (warm-up hooks)."""
+    loaded: list[str] = []
+    failed: list[str] = []
+    for name in (raw or "").split(","):
+        name = name.strip()
+        if not name:
+            continue
+        try:
+            module_name, _, func_name = name.partition(":")
+            module = importlib.import_module(module_name)
+            if func_name:
+                getattr(module, func_name)()
+            loaded.append(name)
+        except Exception:
+            logger.info("[WORKER_POOL] preload of %s failed", name, exc_info=True)
+            failed.append(name)
+    return loaded, failed
+
+
+def _run_spec_job(job: dict[str, Any]) -> dict[str, Any]:
+    global _result_sink
+    spec = str(job.get("spec") or "")
+    _result_sink = []
+    try:
+        rc = run_callable_spec(spec, [str(t) for t in job.get("argv") or []])
+        worker_parsed = _result_sink[-1] if _result_sink else None
+    finally:
+        _result_sink = None
+    return {"returncode": rc, "worker_parsed": worker_parsed}
+
+
+def _run_call_job(job: dict[str, Any]) -> dict[str, Any]:
+    module_name = str(job.get("module") or "")
+    func_name = str(job.get("function") or "")
+    spec = f"{module_name}:{func_name}"
+    if not _spec_allowed(spec):
+        emit_telemetry_event({"event": "maintenance_spec_denied", "spec": spec})
+        return {"ok": False, "error_type": "PermissionError", "error": "spec_not_allowed"}
+    args = tuple(job.get("args") or ())
+    kwargs = dict(job.get("kwargs") or {})
+    try:
+        if resolve_shared_payloads is not None:
+            resolved_args, kwargs = resolve_shared_payloads(args, kwargs)
+            args = tuple(resolved_args)
+        fn = getattr(importlib.import_module(module_name), func_name)
+        logger.info(
+            "Invoking pooled callable %s with args=%s kwargs=%s",
+            spec,
+            _sanitize_args_for_logging(list(args)),
+            sorted(kwargs),
+        )
+        if inspect.iscoroutinefunction(fn):
+            result = _run_coroutine_safely(functools.partial(fn, **kwargs), args)
+        else:
+            result = fn(*args, **kwargs)
+        return {"ok": True, "result": result}
+    except Exception as exc:
+        logger.exception("pooled callable %s raised: %s", spec, exc)
+        reply: dict[str, Any] = {
+            "ok": False,
+            "error_type": type(exc).__name__,
+            "error": str(exc),
+            "traceback": traceback.format_exc()[-4000:],
+        }
+        try:
+            pickle.dumps(exc)
+            reply["exc"] = exc
+        except Exception:
+            pass
+        return reply
+
+
+def _reset_per_job_caches() -> None:
+    """Drop caches the bot invalidates only in its own process, so a warm job starts fresh."""
+    kvk_state = sys.modules.get("kvk_state")
+    if kvk_state is not None:
+        kvk_state.invalidate_kvk_context(reason="pool_job", quiet=True)
+
+
+def serve_pool_worker() -> int:
+    """Serve jobs from core.worker_pool over stdin/stdout frames until EOF or shutdown."""
+    from core.worker_pool import current_rss_mb, read_frame, write_frame
+
+    # Keep fd 1 for frames only; anything the callables print goes to stderr.
+    proto_in = sys.stdin.buffer
+    proto_out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+    os.environ["MAINT_SUBPROC"] = "1"
+
+    loaded, failed = _preload_modules(os.getenv("MAINT_POOL_PRELOAD"))
+    write_frame(
+        proto_out,
+        {"type": "ready", "pid": os.getpid(), "preloaded": loaded, "preload_failed": failed},
+    )
+
+    while True:
+        job = read_frame(proto_in)
+        if job is None or job.get("type") == "shutdown":
+            return 0
+        started = time.monotonic()
+        _reset_per_job_caches()
+        if job.get("kind") == "spec":
+            reply = _run_spec_job(job)
+        else:
+            reply = _run_call_job(job)
+        reply.update(
+            {
+                "type": "result",
+                "job_id": job.get("job_id"),
+                "duration_ms": round((time.monotonic() - started) * 1000.0, 2),
+                "rss_mb": current_rss_mb(),
+            }
+        )
+        try:
+            write_frame(proto_out, reply)
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            write_frame(
+                proto_out,
+                {
+                    "type": "result",
+                    "job_id": job.get("job_id"),
+                    "ok": False,
+                    "returncode": 3,
+                    "error_type": "ResultNotPicklable",
+                    "error": f"result could not be returned: {exc}",
+                    "rss_mb": reply.get("rss_mb"),
+                },
+            )
+
+
 def main(argv=None) -> int:
     if argv is None:
         argv = sys.argv[1:]
 
+    if argv and argv[0] == "--serve":
+        return serve_pool_worker()
+
     if argv:
         first = argv[0]
         if isinstance(first, str) and ":" in first:
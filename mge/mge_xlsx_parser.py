@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from io import BytesIO
 import re
 from typing import Any
 
 import pandas as pd
 
+from core.xlsx_reader import read_xlsx_sheet
+
 _FILENAME_RX = re.compile(r"^mge_rankings_kd\d{4}_\d{8}\.xlsx$", re.IGNORECASE)
 _REQUIRED_COLUMNS = ["Rank", "Player ID", "Player", "Score"]
 _TARGET_SHEET = "Overall"
@@ -48,14 +49,10 @@ def parse_mge_results_xlsx(content: bytes, filename: str) -> list[ParsedMgeResul
     validate_results_filename(filename)
 
     try:
-        df = pd.read_excel(
-            BytesIO(content),
-            sheet_name=_TARGET_SHEET,
-            header=_HEADER_ROW_ZERO_BASED,
-        )
-    except ValueError as e:
+        df = read_xlsx_sheet(content, _TARGET_SHEET, header=_HEADER_ROW_ZERO_BASED)
+    except Exception as e:
         msg = str(e).lower()
-        if "worksheet" in msg and "not found" in msg:
+        if isinstance(e, ValueError) and "worksheet" in msg and "not found" in msg:
             raise ValueError("Missing required sheet 'Overall'.") from e
         raise ValueError(f"Unable to read results workbook: {e}") from e
 
@@ -12,6 +12,7 @@ from typing import Any
 from PIL import Image, ImageDraw
 
 from core import visual_contract, visual_text
+from core.asset_cache import register_warm_asset, shared_asset
 from player_self_service.accounts_models import (
     AccountMetricTotal,
     AccountPortfolioRow,
@@ -22,6 +23,7 @@ from player_self_service.accounts_models import (
 WIDTH = 1702
 HEIGHT = 924
 _BACKGROUND = Path(__file__).resolve().parent.parent / "assets" / "me" / "cards" / "me_accounts.png"
+register_warm_asset(_BACKGROUND)
 _TEXT = visual_contract.TEXT
 _MUTED = visual_contract.MUTED
 _BLUE = visual_contract.BLUE
@@ -152,11 +154,10 @@ def _panel(draw: ImageDraw.ImageDraw, box: tuple[int, int, int, int], radius: in
 
 
 def _canvas() -> tuple[Image.Image, ImageDraw.ImageDraw]:
-    with Image.open(_BACKGROUND) as source:
-        if source.size != (WIDTH, HEIGHT):
-            raise ValueError(f"Accounts backdrop must be {WIDTH}x{HEIGHT}; got {source.size}")
-        canvas = source.convert("RGBA")
-    canvas = Image.alpha_composite(canvas, Image.new("RGBA", canvas.size, (0, 5, 17, 76)))
+    backdrop = shared_asset(_BACKGROUND)
+    if backdrop.size != (WIDTH, HEIGHT):
+        raise ValueError(f"Accounts backdrop must be {WIDTH}x{HEIGHT}; got {backdrop.size}")
+    canvas = Image.alpha_composite(backdrop, Image.new("RGBA", backdrop.size, (0, 5, 17, 76)))
     return canvas, ImageDraw.Draw(canvas, "RGBA")
 
 
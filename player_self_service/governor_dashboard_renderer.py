@@ -11,6 +11,7 @@ from typing import Any
 from PIL import Image, ImageDraw, ImageOps
 
 from core import visual_contract, visual_text
+from core.asset_cache import register_warm_asset, shared_asset
 from player_self_service.governor_dashboard_models import GovernorDashboardPayload
 
 WIDTH = 1180
@@ -18,6 +19,7 @@ HEIGHT = 760
 FILENAME = "governor_dashboard.png"
 
 _BACKGROUND = Path(__file__).resolve().parent.parent / "assets" / "me" / "cards" / "me.png"
+register_warm_asset(_BACKGROUND, size=(WIDTH, HEIGHT))
 _TEXT = visual_contract.TEXT
 _MUTED = visual_contract.MUTED
 _GOLD = visual_contract.GOLD
@@ -160,9 +162,8 @@ def render_governor_dashboard(
     payload: GovernorDashboardPayload, *, avatar_bytes: bytes | None = None
 ) -> RenderedGovernorDashboard:
     """Render the approved self-view payload without Discord, SQL, or network IO."""
-    with Image.open(_BACKGROUND) as source:
-        canvas = source.convert("RGBA").resize((WIDTH, HEIGHT), Image.Resampling.LANCZOS)
-    canvas = Image.alpha_composite(canvas, Image.new("RGBA", canvas.size, (2, 4, 12, 70)))
+    backdrop = shared_asset(_BACKGROUND, size=(WIDTH, HEIGHT))
+    canvas = Image.alpha_composite(backdrop, Image.new("RGBA", backdrop.size, (2, 4, 12, 70)))
     _avatar(canvas, avatar_bytes)
     draw = ImageDraw.Draw(canvas, "RGBA")
 
@@ -10,6 +10,7 @@ from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
 from core import visual_text
+from core.asset_cache import shared_asset
 from player_self_service.service import PlayerSelfServiceSummary
 
 WIDTH = 1702
@@ -137,10 +138,9 @@ def _status_label(value: str) -> str:
 
 def _load_background(page: str) -> Image.Image:
     filename = _BACKGROUND_BY_PAGE[page]
-    with Image.open(_CARD_DIR / filename) as source:
-        background = source.convert("RGBA")
+    background = shared_asset(_CARD_DIR / filename)
     if background.size != (WIDTH, HEIGHT):
-        background = background.resize((WIDTH, HEIGHT), Image.Resampling.LANCZOS)
+        background = shared_asset(_CARD_DIR / filename, size=(WIDTH, HEIGHT))
     overlay = Image.new("RGBA", (WIDTH, HEIGHT), (4, 8, 16, 84))
     return Image.alpha_composite(background, overlay)
 
@@ -6,9 +6,10 @@ from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import ImageDraw, ImageFont
 
 from core import visual_contract, visual_text
+from core.asset_cache import load_asset, register_warm_asset
 from player_self_service.accounts_renderer import format_discord_heading
 from player_self_service.reminders_summary import RemindersSummaryPayload
 
@@ -17,6 +18,7 @@ HEIGHT = 924
 BACKDROP_PATH = (
     Path(__file__).resolve().parent.parent / "assets" / "me" / "cards" / "me_reminders.png"
 )
+register_warm_asset(BACKDROP_PATH)
 
 TEXT = visual_contract.TEXT
 MUTED = visual_contract.MUTED
@@ -271,14 +273,11 @@ def render_reminders_card(
     *,
     avatar_bytes: bytes | None = None,
 ) -> RenderedRemindersCard:
-    with Image.open(BACKDROP_PATH) as source:
-        source.load()
-        if source.size != (WIDTH, HEIGHT):
-            raise ValueError(f"Reminders backdrop must be {WIDTH}x{HEIGHT}; got {source.size}")
-        alpha = source.getchannel("A") if "A" in source.getbands() else None
-        if alpha is not None and alpha.getextrema() != (255, 255):
-            raise ValueError("Reminders backdrop must be fully opaque")
-        canvas = source.convert("RGBA")
+    canvas = load_asset(BACKDROP_PATH)
+    if canvas.size != (WIDTH, HEIGHT):
+        raise ValueError(f"Reminders backdrop must be {WIDTH}x{HEIGHT}; got {canvas.size}")
+    if canvas.getchannel("A").getextrema() != (255, 255):
+        raise ValueError("Reminders backdrop must be fully opaque")
 
     visual_contract.paste_core_avatar(canvas, avatar_bytes)
     draw = ImageDraw.Draw(canvas, "RGBA")
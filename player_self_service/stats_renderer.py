@@ -11,6 +11,7 @@ from pathlib import Path
 from PIL import Image, ImageDraw
 
 from core import visual_contract, visual_text
+from core.asset_cache import load_asset, register_warm_asset
 from player_self_service.stats_models import (
     PersonalStatsPayload,
     StatsMetricSummary,
@@ -20,6 +21,7 @@ from player_self_service.stats_models import (
 WIDTH = 1702
 HEIGHT = 924
 _BACKGROUND = Path(__file__).resolve().parent.parent / "assets" / "me" / "cards" / "me_stats.png"
+register_warm_asset(_BACKGROUND)
 _TEXT = visual_contract.TEXT
 _MUTED = visual_contract.MUTED
 _BLUE = visual_contract.BLUE
@@ -501,12 +503,11 @@ def render_personal_stats_card(
     display_name: str,
     avatar_bytes: bytes | None = None,
 ) -> RenderedStatsCard:
-    with Image.open(_BACKGROUND) as source:
-        if source.size != (WIDTH, HEIGHT):
-            raise ValueError(f"Stats backdrop must be {WIDTH}x{HEIGHT}; got {source.size}")
-        if source.mode == "RGBA" and source.getextrema()[3] != (255, 255):
-            raise ValueError("Stats backdrop must be fully opaque")
-        canvas = source.convert("RGBA")
+    canvas = load_asset(_BACKGROUND)
+    if canvas.size != (WIDTH, HEIGHT):
+        raise ValueError(f"Stats backdrop must be {WIDTH}x{HEIGHT}; got {canvas.size}")
+    if canvas.getextrema()[3] != (255, 255):
+        raise ValueError("Stats backdrop must be fully opaque")
     try:
         overlay = Image.new("RGBA", canvas.size, (0, 4, 14, 76))
         try:
@@ -13,6 +13,7 @@ from typing import Any
 import pyodbc
 
 from constants import PLAYER_STATS_CACHE
+from core.render_cache import invalidate_rendered_cards
 
 logger = logging.getLogger(__name__)
 
@@ -310,6 +311,26 @@ def _atomic_write_json_with_retries(
     raise last_exc
 
 
+def _write_columnar_best_effort(json_path: str, output: dict[str, Any]) -> None:
+    """
+    Write the memory-mapped columnar companion for a freshly persisted JSON cache.
+    Non-fatal: readers fall back to the JSON file when the columnar generation is missing/stale.
+    """
+    import stats_columnar
+
+    if not stats_columnar.columnar_enabled():
+        return
+    t0 = time.perf_counter()
+    try:
+        path = stats_columnar.write_columnar_cache(json_path, output)
+    except Exception:
+        logger.exception("[CACHE] Failed to write columnar cache for %s (continuing)", json_path)
+        return
+    logger.info(
+        "[CACHE] Wrote columnar cache %s (%.2fs)", os.path.basename(path), time.perf_counter() - t0
+    )
+
+
 def _to_int(v: Any, default: int = 0) -> int:
     if v is None or v == "":
         return default
@@ -854,6 +875,7 @@ def _build_last_kvk_cache_sync() -> dict[str, Any] | None:
             }
             # Use atomic write with retries
             _atomic_write_json_with_retries(cache_path, output)
+            _write_columnar_best_effort(cache_path, output)
             logger.info(
                 "[LAST_KVK] Wrote last-KVK cache to %s (KVK %s) with %s entries.",
                 cache_path,
@@ -950,6 +972,7 @@ def _build_and_persist_cache_sync() -> dict[str, Any] | None:
                 return err_output
 
             _atomic_write_json_with_retries(PLAYER_STATS_CACHE, output)
+            _write_columnar_best_effort(PLAYER_STATS_CACHE, output)
             _emit("ok", output=output)
 
             # Build/persist last-KVK cache independently (non-fatal)
@@ -1004,6 +1027,7 @@ async def build_player_stats_cache():
         count = None
 
     logger.info("[CACHE] ✅ player_stats_cache.json written with %s entries.", count)
+    await asyncio.to_thread(invalidate_rendered_cards, "player_stats_cache")
 
 
 async def build_lastkvk_player_stats_cache():
@@ -1022,6 +1046,7 @@ async def build_lastkvk_player_stats_cache():
     except Exception:
         count = None
     logger.info("[LAST_KVK] ✅ last-kvk cache written with %s entries.", count)
+    await asyncio.to_thread(invalidate_rendered_cards, "lastkvk_player_stats_cache")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,5 @@
 # prekvk_importer.py
 import hashlib
-import io
 import logging
 import os
 import re
@@ -9,8 +8,9 @@ from typing import Any
 import pandas as pd
 import pyodbc
 
+from core.xlsx_reader import open_workbook
 from file_utils import fetch_one_dict
-from sheet_importer import executemany_batched  # NEW: shared batching helper
+from sheet_importer import executemany_batched, to_db_rows
 
 logger = logging.getLogger(__name__)
 
@@ -60,25 +60,32 @@ def _clean_governor_names(series: pd.Series) -> pd.Series:
 
 
 def _read_prekvk_workbook(xlsx_bytes: bytes) -> pd.DataFrame:
+    # One open; only the chosen sheet is parsed (not every sheet, as the old fallback did).
     try:
-        return pd.read_excel(io.BytesIO(xlsx_bytes), sheet_name="prekvk")
-    except Exception:
+        workbook = open_workbook(xlsx_bytes)
+    except Exception as exc:
+        raise InvalidWorkbookError(INVALID_WORKBOOK_MESSAGE) from exc
+
+    with workbook:
+        names = workbook.sheet_names
+        if not names:
+            raise NoSheetsError("No sheets found in workbook")
+
+        if "prekvk" in names:
+            pick = "prekvk"
+        else:
+            pick = next(
+                (
+                    name
+                    for name in names
+                    if str(name).strip().lower() in {"prekvk", NEW_PREKVK_SHEET_NAME}
+                ),
+                names[0],
+            )
         try:
-            sheets = pd.read_excel(io.BytesIO(xlsx_bytes), sheet_name=None)
+            return workbook.read_sheet(pick)
         except Exception as exc:
             raise InvalidWorkbookError(INVALID_WORKBOOK_MESSAGE) from exc
-        if not sheets:
-            raise NoSheetsError("No sheets found in workbook")
-
-        pick = next(
-            (
-                name
-                for name in sheets.keys()
-                if str(name).strip().lower() in {"prekvk", NEW_PREKVK_SHEET_NAME}
-            ),
-            None,
-        )
-        return sheets[pick] if pick else next(iter(sheets.values()))
 
 
 def _normalize_prekvk_dataframe(df: pd.DataFrame) -> pd.DataFrame:
@@ -626,22 +633,21 @@ def import_prekvk_bytes(
                 scan_id = int(scan_row.get("ScanID", next(iter(scan_row.values()))))
 
                 phase = "db_insert_rows"
-                rows = [
-                    (
-                        kvk_no,
-                        scan_id,
-                        int(r.GovernorID),
-                        str(r.GovernorName)[:64],
-                        int(r.Points),
-                        None if pd.isna(r.KingdomID) else int(r.KingdomID),
-                        None if pd.isna(r.SourceRank) else int(r.SourceRank),
-                        None if pd.isna(r.Stage1Points) else int(r.Stage1Points),
-                        None if pd.isna(r.Stage2Points) else int(r.Stage2Points),
-                        None if pd.isna(r.Stage3Points) else int(r.Stage3Points),
-                        None if pd.isna(r.TotalPoints) else int(r.TotalPoints),
-                    )
-                    for r in out.itertuples(index=False)
-                ]
+                insert_frame = out[
+                    [
+                        "GovernorID",
+                        "GovernorName",
+                        "Points",
+                        "KingdomID",
+                        "SourceRank",
+                        "Stage1Points",
+                        "Stage2Points",
+                        "Stage3Points",
+                        "TotalPoints",
+                    ]
+                ].copy()
+                insert_frame["GovernorName"] = insert_frame["GovernorName"].astype(str).str[:64]
+                rows = to_db_rows(insert_frame, prefix=(kvk_no, scan_id))
 
                 # Keep fast_executemany ON (works with executemany_batched)
                 cur.fast_executemany = True
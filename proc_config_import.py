@@ -24,6 +24,7 @@ from constants import (
     SERVER,
     _conn_import,
 )
+from core.sql_pool import acquire_pooled_connection
 from gsheet_module import (
     DEFAULT_SHEETS_BACKOFF_FACTOR,
     DEFAULT_SHEETS_MAX_RETRIES,
@@ -35,6 +36,7 @@ from gsheet_module import (
     _normalize_headers,
     _safe_execute,
 )
+from kvk_state import invalidate_kvk_context
 
 logger = logging.getLogger(__name__)
 telemetry_logger = logging.getLogger("telemetry")
@@ -195,7 +197,7 @@ def _retry_predicate(exc: BaseException) -> bool:
     reraise=True,
 )
 def _get_import_connection_with_retry():
-    return _conn_import()
+    return acquire_pooled_connection("import", _conn_import)
 
 
 def _enable_fast_executemany(cursor) -> bool:
@@ -325,7 +327,7 @@ def _read_sheet_to_df(sheet, spreadsheet_id: str, range_name: str) -> pd.DataFra
         dateTimeRenderOption="FORMATTED_STRING",
     )
     try:
-        result = _safe_execute(request, retries=GSHEETS_MAX_RETRIES)
+        result = _safe_execute(request, retries=GSHEETS_MAX_RETRIES, quota="read")
     except Exception:
         logger.exception(
             "Final failure reading range '%s' from spreadsheet %s", range_name, spreadsheet_id
@@ -1146,6 +1148,9 @@ def run_proc_config_import(dry_run: bool = False) -> tuple[bool, dict]:
                 conn.close()
         except Exception:
             pass
+        if not dry_run:
+            # KVK_Details / ProcConfig may have changed; drop this process' cached KVK context.
+            invalidate_kvk_context(reason="proc_config_import")
 
 
 # ---------------------------------------------------------------------------
@@ -1235,3 +1240,7 @@ async def run_proc_config_import_offload(
     except Exception:
         logger.exception("[IMPORT] run_proc_config_import_offload failed")
         return False, {"errors": ["offload wrapper failed"]}
+    finally:
+        if not dry_run:
+            # The import may have run in a worker process; invalidate the caller's cache too.
+            invalidate_kvk_context(reason="proc_config_import")
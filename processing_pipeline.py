@@ -43,6 +43,7 @@ from file_utils import (
     run_maintenance_with_isolation,
 )
 from gsheet_module import run_all_exports
+from kvk_state import invalidate_kvk_context
 
 # NEW: log headroom helpers (bounded wait + auto-trigger on LOG_BACKUP)
 from log_health import LogHeadroomError, preflight_from_env_sync
@@ -277,6 +278,9 @@ async def execute_processing_pipeline(
     success_excel = bool(steps.get("excel"))
     success_archive = bool(steps.get("archive"))
     success_sql = bool(steps.get("sql"))
+    if success_sql:
+        # New scans move MAX(ScanOrder), which drives the resolved KVK state.
+        invalidate_kvk_context(reason="scan_import")
 
     # Prepare a compact context field to include in embeds so humans can correlate
     context_field = build_context_field(filename=filename, rank=rank, seed=seed)
@@ -769,6 +773,10 @@ async def execute_processing_pipeline(
                 context_field=context_field,
             )
 
+    if success_proc_import is not None:
+        # proc_import runs in a maintenance worker; drop this process' cached KVK context.
+        invalidate_kvk_context(reason="proc_config_import")
+
     # 3) Google Sheets exports — offload to thread, but bounded by EXPORT_TIMEOUT
     await send_status_embed(
         "📤 Export to Google Sheets",
@@ -20,6 +20,8 @@ logger = logging.getLogger(__name__)
 
 # Central constants (PLAYER_PROFILE_CACHE should be defined in constants.py)
 from constants import DATA_DIR, PLAYER_PROFILE_CACHE as CONST_PLAYER_PROFILE_CACHE, _conn
+from core.render_cache import invalidate_rendered_cards
+from governor_name_index import NameIndexSlot
 
 # Optional fuzzy deps
 try:
@@ -43,10 +45,14 @@ PLAYER_PROFILE_CACHE = (
     else os.path.join(DATA_DIR, "player_profile_cache.json")
 )
 CACHE_TTL_SECS = 15 * 60  # 15 min
+# Rendered-card scopes built from profile data; a refresh leaves KVK cards cached.
+_PROFILE_CARD_SCOPES = ("player_self_service",)
 
 _cache_lock = threading.Lock()
 _cache: dict[str, Any] = {}
 _cache_loaded_at: float = 0.0
+# Bumped on every in-place change to _cache so the name index knows to rebuild.
+_cache_generation: int = 0
 
 
 # -------------------- Helpers --------------------
@@ -482,6 +488,8 @@ def warm_cache(force: bool = False):
                 _cache_loaded_at = time.time()
             _cache = new_cache
             logger.info("[CACHE] In-memory cache rebuilt from DB (count=%d)", len(_cache))
+            # Cards rendered from the previous profiles are no longer reachable; free them.
+            invalidate_rendered_cards(reason="profile_cache", scopes=_PROFILE_CARD_SCOPES)
         except Exception as e:
             logger.exception("Failed to build fresh player profile cache from DB: %s", e)
             # If we had an existing on-disk cache previously loaded above it would already be set.
@@ -514,8 +522,11 @@ def invalidate_one(governor_id: int):
     warm_cache()
     key = str(governor_id)
     # mutate under lock to avoid races with readers/writers
+    global _cache_generation
     with _cache_lock:
-        _cache.pop(key, None)
+        if _cache.pop(key, None) is not None:
+            _cache_generation += 1
+            invalidate_rendered_cards(reason="profile_cache", scopes=_PROFILE_CARD_SCOPES)
 
 
 def get_profile_cached(governor_id: int) -> dict[str, Any] | None:
@@ -540,17 +551,34 @@ def _normalize(s: str) -> str:
     return " ".join(base.split())
 
 
+_name_index = NameIndexSlot("profile_cache", normalize=_normalize)
+
+
 def _iter_name_entries():
     """
     Yield (display_name, gid, normalized_name) for all cached players.
     Preserves duplicates (multiple players sharing same display name).
+    """
+    for entry in _get_name_index().entries:
+        yield entry.name, entry.payload, entry.norm
+
+
+def _get_name_index():
+    """
+    Name index over the current cache; rebuilt once after each warm/invalidate.
 
-    Implementation note: snapshot the cache under lock to avoid iterator races
+    The index is built from a snapshot taken under lock to avoid iterator races
     if another thread replaces or mutates the global cache.
     """
     warm_cache()
     with _cache_lock:
-        snapshot = list(_cache.values())
+        source, generation = _cache, _cache_generation
+    return _name_index.get(source, lambda: _index_items(source), version=generation)
+
+
+def _index_items(cache: dict[str, Any]):
+    with _cache_lock:
+        snapshot = list(cache.values())
     for v in snapshot:
         try:
             name = (v.get("GovernorName") or "").strip()
@@ -561,7 +589,7 @@ def _iter_name_entries():
                     gid = int(gid_raw)
                 except Exception:
                     continue
-                yield name, gid, _normalize(name)
+                yield name, gid, gid
         except Exception:
             # Skip malformed entries rather than propagating
             logger.debug(
@@ -592,10 +620,25 @@ def search_by_governor_name(name_query: str, limit: int = 8):
     except Exception:
         q_as_id = None
 
-    entries = list(_iter_name_entries())
-    if not entries:
+    index = _get_name_index()
+    if not index.entries:
         return []
 
+    # Score only the trigram/prefix shortlist (plus the typed ID), not every cached player
+    shortlist = index.shortlist(q_norm)
+    entries = [
+        (entry.name, entry.payload, entry.norm)
+        for norm in shortlist
+        for entry in index.entries_for(norm)
+    ]
+    if q_as_id is not None:
+        listed = set(shortlist)
+        entries.extend(
+            (entry.name, entry.payload, entry.norm)
+            for entry in index.by_governor_id(q_as_id)
+            if entry.norm not in listed
+        )
+
     results = []
 
     if HAVE_RAPIDFUZZ:
@@ -1,5 +1,11 @@
 """
-In-process TTL cache for the governor registry dict.
+In-process TTL cache for the governor registry.
+
+The cache holds one immutable ``RegistrySnapshot``: the legacy registry dict plus
+secondary indexes by Discord user and by GovernorID, all wrapped in read-only
+mappings. Readers share the snapshot without copying; a write builds a new
+snapshot and swaps it in whole. ``get_cached_or_none()`` / ``get_stale_or_none()``
+still hand out mutable deep copies for legacy dict callers.
 
 Owned by this module only. All reads/writes go through the public API.
 registry_service.py is the only consumer that writes to this cache.
@@ -7,22 +13,139 @@ registry_service.py is the only consumer that writes to this cache.
 
 from __future__ import annotations
 
-import copy
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 import logging
 import os
 import threading
 import time
+from types import MappingProxyType
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
+
+# ---------------------------------------------------------------------------
+# Snapshot
+# ---------------------------------------------------------------------------
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class RegistrySnapshot:
+    """
+    Read-only view of all Active registrations.
+
+    registry     — legacy shape: {"<uid>": {"discord_id", "discord_name", "accounts"}}
+    by_user      — {discord_user_id: {AccountType: {"GovernorID", "GovernorName"}}}
+    by_governor  — {governor_id: {"DiscordUserID", "DiscordName", "AccountType"}}
+    """
+
+    registry: Mapping[str, Mapping[str, Any]]
+    by_user: Mapping[int, Mapping[str, Mapping[str, str]]]
+    by_governor: Mapping[int, Mapping[str, Any]]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> RegistrySnapshot:
+        """Build from registry_dal.get_all_active() rows."""
+        registry: dict[str, dict[str, Any]] = {}
+        by_governor: dict[int, dict[str, Any]] = {}
+        for row in rows:
+            uid_str = str(row["DiscordUserID"])
+            if uid_str not in registry:
+                registry[uid_str] = {
+                    "discord_id": uid_str,
+                    "discord_name": row.get("DiscordName") or uid_str,
+                    "accounts": {},
+                }
+            registry[uid_str]["accounts"][row["AccountType"]] = {
+                "GovernorID": str(row["GovernorID"]),
+                "GovernorName": str(row.get("GovernorName") or ""),
+            }
+            try:
+                gid = int(row["GovernorID"])
+            except (TypeError, ValueError):
+                continue
+            by_governor.setdefault(
+                gid,
+                {
+                    "DiscordUserID": int(row["DiscordUserID"]),
+                    "DiscordName": row.get("DiscordName"),
+                    "AccountType": row.get("AccountType"),
+                },
+            )
+        return cls._build(registry, by_governor)
+
+    @classmethod
+    def from_registry(cls, data: Mapping[str, Any]) -> RegistrySnapshot:
+        """Build from a legacy registry dict (see module docstring)."""
+        by_governor: dict[int, dict[str, Any]] = {}
+        for uid_str, entry in data.items():
+            try:
+                uid = int(uid_str)
+            except (TypeError, ValueError):
+                continue
+            for account_type, account in ((entry or {}).get("accounts") or {}).items():
+                try:
+                    gid = int(str((account or {}).get("GovernorID") or "").strip())
+                except ValueError:
+                    continue
+                by_governor.setdefault(
+                    gid,
+                    {
+                        "DiscordUserID": uid,
+                        "DiscordName": (entry or {}).get("discord_name"),
+                        "AccountType": account_type,
+                    },
+                )
+        return cls._build(data, by_governor)
+
+    @classmethod
+    def _build(
+        cls, registry: Mapping[str, Any], by_governor: Mapping[int, Mapping[str, Any]]
+    ) -> RegistrySnapshot:
+        by_user: dict[int, Any] = {}
+        for uid_str, entry in registry.items():
+            try:
+                by_user[int(uid_str)] = (entry or {}).get("accounts") or {}
+            except (TypeError, ValueError):
+                continue
+        return cls(
+            registry=_freeze(registry),
+            by_user=_freeze(by_user),
+            by_governor=_freeze(by_governor),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Mutable deep copy in the legacy registry dict shape."""
+        return _thaw(self.registry)
+
+
 # ---------------------------------------------------------------------------
 # Module-level private state
 # ---------------------------------------------------------------------------
 
-_cache_data: dict | None = None
+_cache_data: RegistrySnapshot | None = None
 _cache_ts: float = 0.0
 _cache_lock: threading.Lock = threading.Lock()
 _last_invalidation_reason: str = "never_populated"
+_hits: int = 0
+_misses: int = 0
 
 
 def _parse_ttl() -> float:
@@ -47,50 +170,75 @@ _CACHE_TTL: float = _parse_ttl()
 # ---------------------------------------------------------------------------
 
 
-def get_cached_or_none() -> dict | None:
+def _fresh_snapshot_locked() -> RegistrySnapshot | None:
+    global _hits, _misses
+
+    if _cache_data is None or _cache_ts == 0.0:
+        _misses += 1
+        return None
+    age = time.monotonic() - _cache_ts
+    if age > _CACHE_TTL:
+        _misses += 1
+        return None
+    _hits += 1
+    logger.debug(
+        "[registry_cache] cache hit — age=%.1fs ttl=%.1fs",
+        age,
+        _CACHE_TTL,
+    )
+    return _cache_data
+
+
+def get_snapshot() -> RegistrySnapshot | None:
     """
-    Thread-safe read.
+    Thread-safe read of the shared, immutable snapshot.
 
-    Returns a deep copy of the cached dict if the cache is populated and
-    within TTL, else returns None.
+    Returns the snapshot itself (no copy) if the cache is populated and within
+    TTL, else returns None.
 
     A _cache_ts of 0.0 is used as a sentinel for "invalidated / never populated"
     and always results in a cache miss, regardless of TTL.
     """
-    global _cache_data, _cache_ts
+    with _cache_lock:
+        return _fresh_snapshot_locked()
+
+
+def get_cached_or_none() -> dict | None:
+    """
+    Thread-safe read.
 
+    Returns a mutable deep copy of the cached registry dict if the cache is
+    populated and within TTL, else returns None. Prefer get_snapshot() for
+    read-only access.
+    """
     with _cache_lock:
-        if _cache_data is None:
-            return None
-        if _cache_ts == 0.0:
-            return None
-        age = time.monotonic() - _cache_ts
-        if age > _CACHE_TTL:
-            return None
-        logger.debug(
-            "[registry_cache] cache hit — age=%.1fs ttl=%.1fs",
-            age,
-            _CACHE_TTL,
-        )
-        return copy.deepcopy(_cache_data)
+        snapshot = _fresh_snapshot_locked()
+    return snapshot.to_dict() if snapshot is not None else None
 
 
-def store_cache(data: dict) -> None:
+def store_snapshot(snapshot: RegistrySnapshot) -> None:
     """
-    Thread-safe write. Stores a deep copy and records the current monotonic timestamp.
+    Thread-safe write. Swaps in ``snapshot`` and records the current monotonic timestamp.
     """
     global _cache_data, _cache_ts
 
     with _cache_lock:
-        _cache_data = copy.deepcopy(data)
+        _cache_data = snapshot
         _cache_ts = time.monotonic()
 
 
-def get_stale_or_none() -> dict | None:
+def store_cache(data: dict) -> None:
+    """
+    Thread-safe write of a legacy registry dict (frozen into a new snapshot).
+    """
+    store_snapshot(RegistrySnapshot.from_registry(data))
+
+
+def get_stale_snapshot_or_none() -> RegistrySnapshot | None:
     """
     Thread-safe stale-snapshot read for error-fallback paths.
 
-    Unlike get_cached_or_none(), this ignores TTL expiry — it returns data
+    Unlike get_snapshot(), this ignores TTL expiry — it returns data
     that is beyond TTL but still safe to show.
 
     Critically, it DOES respect the _cache_ts == 0.0 invalidation sentinel:
@@ -107,7 +255,13 @@ def get_stale_or_none() -> dict | None:
         if _cache_ts == 0.0:
             # Explicitly invalidated — do not return this snapshot.
             return None
-        return copy.deepcopy(_cache_data)
+        return _cache_data
+
+
+def get_stale_or_none() -> dict | None:
+    """Like get_stale_snapshot_or_none(), as a mutable legacy dict copy."""
+    snapshot = get_stale_snapshot_or_none()
+    return snapshot.to_dict() if snapshot is not None else None
 
 
 def invalidate(reason: str = "unspecified") -> None:
@@ -134,6 +288,8 @@ def get_info() -> dict[str, object]:
       age_seconds             — float | None: seconds since last store, or None if empty
       ttl_seconds             — float: configured TTL
       last_invalidation_reason — str: reason passed to the last invalidate() call
+      users / governors       — int: entries in the snapshot indexes (0 when empty)
+      hits / misses           — int: fresh-snapshot reads served / missed since start
     """
     with _cache_lock:
         populated = _cache_data is not None
@@ -142,10 +298,17 @@ def get_info() -> dict[str, object]:
         else:
             age = None
         reason = _last_invalidation_reason
+        users = len(_cache_data.by_user) if _cache_data is not None else 0
+        governors = len(_cache_data.by_governor) if _cache_data is not None else 0
+        hits, misses = _hits, _misses
 
     return {
         "populated": populated,
         "age_seconds": age,
         "ttl_seconds": _CACHE_TTL,
         "last_invalidation_reason": reason,
+        "users": users,
+        "governors": governors,
+        "hits": hits,
+        "misses": misses,
     }
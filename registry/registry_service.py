@@ -7,6 +7,7 @@ Responsibilities:
   - Ownership and duplicate rules
   - Orchestrating DAL calls for composite operations (e.g. modify = delete + insert)
   - Shaping DAL rows into formats expected by commands, views, and import/export
+  - get_registry_snapshot() — shared, indexed, read-only view for hot lookups
   - load_registry_as_dict() — backward-compat dict for registry_io audit/export
 
 Not responsible for:
@@ -17,7 +18,6 @@ Not responsible for:
 
 from __future__ import annotations
 
-import copy
 import logging
 from typing import Any
 
@@ -356,15 +356,18 @@ def get_user_accounts(discord_user_id: int) -> dict[str, dict[str, str]]:
     """
     Return all active account slots for a Discord user.
 
-    Raises on SQL failure — callers must handle explicitly.
+    Served from the registry snapshot; raises on SQL failure when the snapshot
+    has to be reloaded — callers must handle explicitly.
     """
-    rows = registry_dal.get_by_discord_id(int(discord_user_id))
+    accounts = get_registry_snapshot(allow_stale_on_error=False).by_user.get(
+        int(discord_user_id), {}
+    )
     return {
-        r["AccountType"]: {
-            "GovernorID": str(r["GovernorID"]),
-            "GovernorName": str(r.get("GovernorName") or ""),
+        account_type: {
+            "GovernorID": str(acc["GovernorID"]),
+            "GovernorName": str(acc.get("GovernorName") or ""),
         }
-        for r in rows
+        for account_type, acc in accounts.items()
     }
 
 
@@ -378,29 +381,31 @@ def get_discord_user_for_governor(governor_id: str | int) -> dict[str, Any] | No
         gid = int(str(governor_id).strip())
     except (ValueError, TypeError):
         return None
-    row = registry_dal.get_by_governor_id(gid)
-    if not row:
+    owner = get_registry_snapshot(allow_stale_on_error=False).by_governor.get(gid)
+    if not owner:
         return None
     return {
-        "DiscordUserID": int(row["DiscordUserID"]),
-        "DiscordName": row.get("DiscordName"),
-        "AccountType": row.get("AccountType"),
+        "DiscordUserID": int(owner["DiscordUserID"]),
+        "DiscordName": owner.get("DiscordName"),
+        "AccountType": owner.get("AccountType"),
     }
 
 
 def get_user_main_governor_id(discord_user_id: int) -> str | None:
     """Return the GovernorID string for the user's Main slot, or None."""
-    rows = registry_dal.get_by_discord_id(int(discord_user_id))
-    main = next((r for r in rows if r.get("AccountType") == "Main"), None)
-    gid = (main or {}).get("GovernorID")
+    accounts = get_registry_snapshot(allow_stale_on_error=False).by_user.get(
+        int(discord_user_id), {}
+    )
+    gid = (accounts.get("Main") or {}).get("GovernorID")
     return str(gid) if gid else None
 
 
 def get_user_main_governor_name(discord_user_id: int) -> str | None:
     """Return the GovernorName string for the user's Main slot, or None."""
-    rows = registry_dal.get_by_discord_id(int(discord_user_id))
-    main = next((r for r in rows if r.get("AccountType") == "Main"), None)
-    name = (main or {}).get("GovernorName")
+    accounts = get_registry_snapshot(allow_stale_on_error=False).by_user.get(
+        int(discord_user_id), {}
+    )
+    name = (accounts.get("Main") or {}).get("GovernorName")
     return str(name) if name else None
 
 
@@ -412,10 +417,46 @@ def check_governor_claimed_by_other(governor_id: str | int, owner_discord_id: in
         gid = int(str(governor_id).strip())
     except (ValueError, TypeError):
         return False
-    row = registry_dal.get_by_governor_id(gid)
-    if not row:
+    owner = get_registry_snapshot(allow_stale_on_error=False).by_governor.get(gid)
+    if not owner:
         return False
-    return int(row["DiscordUserID"]) != int(owner_discord_id)
+    return int(owner["DiscordUserID"]) != int(owner_discord_id)
+
+
+def get_registry_snapshot(
+    *, use_cache: bool = True, allow_stale_on_error: bool = True
+) -> registry_cache.RegistrySnapshot:
+    """
+    Return the shared read-only registry snapshot, loading it from SQL on a cache miss.
+
+    The snapshot is not copied: callers must treat it (and its indexes) as read-only.
+    Parameters match load_registry_as_dict().
+    """
+    if use_cache:
+        cached = registry_cache.get_snapshot()
+        if cached is not None:
+            return cached
+
+    logger.debug("[registry_service] cache miss — loading registry from SQL")
+
+    # Grab a stale snapshot via the public API before attempting SQL.
+    # get_stale_snapshot_or_none() respects the invalidation sentinel (_cache_ts == 0.0),
+    # so data invalidated by a prior successful write will NOT be returned here.
+    stale = registry_cache.get_stale_snapshot_or_none()
+
+    try:
+        rows = registry_dal.get_all_active()
+    except Exception:
+        if stale is not None and allow_stale_on_error:
+            logger.warning(
+                "[registry_service] SQL failure loading registry — returning stale cache data"
+            )
+            return stale
+        raise
+
+    snapshot = registry_cache.RegistrySnapshot.from_rows(rows)
+    registry_cache.store_snapshot(snapshot)
+    return snapshot
 
 
 # ---------------------------------------------------------------------------
@@ -455,44 +496,9 @@ def load_registry_as_dict(
         WARNING log).  When False, re-raise SQL exceptions even if stale data
         is available — use this for audit/export commands where accuracy matters.
     """
-    if use_cache:
-        cached = registry_cache.get_cached_or_none()
-        if cached is not None:
-            return cached
-
-    logger.debug("[registry_service] cache miss — loading registry from SQL")
-
-    # Grab a stale snapshot via the public API before attempting SQL.
-    # get_stale_or_none() respects the invalidation sentinel (_cache_ts == 0.0),
-    # so data invalidated by a prior successful write will NOT be returned here.
-    stale = registry_cache.get_stale_or_none()
-
-    try:
-        rows = registry_dal.get_all_active()
-    except Exception:
-        if stale is not None and allow_stale_on_error:
-            logger.warning(
-                "[registry_service] SQL failure loading registry — returning stale cache data"
-            )
-            return stale
-        raise
-
-    result: dict[str, Any] = {}
-    for row in rows:
-        uid_str = str(row["DiscordUserID"])
-        if uid_str not in result:
-            result[uid_str] = {
-                "discord_id": uid_str,
-                "discord_name": row.get("DiscordName") or uid_str,
-                "accounts": {},
-            }
-        result[uid_str]["accounts"][row["AccountType"]] = {
-            "GovernorID": str(row["GovernorID"]),
-            "GovernorName": str(row.get("GovernorName") or ""),
-        }
-
-    registry_cache.store_cache(result)
-    return copy.deepcopy(result)
+    return get_registry_snapshot(
+        use_cache=use_cache, allow_stale_on_error=allow_stale_on_error
+    ).to_dict()
 
 
 def invalidate_registry_cache(reason: str = "unspecified") -> None:
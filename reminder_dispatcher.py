@@ -0,0 +1,281 @@
+# reminder_dispatcher.py
+"""
+Shared timer heap for scheduled reminders.
+
+Instead of one ``asyncio.Task`` sleeping per (user, event, offset), callers schedule a coroutine
+factory here and get a ``ReminderHandle`` back. A single driver task per event loop sleeps until
+the earliest due entry, then drains every entry due in the same tick and starts their deliveries.
+Only reminders that are actually being delivered own a task.
+
+Handles look enough like ``asyncio.Task`` (``cancel``/``done``/``cancelled``/
+``add_done_callback``/``get_name``/``await``) to be registered with ``reminder_task_registry``,
+so the existing per-user cancellation helpers keep working unchanged.
+
+Due-time state is persisted by the owning subsystem (``dm_scheduled_tracker`` for KVK DMs,
+``ArkReminderState`` for Ark), and those subsystems re-schedule onto the dispatcher when they
+rehydrate after a restart.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+import heapq
+import itertools
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Entries due within this many seconds of the earliest one are drained in the same batch.
+BATCH_TICK_SECONDS = 0.25
+# The driver re-checks the heap at least this often even when nothing is due.
+MAX_IDLE_SLEEP_SECONDS = 60.0
+
+ReminderFactory = Callable[[], Awaitable[Any]]
+
+
+class ReminderHandle:
+    """Cancellable, awaitable reference to one scheduled reminder."""
+
+    __slots__ = (
+        "__weakref__",
+        "_callbacks",
+        "_cancelled",
+        "_dispatcher",
+        "_factory",
+        "_future",
+        "_task",
+        "due",
+        "meta",
+        "name",
+    )
+
+    def __init__(
+        self,
+        dispatcher: ReminderDispatcher,
+        *,
+        due: float,
+        factory: ReminderFactory,
+        name: str,
+        meta: dict[str, Any] | None,
+        future: asyncio.Future,
+    ) -> None:
+        self._dispatcher = dispatcher
+        self._factory: ReminderFactory | None = factory
+        self._future = future
+        self._task: asyncio.Task | None = None
+        self._cancelled = False
+        self._callbacks: list[Callable[[ReminderHandle], Any]] = []
+        self.due = due
+        self.name = name
+        self.meta = dict(meta or {})
+
+    # -- Task-like surface -------------------------------------------------
+    def get_name(self) -> str:
+        return self.name
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def cancel(self, msg: Any | None = None) -> bool:
+        if self._future.done():
+            return False
+        self._cancelled = True
+        self._factory = None
+        if self._task is not None and not self._task.done():
+            self._task.cancel(msg)
+        else:
+            self._dispatcher._discard(self)
+            self._finish(cancelled=True)
+        return True
+
+    def add_done_callback(self, fn: Callable[[ReminderHandle], Any]) -> None:
+        if self._future.done():
+            self._future.get_loop().call_soon(fn, self)
+        else:
+            self._callbacks.append(fn)
+
+    def __await__(self):
+        return asyncio.shield(self._future).__await__()
+
+    @property
+    def due_at_utc(self) -> datetime:
+        """Wall-clock estimate of when the reminder fires."""
+        remaining = self.due - self._future.get_loop().time()
+        return datetime.now(UTC) + timedelta(seconds=max(0.0, remaining))
+
+    # -- dispatcher internals ---------------------------------------------
+    def _start(self) -> None:
+        factory = self._factory
+        self._factory = None
+        if factory is None or self._cancelled:
+            return
+        self._task = self._future.get_loop().create_task(self._run(factory), name=self.name)
+
+    async def _run(self, factory: ReminderFactory) -> None:
+        try:
+            await factory()
+        except asyncio.CancelledError:
+            self._cancelled = True
+            self._finish(cancelled=True)
+            raise
+        except Exception:
+            logger.exception("[REMINDER_DISPATCH] Reminder %s failed", self.name)
+        self._finish(cancelled=False)
+
+    def _finish(self, *, cancelled: bool) -> None:
+        if self._future.done():
+            return
+        if cancelled:
+            self._future.cancel()
+        else:
+            self._future.set_result(None)
+        self._dispatcher._handles.discard(self)
+        callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            try:
+                fn(self)
+            except Exception:
+                logger.exception("[REMINDER_DISPATCH] done callback failed for %s", self.name)
+
+
+class ReminderDispatcher:
+    """One driver task and a min-heap of due times for every scheduled reminder."""
+
+    def __init__(self, name: str = "reminders", *, batch_tick: float = BATCH_TICK_SECONDS) -> None:
+        self.name = name
+        self.batch_tick = batch_tick
+        self._heap: list[tuple[float, int, ReminderHandle]] = []
+        self._handles: set[ReminderHandle] = set()
+        self._seq = itertools.count()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._driver: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self.batches = 0
+        self.fired = 0
+
+    def schedule(
+        self,
+        delay_seconds: float,
+        factory: ReminderFactory,
+        *,
+        name: str,
+        meta: dict[str, Any] | None = None,
+    ) -> ReminderHandle:
+        """Run ``factory()`` after ``delay_seconds`` (immediately on the next tick if <= 0).
+
+        Must be called from the event loop that should deliver the reminder.
+        """
+        loop = asyncio.get_running_loop()
+        self._bind(loop)
+        due = loop.time() + max(0.0, float(delay_seconds))
+        handle = ReminderHandle(
+            self,
+            due=due,
+            factory=factory,
+            name=name,
+            meta=meta,
+            future=loop.create_future(),
+        )
+        was_head = not self._heap or due < self._heap[0][0]
+        heapq.heappush(self._heap, (due, next(self._seq), handle))
+        self._handles.add(handle)
+        if was_head and self._wakeup is not None:
+            self._wakeup.set()
+        return handle
+
+    def pending_count(self) -> int:
+        return sum(1 for handle in self._handles if not handle.done())
+
+    def pending(self) -> list[dict[str, Any]]:
+        """Diagnostics: name, meta and estimated due time of every unfinished reminder."""
+        return [
+            {"name": h.name, "due_at_utc": h.due_at_utc, "running": h.running(), **h.meta}
+            for h in sorted(self._handles, key=lambda h: h.due)
+            if not h.done()
+        ]
+
+    async def aclose(self) -> None:
+        """Cancel every pending reminder and stop the driver."""
+        for handle in list(self._handles):
+            handle.cancel()
+        if self._driver is not None:
+            self._driver.cancel()
+            try:
+                await self._driver
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._driver = None
+
+    # -- internals ---------------------------------------------------------
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._loop is loop and self._driver is not None and not self._driver.done():
+            return
+        if self._loop is not loop:
+            # Entries from a previous (closed) loop can never fire; drop them.
+            self._heap.clear()
+            self._handles.clear()
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._driver = loop.create_task(self._drive(), name=f"{self.name}_dispatcher")
+
+    def _discard(self, handle: ReminderHandle) -> None:
+        # Cancelled heap entries are skipped lazily when they reach the top.
+        self._handles.discard(handle)
+
+    async def _drive(self) -> None:
+        loop = asyncio.get_running_loop()
+        wakeup = self._wakeup
+        assert wakeup is not None
+        while True:
+            wakeup.clear()
+            heap = self._heap
+            while heap and heap[0][2].cancelled():
+                heapq.heappop(heap)
+            if not heap:
+                await wakeup.wait()
+                continue
+            delay = heap[0][0] - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(
+                        wakeup.wait(), timeout=min(delay, MAX_IDLE_SLEEP_SECONDS)
+                    )
+                except TimeoutError:
+                    pass
+                continue
+
+            horizon = loop.time() + self.batch_tick
+            batch: list[ReminderHandle] = []
+            while heap and heap[0][0] <= horizon:
+                handle = heapq.heappop(heap)[2]
+                if not handle.cancelled():
+                    batch.append(handle)
+            for handle in batch:
+                handle._start()
+            if batch:
+                self.batches += 1
+                self.fired += len(batch)
+                logger.debug(
+                    "[REMINDER_DISPATCH] %s drained %d reminder(s) pending=%d",
+                    self.name,
+                    len(batch),
+                    len(heap),
+                )
+            await asyncio.sleep(0)
+
+
+_DISPATCHER = ReminderDispatcher()
+
+
+def get_reminder_dispatcher() -> ReminderDispatcher:
+    """Process-wide dispatcher shared by KVK DM and Ark reminders."""
+    return _DISPATCHER
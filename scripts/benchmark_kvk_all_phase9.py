@@ -9,15 +9,19 @@ from pathlib import Path
 import statistics
 import sys
 import time
+import tracemalloc
 from typing import Any, TypeVar
 
+import numpy as np
 import pandas as pd
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from kvk.dal.kvk_all_import_dal import rows_for_stage
+from core.xlsx_reader import ENGINES, calamine_available, open_workbook
+from kvk.dal.kvk_all_import_dal import STAGE_COL_ORDER, rows_for_stage
+from kvk.schemas.kvk_all_schema import select_full_data_sheet
 from kvk.services.kvk_all_import_service import (
     attach_source_metadata,
     coerce_full_data_frame,
@@ -56,9 +60,49 @@ def _stats(values: list[float]) -> dict[str, Any]:
     }
 
 
+def _legacy_rows_for_stage(token: str, df: pd.DataFrame) -> list[tuple[Any, ...]]:
+    """The per-cell ``rows_for_stage`` this script compares against."""
+    df2 = df.reindex(columns=STAGE_COL_ORDER)
+
+    def _noneify(value: Any) -> Any:
+        if isinstance(value, np.floating) and np.isnan(value):
+            return None
+        return None if pd.isna(value) else value
+
+    return [
+        (token, *(tuple(_noneify(value) for value in row)))
+        for row in df2.itertuples(index=False, name=None)
+    ]
+
+
+def _read_sheet(content: bytes, engine: str) -> int:
+    with open_workbook(content, engine=engine) as workbook:
+        sheet = select_full_data_sheet(workbook.sheet_names)
+        return int(workbook.read_sheet(sheet).shape[0])
+
+
+def benchmark_engines(content: bytes, *, repeats: int) -> dict[str, Any]:
+    """Full Data sheet read per ``core.xlsx_reader`` engine (``pandas`` is the legacy path)."""
+    out: dict[str, Any] = {}
+    for engine in ENGINES:
+        if engine == "calamine" and not calamine_available():
+            out[engine] = {"skipped": "python-calamine not installed"}
+            continue
+        rows, read_ms = _time_call(_read_sheet, content, engine, repeats=repeats)
+        tracemalloc.start()
+        try:
+            _read_sheet(content, engine)
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        out[engine] = {**_stats(read_ms), "rows": rows, "peak_mib": round(peak / 2**20, 1)}
+    return out
+
+
 def benchmark_workbook(path: Path, *, repeats: int) -> dict[str, Any]:
     content = path.read_bytes()
-    workbook = pd.ExcelFile(path)
+    with open_workbook(content) as workbook:
+        sheet_names = workbook.sheet_names
 
     raw_tuple, read_ms = _time_call(
         read_full_data_workbook,
@@ -87,11 +131,17 @@ def benchmark_workbook(path: Path, *, repeats: int) -> dict[str, Any]:
         prepared.dataframe,
         repeats=repeats,
     )
+    _, legacy_rows_ms = _time_call(
+        _legacy_rows_for_stage,
+        "00000000-0000-0000-0000-000000000000",
+        prepared.dataframe,
+        repeats=repeats,
+    )
 
     return {
         "sample": str(path),
         "file_bytes": len(content),
-        "sheets": workbook.sheet_names,
+        "sheets": sheet_names,
         "full_data_rows": int(raw_df.shape[0]),
         "full_data_columns": int(raw_df.shape[1]),
         "schema": schema_metadata,
@@ -102,7 +152,9 @@ def benchmark_workbook(path: Path, *, repeats: int) -> dict[str, Any]:
             "attach_source_metadata": _stats(metadata_ms),
             "prepare_kvk_all_import_total": _stats(prepare_ms),
             "rows_for_stage": _stats(rows_ms),
+            "rows_for_stage_legacy": _stats(legacy_rows_ms),
         },
+        "read_engines": benchmark_engines(content, repeats=repeats),
     }
 
 
@@ -12,6 +12,7 @@ import shutil
 
 import pandas as pd
 
+from core.xlsx_reader import open_workbook
 from services.fallback_import_schema import (
     INTERIM_AUTO_PARTIAL_SNAPSHOT,
     detect_fallback_source_type,
@@ -49,9 +50,9 @@ def read_source_dataframe(source_filepath: str) -> pd.DataFrame:
     if ext == ".csv":
         return pd.read_csv(source_filepath, encoding="utf-8-sig")
 
-    with pd.ExcelFile(source_filepath, engine="openpyxl") as xf:
-        sheet_name = "Data" if "Data" in xf.sheet_names else xf.sheet_names[-1]
-        return pd.read_excel(xf, sheet_name=sheet_name, engine="openpyxl")
+    with open_workbook(source_filepath) as workbook:
+        names = workbook.sheet_names
+        return workbook.read_sheet("Data" if "Data" in names else names[-1])
 
 
 def write_import_metadata(metadata: dict, metadata_path: str) -> None:
@@ -10,6 +10,7 @@ Channel posting (which requires Discord transport) lives in commands/kvk_persona
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
 import logging
 import time
 
@@ -46,7 +47,7 @@ async def load_kvk_personal_stats(governor_id: str) -> dict | None:
         return None
 
 
-async def load_last_kvk_map() -> dict:
+async def load_last_kvk_map() -> Mapping:
     """
     Thin async wrapper around stats_cache_helpers.load_last_kvk_map().
     Single call point for all command-layer consumers.
@@ -6,6 +6,9 @@ Shared helpers for writing pandas DataFrames into SQL Server tables and related
 Functions:
 - detect_transient_error(exc) -> bool
 - executemany_batched(cursor, conn, sql, rows, batch_size=..., commit_per_batch=True) -> int
+- db_column_values(series) -> list
+- iter_db_row_chunks(df, chunk_size=..., prefix=()) -> Iterator[list[tuple]]
+- to_db_rows(df, prefix=()) -> list[tuple]
 - quote_sql_columns(cols) -> str
 - write_df_to_table(cursor, conn, df, table_name, mode='truncate', key_cols=None, batch_size=..., commit_per_batch=True, transactional=False) -> dict
 - write_df_to_staging_and_upsert(cursor, conn, df, staging_table, upsert_proc, transactional=True) -> dict
@@ -15,11 +18,16 @@ These helpers are intentionally conservative and return structured dicts for cal
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from itertools import repeat
 import logging
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from core.bulk_load import bulk_insert
+
 logger = logging.getLogger(__name__)
 
 
@@ -149,13 +157,54 @@ def executemany_batched(
     return inserted
 
 
-def to_db_rows(df: pd.DataFrame) -> list[tuple]:
+def db_column_values(series: pd.Series) -> list[Any]:
+    """
+    One column as DB parameters: Python scalars, with NaN/NaT/NA turned into None by a
+    per-column mask instead of a per-cell ``pd.isna`` check.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biu":
+        return series.tolist()
+    if isinstance(dtype, np.dtype) and dtype.kind == "f":
+        arr = series.to_numpy()
+        values = arr.tolist()
+        for i in np.flatnonzero(np.isnan(arr)).tolist():
+            values[i] = None
+        return values
+    # object / datetime / extension dtypes: NA-like values (NaN, NaT, pd.NA, None) -> None
+    values = series.to_numpy(dtype=object)
+    mask = series.isna().to_numpy()
+    if mask.any():
+        values = values.copy()
+        values[mask] = None
+    return values.tolist()
+
+
+def iter_db_row_chunks(
+    df: pd.DataFrame, chunk_size: int = 5000, *, prefix: tuple[Any, ...] = ()
+) -> Iterator[list[tuple]]:
+    """
+    Yield DB-ready row tuples ``prefix + row`` in chunks of ``chunk_size`` rows.
+
+    Each chunk is converted column-wise when it is requested, so a caller can insert the first
+    chunk before the rest of the frame has been converted.
+    """
+    total = len(df)
+    step = max(1, int(chunk_size))
+    for start in range(0, total, step):
+        part = df.iloc[start : start + step]
+        n = len(part)
+        columns = [db_column_values(part.iloc[:, i]) for i in range(part.shape[1])]
+        yield list(zip(*(repeat(value, n) for value in prefix), *columns, strict=True))
+
+
+def to_db_rows(df: pd.DataFrame, *, prefix: tuple[Any, ...] = ()) -> list[tuple]:
     """
     Convert DataFrame to DB-ready rows: replace pandas NA/NaT with None and return tuples.
     """
-    df2 = df.copy()
-    df2 = df2.astype(object).where(pd.notnull(df2), None)
-    return [tuple(row) for row in df2.itertuples(index=False, name=None)]
+    if df is None or df.empty:
+        return []
+    return next(iter_db_row_chunks(df, len(df), prefix=prefix))
 
 
 def write_df_to_table(
@@ -239,11 +288,15 @@ def write_df_to_table(
         except Exception:
             fe = False
 
-        rows = to_db_rows(df)
         use_commit_per_batch = False if transactional else commit_per_batch
-        inserted = executemany_batched(
-            cursor, conn, insert_sql, rows, batch_size, commit_per_batch=use_commit_per_batch
+        load = bulk_insert(
+            insert_sql,
+            iter_db_row_chunks(df, batch_size),
+            label=table_name,
+            cursor=cursor,
+            commit=conn.commit if use_commit_per_batch else None,
         )
+        inserted = load.rows
         out["rows"] = inserted
         logger.info(
             "[%s] Inserted %d rows (fast_executemany=%s)",
@@ -300,8 +353,10 @@ def write_df_to_staging_and_upsert(
 
 
 __all__ = [
+    "db_column_values",
     "detect_transient_error",
     "executemany_batched",
+    "iter_db_row_chunks",
     "quote_sql_columns",
     "to_db_rows",
     "write_df_to_staging_and_upsert",
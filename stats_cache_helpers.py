@@ -1,6 +1,7 @@
 # stats_cache_helpers.py
 from __future__ import annotations
 
+from collections.abc import Mapping
 import logging
 import time
 from typing import Any
@@ -21,13 +22,19 @@ _last_kvk_cache: dict = {
 }
 
 
-def _read_last_kvk_sync() -> dict[str, Any]:
+def _read_last_kvk_sync() -> Mapping[str, Any]:
     """
     Synchronous read of the PLAYER_STATS_LAST_CACHE file.
-    Returns a dict keyed by GovernorID (strings). Returns {} on any failure.
+    Returns a mapping keyed by GovernorID (strings): the memory-mapped columnar generation when
+    it is current, otherwise the parsed JSON dict. Returns {} on any failure.
     Intended to be executed via run_blocking_in_thread.
     """
     try:
+        import stats_columnar
+
+        table = stats_columnar.open_columnar_cache(PLAYER_STATS_LAST_CACHE)
+        if table is not None:
+            return table
         data = read_json_safe(PLAYER_STATS_LAST_CACHE)
         if isinstance(data, dict):
             data.pop("_meta", None)
@@ -51,7 +58,7 @@ def get_last_kvk_for_governor_sync(governor_id: str) -> dict | None:
     """
     try:
         data = _last_kvk_cache.get("data")
-        if not isinstance(data, dict):
+        if not isinstance(data, Mapping):
             logger.debug(
                 "[STATS_CACHE_HELPERS] get_last_kvk_for_governor_sync: cache not warmed yet"
             )
@@ -71,22 +78,22 @@ def get_last_kvk_for_governor_sync(governor_id: str) -> dict | None:
         return None
 
 
-async def load_last_kvk_map() -> dict[str, Any]:
+async def load_last_kvk_map() -> Mapping[str, Any]:
     """
     Async loader that returns the cached last-KVK map (reads file if cache expired).
-    Guarantees a dict return (possibly empty). Uses a simple in-process TTL cache.
+    Guarantees a mapping return (possibly empty). Uses a simple in-process TTL cache.
     """
     now = int(time.time())
     try:
         # serve from cache if still valid
         if now - int(_last_kvk_cache.get("ts", 0)) < _CACHE_TTL and isinstance(
-            _last_kvk_cache.get("data"), dict
+            _last_kvk_cache.get("data"), Mapping
         ):
             return _last_kvk_cache["data"]
 
         # otherwise read from disk off the event loop
         data = await run_blocking_in_thread(_read_last_kvk_sync, name="read_last_kvk_cache")
-        if not isinstance(data, dict):
+        if not isinstance(data, Mapping):
             data = {}
 
         # update cache
@@ -0,0 +1,351 @@
+# stats_columnar.py
+"""
+Columnar, memory-mapped companion files for the player stats caches.
+
+player_stats_cache.py still writes the JSON caches (compatibility/debugging); next to each one it
+writes a generation file ``<cache>.<ns>.cols`` plus a small pointer ``<cache>.cols.json`` naming
+the current generation. Readers map the generation file read-only, so a reload only parses the
+header and a single-governor read touches only that governor's cells.
+
+File layout (little-endian):
+  8-byte magic | u64 header length | JSON header | 8-byte aligned column blobs
+
+Each column stores one typed array (int64 / float64 / string table / JSON-encoded string table)
+and, when some rows lack the key or hold None, a uint8 state array (0 absent, 1 None, 2 value).
+``key_order`` holds row positions sorted by GovernorID key for binary-search lookups.
+
+Generations are never rewritten in place: Windows cannot replace a file another process has
+mapped, so writers create a new file, switch the pointer and prune older generations best-effort.
+"""
+
+from __future__ import annotations
+
+from collections.abc import ItemsView, Iterator, Mapping, ValuesView
+import glob
+from itertools import pairwise
+import json
+import logging
+import os
+import struct
+import time
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"K98COLS1"
+_ALIGN = 8
+_CHUNK_ROWS = 2048
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+_ABSENT, _NONE, _VALUE = 0, 1, 2
+
+
+def columnar_enabled() -> bool:
+    return os.getenv("PLAYER_STATS_COLUMNAR", "1").strip().lower() not in ("0", "false", "no")
+
+
+def pointer_path(json_path: str) -> str:
+    return f"{os.path.splitext(json_path)[0]}.cols.json"
+
+
+# ---------------------------
+# Writer
+# ---------------------------
+def _column_kind(values: list[Any]) -> str:
+    kinds = {type(v) for v in values if v is not None}
+    if kinds == {int} and all(_INT64_MIN <= v <= _INT64_MAX for v in values if v is not None):
+        return "int"
+    if kinds == {float}:
+        return "float"
+    if not kinds or kinds == {str}:
+        return "str"
+    return "json"
+
+
+def _string_table(values: list[str]) -> tuple[np.ndarray, bytes]:
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+    if encoded:
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return offsets, b"".join(encoded)
+
+
+def _encode_table(
+    keys: list[str], rows: list[dict[str, Any]], meta: dict[str, Any]
+) -> tuple[dict[str, Any], list[bytes]]:
+    names: dict[str, None] = {}
+    for row in rows:
+        names.update(dict.fromkeys(row))
+
+    blobs: list[bytes] = []
+    offset = 0
+
+    def _add(data: bytes) -> list[int]:
+        nonlocal offset
+        pad = (-len(data)) % _ALIGN
+        blobs.append(data + b"\x00" * pad)
+        span = [offset, len(data)]
+        offset += len(data) + pad
+        return span
+
+    columns: list[dict[str, Any]] = []
+    for name in names:
+        states = [
+            _ABSENT if name not in row else (_NONE if row[name] is None else _VALUE) for row in rows
+        ]
+        values = [row.get(name) for row in rows]
+        kind = _column_kind(values)
+        column: dict[str, Any] = {"name": name, "kind": kind, "state": None}
+        if kind == "int":
+            column["data"] = _add(np.array([v or 0 for v in values], dtype="<i8").tobytes())
+        elif kind == "float":
+            column["data"] = _add(
+                np.array([0.0 if v is None else v for v in values], dtype="<f8").tobytes()
+            )
+        else:
+            if kind == "str":
+                texts = ["" if v is None else v for v in values]
+            else:
+                texts = ["" if v is None else json.dumps(v, default=str) for v in values]
+            offsets, blob = _string_table(texts)
+            column["offsets"] = _add(offsets.tobytes())
+            column["data"] = _add(blob)
+        if any(s != _VALUE for s in states):
+            column["state"] = _add(np.array(states, dtype=np.uint8).tobytes())
+        columns.append(column)
+
+    key_offsets, key_blob = _string_table(keys)
+    key_order = np.array(sorted(range(len(keys)), key=keys.__getitem__), dtype="<i8")
+    header = {
+        "version": 1,
+        "rows": len(keys),
+        "meta": meta,
+        "columns": columns,
+        "keys": {"offsets": _add(key_offsets.tobytes()), "data": _add(key_blob)},
+        "key_order": _add(key_order.tobytes()),
+    }
+    return header, blobs
+
+
+def write_columnar_cache(json_path: str, payload: Mapping[str, Any]) -> str:
+    """
+    Write ``payload`` (the JSON cache dict, ``_meta`` included) as a new columnar generation and
+    point ``<cache>.cols.json`` at it. Returns the generation file path.
+    """
+    base = os.path.splitext(json_path)[0]
+    meta = payload.get("_meta") if isinstance(payload.get("_meta"), dict) else {}
+    keys = [str(k) for k, v in payload.items() if k != "_meta" and isinstance(v, dict)]
+    rows = [payload[k] for k in keys]
+    header, blobs = _encode_table(keys, rows, dict(meta or {}))
+
+    header_bytes = json.dumps(header, default=str).encode("utf-8")
+    prefix_len = len(MAGIC) + 8 + len(header_bytes)
+    prefix_pad = (-prefix_len) % _ALIGN
+
+    data_path = f"{base}.{time.time_ns()}.cols"
+    tmp = f"{data_path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header_bytes) + prefix_pad))
+        f.write(header_bytes + b" " * prefix_pad)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, data_path)
+
+    ptr = pointer_path(json_path)
+    ptr_tmp = f"{ptr}.tmp"
+    with open(ptr_tmp, "w", encoding="utf-8") as f:
+        json.dump({"file": os.path.basename(data_path), "rows": len(keys)}, f)
+    os.replace(ptr_tmp, ptr)
+
+    _prune_generations(base, keep=data_path)
+    return data_path
+
+
+def _prune_generations(base: str, *, keep: str, retain: int = 1) -> None:
+    """Remove older generation files, keeping ``keep`` and the ``retain`` newest before it."""
+    older = sorted(p for p in glob.glob(f"{glob.escape(base)}.*.cols") if p != keep)
+    for path in older[: max(0, len(older) - retain)]:
+        try:
+            os.remove(path)
+        except OSError:
+            # Still mapped by a reader on Windows; a later write prunes it.
+            logger.debug("[STATS_COLUMNAR] could not prune %s", path, exc_info=True)
+
+
+# ---------------------------
+# Reader
+# ---------------------------
+class _Column:
+    __slots__ = ("data", "kind", "name", "offsets", "state")
+
+    def __init__(self, buf: np.ndarray, spec: dict[str, Any], base: int) -> None:
+        self.name: str = spec["name"]
+        self.kind: str = spec.get("kind", "str")
+        self.offsets = _view(buf, base, spec.get("offsets"), "<i8")
+        dtype = {"int": "<i8", "float": "<f8"}.get(self.kind, np.uint8)
+        self.data = _view(buf, base, spec["data"], dtype)
+        self.state = _view(buf, base, spec.get("state"), np.uint8)
+
+    def _text(self, blob: bytes, start: int, stop: int) -> Any:
+        text = blob[start:stop].decode("utf-8")
+        if self.kind != "json":
+            return text
+        # Absent/None cells are stored as "" (never valid JSON); the state array masks them.
+        return json.loads(text) if text else None
+
+    def value(self, i: int) -> Any:
+        if self.offsets is None:
+            return self.data[i].item()
+        start, stop = int(self.offsets[i]), int(self.offsets[i + 1])
+        return self._text(self.data[start:stop].tobytes(), 0, stop - start)
+
+    def values(self, start: int, stop: int) -> list[Any]:
+        if self.offsets is None:
+            return self.data[start:stop].tolist()
+        offs = self.offsets[start : stop + 1].tolist()
+        blob = self.data[offs[0] : offs[-1]].tobytes()
+        first = offs[0]
+        return [self._text(blob, a - first, b - first) for a, b in pairwise(offs)]
+
+
+def _view(buf: np.ndarray, base: int, span: list[int] | None, dtype: Any) -> np.ndarray | None:
+    if span is None:
+        return None
+    start, length = base + int(span[0]), int(span[1])
+    return buf[start : start + length].view(dtype)
+
+
+class ColumnarStatsTable(Mapping[str, dict[str, Any]]):
+    """Read-only ``GovernorID -> row`` mapping backed by a memory-mapped generation file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        buf = np.memmap(path, dtype=np.uint8, mode="r")
+        if bytes(buf[: len(MAGIC)]) != MAGIC:
+            raise ValueError(f"not a columnar stats file: {path}")
+        (header_len,) = struct.unpack("<Q", bytes(buf[len(MAGIC) : len(MAGIC) + 8]))
+        header_start = len(MAGIC) + 8
+        header = json.loads(bytes(buf[header_start : header_start + header_len]))
+        base = header_start + header_len
+
+        self._buf = buf
+        self.meta: dict[str, Any] = header.get("meta") or {}
+        self._rows = int(header["rows"])
+        self._columns = [_Column(buf, spec, base) for spec in header["columns"]]
+        self._keys = _Column(buf, {"name": "", "kind": "str", **header["keys"]}, base)
+        self._key_order = _view(buf, base, header["key_order"], "<i8")
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        for start in range(0, self._rows, _CHUNK_ROWS):
+            yield from self._keys.values(start, min(start + _CHUNK_ROWS, self._rows))
+
+    def __contains__(self, key: object) -> bool:
+        return self._position(key) is not None
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        pos = self._position(key)
+        if pos is None:
+            raise KeyError(key)
+        return self._row(pos)
+
+    def items(self) -> ItemsView[str, dict[str, Any]]:
+        return _TableItems(self)
+
+    def values(self) -> ValuesView[dict[str, Any]]:
+        return _TableValues(self)
+
+    def _position(self, key: object) -> int | None:
+        if not isinstance(key, str) or self._key_order is None:
+            return None
+        lo, hi = 0, self._rows
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._keys.value(int(self._key_order[mid])) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._rows:
+            pos = int(self._key_order[lo])
+            if self._keys.value(pos) == key:
+                return pos
+        return None
+
+    def _row(self, i: int) -> dict[str, Any]:
+        row: dict[str, Any] = {}
+        for col in self._columns:
+            state = _VALUE if col.state is None else int(col.state[i])
+            if state == _VALUE:
+                row[col.name] = col.value(i)
+            elif state == _NONE:
+                row[col.name] = None
+        return row
+
+    def iter_items(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield ``(key, row)`` decoding each column a chunk at a time."""
+        for start in range(0, self._rows, _CHUNK_ROWS):
+            stop = min(start + _CHUNK_ROWS, self._rows)
+            keys = self._keys.values(start, stop)
+            decoded = [
+                (
+                    col.name,
+                    col.values(start, stop),
+                    None if col.state is None else col.state[start:stop].tolist(),
+                )
+                for col in self._columns
+            ]
+            for j, key in enumerate(keys):
+                row: dict[str, Any] = {}
+                for name, vals, states in decoded:
+                    state = _VALUE if states is None else states[j]
+                    if state == _VALUE:
+                        row[name] = vals[j]
+                    elif state == _NONE:
+                        row[name] = None
+                yield key, row
+
+
+class _TableItems(ItemsView):
+    def __iter__(self):
+        return self._mapping.iter_items()
+
+
+class _TableValues(ValuesView):
+    def __iter__(self):
+        return (row for _key, row in self._mapping.iter_items())
+
+
+def columnar_signature(json_path: str) -> float | None:
+    """Pointer mtime, or None when no columnar generation exists for ``json_path``."""
+    try:
+        return os.path.getmtime(pointer_path(json_path))
+    except OSError:
+        return None
+
+
+def open_columnar_cache(json_path: str) -> ColumnarStatsTable | None:
+    """
+    Open the current generation for ``json_path``. Returns None (caller falls back to JSON)
+    when disabled, missing, older than the JSON file, or unreadable.
+    """
+    if not columnar_enabled():
+        return None
+    ptr = pointer_path(json_path)
+    try:
+        if os.path.getmtime(ptr) < os.path.getmtime(json_path):
+            return None
+        with open(ptr, encoding="utf-8") as f:
+            name = json.load(f)["file"]
+        return ColumnarStatsTable(os.path.join(os.path.dirname(ptr), name))
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning(
+            "[STATS_COLUMNAR] unreadable columnar cache for %s", json_path, exc_info=True
+        )
+        return None
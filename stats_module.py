@@ -31,6 +31,7 @@ logger = logging.getLogger(__name__)
 telemetry_logger = logging.getLogger("telemetry")
 
 from constants import DOWNLOAD_FOLDER, _conn_trusted
+from core.sql_pool import acquire_pooled_connection
 from file_utils import (  # run_step/run_blocking_in_thread imported dynamically later
     emit_telemetry_event,
 )
@@ -264,7 +265,7 @@ async def run_sql_procedure(
     logger.info(f"[SQL_PROC] Received Rank: {rank}, Seed: {seed}")
 
     def _proc_and_get_expected_counter() -> int:
-        with _conn_trusted() as conn:
+        with acquire_pooled_connection("trusted", _conn_trusted) as conn:
             conn.autocommit = False
             cur = conn.cursor()
             try:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
 import logging
 import time
 from typing import Any
@@ -10,6 +11,8 @@ import discord
 from rapidfuzz import fuzz, process
 from unidecode import unidecode
 
+from governor_name_index import NameIndexSlot
+
 # NOTE: _conn is the repo's SQL connection helper imported from constants
 from kvk_state import get_kvk_context_today
 from targets_embed import build_kvk_targets_embed
@@ -39,6 +42,24 @@ def _normalize_name(name: str) -> str:
     return unidecode(str(name or "").strip().lower())
 
 
+# Search index over _name_cache["rows"]; rebuilt whenever the rows list is replaced.
+_name_index = NameIndexSlot("target_utils", normalize=_normalize_name)
+_NO_ROWS: list[dict[str, Any]] = []
+
+
+def _row_index_items(rows: list[dict[str, Any]]):
+    for row in rows:
+        if isinstance(row, dict):
+            yield row.get("GovernorName"), row.get("GovernorID"), row
+
+
+def _current_name_index():
+    rows = _name_cache.get("rows") if isinstance(_name_cache, dict) else None
+    if rows is None:
+        rows = _NO_ROWS
+    return _name_index.get(rows, lambda: _row_index_items(rows))
+
+
 # ----------------------------------------------------------------------
 # Module-level synchronous worker for name cache refresh
 # ----------------------------------------------------------------------
@@ -127,6 +148,9 @@ def sync_refresh_worker() -> dict[str, Any]:
                     except Exception:
                         pass
 
+            # Build the search index first so readers switch to rows and index together
+            _name_index.publish(rows, _row_index_items(rows))
+
             # Atomically swap cache contents
             _name_cache["names"] = name_map
             _name_cache["norm_to_row"] = norm_to_row
@@ -229,11 +253,8 @@ async def lookup_governor_row_by_id(governor_id: str | int) -> dict[str, Any] |
         except Exception:
             logger.exception("[TARGET_UTILS] lookup_governor_row_by_id cache warm failed")
 
-    rows = _name_cache.get("rows", []) if isinstance(_name_cache, dict) else []
-    for row in rows:
-        if str(row.get("GovernorID", "")).strip() == gid:
-            return dict(row)
-    return None
+    matches = _current_name_index().by_governor_id(gid)
+    return dict(matches[0].payload) if matches else None
 
 
 # Small diagnostic helper to inspect cache state (useful in logs / REPL)
@@ -251,26 +272,27 @@ def get_name_cache_rows() -> list[dict[str, Any]]:
     return [dict(row) for row in rows if isinstance(row, dict)]
 
 
-def _unwrap_targets_result(result: Any) -> dict[str, Any] | None:
-    if isinstance(result, dict):
-        return result
-    if not isinstance(result, tuple) or len(result) < 2:
-        return None
+async def _lookup_targets(gid: int) -> dict[str, Any] | None:
+    """
+    Answer a targets lookup in the bot process.
 
-    first, second = result[0], result[1]
-    if isinstance(first, bool):
-        if not first:
-            raise RuntimeError("Target maintenance failed")
-        return second if isinstance(second, dict) else None
-    if isinstance(second, bool):
-        if not second:
-            raise RuntimeError("Target maintenance failed")
-        return first if isinstance(first, dict) else None
-    if isinstance(first, dict):
-        return first
-    if isinstance(second, dict) and isinstance(second.get("result"), dict):
-        return second["result"]
-    return None
+    get_targets_for_governor() serves from a process-level index of PLAYER_TARGETS_CACHE and
+    single-flights stale-context refreshes; a child process would rebuild both on every call.
+    The lookup runs on a worker thread because a stale cache may still trigger a SQL refresh.
+    """
+    try:
+        from file_utils import run_blocking_in_thread
+    except Exception:
+        run_blocking_in_thread = None
+
+    if run_blocking_in_thread is not None:
+        return await run_blocking_in_thread(
+            get_targets_for_governor,
+            gid,
+            name="get_targets_for_governor",
+            meta={"governor_id": gid},
+        )
+    return await asyncio.to_thread(get_targets_for_governor, gid)
 
 
 # ---------------- Targets: EXEMPT/NOT ACTIVE fallback (still via SQL) ----------------
@@ -387,10 +409,13 @@ async def lookup_governor_id(governor_name: str):
     input_norm = _normalize_name(governor_name)
     logger.debug("[TARGET_UTILS] normalized input: %r", input_norm)
 
-    # Exact lookup via cached normalized map
+    index = _current_name_index()
+
+    # Exact lookup via the normalized name index (first row wins for duplicate names)
     try:
-        exact_row = _name_cache.get("norm_to_row", {}).get(input_norm)
-        if exact_row:
+        exact = index.first_for(input_norm)
+        if exact:
+            exact_row = exact.payload
             logger.debug("[TARGET_UTILS] exact match found for %r -> %s", governor_name, exact_row)
             return {
                 "status": "found",
@@ -402,42 +427,39 @@ async def lookup_governor_id(governor_name: str):
     except Exception:
         logger.exception("[CACHE] exact lookup failed; falling back to fuzzy")
 
-    # Fuzzy matching fallback
+    # Fuzzy matching fallback, scored over the index shortlist only
     try:
-        names_map = _name_cache.get("names", {})
-        if not names_map:
+        if not index.norms:
             logger.debug("[TARGET_UTILS] name cache empty; returning not_found")
             return {"status": "not_found", "message": "No governor data available"}
 
-        choices = list(names_map.keys())
         # If the normalized input is empty, return top suggestions (insertion order) limited by 8
         if not input_norm:
             logger.debug("[TARGET_UTILS] empty input; returning top names by insertion order")
             matches = []
-            for norm in choices[:8]:
-                row = _name_cache["norm_to_row"].get(norm)
-                if row:
-                    matches.append(
-                        {
-                            "GovernorName": row["GovernorName"],
-                            "GovernorID": str(row["GovernorID"]),
-                            "score": 100,
-                        }
-                    )
-            return {"status": "fuzzy_matches", "matches": matches}
-
-        results = process.extract(input_norm, choices, scorer=fuzz.WRatio, limit=8)
-        matches = []
-        for match_norm, score, _ in results:
-            row = _name_cache["norm_to_row"].get(match_norm)
-            if row:
+            for norm in index.norms[:8]:
+                row = index.first_for(norm).payload
                 matches.append(
                     {
-                        "GovernorName": str(row["GovernorName"]),
+                        "GovernorName": row["GovernorName"],
                         "GovernorID": str(row["GovernorID"]),
-                        "score": int(score),
+                        "score": 100,
                     }
                 )
+            return {"status": "fuzzy_matches", "matches": matches}
+
+        choices = index.shortlist(input_norm)
+        results = process.extract(input_norm, choices, scorer=fuzz.WRatio, limit=8)
+        matches = []
+        for match_norm, score, _ in results:
+            row = index.first_for(match_norm).payload
+            matches.append(
+                {
+                    "GovernorName": str(row["GovernorName"]),
+                    "GovernorID": str(row["GovernorID"]),
+                    "score": int(score),
+                }
+            )
 
         if matches:
             logger.debug("[TARGET_UTILS] fuzzy matches found: %d", len(matches))
@@ -530,44 +552,36 @@ async def autocomplete_governor_names(ctx: discord.AutocompleteContext):
                 logger.exception("[TARGET_UTILS] autocomplete: SQL cache refresh failed")
 
         prefix_norm = _normalize_name(q)
-        names_map = _name_cache.get("names", {}) or {}
-        norm_to_row = _name_cache.get("norm_to_row", {}) or {}
+        index = _current_name_index()
 
         results: list[tuple[str, str]] = []
         seen_norms: set[str] = set()
 
-        # Fast prefix matches for best UX
-        if prefix_norm:
-            for norm in names_map.keys():
-                if norm.startswith(prefix_norm):
-                    row = norm_to_row.get(norm)
-                    if row:
-                        results.append(
-                            (f"{row['GovernorName']} ({row['GovernorID']})", str(row["GovernorID"]))
-                        )
-                        seen_norms.add(norm)
-                        if len(results) >= 25:
-                            break
+        def _add(norm: str) -> None:
+            row = index.first_for(norm).payload
+            results.append((f"{row['GovernorName']} ({row['GovernorID']})", str(row["GovernorID"])))
+            seen_norms.add(norm)
 
-        # If not enough results, use fuzzy matching to supplement
-        if len(results) < 25 and names_map:
-            choices = list(names_map.keys())
+        # Fast prefix matches for best UX (bisect over the sorted names)
+        for norm in index.prefix(prefix_norm, 25):
+            _add(norm)
+
+        # If not enough results, fuzzy-score the trigram shortlist to supplement
+        if len(results) < 25 and index.norms:
             fuzzy_limit = 50
             try:
                 fuzzy = process.extract(
-                    prefix_norm or "", choices, scorer=fuzz.WRatio, limit=fuzzy_limit
+                    prefix_norm or "",
+                    index.shortlist(prefix_norm),
+                    scorer=fuzz.WRatio,
+                    limit=fuzzy_limit,
                 )
-                for match_norm, score, _ in fuzzy:
+                for match_norm, _score, _ in fuzzy:
                     if match_norm in seen_norms:
                         continue
-                    row = norm_to_row.get(match_norm)
-                    if row:
-                        results.append(
-                            (f"{row['GovernorName']} ({row['GovernorID']})", str(row["GovernorID"]))
-                        )
-                        seen_norms.add(match_norm)
-                        if len(results) >= 25:
-                            break
+                    _add(match_norm)
+                    if len(results) >= 25:
+                        break
             except Exception:
                 logger.exception("[TARGET_UTILS] autocomplete fuzzy match failed")
 
@@ -633,40 +647,7 @@ async def run_target_lookup(*args, **kwargs) -> dict[str, Any] | None:
         if str(query).strip().isdigit():
             gid = int(str(query).strip())
             try:
-                # Local import to avoid module-level cycles
-                try:
-                    from file_utils import run_maintenance_with_isolation  # type: ignore
-                except Exception:
-                    run_maintenance_with_isolation = None
-
-                try:
-                    from file_utils import run_blocking_in_thread
-                except Exception:
-                    run_blocking_in_thread = None
-
-                if run_maintenance_with_isolation is not None:
-                    targets = _unwrap_targets_result(
-                        await run_maintenance_with_isolation(
-                            get_targets_for_governor,
-                            gid,
-                            name="get_targets_for_governor",
-                            prefer_process=True,
-                            meta={"governor_id": gid},
-                        )
-                    )
-                elif run_blocking_in_thread is not None:
-                    targets = await run_blocking_in_thread(
-                        get_targets_for_governor,
-                        gid,
-                        name="get_targets_for_governor",
-                        meta={"governor_id": gid},
-                    )
-                else:
-                    import asyncio as _asyncio
-
-                    targets = await _asyncio.to_thread(get_targets_for_governor, gid)
-
-                tgt = targets
+                tgt = await _lookup_targets(gid)
 
                 # ---- Attach last-KVK data (non-fatal) ----
                 try:
@@ -675,7 +656,7 @@ async def run_target_lookup(*args, **kwargs) -> dict[str, Any] | None:
 
                     try:
                         last_map = await load_last_kvk_map()
-                        if isinstance(last_map, dict):
+                        if isinstance(last_map, Mapping):
                             lk = last_map.get(str(gid))
                             if lk and isinstance(tgt, dict):
                                 tgt["last_kvk"] = lk
@@ -766,39 +747,7 @@ async def run_target_lookup(*args, **kwargs) -> dict[str, Any] | None:
         if lookup.get("status") == "found":
             gid = int(lookup["data"]["GovernorID"])
             try:
-                try:
-                    from file_utils import run_maintenance_with_isolation  # type: ignore
-                except Exception:
-                    run_maintenance_with_isolation = None
-
-                try:
-                    from file_utils import run_blocking_in_thread
-                except Exception:
-                    run_blocking_in_thread = None
-
-                if run_maintenance_with_isolation is not None:
-                    targets = _unwrap_targets_result(
-                        await run_maintenance_with_isolation(
-                            get_targets_for_governor,
-                            gid,
-                            name="get_targets_for_governor",
-                            prefer_process=True,
-                            meta={"governor_id": gid},
-                        )
-                    )
-                elif run_blocking_in_thread is not None:
-                    targets = await run_blocking_in_thread(
-                        get_targets_for_governor,
-                        gid,
-                        name="get_targets_for_governor",
-                        meta={"governor_id": gid},
-                    )
-                else:
-                    import asyncio as _asyncio
-
-                    targets = await _asyncio.to_thread(get_targets_for_governor, gid)
-
-                tgt = targets
+                tgt = await _lookup_targets(gid)
 
                 # ---- Attach last-KVK data (non-fatal) ----
                 try:
@@ -806,7 +755,7 @@ async def run_target_lookup(*args, **kwargs) -> dict[str, Any] | None:
 
                     try:
                         last_map = await load_last_kvk_map()
-                        if isinstance(last_map, dict):
+                        if isinstance(last_map, Mapping):
                             lk = last_map.get(str(gid))
                             if lk and isinstance(tgt, dict):
                                 tgt["last_kvk"] = lk
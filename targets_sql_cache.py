@@ -1,9 +1,22 @@
 # targets_sql_cache.py
+"""
+SQL-backed KVK targets cache.
+
+``refresh_targets_cache()`` rebuilds PLAYER_TARGETS_CACHE from dbo.v_TARGETS_FOR_UPLOAD.
+``get_targets_for_governor()`` answers from a process-level index of that file which is
+reloaded only when the file's mtime/size changes. While the cache is in DRAFT the KVK
+context is re-checked at most every CONTEXT_RECHECK_SECONDS, and a context change
+triggers one refresh shared by every concurrent caller.
+"""
+
 from __future__ import annotations
 
+from dataclasses import dataclass
 import json
 import logging
 import os
+import threading
+import time
 from typing import Any
 
 from constants import PLAYER_TARGETS_CACHE, _conn
@@ -14,6 +27,22 @@ logger = logging.getLogger(__name__)
 
 VIEW_NAME = "dbo.v_TARGETS_FOR_UPLOAD"  # single source of truth
 
+# How often a DRAFT cache re-resolves the KVK context (two SQL queries) to detect a change.
+CONTEXT_RECHECK_SECONDS = 60.0
+
+
+@dataclass(slots=True)
+class _TargetsIndex:
+    signature: tuple[int, int] | None  # (mtime_ns, size) of the file this was loaded from
+    cache: dict[str, Any]
+    by_gov: dict[str, Any]
+    context_checked_at: float | None = None
+
+
+_targets_index: _TargetsIndex | None = None
+_index_lock = threading.Lock()
+_refresh_lock = threading.Lock()
+
 
 def _read_json(path: str) -> dict[str, Any]:
     if not os.path.exists(path):
@@ -30,7 +59,7 @@ def _write_json(path: str, data: dict[str, Any]) -> None:
     tmp = path + ".tmp"
     try:
         with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
         os.replace(tmp, path)
     except Exception:
         # If write fails, remove temp file if present and raise/log
@@ -204,14 +233,58 @@ def refresh_targets_cache() -> dict[str, Any]:
     return data
 
 
-def get_targets_for_governor(governor_id: int) -> dict[str, Any] | None:
+def _file_signature(path: str) -> tuple[int, int] | None:
     try:
-        key = normalize_governor_id(governor_id)
-    except Exception:
-        key = str(governor_id)
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _make_index(cache: dict[str, Any], signature: tuple[int, int] | None) -> _TargetsIndex:
+    by_gov = cache.get("by_gov") if isinstance(cache, dict) else None
+    return _TargetsIndex(
+        signature=signature,
+        cache=cache if isinstance(cache, dict) else {},
+        by_gov=by_gov if isinstance(by_gov, dict) else {},
+    )
+
+
+def _current_index() -> _TargetsIndex:
+    """Return the in-memory index, reloading it when the cache file changed on disk."""
+    global _targets_index
+
+    signature = _file_signature(PLAYER_TARGETS_CACHE)
+    index = _targets_index
+    if index is not None and index.signature == signature:
+        return index
+    with _index_lock:
+        index = _targets_index
+        if index is None or index.signature != signature:
+            index = _make_index(_read_json(PLAYER_TARGETS_CACHE), signature)
+            _targets_index = index
+            logger.debug(
+                "[targets_sql_cache] Loaded targets index (%d governors)", len(index.by_gov)
+            )
+        return index
+
+
+def _recheck_context(index: _TargetsIndex) -> _TargetsIndex:
+    """
+    Resolve the KVK context for a possibly-stale cache and refresh it if the context moved on.
 
-    cache = _read_json(PLAYER_TARGETS_CACHE)
-    if _cache_might_be_stale(cache):
+    Single-flight: concurrent callers wait for the thread already checking/refreshing and then
+    reuse its result instead of running refresh_targets_cache() again.
+    """
+    global _targets_index
+
+    with _refresh_lock:
+        current = _targets_index or index
+        checked_at = current.context_checked_at
+        if checked_at is not None and time.monotonic() - checked_at < CONTEXT_RECHECK_SECONDS:
+            return current
+
+        cache = current.cache
         ctx = get_kvk_context_today()
         if ctx and not _cache_matches_context(cache, ctx):
             if cache:
@@ -224,10 +297,45 @@ def get_targets_for_governor(governor_id: int) -> dict[str, Any] | None:
                     ctx.get("state"),
                     ctx.get("state_reason"),
                 )
-            cache = refresh_targets_cache()
+            refreshed = refresh_targets_cache()
+            if isinstance(refreshed, dict) and "by_gov" in refreshed:
+                current = _make_index(refreshed, _file_signature(PLAYER_TARGETS_CACHE))
+            else:
+                # Summary-only result (maintenance subprocess): the full cache is on disk.
+                with _index_lock:
+                    _targets_index = None
+                current = _current_index()
         elif not ctx and cache:
             logger.info(
                 "[targets_sql_cache] Keeping existing targets cache because KVK context could not be resolved."
             )
 
-    return (cache.get("by_gov") or {}).get(str(key))
+        current.context_checked_at = time.monotonic()
+        with _index_lock:
+            _targets_index = current
+        return current
+
+
+def reset_targets_index() -> None:
+    """Drop the in-memory targets index so the next lookup reloads it from disk."""
+    global _targets_index
+
+    with _index_lock:
+        _targets_index = None
+
+
+def get_targets_for_governor(governor_id: int) -> dict[str, Any] | None:
+    try:
+        key = normalize_governor_id(governor_id)
+    except Exception:
+        key = str(governor_id)
+
+    index = _current_index()
+    if _cache_might_be_stale(index.cache):
+        checked_at = index.context_checked_at
+        if checked_at is None or time.monotonic() - checked_at >= CONTEXT_RECHECK_SECONDS:
+            index = _recheck_context(index)
+
+    # Shallow copy: callers annotate the returned row (e.g. "last_kvk").
+    row = index.by_gov.get(str(key))
+    return dict(row) if isinstance(row, dict) else row
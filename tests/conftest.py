@@ -20,6 +20,8 @@ os.environ.setdefault("SQL_DATABASE", "test-db")
 os.environ.setdefault("IMPORT_SQL_USERNAME", "test-user")
 os.environ.setdefault("IMPORT_SQL_PASSWORD", "test-password")
 os.environ.setdefault("PREKVK_IMPORT_HISTORY_DISABLED", "1")
+# Coalesced card refreshes would leave trailing edits running past the test that cast the vote.
+os.environ.setdefault("VOTE_CARD_REFRESH_WINDOW_SECONDS", "0")
 
 # Determine repository root (one directory up from tests/)
 _THIS_DIR = os.path.dirname(__file__)
@@ -140,3 +142,32 @@ def _block_live_ark_db_access_in_unit_tests(monkeypatch):
         pass
 
     yield
+
+
+@pytest.fixture(autouse=True)
+def _isolate_usage_jsonl(monkeypatch, tmp_path):
+    """Write command-usage/metrics/alerts JSONL under tmp_path and stop the writer thread after."""
+    try:
+        from core.jsonl_writer import JsonlWriter
+        import usage_tracker
+    except Exception:
+        yield
+        return
+
+    writer = JsonlWriter(str(tmp_path))
+    monkeypatch.setattr(usage_tracker, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(usage_tracker, "_JSONL_WRITER", writer)
+    yield
+    writer.close()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_offload_files(monkeypatch, tmp_path):
+    """Keep the offload registry, staged args and result frames out of the repo's data/ dir."""
+    file_utils = sys.modules.get("file_utils")
+    if file_utils is not None:
+        monkeypatch.setattr(file_utils, "DATA_DIR", str(tmp_path))
+        monkeypatch.setattr(
+            file_utils, "_OFFLOAD_REGISTRY_PATH", str(tmp_path / "offload_registry.json")
+        )
+    yield
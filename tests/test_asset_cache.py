@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+
+from PIL import Image
+
+from core import asset_cache
+from core.asset_cache import DecodedAssetCache
+
+
+def _png(path, size=(40, 20), color=(10, 20, 30, 255)):
+    Image.new("RGBA", size, color).save(path)
+    return path
+
+
+def test_get_decodes_once_and_scales(tmp_path):
+    path = _png(tmp_path / "bg.png")
+    cache = DecodedAssetCache(10 * 1024 * 1024)
+
+    first = cache.get(path, size=(20, 10))
+    second = cache.get(path, size=(20, 10))
+    native = cache.get(path)
+
+    assert first is second
+    assert first.size == (20, 10) and first.mode == "RGBA"
+    assert native.size == (40, 20)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_changed_file_is_redecoded_and_old_version_dropped(tmp_path):
+    path = _png(tmp_path / "bg.png")
+    cache = DecodedAssetCache(10 * 1024 * 1024)
+    old = cache.get(path)
+
+    _png(path, color=(200, 0, 0, 255))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    new = cache.get(path)
+
+    assert new is not old
+    assert new.getpixel((0, 0)) == (200, 0, 0, 255)
+    assert cache.stats()["entries"] == 1
+
+
+def test_memory_budget_evicts_least_recently_used(tmp_path):
+    a = _png(tmp_path / "a.png", size=(10, 10))
+    b = _png(tmp_path / "b.png", size=(10, 10))
+    c = _png(tmp_path / "c.png", size=(10, 10))
+    cache = DecodedAssetCache(2 * 10 * 10 * 4)
+
+    cache.get(a)
+    cache.get(b)
+    cache.get(a)
+    cache.get(c)
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= stats["max_bytes"]
+    cache.get(a)
+    assert cache.stats()["misses"] == 3
+
+
+def test_load_asset_hands_out_private_copies(tmp_path):
+    path = _png(tmp_path / "bg.png")
+    asset_cache.get_asset_cache().clear()
+
+    copy = asset_cache.load_asset(path)
+    copy.putpixel((0, 0), (255, 255, 255, 255))
+
+    assert asset_cache.shared_asset(path).getpixel((0, 0)) == (10, 20, 30, 255)
+
+
+def test_prepare_and_thumbnail_are_part_of_the_key(tmp_path):
+    path = _png(tmp_path / "icon.png", size=(64, 32))
+    cache = DecodedAssetCache(10 * 1024 * 1024)
+
+    def clear(image):
+        image.putpixel((0, 0), (0, 0, 0, 0))
+        return image
+
+    thumb = cache.get(path, size=(16, 16), fit="thumbnail")
+    prepared = cache.get(path, size=(16, 16), fit="thumbnail", prepare=clear)
+
+    assert thumb.size == prepared.size == (16, 8)
+    assert thumb.getpixel((0, 0))[3] == 255
+    assert prepared.getpixel((0, 0))[3] == 0
+
+
+def test_closures_with_the_same_qualname_do_not_share_an_entry(tmp_path):
+    path = _png(tmp_path / "icon.png", size=(8, 8))
+    cache = DecodedAssetCache(10 * 1024 * 1024)
+
+    def make_prepare(alpha):
+        def prepare(image):
+            image.putpixel((0, 0), (0, 0, 0, alpha))
+            return image
+
+        return prepare
+
+    first, second = make_prepare(0), make_prepare(128)
+    assert first.__qualname__ == second.__qualname__
+
+    assert cache.get(path, prepare=first).getpixel((0, 0))[3] == 0
+    assert cache.get(path, prepare=second).getpixel((0, 0))[3] == 128
+    assert cache.get(path, prepare=first).getpixel((0, 0))[3] == 0
+
+
+def test_register_warm_assets_leaves_no_loop_variable_behind(tmp_path, monkeypatch):
+    from inventory import report_image_renderer
+    from kvk.rendering import kvk_stats_card_renderer
+
+    monkeypatch.setattr(asset_cache, "_warm_assets", [])
+    asset_cache.register_warm_assets([tmp_path / "a.png", tmp_path / "b.png"], size=(8, 4))
+
+    assert [entry[0].name for entry in asset_cache._warm_assets] == ["a.png", "b.png"]
+    assert not hasattr(kvk_stats_card_renderer, "_path")
+    assert not hasattr(report_image_renderer, "_path")
+
+
+def test_warm_registered_assets_skips_missing_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_cache, "_warm_assets", [])
+    asset_cache.register_warm_asset(_png(tmp_path / "bg.png"), size=(8, 4))
+    asset_cache.register_warm_asset(tmp_path / "missing.png")
+    asset_cache.register_warm_asset(tmp_path / "bg.png", size=(8, 4))
+
+    assert asset_cache.warm_registered_assets() == 1
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+from io import BytesIO
+
+from PIL import Image
+import pytest
+
+from core import avatar_cache
+from core.avatar_cache import AvatarByteCache
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+class _Asset:
+    def __init__(self, key: str | None, data: bytes = b"avatar", delay: float = 0.0) -> None:
+        self.key = key
+        self.data = data
+        self.delay = delay
+        self.sizes: list[int] = []
+        self.reads = 0
+
+    def with_size(self, size: int):
+        self.sizes.append(size)
+        return self
+
+    async def read(self) -> bytes:
+        self.reads += 1
+        await asyncio.sleep(self.delay)
+        return self.data
+
+
+@pytest.mark.asyncio
+async def test_same_hash_and_size_is_downloaded_once():
+    cache = AvatarByteCache(1024)
+    asset = _Asset("a_hash")
+
+    assert await cache.fetch(asset, size=256) == b"avatar"
+    assert await cache.fetch(asset, size=256) == b"avatar"
+    assert await cache.fetch(asset, size=128) == b"avatar"
+
+    assert asset.reads == 2
+    assert asset.sizes == [256, 256, 128]
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_download():
+    cache = AvatarByteCache(1024)
+    asset = _Asset("hash", delay=0.05)
+
+    results = await asyncio.gather(*(cache.fetch(asset, size=256) for _ in range(5)))
+
+    assert results == [b"avatar"] * 5
+    assert asset.reads == 1
+    assert cache.stats()["coalesced"] == 4
+    assert cache.stats()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_timed_out_caller_still_fills_the_cache():
+    cache = AvatarByteCache(1024)
+    asset = _Asset("slow", delay=0.1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await cache.fetch(asset, size=256, timeout=0.01)
+    await asyncio.sleep(0.15)
+
+    assert cache.get(("slow", 256)) == b"avatar"
+    assert asset.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached_and_unkeyed_assets_are_read_directly():
+    cache = AvatarByteCache(1024)
+
+    class _Broken(_Asset):
+        async def read(self) -> bytes:
+            self.reads += 1
+            raise RuntimeError("cdn down")
+
+    broken = _Broken("broken")
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await cache.fetch(broken, size=64)
+    assert broken.reads == 2
+
+    unkeyed = _Asset(None)
+    await cache.fetch(unkeyed, size=64)
+    await cache.fetch(unkeyed, size=64)
+    assert unkeyed.reads == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_is_bounded_by_bytes():
+    cache = AvatarByteCache(10)
+    cache.put(("a", 1), b"12345")
+    cache.put(("b", 1), b"12345")
+    cache.put(("c", 1), b"12345")
+
+    assert cache.get(("a", 1)) is None
+    assert cache.stats()["bytes"] == 10
+
+
+def test_fitted_avatar_is_decoded_once_per_size():
+    buf = BytesIO()
+    Image.new("RGB", (40, 20), (200, 10, 10)).save(buf, format="PNG")
+    data = buf.getvalue()
+
+    first = avatar_cache.fitted_avatar(data, 16)
+    assert first is avatar_cache.fitted_avatar(data, 16)
+    assert first.size == (16, 16) and first.mode == "RGBA"
+    assert avatar_cache.fitted_avatar(data, 8).size == (8, 8)
+    assert avatar_cache.fitted_avatar(b"not an image", 16) is None
@@ -0,0 +1,251 @@
+import threading
+
+import pytest
+
+from core import bulk_load
+from core.sql_pool import SqlConnectionPool
+
+SQL = "INSERT INTO t (a, b) VALUES (?, ?)"
+
+
+class _Cursor:
+    def __init__(self, owner):
+        self.owner = owner
+        self.fast_executemany = False
+
+    def executemany(self, sql, rows):
+        self.owner.executemany(sql, rows)
+
+    def execute(self, sql, *params):
+        self.owner.session_sql.append(sql)
+
+    def close(self):
+        pass
+
+
+class _Conn:
+    def __init__(self, fail=None):
+        self.fail = fail
+        self.batches = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.closed = False
+        self.session_sql = []
+
+    def cursor(self):
+        return _Cursor(self)
+
+    def executemany(self, sql, rows):
+        if self.fail is not None:
+            exc, self.fail = self.fail, None
+            raise exc
+        self.batches.append(list(rows))
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def events(monkeypatch):
+    import file_utils
+
+    captured = []
+    monkeypatch.setattr(
+        file_utils, "emit_telemetry_event", lambda payload, **kw: captured.append(payload)
+    )
+    return captured
+
+
+def _flat(batches):
+    return [row for batch in batches for row in batch]
+
+
+def _rows(n):
+    return [(i, f"r{i}") for i in range(n)]
+
+
+def test_iter_chunks_slices_rows():
+    assert [len(c) for c in bulk_load.iter_chunks(_rows(7), 3)] == [3, 3, 1]
+    assert list(bulk_load.iter_chunks([], 3)) == []
+
+
+def test_inline_uses_caller_cursor_and_commit(events):
+    conn = _Conn()
+    cur = conn.cursor()
+    commits = []
+
+    report = bulk_load.bulk_insert(
+        SQL,
+        bulk_load.iter_chunks(_rows(5), 2),
+        label="t",
+        cursor=cur,
+        commit=lambda: commits.append(1),
+    )
+
+    assert cur.fast_executemany is True
+    assert [len(b) for b in conn.batches] == [2, 2, 1]
+    assert _flat(conn.batches) == _rows(5)
+    assert len(commits) == 3
+    assert (report.mode, report.rows, report.chunks) == ("inline", 5, 3)
+    assert events[-1]["event"] == "bulk_load"
+    assert events[-1]["status"] == "ok"
+    assert events[-1]["rows"] == 5
+
+
+def test_inline_without_parallel_ignores_connect_factory(monkeypatch, events):
+    monkeypatch.setenv("BULK_LOAD_PARALLEL", "0")
+    conn = _Conn()
+
+    report = bulk_load.bulk_insert(
+        SQL,
+        bulk_load.iter_chunks(_rows(3), 2),
+        label="t",
+        cursor=conn.cursor(),
+        connect=lambda: pytest.fail("should not open connections"),
+        workers=4,
+    )
+
+    assert report.mode == "inline"
+    assert conn.commits == 0
+
+
+def test_parallel_commits_each_chunk_on_own_connection(monkeypatch, events):
+    monkeypatch.setenv("BULK_LOAD_PARALLEL", "1")
+    lock = threading.Lock()
+    opened = []
+
+    def _connect():
+        conn = _Conn()
+        with lock:
+            opened.append(conn)
+        return conn
+
+    report = bulk_load.bulk_insert(
+        SQL, bulk_load.iter_chunks(_rows(10), 2), label="t", connect=_connect, workers=2
+    )
+
+    assert (report.mode, report.rows, report.chunks, report.connections) == ("parallel", 10, 5, 2)
+    assert 1 <= len(opened) <= 2
+    assert sorted(_flat(b for c in opened for b in c.batches)) == _rows(10)
+    assert sum(c.commits for c in opened) == 5
+    assert all(c.closed for c in opened)
+
+
+def test_parallel_retries_transient_chunk_on_fresh_connection(monkeypatch, events):
+    monkeypatch.setenv("BULK_LOAD_PARALLEL", "1")
+    monkeypatch.setattr(bulk_load, "BULK_LOAD_RETRY_BACKOFF", 0.0)
+    opened = []
+
+    def _connect():
+        conn = _Conn(fail=TimeoutError("Query timeout expired") if not opened else None)
+        opened.append(conn)
+        return conn
+
+    report = bulk_load.bulk_insert(
+        SQL, bulk_load.iter_chunks(_rows(4), 2), label="t", connect=_connect, workers=1
+    )
+
+    assert report.rows == 4
+    assert report.retries == 1
+    assert opened[0].rollbacks == 1 and opened[0].closed
+    assert _flat(opened[1].batches) == _rows(4)
+    assert events[-1]["retries"] == 1
+
+
+def test_non_transient_failure_reraises_original_error(monkeypatch, events):
+    monkeypatch.setenv("BULK_LOAD_PARALLEL", "1")
+
+    def _connect():
+        return _Conn(fail=ValueError("bad value"))
+
+    with pytest.raises(ValueError, match="bad value"):
+        bulk_load.bulk_insert(
+            SQL, bulk_load.iter_chunks(_rows(4), 2), label="t", connect=_connect, workers=2
+        )
+
+    assert events[-1]["status"] == "error"
+    assert events[-1]["error"] == "ValueError: bad value"
+
+
+def test_pool_leases_are_capped_at_pool_size_and_returned(monkeypatch, events):
+    monkeypatch.setenv("BULK_LOAD_PARALLEL", "1")
+    pool = SqlConnectionPool("bulk", max_size=2, checkout_timeout=0.0)
+    lock = threading.Lock()
+    opened = []
+
+    def _connect():
+        conn = _Conn()
+        with lock:
+            opened.append(conn)
+        return conn
+
+    report = bulk_load.bulk_insert(
+        SQL, bulk_load.iter_chunks(_rows(10), 2), label="t", connect=_connect, pool=pool, workers=4
+    )
+
+    stats = pool.stats()
+    assert (report.mode, report.rows, report.connections) == ("parallel", 10, 2)
+    assert stats["overflow"] == 0 and stats["in_use"] == 0
+    assert stats["idle"] == len(opened) <= 2
+    assert not any(c.closed for c in opened)
+
+
+def test_pool_leases_are_returned_when_a_chunk_fails(monkeypatch, events):
+    monkeypatch.setenv("BULK_LOAD_PARALLEL", "1")
+    pool = SqlConnectionPool("bulk", max_size=2, checkout_timeout=0.0)
+    opened = []
+
+    def _connect():
+        conn = _Conn(fail=ValueError("bad value") if not opened else None)
+        opened.append(conn)
+        return conn
+
+    with pytest.raises(ValueError, match="bad value"):
+        bulk_load.bulk_insert(
+            SQL,
+            bulk_load.iter_chunks(_rows(8), 2),
+            label="t",
+            connect=_connect,
+            pool=pool,
+            workers=2,
+        )
+
+    stats = pool.stats()
+    assert stats["in_use"] == 0
+    # The session that failed is closed instead of going back to the pool.
+    assert opened[0].closed and stats["discarded"] == 1
+    assert stats["idle"] == len(opened) - 1
+
+
+def test_producer_error_is_raised_to_caller(events):
+    def _chunks():
+        yield _rows(2)
+        raise KeyError("boom")
+
+    conn = _Conn()
+    with pytest.raises(KeyError):
+        bulk_load.bulk_insert(SQL, _chunks(), label="t", cursor=conn.cursor())
+
+    assert conn.batches == [_rows(2)]
+    assert events[-1]["status"] == "error"
+
+
+def test_requires_cursor_or_connect():
+    with pytest.raises(ValueError):
+        bulk_load.bulk_insert(SQL, [], label="t")
+
+
+def test_telemetry_rates():
+    report = bulk_load.BulkLoadReport(
+        label="t", mode="inline", rows=100, produce_s=0.5, insert_s=2.0, wall_s=2.0
+    )
+    payload = report.to_telemetry()
+    assert payload["produce_rows_per_s"] == 200.0
+    assert payload["insert_rows_per_s"] == 50.0
+    assert bulk_load.BulkLoadReport(label="t", mode="inline").to_telemetry()["rows_per_s"] is None
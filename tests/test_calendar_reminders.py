@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+import json
 
 import pytest
 
@@ -12,7 +13,7 @@ from event_calendar.reminder_prefs import (
     set_enabled,
     set_offsets_for_event_type,
 )
-from event_calendar.reminder_state import CalendarReminderState, make_key
+from event_calendar.reminder_state import CalendarReminderState, make_key, migrate_legacy_state
 from event_calendar.reminder_types import REMINDER_3D, REMINDER_7D, REMINDER_24H, REMINDER_START
 
 KNOWN = {"raid", "war", "alliance"}
@@ -114,7 +115,7 @@ def test_remove_offsets():
 
 def test_state_make_key_and_grace(tmp_path):
     path = tmp_path / "state.json"
-    st = CalendarReminderState.load(path=path)
+    st = CalendarReminderState.load_for_update(path=path)
     k = make_key("evt-1", 123, REMINDER_24H)
 
     scheduled = datetime.now(UTC) - timedelta(minutes=5)
@@ -127,7 +128,7 @@ def test_state_make_key_and_grace(tmp_path):
 
 def test_state_round_trip(tmp_path):
     path = tmp_path / "state.json"
-    st = CalendarReminderState.load(path=path)
+    st = CalendarReminderState.load_for_update(path=path)
     k = make_key("evt-2", 456, REMINDER_START)
     st.mark_sent(k)
     st.save()
@@ -141,3 +142,77 @@ def test_normalize_prefs_invalid_shape():
     p = normalize_prefs({"enabled": "yes", "by_event_type": "bad"})
     assert p["enabled"] is True
     assert p["by_event_type"] == {}
+
+
+def test_state_save_appends_only_new_markers(tmp_path):
+    path = tmp_path / "state.json"
+    st = CalendarReminderState.load_for_update(path=path)
+    st.mark_sent(make_key("evt-3", 1, REMINDER_24H))
+    st.save()
+    size_after_first = st.log_path.stat().st_size
+
+    st = CalendarReminderState.load_for_update(path=path)
+    k2 = make_key("evt-3", 2, REMINDER_24H)
+    st.mark_sent(k2)
+    st.save()
+    appended = st.log_path.read_bytes()[size_after_first:]
+
+    assert appended.count(b"\n") == 1
+    assert b"evt-3|2|" in appended
+    assert CalendarReminderState.load(path=path).was_sent(k2) is True
+
+
+def test_state_migrates_legacy_json_once(tmp_path):
+    path = tmp_path / "state.json"
+    k = make_key("evt-4", 7, REMINDER_START)
+    sent_at = datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    path.write_text(json.dumps({"schema_version": 1, "sent": {k: sent_at}}), encoding="utf-8")
+
+    view = CalendarReminderState.load(path=path)
+
+    assert view.was_sent(k) is True
+    assert path.exists()
+    assert not view.log_path.exists()
+
+    assert migrate_legacy_state(path) is True
+    assert migrate_legacy_state(path) is False
+    assert not path.exists()
+    assert (tmp_path / "state.json.migrated").exists()
+    assert CalendarReminderState.load(path=path).sent_at(k) is not None
+
+
+def test_state_load_is_a_read_only_snapshot(tmp_path):
+    path = tmp_path / "state.json"
+    writer = CalendarReminderState.load_for_update(path=path)
+    k = make_key("evt-7", 1, REMINDER_24H)
+    writer.mark_sent(k)
+    writer.save()
+
+    first = CalendarReminderState.load(path=path)
+    second = CalendarReminderState.load(path=path)
+    assert first.sent == second.sent == {k: writer.sent[k]}
+    with pytest.raises(TypeError):
+        first.sent[k] = "x"  # type: ignore[index]
+    with pytest.raises(RuntimeError):
+        first.mark_sent(make_key("evt-7", 2, REMINDER_24H))
+
+    writer.mark_sent(make_key("evt-7", 3, REMINDER_24H))
+    writer.save()
+    assert len(first.sent) == 1
+    assert len(CalendarReminderState.load(path=path).sent) == 2
+
+
+def test_state_compaction_drops_finished_instances(tmp_path):
+    path = tmp_path / "state.json"
+    now = datetime.now(UTC)
+    st = CalendarReminderState.load_for_update(path=path)
+    done = make_key("evt-5", 1, REMINDER_24H)
+    live = make_key("evt-6", 1, REMINDER_24H)
+    st.mark_sent(done, sent_at=now - timedelta(days=2), expires_at=now - timedelta(days=1))
+    st.mark_sent(live, sent_at=now, expires_at=now + timedelta(days=1))
+
+    assert st.compact(now=now) == 1
+
+    loaded = CalendarReminderState.load(path=path)
+    assert loaded.was_sent(done) is False
+    assert loaded.was_sent(live) is True
@@ -42,6 +42,11 @@ class _FakeResponse:
     text = "not found"
 
 
+@pytest.fixture(autouse=True)
+def fresh_dm_engine(monkeypatch):
+    monkeypatch.setattr(mod, "_dm_engine", None)
+
+
 @pytest.fixture
 def fixed_now(monkeypatch):
     now = datetime(2026, 3, 9, 12, 0, tzinfo=UTC)
@@ -184,3 +189,72 @@ async def test_dispatch_failure_reason_buckets(monkeypatch, fixed_now, tmp_path)
     out = await mod.dispatch_due_calendar_reminders(bot)
     assert out.failures == 1
     assert out.failed_not_found == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatch_skips_recently_undeliverable_user(monkeypatch, fixed_now, tmp_path):
+    start = fixed_now + timedelta(hours=24)
+    cache_state = {"ok": True, "events": [_event("evt-4", "raid", start)]}
+
+    monkeypatch.setattr(mod, "EVENT_CALENDAR_REMINDERS_DRY_RUN", False)
+    monkeypatch.setattr(mod, "load_runtime_cache", lambda: cache_state)
+    monkeypatch.setattr(mod, "filter_events", lambda events, **_k: events)
+    monkeypatch.setattr(mod, "list_event_types", lambda _c: ["raid"])
+    monkeypatch.setattr(
+        mod,
+        "load_all_user_prefs",
+        lambda: {"123": {"enabled": True, "by_event_type": {"raid": ["24h"]}}},
+    )
+
+    from event_calendar import reminder_state as rs_mod
+
+    monkeypatch.setattr(rs_mod, "DEFAULT_REMINDER_STATE_PATH", tmp_path / "state.json")
+
+    bot = _FakeBot(fetch_user_exc=discord.NotFound(response=_FakeResponse(), message="x"))
+    first = await mod.dispatch_due_calendar_reminders(bot)
+    second = await mod.dispatch_due_calendar_reminders(bot)
+
+    assert first.failed_not_found == 1
+    assert second.failures == 0
+    assert second.attempted == 0
+    assert second.skipped_undeliverable == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatch_counts_a_failed_dm_build_and_keeps_going(monkeypatch, fixed_now, tmp_path):
+    start = fixed_now + timedelta(hours=24)
+    cache_state = {
+        "ok": True,
+        "events": [_event("evt-bad", "raid", start), _event("evt-good", "raid", start)],
+    }
+
+    monkeypatch.setattr(mod, "EVENT_CALENDAR_REMINDERS_DRY_RUN", False)
+    monkeypatch.setattr(mod, "load_runtime_cache", lambda: cache_state)
+    monkeypatch.setattr(mod, "filter_events", lambda events, **_k: events)
+    monkeypatch.setattr(mod, "list_event_types", lambda _c: ["raid"])
+    monkeypatch.setattr(
+        mod,
+        "load_all_user_prefs",
+        lambda: {"123": {"enabled": True, "by_event_type": {"raid": ["24h"]}}},
+    )
+    real_build = mod.build_reminder_dm_embed
+
+    def build_embed(*, event, reminder_type):
+        if event["instance_id"] == "evt-bad":
+            raise ValueError("bad event row")
+        return real_build(event=event, reminder_type=reminder_type)
+
+    monkeypatch.setattr(mod, "build_reminder_dm_embed", build_embed)
+
+    from event_calendar import reminder_state as rs_mod
+
+    monkeypatch.setattr(rs_mod, "DEFAULT_REMINDER_STATE_PATH", tmp_path / "state.json")
+
+    user = _FakeUser()
+    out = await mod.dispatch_due_calendar_reminders(_FakeBot(user=user))
+
+    assert out.sent == 1
+    assert out.failures == 1
+    assert out.failed_unknown == 1
+    assert out.attempted == 2
+    assert len(user.sent) == 1
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import pytest
+
+from voting.card_refresh import CardRefreshCoordinator
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+@dataclass(frozen=True)
+class _Snap:
+    total_votes: int
+    updated_at_utc: datetime
+
+
+def _snap(total: int, second: int = 0) -> _Snap:
+    return _Snap(total, datetime(2026, 7, 1, 12, 0, second, tzinfo=UTC))
+
+
+@pytest.mark.asyncio
+async def test_burst_collapses_to_leading_and_trailing_edit_of_latest_snapshot():
+    coordinator = CardRefreshCoordinator("test", window_seconds=0.05)
+    edited: list[int] = []
+    latest = {"snap": _snap(1)}
+
+    async def edit(snapshot):
+        edited.append(snapshot.total_votes)
+        return True
+
+    async def load_latest():
+        return latest["snap"]
+
+    for total in range(1, 21):
+        latest["snap"] = _snap(total)
+        await coordinator.request(7, latest["snap"], edit=edit, load_latest=load_latest)
+    await coordinator.drain()
+
+    assert edited == [1, 20]
+    assert coordinator.coalesced == 19
+
+
+@pytest.mark.asyncio
+async def test_unchanged_tally_skips_edit_even_when_updated_at_moves():
+    coordinator = CardRefreshCoordinator("test", window_seconds=0.01)
+    edited: list[int] = []
+
+    async def edit(snapshot):
+        edited.append(snapshot.total_votes)
+        return True
+
+    async def load_latest():
+        return _snap(3, second=30)
+
+    await coordinator.request(7, _snap(3), edit=edit, load_latest=load_latest)
+    await asyncio.sleep(0.02)
+    await coordinator.request(7, _snap(3, second=10), edit=edit, load_latest=load_latest)
+
+    assert edited == [3]
+    assert coordinator.skipped_unchanged == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_edit_is_retried_by_trailing_refresh():
+    coordinator = CardRefreshCoordinator("test", window_seconds=0.01)
+    results = iter([False, True])
+    edited: list[int] = []
+
+    async def edit(snapshot):
+        edited.append(snapshot.total_votes)
+        return next(results)
+
+    async def load_latest():
+        return _snap(2)
+
+    await coordinator.request(7, _snap(1), edit=edit, load_latest=load_latest)
+    await coordinator.request(7, _snap(2), edit=edit, load_latest=load_latest)
+    await coordinator.drain()
+
+    assert edited == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_zero_window_edits_every_request():
+    coordinator = CardRefreshCoordinator("test", window_seconds=0)
+    edited: list[int] = []
+
+    async def edit(snapshot):
+        edited.append(snapshot.total_votes)
+        return True
+
+    async def load_latest():
+        raise AssertionError("zero window never reloads")
+
+    for total in (1, 1, 2):
+        await coordinator.request(7, _snap(total), edit=edit, load_latest=load_latest)
+
+    assert edited == [1, 1, 2]
+
+
+@dataclass(frozen=True)
+class _StatusSnap:
+    total_votes: int
+    status: str
+    updated_at_utc: datetime | None = None
+
+
+@pytest.mark.asyncio
+async def test_trailing_refresh_does_not_overwrite_closed_card():
+    coordinator = CardRefreshCoordinator("test", window_seconds=0.01)
+    edited: list[str] = []
+    latest = {"snap": _StatusSnap(1, "Open")}
+
+    async def edit(snapshot):
+        edited.append(snapshot.status)
+        return True
+
+    async def load_latest():
+        return latest["snap"]
+
+    await coordinator.request(7, _StatusSnap(1, "Open"), edit=edit, load_latest=load_latest)
+    await coordinator.request(7, _StatusSnap(2, "Open"), edit=edit, load_latest=load_latest)
+    latest["snap"] = _StatusSnap(2, "Closed")
+    await coordinator.drain()
+
+    assert edited == ["Open"]
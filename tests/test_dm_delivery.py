@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+
+import discord
+import pytest
+
+from core import dm_delivery as mod
+from core.dm_delivery import DmDeliveryEngine, DmRequest
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+class _Response:
+    def __init__(self, status: int, reason: str = "err", headers: dict | None = None):
+        self.status = status
+        self.reason = reason
+        self.headers = headers or {}
+
+
+class _User:
+    def __init__(self, user_id: int, failures: list[Exception] | None = None):
+        self.id = user_id
+        self.failures = list(failures or [])
+        self.sent: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send(self, content=None, embed=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.failures:
+                raise self.failures.pop(0)
+            self.sent.append({"content": content, "embed": embed})
+        finally:
+            self.in_flight -= 1
+
+
+class _Bot:
+    def __init__(self, users: dict[int, object]):
+        self.users = users
+        self.fetches: list[int] = []
+
+    def get_user(self, user_id: int):
+        user = self.users.get(user_id)
+        return None if isinstance(user, Exception) else user
+
+    async def fetch_user(self, user_id: int):
+        self.fetches.append(user_id)
+        user = self.users.get(user_id)
+        if isinstance(user, Exception):
+            raise user
+        return user
+
+
+@pytest.fixture(autouse=True)
+def no_backoff_sleep(monkeypatch):
+    monkeypatch.setattr(mod.random, "uniform", lambda _a, _b: 0.0)
+
+
+@pytest.mark.asyncio
+async def test_deliver_runs_sends_concurrently_and_keeps_order():
+    shared = _User(1)
+    bot = _Bot({1: shared})
+    engine = DmDeliveryEngine("test", concurrency=4, backoff_base_seconds=0.0)
+
+    report = await engine.deliver(
+        bot, [DmRequest(user_id=1, content=f"m{i}", tag=i) for i in range(8)]
+    )
+
+    assert [result.request.tag for result in report.results] == list(range(8))
+    assert report.count(mod.STATUS_SENT) == 8
+    assert 1 < shared.max_in_flight <= 4
+    assert report.elapsed_ms > 0
+    assert report.latency_percentile_ms(95) >= report.latency_percentile_ms(50) > 0
+
+
+@pytest.mark.asyncio
+async def test_deliver_retries_rate_limited_and_server_errors():
+    user = _User(
+        1,
+        failures=[
+            discord.HTTPException(_Response(429, headers={"Retry-After": "0"}), "slow down"),
+            discord.HTTPException(_Response(503), "unavailable"),
+        ],
+    )
+    engine = DmDeliveryEngine("test", max_attempts=3, backoff_base_seconds=0.0)
+
+    result = await engine.deliver_one(_Bot({1: user}), DmRequest(user_id=1, content="hi"))
+
+    assert result.ok
+    assert result.attempts == 3
+    assert len(user.sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_deliver_falls_back_to_plain_content_when_embed_rejected():
+    user = _User(1, failures=[discord.HTTPException(_Response(400), "bad embed")])
+    engine = DmDeliveryEngine("test")
+
+    result = await engine.deliver_one(
+        _Bot({1: user}), DmRequest(user_id=1, content="hi", embed=discord.Embed(title="x"))
+    )
+
+    assert result.ok
+    assert user.sent == [{"content": "hi", "embed": None}]
+
+
+@pytest.mark.asyncio
+async def test_permanent_failures_are_suppressed_on_later_batches():
+    forbidden = _User(2, failures=[discord.Forbidden(_Response(403), "closed dms")])
+    bot = _Bot({1: discord.NotFound(_Response(404), "unknown user"), 2: forbidden})
+    engine = DmDeliveryEngine("test")
+    requests = [DmRequest(user_id=1, content="a"), DmRequest(user_id=2, content="b")]
+
+    first = await engine.deliver(bot, requests)
+    second = await engine.deliver(bot, requests)
+
+    assert [r.status for r in first.results] == [mod.STATUS_NOT_FOUND, mod.STATUS_FORBIDDEN]
+    assert [r.status for r in second.results] == [mod.STATUS_SUPPRESSED] * 2
+    assert bot.fetches == [1]
+    assert engine.suppressed_count() == 2
+
+    engine.clear_suppression(2)
+    assert not engine.is_suppressed(2)
+
+
+@pytest.mark.asyncio
+async def test_suppression_is_scoped_to_the_failed_request():
+    user = _User(1, failures=[discord.Forbidden(_Response(403), "closed dms")])
+    engine = DmDeliveryEngine("test")
+    failed = DmRequest(user_id=1, content="a", suppress_key="evt-1")
+    other = DmRequest(user_id=1, content="b", suppress_key="evt-2")
+
+    first = await engine.deliver(_Bot({1: user}), [failed])
+    second = await engine.deliver(_Bot({1: user}), [failed, other])
+
+    assert first.results[0].status == mod.STATUS_FORBIDDEN
+    assert [r.status for r in second.results] == [mod.STATUS_SUPPRESSED, mod.STATUS_SENT]
+    assert engine.is_suppressed(1, "evt-1")
+    assert not engine.is_suppressed(1, "evt-2")
+    assert not engine.is_suppressed(1)
+
+
+@pytest.mark.asyncio
+async def test_expired_suppressions_are_pruned_on_the_next_batch():
+    user = _User(1, failures=[discord.Forbidden(_Response(403), "closed dms")])
+    engine = DmDeliveryEngine("test", suppress_seconds=0.01)
+
+    await engine.deliver(_Bot({1: user}), [DmRequest(user_id=1, content="a", suppress_key="k")])
+    await asyncio.sleep(0.02)
+    retry = await engine.deliver(_Bot({1: user}), [])
+
+    assert retry.results == []
+    assert engine._suppressed == {}
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+import event_scheduler as scheduler
+
+
+def _not_found() -> discord.NotFound:
+    return discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown User")
+
+
+@pytest.mark.asyncio
+async def test_scheduler_resolves_each_subscriber_once_and_saves_once(monkeypatch) -> None:
+    now = datetime(2026, 7, 15, 12, 0, tzinfo=UTC)
+    events = [
+        {
+            "name": f"Ruins {index}",
+            "type": "ruins",
+            "start_time": now + timedelta(hours=index),
+            "end_time": now + timedelta(hours=index, minutes=30),
+        }
+        for index in (1, 2, 3)
+    ]
+    fetched: list[int] = []
+    saves: list[dict] = []
+    captured: list[tuple[int, dict]] = []
+
+    class FakeBot:
+        def get_user(self, user_id: int):
+            return SimpleNamespace(id=user_id) if user_id == 41 else None
+
+        async def fetch_user(self, user_id: int):
+            fetched.append(user_id)
+            if user_id == 43:
+                raise _not_found()
+            return SimpleNamespace(id=user_id)
+
+    async def no_op_async(*_args, **_kwargs):
+        return None
+
+    async def capture_save(**kwargs):
+        saves.append(kwargs)
+
+    def capture_task(user_id, task, *, meta):
+        captured.append((user_id, meta))
+        task.cancel()
+
+    config = {"subscriptions": ["ruins"], "reminder_times": ["now", "1h"]}
+    monkeypatch.setattr(scheduler, "load_dm_sent_tracker_async", no_op_async)
+    monkeypatch.setattr(scheduler, "load_dm_scheduled_tracker_async", no_op_async)
+    monkeypatch.setattr(scheduler, "rehydrate_dm_scheduled_tasks", no_op_async)
+    monkeypatch.setattr(scheduler, "cleanup_dm_scheduled_tracker_async", no_op_async)
+    monkeypatch.setattr(scheduler, "cleanup_dm_sent_tracker_async", no_op_async)
+    monkeypatch.setattr(scheduler, "_save_trackers_coalesced_async", capture_save)
+    monkeypatch.setattr(scheduler, "REMINDER_WINDOWS", ())
+    monkeypatch.setattr(scheduler, "get_all_upcoming_events", lambda: events)
+    monkeypatch.setattr(
+        scheduler, "get_all_subscribers", lambda: {"41": config, "42": config, "43": config}
+    )
+    monkeypatch.setattr(scheduler, "utcnow", lambda: now)
+    monkeypatch.setattr(scheduler, "register_user_task", capture_task)
+    monkeypatch.setattr(scheduler, "dm_sent_tracker", {})
+    monkeypatch.setattr(scheduler, "dm_scheduled_tracker", {})
+    monkeypatch.setattr(scheduler, "_subscriber_user_cache", {})
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(
+            scheduler.schedule_event_reminders(FakeBot(), notify_channel_id=1),
+            timeout=0.05,
+        )
+
+    assert fetched == [42, 43]
+    assert saves == [{"scheduled": True}]
+    assert {user_id for user_id, _meta in captured} == {41, 42}
+    assert len(captured) == 12
+    assert scheduler._subscriber_user_cache["43"][1] is None
+
+
+@pytest.mark.asyncio
+async def test_resolve_subscriber_user_uses_negative_cache(monkeypatch) -> None:
+    calls: list[int] = []
+
+    class FakeBot:
+        async def fetch_user(self, user_id: int):
+            calls.append(user_id)
+            raise _not_found()
+
+    monkeypatch.setattr(scheduler, "_subscriber_user_cache", {})
+
+    assert await scheduler._resolve_subscriber_user(FakeBot(), "7") is None
+    assert await scheduler._resolve_subscriber_user(FakeBot(), "7") is None
+    assert calls == [7]
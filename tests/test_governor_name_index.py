@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from governor_name_index import GovernorNameIndex, NameIndexSlot
+import profile_cache
+import target_utils
+
+
+def _norm(value: str) -> str:
+    return value.strip().lower()
+
+
+def _synthetic_names(count: int) -> list[tuple[str, int, None]]:
+    syllables = ("ka", "ro", "mi", "zen", "tor", "vel", "ash", "qu", "lin", "dra")
+    out = []
+    for i in range(count):
+        parts = [syllables[(i // 10**p) % 10] for p in range(5)]
+        out.append(("".join(parts), 1000 + i, None))
+    return out
+
+
+def test_index_keeps_duplicate_names_and_numeric_ids():
+    index = GovernorNameIndex(
+        [("Ada", 1, "a"), ("ADA", 2, "b"), ("Grace", 3, "c"), ("", 4, "skip")],
+        normalize=_norm,
+    )
+
+    assert index.norms == ("ada", "grace")
+    assert [e.governor_id for e in index.entries_for("ada")] == ["1", "2"]
+    assert index.first_for("ada").payload == "a"
+    assert [e.payload for e in index.by_governor_id(3)] == ["c"]
+    assert index.by_governor_id("4") == ()
+
+
+def test_prefix_uses_sorted_names_and_respects_limit():
+    index = GovernorNameIndex(
+        [("Zed", 1, None), ("Alpha", 2, None), ("Alpine", 3, None), ("Alps", 4, None)],
+        normalize=_norm,
+    )
+
+    assert index.prefix("alp", 10) == ["alpha", "alpine", "alps"]
+    assert index.prefix("alp", 2) == ["alpha", "alpine"]
+    assert index.prefix("q", 10) == []
+
+
+def test_shortlist_is_bounded_and_keeps_fuzzy_and_prefix_hits():
+    items = _synthetic_names(20_000)
+    items.append(("Lord Vader", 99, None))
+    index = GovernorNameIndex(items, normalize=_norm)
+
+    shortlist = index.shortlist("lord vadr", size=64)
+    assert len(shortlist) <= 64 + 64
+    assert "lord vader" in shortlist
+
+    prefix_only = index.shortlist("karo", size=8)
+    assert set(index.prefix("karo", 8)) <= set(prefix_only)
+
+
+def test_small_index_shortlist_returns_every_name_in_order():
+    index = GovernorNameIndex([("b", 1, None), ("a", 2, None)], normalize=_norm)
+    assert index.shortlist("zzz") == ["b", "a"]
+
+
+def test_slot_rebuilds_only_when_source_or_version_changes():
+    slot = NameIndexSlot("test", normalize=_norm)
+    builds: list[int] = []
+    rows = [("Ada", 1, None)]
+
+    def items():
+        builds.append(1)
+        return rows
+
+    first = slot.get(rows, items)
+    assert slot.get(rows, items) is first
+    assert len(builds) == 1
+
+    bumped = slot.get(rows, items, version=1)
+    assert bumped is not first
+    new_rows = [("Grace", 2, None)]
+    assert slot.get(new_rows, lambda: new_rows, version=1).norms == ("grace",)
+    assert len(builds) == 2
+
+
+def test_target_utils_lookup_and_autocomplete_use_rows_index(monkeypatch):
+    monkeypatch.setitem(
+        target_utils._name_cache,
+        "rows",
+        [
+            {"GovernorID": "11", "GovernorName": "Ada"},
+            {"GovernorID": "12", "GovernorName": "ada"},
+            {"GovernorID": "13", "GovernorName": "Adamant"},
+        ],
+    )
+    monkeypatch.setitem(target_utils._name_cache, "last_updated", 10**12)
+
+    found = asyncio.run(target_utils.lookup_governor_id("ADA"))
+    assert found == {"status": "found", "data": {"GovernorName": "Ada", "GovernorID": "11"}}
+    assert asyncio.run(target_utils.lookup_governor_row_by_id("12"))["GovernorName"] == "ada"
+
+    class _Ctx:
+        value = "ad"
+
+    choices = asyncio.run(target_utils.autocomplete_governor_names(_Ctx()))
+    assert [c.value for c in choices] == ["11", "13"]
+
+
+@pytest.fixture
+def profile_players(monkeypatch):
+    players = {
+        "1": {"GovernorID": 1, "GovernorName": "Night Owl"},
+        "2": {"GovernorID": 2, "GovernorName": "Night Owl"},
+        "3": {"GovernorID": 3, "GovernorName": "Owl King"},
+    }
+    monkeypatch.setattr(profile_cache, "_cache", players)
+    monkeypatch.setattr(profile_cache, "warm_cache", lambda force=False: None)
+    return players
+
+
+def test_profile_search_keeps_duplicate_names(profile_players):
+    results = profile_cache.search_by_governor_name("night owl")
+    assert {(name, gid) for name, gid, _score in results[:2]} == {
+        ("Night Owl", 1),
+        ("Night Owl", 2),
+    }
+
+
+def test_profile_index_rebuilds_after_invalidate(profile_players, monkeypatch):
+    assert len(profile_cache.search_by_governor_name("owl king")) >= 1
+    profile_cache.invalidate_one(3)
+    assert all(gid != 3 for _n, gid, _s in profile_cache.search_by_governor_name("owl king"))
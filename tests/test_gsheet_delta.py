@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pandas as pd
+
+import gsheet_delta
+from gsheet_delta import grid_fingerprint, plan_sheet_delta, sort_frame_like_sheet
+
+HEADER = ["GovernorID", "Name", "DKP"]
+
+
+def _grid(*rows):
+    return [HEADER, *[list(r) for r in rows]]
+
+
+def test_first_export_and_header_change_are_full_rewrites():
+    grid = _grid((1, "Ada", 10))
+    assert plan_sheet_delta(grid, None).mode == "full"
+
+    previous = grid_fingerprint(grid)
+    renamed = [["GovernorID", "Name", "DKP Score"], [1, "Ada", 10]]
+    assert plan_sheet_delta(renamed, previous).reason == "header changed"
+    assert plan_sheet_delta(grid, previous, force_full=True).reason == "forced"
+
+
+def test_unchanged_grid_is_noop_and_expired_fingerprint_rewrites():
+    grid = _grid((1, "Ada", 10), (2, "Bo", 5))
+    previous = grid_fingerprint(grid, written_at=1000.0)
+
+    assert plan_sheet_delta(grid, previous, now=1000.0 + 60).mode == "noop"
+    expired = plan_sheet_delta(grid, previous, max_age_hours=1, now=1000.0 + 7200)
+    assert expired.reason == "fingerprint expired"
+
+
+def test_changed_rows_become_merged_ranges():
+    old = _grid(*[(i, f"g{i}", i) for i in range(20)])
+    new = [row[:] for row in old]
+    new[1 + 2][2] = 99
+    new[1 + 4][2] = 98
+    new[1 + 15][2] = 97
+
+    plan = plan_sheet_delta(new, grid_fingerprint(old), merge_gap=2)
+
+    assert plan.mode == "delta"
+    assert plan.changed_rows == 3
+    ranges = plan.value_ranges("KVK Tab")
+    assert [r["range"] for r in ranges] == ["'KVK Tab'!A4:C6", "'KVK Tab'!A17:C17"]
+    assert ranges[0]["values"][0] == [2, "g2", 99]
+    assert plan.summary()["cells"] == 4 * 3
+
+
+def test_grown_and_shrunk_grids_append_and_blank_rows():
+    old = _grid((1, "a", 1), (2, "b", 2), (3, "c", 3))
+
+    shrunk = plan_sheet_delta(_grid((1, "a", 1)), grid_fingerprint(old), merge_gap=0)
+    assert shrunk.removed_rows == 2
+    assert shrunk.value_ranges("T") == [{"range": "'T'!A3:C4", "values": [["", "", ""]] * 2}]
+
+    grown = plan_sheet_delta(
+        _grid((1, "a", 1), (2, "b", 2), (3, "c", 3), (4, "d", 4)), grid_fingerprint(old)
+    )
+    assert grown.appended_rows == 1 and grown.changed_rows == 0
+    assert grown.value_ranges("T")[0]["range"] == "'T'!A5:C5"
+
+
+def test_column_letters_cover_wide_tabs():
+    assert gsheet_delta.column_letter(1) == "A"
+    assert gsheet_delta.column_letter(26) == "Z"
+    assert gsheet_delta.column_letter(27) == "AA"
+    assert gsheet_delta.column_letter(703) == "AAA"
+
+
+def test_fingerprints_round_trip_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(gsheet_delta, "FINGERPRINT_DIR", tmp_path)
+    fingerprint = grid_fingerprint(_grid((1, "Ada", 10)))
+    key = gsheet_delta.fingerprint_key("sheet/id", 7)
+
+    gsheet_delta.save_fingerprint(key, fingerprint)
+    assert gsheet_delta.load_fingerprint(key) == fingerprint
+
+    gsheet_delta.forget_fingerprint(key)
+    assert gsheet_delta.load_fingerprint(key) is None
+
+
+def test_local_sort_matches_sheet_order():
+    df = pd.DataFrame(
+        {
+            "last_scan_id": [2, 1, 1, 2],
+            "name": ["b", "a", "C", "d"],
+            "dkp": [5.0, None, 7.0, 9.0],
+        }
+    )
+
+    by_dkp = sort_frame_like_sheet(df, [(2, "DESCENDING")])
+    assert by_dkp["name"].tolist() == ["d", "C", "b", "a"]
+
+    multi = sort_frame_like_sheet(df, [(0, "ASCENDING"), (2, "DESCENDING")])
+    assert multi["name"].tolist() == ["C", "a", "d", "b"]
+
+    by_name = sort_frame_like_sheet(df, [(1, "ASCENDING")])
+    assert by_name["name"].tolist() == ["a", "b", "C", "d"]
@@ -301,3 +301,135 @@ def test_create_additional_kvk_spreadsheets_accepts_named_export_sections(monkey
     assert result["KVK_PASS4_ALL_PLAYER_OUTPUT"]["created"] is True
     assert "PASS4_PLAYER" in written_tabs
     assert "KVK_Scan_Log" in written_tabs
+
+
+class _FakeWorksheet:
+    def __init__(self):
+        self.id = 5
+        self.title = "KVK"
+        self.row_count = 3
+        self.spreadsheet = types.SimpleNamespace(id="ss-1", title="KVK LIST")
+        self.calls = []
+
+    def clear(self):
+        self.calls.append(("clear",))
+
+    def update(self, values, value_input_option=None):
+        self.calls.append(("update", len(values)))
+        self.row_count = max(self.row_count, len(values))
+
+    def batch_update(self, data, value_input_option=None):
+        self.calls.append(("batch_update", [d["range"] for d in data]))
+
+    def add_rows(self, n):
+        self.calls.append(("add_rows", n))
+        self.row_count += n
+
+
+def test_export_dataframe_to_sheet_writes_only_changed_rows(monkeypatch, tmp_path):
+    import gsheet_delta
+
+    monkeypatch.setenv("GSHEET_DELTA_SYNC", "1")
+    monkeypatch.setenv("GSHEET_FORCE_FULL_REWRITE", "0")
+    monkeypatch.setattr(gsheet_delta, "FINGERPRINT_DIR", tmp_path)
+    monkeypatch.setattr(gm, "_retry_gspread_call", lambda fn, **_kwargs: fn())
+    monkeypatch.setattr(gm.time, "sleep", lambda *_args: None)
+    ws = _FakeWorksheet()
+    df = pd.DataFrame({"GovernorID": [1, 2], "Name": ["Ada", "Bo"]})
+
+    assert gm.export_dataframe_to_sheet(ws, df).mode == "full"
+    assert ws.calls == [("clear",), ("update", 3)]
+
+    ws.calls.clear()
+    assert gm.export_dataframe_to_sheet(ws, df).mode == "noop"
+    assert ws.calls == []
+
+    changed = pd.DataFrame({"GovernorID": [1, 2, 3], "Name": ["Ada", "Bob", "Cy"]})
+    report = gm.export_dataframe_to_sheet(ws, changed, dry_run=True)
+    assert report.summary()["changed_rows"] == 1 and ws.calls == []
+
+    plan = gm.export_dataframe_to_sheet(ws, changed)
+    assert plan.mode == "delta"
+    assert ws.calls == [("add_rows", 1), ("batch_update", ["'KVK'!A3:B4"])]
+
+    ws.calls.clear()
+    gm.export_dataframe_to_sheet(ws, changed, force_full=True)
+    assert ws.calls[0] == ("clear",)
+
+
+def test_transfer_and_sort_dry_run_never_creates_missing_tab(monkeypatch):
+    import gspread
+
+    monkeypatch.setattr(gm, "_retry_gspread_call", lambda fn, **_kwargs: fn())
+
+    class _NoTabs(_FakeSpreadsheet):
+        def worksheet(self, title):
+            raise gspread.WorksheetNotFound(title)
+
+        def add_worksheet(self, **_kwargs):
+            raise AssertionError("dry run must not create worksheets")
+
+    client = types.SimpleNamespace(open=lambda _name: _NoTabs())
+    df = pd.DataFrame({"GovernorID": [1, 2, 3], "Name": ["Ada", "Bo", "Cy"]})
+
+    plan = gm.transfer_and_sort(
+        None, client, None, "SELECT 1", "KVK LIST", "NEW_TAB", dry_run=True, df=df
+    )
+
+    assert (plan.mode, plan.reason, plan.total_rows, plan.n_cols) == ("full", "tab missing", 3, 2)
+
+
+def test_run_all_exports_loads_queries_per_job_and_retries_per_job(monkeypatch, tmp_path):
+    import json
+
+    config = tmp_path / "exports.json"
+    config.write_text(
+        json.dumps(
+            [
+                {"query": "SELECT 1", "sheet": "A", "tab": "one"},
+                {"query": "SELECT 2", "sheet": "B", "tab": "two"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(gm, "CONFIG_FILE", str(config))
+    monkeypatch.setattr(gm, "get_sql_engine", lambda *_args: "engine")
+    monkeypatch.setattr(gm, "get_gsheet_client", lambda _creds: "client")
+    monkeypatch.setattr(gm, "get_sort_service", lambda _creds: "service")
+    monkeypatch.setattr(gm, "_full_jitter_sleep", lambda *_args: 0.0)
+    queries = []
+    monkeypatch.setattr(
+        gm.pd, "read_sql", lambda query, _engine: queries.append(query) or pd.DataFrame({"q": [1]})
+    )
+
+    attempts = {"A": 0, "B": 0}
+
+    def fake_transfer(_engine, _client, _service, *, sheet_name, df=None, **_kwargs):
+        assert df is not None  # the scheduler loaded the job's frame before the write
+        attempts[sheet_name] += 1
+        if sheet_name == "B" and attempts["B"] == 1:
+            raise RuntimeError("503 unavailable")
+
+    monkeypatch.setattr(gm, "transfer_and_sort", fake_transfer)
+
+    ok, log = gm.run_all_exports("srv", "db", "user", "pw", credentials_file="creds.json")
+
+    assert ok is True
+    # A retried job re-runs its query instead of holding its frame while it waits.
+    assert sorted(queries) == ["SELECT 1", "SELECT 2", "SELECT 2"]
+    assert attempts == {"A": 1, "B": 2}
+    assert "[OK] A > one" in log
+    assert "[OK] B > two" in log
+    assert "[⚠️ RETRY 1] B > two" in log
+
+
+def test_safe_execute_takes_tokens_from_the_callers_quota(monkeypatch):
+    kinds = []
+    monkeypatch.setattr(gm, "throttle", lambda kind: kinds.append(kind) or 0.0)
+    req = types.SimpleNamespace(execute=lambda num_retries=0: {"ok": True})
+
+    gm._safe_execute(req, quota="read")
+    gm._safe_execute(req, quota=None)
+    gm._safe_execute(req)
+
+    assert kinds == ["read", None, "write"]
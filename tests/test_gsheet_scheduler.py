@@ -0,0 +1,183 @@
+import threading
+import time
+
+import pytest
+
+import gsheet_scheduler as gs
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.slept: list[float] = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_paces_to_rate():
+    clock = _FakeClock()
+    bucket = gs.TokenBucket("write", 60, 3, clock=clock, sleep=clock.sleep)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(1.0)
+    assert bucket.acquire() == pytest.approx(1.0)
+    assert clock.slept == pytest.approx([1.0, 1.0])
+    assert bucket.stats()["waits"] == 2
+
+
+def test_token_bucket_defer_blocks_every_caller():
+    clock = _FakeClock()
+    bucket = gs.TokenBucket("write", 60, 10, clock=clock, sleep=clock.sleep)
+
+    bucket.defer(7.5)
+
+    assert bucket.acquire() == pytest.approx(7.5)
+    assert bucket.acquire() == 0.0
+    assert bucket.stats()["deferrals"] == 1
+
+
+def test_throttle_is_noop_when_rate_limit_disabled(monkeypatch):
+    monkeypatch.setenv("GSHEET_RATE_LIMIT", "0")
+
+    assert gs.throttle("write") == 0.0
+
+
+def test_run_export_jobs_runs_spreadsheets_concurrently_and_tabs_in_order():
+    barrier = threading.Barrier(2, timeout=5)
+    order: list[str] = []
+    lock = threading.Lock()
+
+    def _job(group, tab, wait=False):
+        def _run():
+            if wait:
+                # Both spreadsheets must be in flight at once to pass the barrier.
+                barrier.wait()
+            with lock:
+                order.append(f"{group}:{tab}")
+            return tab
+
+        return gs.ExportJob(name=f"{group} > {tab}", group=group, run=_run)
+
+    jobs = [
+        _job("A", "1", wait=True),
+        _job("B", "1", wait=True),
+        _job("A", "2"),
+        _job("B", "2"),
+    ]
+
+    done = gs.run_export_jobs(jobs, concurrency=2)
+
+    assert [job.status for job in done] == ["ok"] * 4
+    assert order.index("A:1") < order.index("A:2")
+    assert order.index("B:1") < order.index("B:2")
+
+
+def test_run_export_jobs_retries_after_other_tabs_of_the_spreadsheet():
+    clock = _FakeClock()
+    calls: list[str] = []
+    failures = {"n": 0}
+
+    def _flaky():
+        calls.append("flaky")
+        if failures["n"] == 0:
+            failures["n"] += 1
+            raise RuntimeError("429")
+
+    def _steady():
+        calls.append("steady")
+
+    jobs = [
+        gs.ExportJob(name="S > flaky", group="S", run=_flaky),
+        gs.ExportJob(name="S > steady", group="S", run=_steady),
+    ]
+
+    gs.run_export_jobs(
+        jobs,
+        concurrency=1,
+        retry_delay=lambda _job, _exc: 3.0,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    assert calls == ["flaky", "steady", "flaky"]
+    assert jobs[0].status == "ok"
+    assert jobs[0].attempts == 2
+    assert jobs[0].retry_wait_s == pytest.approx(3.0)
+    assert "attempts=2" in jobs[0].timing_line()
+
+
+def test_run_export_jobs_gives_up_after_max_attempts():
+    given_up: list[str] = []
+
+    def _broken():
+        raise ValueError("bad sheet")
+
+    job = gs.ExportJob(name="S > tab", group="S", run=_broken, max_attempts=3)
+
+    gs.run_export_jobs(
+        [job],
+        retry_delay=lambda _job, _exc: 0.0,
+        on_give_up=lambda j, exc: given_up.append(f"{j.name}: {exc}"),
+    )
+
+    assert job.status == "failed"
+    assert job.attempts == 3
+    assert isinstance(job.error, ValueError)
+    assert given_up == ["S > tab: bad sheet"]
+
+
+def test_load_runs_per_attempt_and_is_timed_as_sql():
+    clock = iter(range(100)).__next__
+    loads = []
+
+    def _load():
+        loads.append(1)
+        return len(loads)
+
+    seen = []
+
+    def _run(data):
+        seen.append(data)
+        if data == 1:
+            raise RuntimeError("503")
+
+    job = gs.ExportJob(name="S > tab", group="S", run=_run, load=_load)
+
+    gs.run_export_jobs(
+        [job], retry_delay=lambda _job, _exc: 0.0, clock=clock, sleep=lambda _s: None
+    )
+
+    assert job.status == "ok" and seen == [1, 2]
+    assert job.sql_s > 0 and job.run_s > 0
+    assert job.error is None
+
+
+def test_loaded_frames_are_bounded_by_concurrency():
+    live = []
+    peak = []
+    lock = threading.Lock()
+
+    class _Frame:
+        def __init__(self):
+            with lock:
+                live.append(self)
+                peak.append(len(live))
+
+    def _run(frame):
+        time.sleep(0.01)
+        with lock:
+            live.remove(frame)
+
+    jobs = [
+        gs.ExportJob(name=f"S{i} > tab", group=f"S{i}", run=_run, load=_Frame) for i in range(8)
+    ]
+
+    gs.run_export_jobs(jobs, concurrency=2)
+
+    assert all(job.status == "ok" for job in jobs)
+    assert max(peak) <= 2
@@ -2,7 +2,7 @@ import types
 
 import pandas as pd
 
-from gsheet_module import _sort_kvk_export_sheet, sort_worksheet_multi
+from gsheet_module import _presort_kvk_export, _sort_kvk_export_sheet, sort_worksheet_multi
 
 
 class DummyBatchUpdate:
@@ -44,7 +44,8 @@ def test_sort_worksheet_multi_builds_sort_specs():
     ]
 
 
-def test_sort_kvk_export_sheet_default_sort():
+def test_sort_kvk_export_sheet_default_sort(monkeypatch):
+    monkeypatch.setenv("GSHEET_DELTA_SYNC", "0")
     service = DummyService()
     df = pd.DataFrame({"DKP": [1, 2], "foo": [3, 4]})
     ws = types.SimpleNamespace(id=99)
@@ -52,3 +53,14 @@ def test_sort_kvk_export_sheet_default_sort():
     _, body = service.batch.calls[0]
     sort_specs = body["requests"][0]["sortRange"]["sortSpecs"]
     assert sort_specs == [{"dimensionIndex": 0, "sortOrder": "DESCENDING"}]
+
+
+def test_sort_kvk_export_sheet_skips_server_sort_under_delta_sync(monkeypatch):
+    monkeypatch.setenv("GSHEET_DELTA_SYNC", "1")
+    service = DummyService()
+    df = pd.DataFrame({"DKP": [1, 2], "foo": [3, 4]})
+
+    _sort_kvk_export_sheet(service, "sheetX", types.SimpleNamespace(id=99), df, "ANY", "ANY")
+
+    assert service.batch.calls == []
+    assert _presort_kvk_export(df, "ANY", "ANY")["DKP"].tolist() == [2, 1]
@@ -70,7 +70,7 @@ def _fake_df_with_columns(columns, rows):
 def test_parse_honor_xlsx_missing_columns_returns_error(monkeypatch):
     # DataFrame missing HonorPoints
     df = _fake_df_with_columns(["GovernorID", "Name"], [{"GovernorID": 1, "Name": "Alice"}])
-    monkeypatch.setattr(hi.pd, "read_excel", lambda bio, sheet_name="honor": df)
+    monkeypatch.setattr(hi, "read_xlsx_sheet", lambda content, sheet_name="honor": df)
 
     with pytest.raises(ValueError) as ei:
         hi.parse_honor_xlsx(b"dummy")
@@ -87,7 +87,7 @@ def test_parse_honor_xlsx_nan_name_becomes_empty_string(monkeypatch):
             {"GovernorID": 456, "Name": float("nan"), "Honor Points": 20},
         ],
     )
-    monkeypatch.setattr(hi.pd, "read_excel", lambda bio, sheet_name="honor": df)
+    monkeypatch.setattr(hi, "read_xlsx_sheet", lambda content, sheet_name="honor": df)
 
     result = hi.parse_honor_xlsx(b"bytes")
     assert result.shape[0] == 2
@@ -139,7 +139,7 @@ def test_ingest_honor_snapshot_rolls_back_on_failure(monkeypatch):
     df = _fake_df_with_columns(
         ["GovernorID", "Name", "Honor Points"], [{"GovernorID": 1, "Name": "A", "Honor Points": 5}]
     )
-    monkeypatch.setattr(hi.pd, "read_excel", lambda bio, sheet_name="honor": df)
+    monkeypatch.setattr(hi, "read_xlsx_sheet", lambda content, sheet_name="honor": df)
 
     # Provide deterministic _current_kvk_no and _next_scan_id so code proceeds to insert
     monkeypatch.setattr(hi, "_current_kvk_no", lambda cur: 13)
@@ -178,7 +178,7 @@ def test_ingest_honor_snapshot_success_commits_emits_telemetry(monkeypatch):
     df = _fake_df_with_columns(
         ["GovernorID", "Name", "Honor Points"], [{"GovernorID": 1, "Name": "A", "Honor Points": 5}]
     )
-    monkeypatch.setattr(hi.pd, "read_excel", lambda bio, sheet_name="honor": df)
+    monkeypatch.setattr(hi, "read_xlsx_sheet", lambda content, sheet_name="honor": df)
 
     # Provide deterministic values via monkeypatching to avoid DB queries
     monkeypatch.setattr(hi, "_current_kvk_no", lambda cur: 99)
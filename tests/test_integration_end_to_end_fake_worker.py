@@ -6,11 +6,13 @@ pytest_plugins = ("pytest_asyncio",)
 
 
 @pytest.mark.asyncio
-async def test_run_callable_subprocess_and_parse_result():
+async def test_run_callable_subprocess_and_parse_result(monkeypatch):
     """
     Run an async callable through run_callable_subprocess and assert structured output parsing.
     Uses tests.test_worker_module.async_long_sleep for a short sleep.
     """
+    # Exercise the spawned callable_worker path; tests/test_worker_pool.py covers the pool.
+    monkeypatch.setenv("MAINT_WORKER_POOL", "0")
     ok, out = await run_callable_subprocess(
         module="tests.test_worker_module",
         function="async_long_sleep",
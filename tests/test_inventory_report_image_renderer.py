@@ -4,6 +4,7 @@ from io import BytesIO
 from PIL import Image, ImageDraw
 
 from core import visual_contract, visual_text
+from core.asset_cache import get_asset_cache
 from inventory import report_image_renderer
 from inventory.models import (
     InventoryGovernorProfile,
@@ -108,6 +109,8 @@ def test_runtime_renderer_never_loads_master_backdrops(monkeypatch):
         return real_open(path, *args, **kwargs)
 
     monkeypatch.setattr(report_image_renderer.Image, "open", recording_open)
+    # Earlier renders may already hold the decoded backdrop.
+    get_asset_cache().clear()
     payload = InventoryReportPayload(
         governor_id=111,
         governor_name="Runtime Governor",
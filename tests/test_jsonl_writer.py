@@ -0,0 +1,92 @@
+import json
+import os
+import threading
+
+from core.jsonl_writer import JsonlWriter
+
+# 2026-05-08 23:59:59 UTC and one second later
+BEFORE_MIDNIGHT = 1778284799.0
+AFTER_MIDNIGHT = BEFORE_MIDNIGHT + 1
+
+
+def _lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _writer(tmp_path, **kwargs):
+    kwargs.setdefault("flush_interval", 3600)
+    kwargs.setdefault("batch_size", 1000)
+    return JsonlWriter(str(tmp_path), **kwargs)
+
+
+def test_write_only_buffers_until_flush(tmp_path):
+    writer = _writer(tmp_path)
+    try:
+        writer.write("metrics_", {"metric": "a"}, ts=BEFORE_MIDNIGHT)
+        writer.write("metrics_", {"metric": "b"}, ts=BEFORE_MIDNIGHT)
+        assert os.listdir(tmp_path) == []
+
+        assert writer.flush() == 2
+        assert _lines(tmp_path / "metrics_20260508.jsonl") == [{"metric": "a"}, {"metric": "b"}]
+        assert writer.stats()["written"] == 2
+    finally:
+        writer.close()
+
+
+def test_rotates_at_utc_day_boundary_per_stream(tmp_path):
+    writer = _writer(tmp_path)
+    try:
+        writer.write("command_usage_", {"n": 1}, ts=BEFORE_MIDNIGHT)
+        writer.write("alerts_", {"n": 2}, ts=BEFORE_MIDNIGHT)
+        writer.write("command_usage_", {"n": 3}, ts=AFTER_MIDNIGHT)
+        writer.flush()
+    finally:
+        writer.close()
+
+    assert sorted(os.listdir(tmp_path)) == [
+        "alerts_20260508.jsonl",
+        "command_usage_20260508.jsonl",
+        "command_usage_20260509.jsonl",
+    ]
+    assert _lines(tmp_path / "command_usage_20260509.jsonl") == [{"n": 3}]
+    assert writer.stats()["fsyncs"] >= 2
+
+
+def test_full_buffer_drops_oldest_and_reports(tmp_path, caplog):
+    writer = _writer(tmp_path, capacity=2)
+    try:
+        for n in range(5):
+            writer.write("metrics_", {"n": n}, ts=BEFORE_MIDNIGHT)
+        stats = writer.stats()
+        assert (stats["depth"], stats["dropped"], stats["high_water"]) == (2, 3, 2)
+
+        writer.flush()
+    finally:
+        writer.close()
+
+    assert _lines(tmp_path / "metrics_20260508.jsonl") == [{"n": 3}, {"n": 4}]
+    assert "dropped 3 record(s)" in caplog.text
+
+
+def test_background_thread_drains_after_batch_size(tmp_path):
+    writer = _writer(tmp_path, batch_size=3)
+    try:
+        for n in range(3):
+            writer.write("metrics_", {"n": n}, ts=BEFORE_MIDNIGHT)
+        for _ in range(200):
+            if writer.stats()["written"] == 3:
+                break
+            threading.Event().wait(0.01)
+        assert writer.stats()["written"] == 3
+    finally:
+        writer.close()
+
+
+def test_close_writes_pending_records_and_stringifies_non_json_values(tmp_path):
+    writer = _writer(tmp_path)
+    writer.write("metrics_", {"value": {1, 2}.__class__}, ts=BEFORE_MIDNIGHT)
+    writer.write("metrics_", {"ok": True}, ts=BEFORE_MIDNIGHT)
+    writer.close()
+
+    assert _lines(tmp_path / "metrics_20260508.jsonl") == [{"value": "<class 'set'>"}, {"ok": True}]
@@ -4,6 +4,7 @@ import datetime as dt
 from typing import Any, cast
 
 import pandas as pd
+import pytest
 
 from kvk.dal import kvk_all_import_dal as dal
 from kvk.schemas.kvk_all_schema import (
@@ -97,6 +98,100 @@ def test_rows_for_stage_uses_declared_column_order() -> None:
     assert len(row) == len(dal.STAGE_INSERT_COLUMNS)
 
 
+def test_rows_for_stage_maps_missing_values_to_none() -> None:
+    df = _prepared_frame().dataframe
+    df = pd.concat([df, df.assign(governor_id=456, name=None)], ignore_index=True)
+    df["min_dead"] = [float("nan"), 2.5]
+    df["first_updateUTC"] = pd.to_datetime(["2026-05-08 01:00", None])
+
+    rows = dal.rows_for_stage("token-1", df)
+    values = [dict(zip(["IngestToken", *dal.STAGE_COL_ORDER], r, strict=True)) for r in rows]
+
+    assert values[0]["min_dead"] is None
+    assert values[1]["min_dead"] == 2.5
+    assert values[1]["name"] is None
+    assert values[1]["first_updateUTC"] is None
+    assert type(values[1]["governor_id"]) is int
+
+
+def test_iter_stage_row_chunks_matches_rows_for_stage() -> None:
+    df = pd.concat([_prepared_frame().dataframe] * 5, ignore_index=True)
+
+    chunks = list(dal.iter_stage_row_chunks("token-1", df, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [row for chunk in chunks for row in chunk] == dal.rows_for_stage("token-1", df)
+
+
+def test_ingest_prepared_import_stages_in_chunks(monkeypatch) -> None:
+    connection = MockConnection()
+    monkeypatch.setattr(dal, "scan_ts_within_kvk_details", lambda *_args, **_kwargs: True)
+    monkeypatch.setattr(dal, "KVK_ALL_STAGE_CHUNK_ROWS", 2)
+    prepared = _prepared_frame()
+    prepared = KvkAllPreparedImport(
+        dataframe=pd.concat([prepared.dataframe] * 3, ignore_index=True),
+        sheet_name=prepared.sheet_name,
+        schema_metadata=prepared.schema_metadata,
+    )
+
+    dal.ingest_prepared_import(
+        con=connection,
+        prepared=prepared,
+        content=b"abc",
+        source_filename="kvk.xlsx",
+        uploader_id=999,
+        scan_ts_utc=dt.datetime(2026, 5, 8, 1, 0, tzinfo=dt.UTC),
+    )
+
+    stage_calls = connection.cursors[0].executemany_calls
+    assert [len(rows) for _sql, rows in stage_calls] == [2, 1]
+
+
+def test_ingest_prepared_import_parallel_stage_failure_deletes_token_rows(monkeypatch) -> None:
+    connection = MockConnection()
+    connection.rollback = lambda: None  # type: ignore[attr-defined]
+    monkeypatch.setenv("BULK_LOAD_PARALLEL", "1")
+    monkeypatch.setattr(dal, "KVK_ALL_STAGE_CHUNK_ROWS", 1)
+    monkeypatch.setattr(dal.uuid, "uuid4", lambda: "token-3")
+    prepared = _prepared_frame()
+    prepared = KvkAllPreparedImport(
+        dataframe=pd.concat([prepared.dataframe] * 4, ignore_index=True),
+        sheet_name=prepared.sheet_name,
+        schema_metadata=prepared.schema_metadata,
+    )
+    commits: list[int] = []
+
+    class WorkerConnection(MockConnection):
+        def commit(self) -> None:
+            commits.append(1)
+            if len(commits) == 3:
+                raise ValueError("disk full")
+
+        def rollback(self) -> None:
+            return None
+
+        def close(self) -> None:
+            return None
+
+    def _connect() -> MockConnection:
+        return WorkerConnection()
+
+    with pytest.raises(ValueError, match="disk full"):
+        dal.ingest_prepared_import(
+            con=connection,
+            prepared=prepared,
+            content=b"abc",
+            source_filename="kvk.xlsx",
+            uploader_id=999,
+            scan_ts_utc=dt.datetime(2026, 5, 8, 1, 0, tzinfo=dt.UTC),
+            connect=_connect,
+        )
+
+    stage_cursor = connection.cursors[0]
+    assert stage_cursor.executemany_calls == []
+    assert (dal.DELETE_STAGED_TOKEN_SQL, "token-3") in stage_cursor.executed
+
+
 def test_ingest_prepared_import_call_shape(monkeypatch) -> None:
     connection = MockConnection()
     monkeypatch.setattr(dal, "scan_ts_within_kvk_details", lambda *_args, **_kwargs: True)
@@ -5,7 +5,11 @@ from io import BytesIO
 import pandas as pd
 import pytest
 
-from kvk.schemas.kvk_all_schema import EXPECTED_FULL_DATA_COLUMNS, SCHEMA_VERSION
+from kvk.schemas.kvk_all_schema import (
+    EXPECTED_FULL_DATA_COLUMNS,
+    SCHEMA_VERSION,
+    KvkAllSchemaValidationError,
+)
 from kvk.services import kvk_all_import_service as service
 
 
@@ -97,6 +101,31 @@ def test_read_full_data_workbook_preserves_unknown_column_reporting() -> None:
     assert schema["unknown_columns"] == ["future_metric"]
 
 
+def test_read_full_data_workbook_suffixes_exact_duplicate_headers() -> None:
+    full_data = _full_data_df()
+    full_data.insert(len(full_data.columns), "future_metric", 1, allow_duplicates=True)
+    full_data.insert(len(full_data.columns), "future_metric", 2, allow_duplicates=True)
+
+    df, _sheet_name, _schema = service.read_full_data_workbook(
+        _xlsx_bytes({"Full Data": full_data}),
+        "kvk.xlsx",
+    )
+
+    assert list(df.columns[-2:]) == ["future_metric", "future_metric.1"]
+    assert df["future_metric.1"].iloc[0] == 2
+
+
+def test_read_full_data_workbook_rejects_headers_that_collide_after_normalising() -> None:
+    full_data = _full_data_df()
+    full_data[" name "] = "Shadow"
+
+    with pytest.raises(KvkAllSchemaValidationError) as exc:
+        service.read_full_data_workbook(_xlsx_bytes({"Full Data": full_data}), "kvk.xlsx")
+
+    assert exc.value.code == "duplicate_full_data_columns"
+    assert "name" in str(exc.value)
+
+
 def test_prepare_wraps_coercion_failures_with_sheet_and_schema() -> None:
     full_data = _full_data_df()
     full_data.loc[0, "governor_id"] = None
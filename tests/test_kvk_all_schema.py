@@ -248,6 +248,27 @@ def test_ingest_returns_structured_schema_error_for_missing_full_data() -> None:
     assert result["validation_error"]["code"] == "missing_full_data_sheet"
 
 
+def test_ingest_rejects_headers_that_only_differ_by_spacing() -> None:
+    # Such uploads used to import with two "name" columns; they are now a schema error.
+    full_data = _full_data_df()
+    full_data["name "] = "Shadow"
+
+    result = importer.ingest_kvk_all_excel(
+        content=_xlsx_bytes({"Full Data": full_data}),
+        source_filename="kvk.xlsx",
+        uploader_id=123,
+        scan_ts_utc=pd.Timestamp("2026-05-08T01:00:00Z").to_pydatetime(),
+        server="unused",
+        database="unused",
+        username="unused",
+        password="unused",
+    )
+
+    assert result["success"] is False
+    assert result["validation_error"]["code"] == "duplicate_full_data_columns"
+    assert result["sheet"] == "Full Data"
+
+
 def test_ingest_returns_migration_order_error_when_stage_schema_is_outdated(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
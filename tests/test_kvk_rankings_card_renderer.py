@@ -4,6 +4,7 @@ from io import BytesIO
 
 from PIL import Image
 
+from core.asset_cache import get_asset_cache
 from kvk.models.kvk_rankings import RankingPayload, RankingRow
 from kvk.rendering.kvk_rankings_card_renderer import (
     _background_path,
@@ -271,7 +272,8 @@ def test_current_rankings_overlay_is_cached():
 
 
 def test_ranking_background_cache_is_reused_without_mutation():
-    _ranking_background.cache_clear()
+    cache = get_asset_cache()
+    cache.clear()
     payload = _payload()
     background = _background_path(payload.mode)
     assert background is not None
@@ -280,11 +282,11 @@ def test_ranking_background_cache_is_reused_without_mutation():
     cached_image = _ranking_background(background)
     sampled_pixel = cached_image.getpixel((10, 10))
 
-    cached = _ranking_background.cache_info()
-    assert cached.misses == 1
+    before = cache.stats()
     assert render_current_rankings_top10_card(payload) is not None
 
-    cached = _ranking_background.cache_info()
-    assert cached.hits == 2
-    assert cached.misses == 1
+    after = cache.stats()
+    assert after["misses"] == before["misses"]
+    assert after["hits"] == before["hits"] + 1
+    assert _ranking_background(background) is cached_image
     assert cached_image.getpixel((10, 10)) == sampled_pixel
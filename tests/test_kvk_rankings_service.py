@@ -1026,3 +1026,110 @@ async def test_build_hall_of_fame_payload_fetches_dal_rows(monkeypatch):
     assert payload.metric_label == "Honor"
     assert payload.limit == 10
     assert payload.total_rows == 18
+
+
+def _snapshot_stat_cache(count: int) -> dict[str, dict]:
+    return {
+        str(index): {
+            "GovernorID": str(index),
+            "GovernorName": f"Gov {index}",
+            "Starting Power": 50_000_000 + index,
+            "T4&T5_Kills": 1_000 * (index // 2),
+            "DKP_SCORE": index,
+            "STATUS": "INCLUDED",
+        }
+        for index in range(1, count + 1)
+    }
+
+
+@pytest.mark.asyncio
+async def test_kvk_snapshot_is_reused_until_stat_cache_reloads(monkeypatch):
+    caches = [_snapshot_stat_cache(6)]
+    monkeypatch.setattr(kvk_rankings_service, "load_stat_cache", lambda: caches[-1])
+    monkeypatch.setattr(kvk_rankings_service, "_kvk_snapshot", None)
+
+    first = await kvk_rankings_service.build_kvk_rankings_payload(metric="kills", limit=10)
+    snapshot = kvk_rankings_service._kvk_snapshot
+    again = await kvk_rankings_service.build_kvk_rankings_payload(metric="kills", limit=10)
+    dkp = await kvk_rankings_service.build_kvk_rankings_payload(metric="dkp", limit=10)
+
+    assert kvk_rankings_service._kvk_snapshot is snapshot
+    assert again.rows[0] is first.rows[0]
+    assert [row.rank for row in first.rows] == [1, 2, 2, 4, 4, 6]
+    assert [row.governor_id for row in dkp.rows] == [6, 5, 4, 3, 2, 1]
+    assert dkp.rows[0].supporting_values is first.rows[0].supporting_values
+
+    caches.append(_snapshot_stat_cache(2))
+    reloaded = await kvk_rankings_service.build_kvk_rankings_payload(metric="kills", limit=10)
+
+    assert kvk_rankings_service._kvk_snapshot is not snapshot
+    assert reloaded.total_rows == 2
+
+
+@pytest.mark.asyncio
+async def test_my_rank_uses_snapshot_index_for_full_kvk_list(monkeypatch):
+    cache = _snapshot_stat_cache(5)
+    monkeypatch.setattr(kvk_rankings_service, "load_stat_cache", lambda: cache)
+    monkeypatch.setattr(kvk_rankings_service, "_kvk_snapshot", None)
+
+    async def fake_summary(user_id):
+        return governor_account_service.summarize_accounts(
+            {"Main": {"GovernorID": "3", "GovernorName": "Gov 3"}}
+        )
+
+    monkeypatch.setattr(
+        kvk_rankings_service.governor_account_service,
+        "get_account_summary_for_user",
+        fake_summary,
+    )
+
+    result = await kvk_rankings_service.build_my_rank_lookup_result(
+        discord_user_id=42, mode="kvk", metric="dkp"
+    )
+    index = kvk_rankings_service._kvk_snapshot.cached_index("dkp")
+
+    assert index is not None and index.covers(result.payload.rows)
+    assert result.status == "found"
+    assert result.row.rank == 3
+    assert result.row_above.governor_id == 4
+    assert result.row_below.governor_id == 2
+    assert result.gap_to_next_value == 1
+
+
+def test_honor_rankings_reuse_index_for_same_scan(monkeypatch):
+    monkeypatch.setattr(kvk_rankings_service, "_source_indexes", {})
+    rows = [
+        {"KVK_NO": 17, "ScanID": 4, "GovernorID": index, "HonorPoints": 100 - index}
+        for index in range(1, 4)
+    ]
+
+    first = kvk_rankings_service.build_honor_rankings_payload_from_rows(rows, include_all=True)
+    second = kvk_rankings_service.build_honor_rankings_payload_from_rows(
+        [dict(row) for row in rows], limit=10
+    )
+    next_scan = kvk_rankings_service.build_honor_rankings_payload_from_rows(
+        [{**row, "ScanID": 5} for row in rows], include_all=True
+    )
+
+    assert second.rows[0] is first.rows[0]
+    assert next_scan.rows[0] is not first.rows[0]
+    assert [row.rank for row in next_scan.rows] == [1, 2, 3]
+
+
+def test_honor_rankings_rebuild_when_same_scan_is_corrected(monkeypatch):
+    monkeypatch.setattr(kvk_rankings_service, "_source_indexes", {})
+    rows = [
+        {"KVK_NO": 17, "ScanID": 4, "GovernorID": index, "HonorPoints": 100 - index}
+        for index in range(1, 4)
+    ]
+    corrected = [dict(row) for row in rows]
+    corrected[2]["HonorPoints"] = 500
+
+    before = kvk_rankings_service.build_honor_rankings_payload_from_rows(rows, include_all=True)
+    after = kvk_rankings_service.build_honor_rankings_payload_from_rows(
+        sorted(corrected, key=lambda row: -row["HonorPoints"]), include_all=True
+    )
+
+    assert before.rows[0].governor_id == 1
+    assert after.rows[0].governor_id == 3
+    assert after.rows[0].value == 500
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import datetime as dt
 from types import SimpleNamespace
 
+import pytest
+
 import kvk_state
 from kvk_state import is_scan_within_open_window, resolve_kvk_scan_state
 import stats_alerts.kvk_meta as kvk_meta
 
 
+@pytest.fixture(autouse=True)
+def _fresh_kvk_context():
+    kvk_state.invalidate_kvk_context("test")
+    yield
+    kvk_state.invalidate_kvk_context("test")
+
+
 def test_open_ended_fighting_window_is_active() -> None:
     state, reason = resolve_kvk_scan_state(
         pass4_start_scan=866,
@@ -176,3 +186,115 @@ def test_stats_alerts_currently_kvk_uses_fallback_window(monkeypatch) -> None:
     )
 
     assert kvk_meta.is_currently_kvk() is True
+
+
+def _details(kvk_no: int = 15) -> dict:
+    return {
+        "kvk_no": kvk_no,
+        "kvk_name": f"KVK {kvk_no}",
+        "start_date": None,
+        "end_date": None,
+        "matchmaking_scan": 837,
+        "kvk_end_scan": None,
+        "pass4_start_scan": 866,
+        "max_scan_order": 875,
+        "state": "ACTIVE",
+        "state_reason": "max_scan_order_within_fighting_window",
+    }
+
+
+def test_latest_kvk_details_is_cached_until_invalidated(monkeypatch) -> None:
+    loads: list[dt.date] = []
+
+    def _load(today):
+        loads.append(today)
+        return _details(15 + len(loads) - 1)
+
+    monkeypatch.setattr(kvk_state, "_load_latest_kvk_details", _load)
+
+    first = kvk_state.get_latest_kvk_details()
+    first["kvk_no"] = 99
+    assert kvk_state.get_latest_kvk_details()["kvk_no"] == 15
+    assert len(loads) == 1
+
+    kvk_state.invalidate_kvk_context("scan_import")
+    assert kvk_state.get_latest_kvk_details()["kvk_no"] == 16
+    assert len(loads) == 2
+
+    info = kvk_state.get_kvk_context_cache_info()
+    assert info["populated"] is True
+    assert info["kvk_no"] == 16
+    assert info["age_seconds"] is not None and info["age_seconds"] >= 0
+    assert info["last_invalidation_reason"] == "scan_import"
+
+
+def test_latest_kvk_details_reloads_after_ttl(monkeypatch) -> None:
+    loads: list[dt.date] = []
+    monkeypatch.setattr(
+        kvk_state, "_load_latest_kvk_details", lambda today: loads.append(today) or _details()
+    )
+    monkeypatch.setattr(kvk_state, "KVK_CONTEXT_TTL_SECONDS", 0.0)
+
+    kvk_state.get_latest_kvk_details()
+    kvk_state.get_latest_kvk_details()
+    assert len(loads) == 2
+
+
+def test_latest_kvk_details_does_not_cache_misses_or_explicit_dates(monkeypatch) -> None:
+    loads: list[dt.date] = []
+    monkeypatch.setattr(
+        kvk_state, "_load_latest_kvk_details", lambda today: loads.append(today) or None
+    )
+
+    assert kvk_state.get_latest_kvk_details() is None
+    assert kvk_state.get_latest_kvk_details() is None
+    assert len(loads) == 2
+    assert kvk_state.get_kvk_context_cache_info()["populated"] is False
+
+    monkeypatch.setattr(
+        kvk_state, "_load_latest_kvk_details", lambda today: loads.append(today) or _details()
+    )
+    pinned = dt.date(2025, 1, 1)
+    kvk_state.get_latest_kvk_details(today=pinned)
+    assert loads[-1] == pinned
+    assert kvk_state.get_kvk_context_cache_info()["populated"] is False
+
+
+def test_invalidation_during_load_is_not_overwritten_and_does_not_wait(monkeypatch) -> None:
+    import threading
+
+    loading = threading.Event()
+    release = threading.Event()
+
+    def _slow_load(_today):
+        loading.set()
+        release.wait(timeout=5)
+        return _details(15)
+
+    monkeypatch.setattr(kvk_state, "_load_latest_kvk_details", _slow_load)
+    loader = threading.Thread(target=kvk_state.get_latest_kvk_details)
+    loader.start()
+    assert loading.wait(timeout=5)
+
+    invalidated = threading.Thread(target=kvk_state.invalidate_kvk_context, args=("proc_config",))
+    invalidated.start()
+    invalidated.join(timeout=1)
+    assert not invalidated.is_alive()
+
+    release.set()
+    loader.join(timeout=5)
+    assert kvk_state.get_kvk_context_cache_info()["populated"] is False
+
+
+def test_pool_worker_drops_kvk_context_before_each_job(monkeypatch) -> None:
+    import maintenance_worker
+
+    monkeypatch.setattr(kvk_state, "_load_latest_kvk_details", lambda _today: _details(15))
+    kvk_state.get_latest_kvk_details()
+    assert kvk_state.get_kvk_context_cache_info()["populated"] is True
+
+    maintenance_worker._reset_per_job_caches()
+
+    info = kvk_state.get_kvk_context_cache_info()
+    assert info["populated"] is False
+    assert info["last_invalidation_reason"] == "pool_job"
@@ -179,6 +179,7 @@ def test_delegates_to_normalizer_when_available(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_fallback_for_nested_callable(monkeypatch):
+    monkeypatch.setenv("MAINT_WORKER_POOL", "0")
     events = []
 
     # Capture telemetry events emitted by file_utils.emit_telemetry_event
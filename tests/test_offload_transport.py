@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+
+from core import offload_transport as ot
+import file_utils
+
+
+def test_shm_token_roundtrip_and_release():
+    payload = b"PK\x03\x04" + os.urandom(1024)
+    before = ot.active_segment_count()
+
+    tok = ot.make_shm_token(payload)
+
+    assert ot.is_shm_token(tok)
+    assert ot.read_shm_token(tok) == payload
+    assert ot.active_segment_count() == before + 1
+    ot.release_shm_token(tok)
+    assert ot.active_segment_count() == before
+
+
+def test_segment_refcount_keeps_segment_until_last_release():
+    name = ot.put_shared_bytes(b"abc")
+    ot.retain_segment(name)
+
+    ot.release_segment(name)
+    assert ot.read_shared_bytes(name, 3) == b"abc"
+    ot.release_segment(name)
+    assert name not in ot._segments
+
+
+def test_serialize_args_shm_transport_uses_segments_and_cleans_up():
+    binary = b"PK\x03\x04\xaa\xbb"
+    rows = [[i, f"gov{i}"] for i in range(file_utils.OFFLOAD_GROUP_THRESHOLD)]
+    before = ot.active_segment_count()
+
+    toks, cleanup = file_utils.serialize_args_for_subprocess(
+        args=[binary, {"n": 1}], transport="shm"
+    )
+    grouped, grouped_cleanup = file_utils.serialize_args_for_subprocess(args=rows, transport="shm")
+
+    assert all(t.startswith(ot.SHM_PREFIX) for t in toks)
+    assert ot.read_shm_token(toks[0]) == binary
+    assert ot.read_shm_token(toks[1]) == {"n": 1}
+    assert ot.read_shm_token(grouped[0]) == rows
+    file_utils.cleanup_temp_paths(cleanup + grouped_cleanup)
+    assert ot.active_segment_count() == before
+
+
+def test_serialize_args_defaults_to_temp_files(tmp_path):
+    toks, paths = file_utils.serialize_args_for_subprocess(args=[b"PK"], tmp_dir=str(tmp_path))
+
+    assert toks[0].startswith(file_utils.OFFLOAD_FILE_PREFIX)
+    file_utils.cleanup_temp_paths(paths)
+
+
+def test_stage_and_resolve_shared_payloads(monkeypatch):
+    monkeypatch.setattr(ot, "OFFLOAD_SHM_MIN_BYTES", 16)
+    big = os.urandom(64)
+
+    args, kwargs, names = ot.stage_shared_payloads([big, b"tiny"], {"content": big, "n": 3})
+
+    assert isinstance(args[0], ot.SharedBytesRef)
+    assert args[1] == b"tiny"
+    assert isinstance(kwargs["content"], ot.SharedBytesRef)
+    resolved_args, resolved_kwargs = ot.resolve_shared_payloads(args, kwargs)
+    assert resolved_args == [big, b"tiny"]
+    assert resolved_kwargs == {"content": big, "n": 3}
+    for name in names:
+        ot.release_segment(name)
+    assert not set(names) & set(ot._segments)
+
+
+def test_result_frame_roundtrip(tmp_path):
+    path = str(tmp_path / "result.bin")
+    payload = {"worker_result": True, "status": "success", "result": {"rows": 3}}
+
+    assert ot.read_result_frame(path) is None
+    ot.write_result_frame(path, payload)
+
+    assert ot.read_result_frame(path) == payload
+
+
+def test_worker_reconstructs_shm_token():
+    import maintenance_worker as mw
+
+    tok = ot.make_shm_token(b"xlsx-bytes")
+    try:
+        assert mw._reconstruct_token(tok) == b"xlsx-bytes"
+        assert mw._sanitize_for_logging(tok) == ot.SHM_PREFIX + "<segment>"
+    finally:
+        ot.release_shm_token(tok)
+
+
+def test_stale_result_frames_are_swept(tmp_path):
+    stale = tmp_path / "result_old.bin"
+    fresh = tmp_path / "result_new.bin"
+    staged_arg = tmp_path / "offload_old.bin"
+    for path in (stale, fresh, staged_arg):
+        path.write_bytes(b"frame")
+    old = os.path.getmtime(stale) - file_utils.RESULT_FRAME_STALE_SECONDS - 60
+    os.utime(stale, (old, old))
+    os.utime(staged_arg, (old, old))
+
+    assert file_utils.sweep_stale_result_frames(str(tmp_path)) == 1
+
+    assert not stale.exists()
+    assert fresh.exists()
+    assert staged_arg.exists()
+
+
+def test_result_frame_paths_live_under_the_test_data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_utils, "_result_frames_swept", False)
+
+    path = file_utils._new_result_frame_path()
+
+    assert os.path.dirname(path) == str(tmp_path / "offload_tmp")
+    assert os.path.basename(path).startswith("result_")
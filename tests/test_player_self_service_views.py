@@ -266,7 +266,9 @@ def test_reminders_fallback_identity_and_footer_match_card_contract() -> None:
 async def test_dashboard_page_response_includes_generated_card(monkeypatch) -> None:
     calls = []
 
-    def fake_render(summary, *, display_name):
+    def fake_render(summary, *, display_name, generated_at_utc):
+        # The view stamps the render so a cached card never shows an older "updated" time.
+        assert generated_at_utc.tzinfo is not None
         calls.append((summary.discord_user_id, display_name))
         return views.dashboard_card.RenderedDashboardCard(
             filename="me_dashboard_42.png",
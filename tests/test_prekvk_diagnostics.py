@@ -77,8 +77,24 @@ class MockConn:
         return False
 
 
+class _FakeWorkbook:
+    sheet_names = ("prekvk",)
+
+    def __init__(self, df):
+        self._df = df
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def read_sheet(self, _sheet_name):
+        return self._df
+
+
 def _patch_excel(monkeypatch, df):
-    monkeypatch.setattr(pki.pd, "read_excel", lambda *_a, **_kw: df)
+    monkeypatch.setattr(pki, "open_workbook", lambda _content: _FakeWorkbook(df))
 
 
 def _patch_conn(monkeypatch, cur):
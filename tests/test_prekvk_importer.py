@@ -1,3 +1,4 @@
+from io import BytesIO
 import zipfile
 
 import pandas as pd
@@ -178,23 +179,32 @@ class MockConn:
         return False
 
 
+class _FakeWorkbook:
+    def __init__(self, sheets: dict[str, pd.DataFrame]):
+        self.sheet_names = list(sheets)
+        self._sheets = sheets
+        self.read: list[str] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def read_sheet(self, sheet_name):
+        self.read.append(sheet_name)
+        return self._sheets[sheet_name]
+
+
 def _patch_read_excel(monkeypatch, df: pd.DataFrame, *, sheet_name_required=True):
     """
-    Patch pandas.read_excel behavior in importer:
-    - When called with sheet_name="prekvk", return df (or raise if sheet_name_required=False)
-    - When called with sheet_name=None, return dict of sheets
+    Patch the importer's workbook reader:
+    - the workbook has a "prekvk" sheet holding df (or only "Sheet1" if sheet_name_required=False)
     """
-
-    def fake_read_excel(_bio, sheet_name="prekvk"):
-        if sheet_name == "prekvk":
-            if sheet_name_required:
-                return df
-            raise Exception("sheet not found")
-        if sheet_name is None:
-            return {"Sheet1": df}
-        raise AssertionError(f"Unexpected sheet_name: {sheet_name!r}")
-
-    monkeypatch.setattr(pki.pd, "read_excel", fake_read_excel)
+    name = "prekvk" if sheet_name_required else "Sheet1"
+    workbook = _FakeWorkbook({name: df})
+    monkeypatch.setattr(pki, "open_workbook", lambda _content: workbook)
+    return workbook
 
 
 def _patch_conn(monkeypatch, cursor: MockCursor, conn: MockConn):
@@ -227,19 +237,28 @@ def test_missing_required_columns_returns_false(monkeypatch):
     assert "Found columns" in msg
 
 
+def test_read_workbook_parses_only_the_rankings_sheet():
+    bio = BytesIO()
+    with pd.ExcelWriter(bio, engine="openpyxl") as writer:
+        pd.DataFrame({"Notes": ["ignore me"]}).to_excel(writer, sheet_name="Info", index=False)
+        pd.DataFrame({"Rank": [1], "Name": ["Alice"]}).to_excel(
+            writer, sheet_name="Pre-KvK Rankings", index=False
+        )
+
+    df = pki._read_prekvk_workbook(bio.getvalue())
+
+    assert list(df.columns) == ["Rank", "Name"]
+    assert df.iloc[0]["Name"] == "Alice"
+
+
 def test_invalid_workbook_failure_is_not_reported_as_no_sheets(monkeypatch):
     calls = []
 
-    def fake_read_excel(bio, sheet_name="prekvk"):
-        assert bio is not None
-        calls.append(sheet_name)
-        if sheet_name == "prekvk":
-            raise ValueError("Worksheet named 'prekvk' not found")
-        if sheet_name is None:
-            raise zipfile.BadZipFile("corrupted workbook bytes")
-        raise AssertionError(f"Unexpected sheet_name: {sheet_name!r}")
+    def fake_open_workbook(content):
+        calls.append(content)
+        raise zipfile.BadZipFile("corrupted workbook bytes")
 
-    monkeypatch.setattr(pki.pd, "read_excel", fake_read_excel)
+    monkeypatch.setattr(pki, "open_workbook", fake_open_workbook)
 
     def fail_conn():
         raise AssertionError("_conn() should not be called when workbook reading fails")
@@ -256,7 +275,7 @@ def test_invalid_workbook_failure_is_not_reported_as_no_sheets(monkeypatch):
     assert ok is False
     assert rows == 0
     assert msg == pki.INVALID_WORKBOOK_MESSAGE
-    assert calls == ["prekvk", None]
+    assert calls == [b"not-an-xlsx"]
     assert any(p.get("error_type") == "InvalidWorkbook" for p in emitted)
     assert all(p.get("error_type") != "NoSheets" for p in emitted if "error_type" in p)
 
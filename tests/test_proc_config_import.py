@@ -418,7 +418,7 @@ def test_read_sheet_to_df_fallback_to_safe_execute(monkeypatch):
     # Have _safe_execute return a results dict matching the expected shape
     fake_result = {"values": [["C", "D"], ["x", "y"]]}
 
-    monkeypatch.setattr(pci, "_safe_execute", lambda req, retries=5: fake_result)
+    monkeypatch.setattr(pci, "_safe_execute", lambda req, retries=5, quota=None: fake_result)
 
     df = pci._read_sheet_to_df(FakeSheet(), "FAKE_ID", "Tab!A1:B2")
     assert isinstance(df, pd.DataFrame)
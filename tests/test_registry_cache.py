@@ -601,3 +601,80 @@ def test_get_registry_cache_info_returns_expected_keys(monkeypatch):
     assert "age_seconds" in info
     assert "ttl_seconds" in info
     assert "last_invalidation_reason" in info
+
+
+# ---------------------------------------------------------------------------
+# Shared snapshot and secondary indexes
+# ---------------------------------------------------------------------------
+
+
+def test_snapshot_is_shared_read_only_and_indexed(monkeypatch):
+    _reset_cache(monkeypatch)
+    monkeypatch.setattr(rc, "_CACHE_TTL", 9999.0)
+    monkeypatch.setattr(dal, "get_all_active", lambda: _ACTIVE_ROW)
+
+    snap = svc.get_registry_snapshot()
+    assert svc.get_registry_snapshot() is snap
+    assert snap.by_user[111]["Main"]["GovernorID"] == "2441482"
+    assert snap.by_governor[2441482]["DiscordUserID"] == 111
+    with pytest.raises(TypeError):
+        snap.by_user[111]["Main"]["GovernorID"] = "0"  # type: ignore[index]
+
+
+def test_hot_lookups_use_snapshot_without_per_entity_sql(monkeypatch):
+    _reset_cache(monkeypatch)
+    monkeypatch.setattr(rc, "_CACHE_TTL", 9999.0)
+
+    def _no_sql(*_a, **_kw):
+        raise AssertionError("per-entity SQL lookup should not be used")
+
+    monkeypatch.setattr(dal, "get_all_active", lambda: _ACTIVE_ROW)
+    monkeypatch.setattr(dal, "get_by_discord_id", _no_sql)
+    monkeypatch.setattr(dal, "get_by_governor_id", _no_sql)
+
+    assert svc.get_user_accounts(111) == {
+        "Main": {"GovernorID": "2441482", "GovernorName": "Chrislos"}
+    }
+    assert svc.get_user_main_governor_id(111) == "2441482"
+    assert svc.get_user_main_governor_name(111) == "Chrislos"
+    assert svc.get_discord_user_for_governor("2441482") == {
+        "DiscordUserID": 111,
+        "DiscordName": "Alice",
+        "AccountType": "Main",
+    }
+    assert svc.check_governor_claimed_by_other(2441482, 222) is True
+    assert svc.check_governor_claimed_by_other(2441482, 111) is False
+    assert svc.get_user_accounts(999) == {}
+
+
+def test_write_invalidation_swaps_in_new_snapshot(monkeypatch):
+    _reset_cache(monkeypatch)
+    monkeypatch.setattr(rc, "_CACHE_TTL", 9999.0)
+    _patch_dal(monkeypatch, all_active=_ACTIVE_ROW)
+    first = svc.get_registry_snapshot()
+
+    ok, _err = svc.register_governor(
+        discord_user_id=111,
+        discord_name="Alice",
+        account_type="Alt 1",
+        governor_id="46718337",
+        governor_name="Kurisulos",
+    )
+    assert ok is True
+    assert svc.get_registry_snapshot() is not first
+
+
+def test_get_info_counts_hits_and_misses(monkeypatch):
+    _reset_cache(monkeypatch)
+    monkeypatch.setattr(rc, "_hits", 0)
+    monkeypatch.setattr(rc, "_misses", 0)
+    monkeypatch.setattr(rc, "_CACHE_TTL", 9999.0)
+
+    assert rc.get_snapshot() is None
+    rc.store_cache(_SAMPLE_DICT)
+    assert rc.get_snapshot() is not None
+    assert rc.get_cached_or_none() is not None
+
+    info = rc.get_info()
+    assert (info["hits"], info["misses"]) == (2, 1)
+    assert (info["users"], info["governors"]) == (1, 1)
@@ -296,8 +296,9 @@ def test_load_registry_as_dict_propagates_sql_exception(monkeypatch):
 
 
 def test_get_user_accounts_propagates_sql_exception(monkeypatch):
+    _reset_cache(monkeypatch)
     monkeypatch.setattr(
-        dal, "get_by_discord_id", lambda uid, **kw: (_ for _ in ()).throw(RuntimeError("timeout"))
+        dal, "get_all_active", lambda: (_ for _ in ()).throw(RuntimeError("timeout"))
     )
     with pytest.raises(RuntimeError, match="timeout"):
         svc.get_user_accounts(111)
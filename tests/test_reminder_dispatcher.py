@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from reminder_dispatcher import ReminderDispatcher
+from reminder_task_registry import (
+    active_task_count,
+    cancel_user_tasks_for_event,
+    register_user_task,
+)
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+@pytest.mark.asyncio
+async def test_due_reminders_fire_in_order_in_one_batch():
+    dispatcher = ReminderDispatcher("test", batch_tick=0.05)
+    fired: list[str] = []
+
+    def _factory(label: str):
+        async def _send() -> None:
+            fired.append(label)
+
+        return _send
+
+    handles = [
+        dispatcher.schedule(0.02, _factory("b"), name="b"),
+        dispatcher.schedule(0.01, _factory("a"), name="a"),
+        dispatcher.schedule(0.03, _factory("c"), name="c"),
+    ]
+    await asyncio.gather(*handles)
+
+    assert fired == ["a", "b", "c"]
+    assert dispatcher.batches == 1
+    assert dispatcher.fired == 3
+    assert dispatcher.pending_count() == 0
+    await dispatcher.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_handle_never_runs_and_finishes_cancelled():
+    dispatcher = ReminderDispatcher("test", batch_tick=0.0)
+    fired: list[str] = []
+
+    async def _send() -> None:
+        fired.append("sent")
+
+    cancelled = dispatcher.schedule(0.01, _send, name="cancelled")
+    kept = dispatcher.schedule(0.02, _send, name="kept")
+    assert cancelled.cancel() is True
+
+    await kept
+    assert fired == ["sent"]
+    assert cancelled.done() and cancelled.cancelled()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    await dispatcher.aclose()
+
+
+@pytest.mark.asyncio
+async def test_earlier_reminder_wakes_sleeping_driver():
+    dispatcher = ReminderDispatcher("test", batch_tick=0.0)
+    fired: list[str] = []
+
+    async def _send() -> None:
+        fired.append("early")
+
+    late = dispatcher.schedule(30, _send, name="late")
+    await asyncio.sleep(0.01)
+    early = dispatcher.schedule(0.01, _send, name="early")
+
+    await asyncio.wait_for(early, timeout=1)
+    assert fired == ["early"]
+    assert not late.done()
+    await dispatcher.aclose()
+    assert late.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_handles_work_with_task_registry_cancellation():
+    dispatcher = ReminderDispatcher("test")
+    fired: list[str] = []
+
+    async def _send() -> None:
+        fired.append("sent")
+
+    handle = dispatcher.schedule(30, _send, name="dm")
+    register_user_task(99, handle, meta={"event_id": "ev1", "delta_seconds": 60})
+    assert active_task_count(99) == 1
+
+    assert cancel_user_tasks_for_event(99, "ev1") == 1
+    await asyncio.sleep(0.01)
+    assert active_task_count(99) == 0
+    assert fired == []
+    await dispatcher.aclose()
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from io import BytesIO
+
+import pytest
+
+from core import render_cache, render_service
+from core.render_cache import RenderedCardCache, card_fingerprint
+from tests import test_worker_module
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+@dataclass(frozen=True, slots=True)
+class _Payload:
+    governor_id: int
+    name: str
+    generated_at: datetime
+    tags: frozenset[str] = frozenset()
+
+
+def _fp(*args, **kwargs):
+    return card_fingerprint(test_worker_module.render_png, args, kwargs)
+
+
+def test_fingerprint_is_stable_and_content_addressed():
+    at = datetime(2026, 1, 1, tzinfo=UTC)
+    payload = _Payload(1, "Ada", at, frozenset({"a", "b"}))
+
+    same = _fp(_Payload(1, "Ada", at, frozenset({"b", "a"})), avatar_bytes=b"x")
+    assert _fp(payload, avatar_bytes=b"x") == same
+    assert _fp(payload, avatar_bytes=b"y") != same
+    assert _fp(_Payload(2, "Ada", at), avatar_bytes=b"x") != same
+    assert _fp(payload, avatar_bytes=None) != _fp(payload)
+
+
+def test_fingerprint_keys_generated_at_stamps_to_the_minute():
+    payload = _Payload(1, "Ada", datetime(2026, 1, 1, tzinfo=UTC))
+    same_minute = _Payload(1, "Ada", datetime(2026, 1, 1, 0, 0, 59, 999, tzinfo=UTC))
+    later = _Payload(1, "Ada", datetime(2026, 1, 1, 0, 5, tzinfo=UTC))
+    at, at_later = payload.generated_at, same_minute.generated_at
+
+    assert _fp(payload) == _fp(same_minute)
+    assert _fp(payload) != _fp(later)
+    assert _fp(payload, generated_at_utc=at) == _fp(payload, generated_at_utc=at_later)
+    assert _fp(payload, generated_at_utc=at) != _fp(payload, generated_at_utc=later.generated_at)
+
+
+def test_fingerprint_is_scoped_by_renderer_package():
+    key = _fp(1, 2)
+
+    assert render_cache.key_scope(key) == "tests"
+
+
+def test_unknown_argument_types_are_not_cacheable():
+    assert _fp(object()) is None
+
+    def local_renderer():
+        return None
+
+    assert card_fingerprint(local_renderer, (), {}) is None
+
+
+def test_hits_return_fresh_objects():
+    cache = RenderedCardCache(max_bytes=1024 * 1024)
+    stream = BytesIO(b"png-bytes")
+    cache.put("k", {"image": stream})
+    stream.close()
+
+    first = cache.get("k")
+    first["image"].close()
+    second = cache.get("k")
+
+    assert second["image"].getvalue() == b"png-bytes"
+    assert cache.stats()["hits"] == 2
+
+
+def test_memory_budget_evicts_oldest():
+    cache = RenderedCardCache(max_bytes=300)
+    for key in ("a", "b", "c"):
+        cache.put(key, b"x" * 100)
+
+    assert cache.get("a") is None
+    assert cache.get("c") == b"x" * 100
+    assert cache.stats()["evictions"] >= 1
+    assert cache.stats()["bytes"] <= 300
+
+
+def test_disk_tier_survives_a_new_cache_and_invalidate_clears_it(tmp_path):
+    cache = RenderedCardCache(max_bytes=1024, disk_dir=tmp_path, disk_max_bytes=1024 * 1024)
+    blob = cache.put("kvk.ab12", b"card")
+    cache.write_disk("kvk.ab12", blob)
+
+    restarted = RenderedCardCache(max_bytes=1024, disk_dir=tmp_path, disk_max_bytes=1024 * 1024)
+    assert restarted.get("kvk.ab12") is None
+    assert restarted.get_disk("kvk.ab12") == b"card"
+    assert restarted.get("kvk.ab12") == b"card"
+
+    restarted.invalidate("test")
+    assert restarted.get("kvk.ab12") is None
+    assert restarted.get_disk("kvk.ab12") is None
+
+
+def test_scoped_invalidate_keeps_other_scopes(tmp_path):
+    cache = RenderedCardCache(max_bytes=1024, disk_dir=tmp_path, disk_max_bytes=1024 * 1024)
+    for key in ("player_self_service.aa01", "kvk.bb02"):
+        cache.write_disk(key, cache.put(key, key.encode()))
+
+    cache.invalidate("profile_cache", scopes=("player_self_service",))
+
+    assert cache.get("player_self_service.aa01") is None
+    assert cache.get_disk("player_self_service.aa01") is None
+    assert cache.get("kvk.bb02") == b"kvk.bb02"
+    assert (tmp_path / "kvk" / "bb" / "bb02.pkl").exists()
+    assert cache.stats()["bytes"] == len(cache._entries["kvk.bb02"])
+
+
+def test_invalidate_unlinks_disk_files_outside_the_lock(tmp_path, monkeypatch):
+    cache = RenderedCardCache(max_bytes=1024, disk_dir=tmp_path, disk_max_bytes=1024 * 1024)
+    cache.write_disk("kvk.ab12", cache.put("kvk.ab12", b"card"))
+    held = []
+    real_unlink = render_cache.Path.unlink
+
+    def spy_unlink(self, *args, **kwargs):
+        held.append(cache._lock.locked() or render_cache._cache_lock.locked())
+        return real_unlink(self, *args, **kwargs)
+
+    monkeypatch.setattr(render_cache.Path, "unlink", spy_unlink)
+    cache.invalidate("test")
+
+    assert held == [False]
+
+
+def test_disk_tier_prunes_oldest_files(tmp_path):
+    cache = RenderedCardCache(max_bytes=10_000, disk_dir=tmp_path, disk_max_bytes=1000)
+    for i in range(5):
+        key = f"kvk.{i:02d}key"
+        cache.write_disk(key, cache.put(key, b"x" * 300))
+
+    remaining = sorted(p.name for p in tmp_path.rglob("*.pkl"))
+    assert sum(p.stat().st_size for p in tmp_path.rglob("*.pkl")) <= 1000
+    assert "04key.pkl" in remaining and "00key.pkl" not in remaining
+
+
+@pytest.mark.asyncio
+async def test_render_card_reuses_identical_renders(monkeypatch):
+    monkeypatch.setenv("RENDER_CACHE", "1")
+    monkeypatch.setenv("RENDER_POOL", "0")
+    monkeypatch.setattr(render_cache, "_cache", RenderedCardCache(max_bytes=1024 * 1024))
+    monkeypatch.setattr(render_service, "_service", None)
+    calls = []
+    real = test_worker_module.render_png
+
+    def counting_render_png(width, height):
+        calls.append((width, height))
+        return real(width, height)
+
+    monkeypatch.setattr(test_worker_module, "render_png", counting_render_png)
+    counting_render_png.__module__ = test_worker_module.__name__
+    counting_render_png.__qualname__ = "render_png"
+
+    first = await render_service.render_card(counting_render_png, 4, 4)
+    second = await render_service.render_card(counting_render_png, 4, 4)
+    other = await render_service.render_card(counting_render_png, 5, 4)
+
+    assert first == second and first.startswith(b"\x89PNG")
+    assert other != first
+    assert calls == [(4, 4), (5, 4)]
+    stats = render_cache.get_render_cache_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_me_reminders_card_hits_cache_within_the_stamped_minute(monkeypatch):
+    from player_self_service import reminders_renderer
+    from player_self_service.reminders_summary import (
+        CalendarEventCatalog,
+        build_reminders_summary_payload,
+    )
+
+    monkeypatch.setenv("RENDER_CACHE", "1")
+    monkeypatch.setenv("RENDER_POOL", "0")
+    monkeypatch.setattr(render_cache, "_cache", RenderedCardCache(max_bytes=64 * 1024 * 1024))
+    monkeypatch.setattr(render_service, "_service", None)
+
+    def payload(now):
+        return build_reminders_summary_payload(
+            viewer_discord_id=42,
+            display_name="Ada",
+            kvk_config={"subscriptions": ["ruins"], "reminder_times": ["1h"]},
+            calendar_prefs={"enabled": False},
+            calendar_catalog=CalendarEventCatalog(available=True, event_types=("ark",)),
+            generated_at_utc=now,
+        )
+
+    first = await render_service.render_card(
+        reminders_renderer.render_reminders_card,
+        payload(datetime(2026, 7, 14, 15, 30, tzinfo=UTC)),
+        avatar_bytes=None,
+    )
+    second = await render_service.render_card(
+        reminders_renderer.render_reminders_card,
+        payload(datetime(2026, 7, 14, 15, 30, 40, tzinfo=UTC)),
+        avatar_bytes=None,
+    )
+    await render_service.render_card(
+        reminders_renderer.render_reminders_card,
+        payload(datetime(2026, 7, 14, 15, 31, tzinfo=UTC)),
+        avatar_bytes=None,
+    )
+
+    stats = render_cache.get_render_cache_stats()
+    assert stats["misses"] == 2 and stats["hits"] == 1
+    assert second.filename == first.filename
+    assert second.image_bytes.getvalue() == first.image_bytes.getvalue()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import sys
+
+import pytest
+
+from core import render_service, worker_pool
+import maintenance_worker as mw
+from tests import test_worker_module
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+@pytest.fixture
+def pool_enabled(monkeypatch):
+    monkeypatch.setenv("RENDER_POOL", "1")
+
+
+def _service(**kwargs) -> render_service.RenderService:
+    kwargs.setdefault("size", 1)
+    kwargs.setdefault("preload", "json")
+    return render_service.RenderService(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_render_runs_on_pool_and_returns_png_bytes(pool_enabled):
+    service = _service()
+    try:
+        png = await service.render(test_worker_module.render_png, 8, 4)
+        again = await service.render(test_worker_module.render_png, 2, 2)
+        stats = service.stats()
+    finally:
+        await service.shutdown()
+
+    assert png.startswith(b"\x89PNG") and again.startswith(b"\x89PNG")
+    assert stats["pool_renders"] == 2
+    assert stats["thread_renders"] == 0
+    assert stats["queue_depth"] == 0 and stats["in_flight"] == 0
+    assert stats["pool"]["spawned"] == 1
+
+
+@pytest.mark.asyncio
+async def test_non_importable_renderer_uses_thread(pool_enabled):
+    service = _service()
+
+    def local_render(value):
+        return value * 2
+
+    assert await service.render(local_render, 21) == 42
+    assert service.stats()["thread_renders"] == 1
+    assert service.stats()["pool"] is None
+
+
+@pytest.mark.asyncio
+async def test_disabled_pool_uses_thread(monkeypatch):
+    monkeypatch.setenv("RENDER_POOL", "0")
+    service = _service()
+
+    png = await service.render(test_worker_module.render_png, 1, 1)
+
+    assert png.startswith(b"\x89PNG")
+    assert service.stats()["thread_renders"] == 1
+
+
+@pytest.mark.asyncio
+async def test_render_timeout_kills_worker(pool_enabled):
+    service = _service(timeout=0.5)
+    try:
+        with pytest.raises(worker_pool.WorkerJobTimeout):
+            await service.render(test_worker_module.long_sleep, "10")
+    finally:
+        await service.shutdown()
+
+    assert service.stats()["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unstartable_pool_falls_back_and_backs_off(pool_enabled):
+    service = _service(worker_cmd=[sys.executable, "-c", "pass"])
+    try:
+        first = await service.render(test_worker_module.long_sleep, "0")
+        second = await service.render(test_worker_module.long_sleep, "0")
+    finally:
+        await service.shutdown()
+
+    assert first == second == "slept:0"
+    stats = service.stats()
+    assert stats["fallbacks"] == 1
+    assert stats["thread_renders"] == 2
+    assert stats["available"] is False
+
+
+@pytest.mark.asyncio
+async def test_renderer_exception_is_reraised(pool_enabled):
+    service = _service()
+    try:
+        with pytest.raises(json.JSONDecodeError):
+            await service.render(json.loads, "not json")
+    finally:
+        await service.shutdown()
+
+    assert service.stats()["failed"] == 1
+
+
+def test_preload_calls_module_function_hooks():
+    loaded, failed = mw._preload_modules("json,gc:collect,no_such_module_for_tests")
+
+    assert loaded == ["json", "gc:collect"]
+    assert failed == ["no_such_module_for_tests"]
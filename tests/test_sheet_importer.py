@@ -1,6 +1,13 @@
+import numpy as np
 import pandas as pd
 
-from sheet_importer import executemany_batched, quote_sql_columns, write_df_to_staging_and_upsert
+from sheet_importer import (
+    executemany_batched,
+    iter_db_row_chunks,
+    quote_sql_columns,
+    to_db_rows,
+    write_df_to_staging_and_upsert,
+)
 
 
 def test_quote_sql_columns_basic():
@@ -12,6 +19,38 @@ def test_quote_sql_columns_basic():
     )  # ensure brackets escaped
 
 
+def _mixed_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "i": [1, 2, 3],
+            "f": [1.5, np.nan, 2.0],
+            "ts": pd.to_datetime(["2026-05-08", None, "2026-05-09"]),
+            "s": ["a", None, np.nan],
+            "n": pd.array([1, None, 3], dtype="Int64"),
+            "b": [True, False, True],
+        }
+    )
+
+
+def test_to_db_rows_matches_object_where_conversion():
+    df = _mixed_frame()
+    legacy = [
+        tuple(row) for row in df.astype(object).where(pd.notnull(df), None).itertuples(index=False)
+    ]
+
+    rows = to_db_rows(df)
+
+    assert rows == legacy
+    assert [type(v) for v in rows[0]] == [type(v) for v in legacy[0]]
+    assert rows[1] == (2, None, None, None, None, False)
+
+
+def test_iter_db_row_chunks_prefixes_and_chunks():
+    chunks = list(iter_db_row_chunks(_mixed_frame()[["i", "f"]], 2, prefix=("tok",)))
+
+    assert chunks == [[("tok", 1, 1.5), ("tok", 2, None)], [("tok", 3, 2.0)]]
+
+
 def test_executemany_batched_single_and_multi(monkeypatch):
     executed = []
 
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from core import sql_pool
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.closed = False
+
+    def execute(self, sql, *params):
+        if self.conn.dead:
+            raise RuntimeError("link failure")
+        self.conn.executed.append(sql)
+        return self
+
+    def fetchone(self):
+        return (1,)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConn:
+    def __init__(self):
+        self.autocommit = False
+        self.timeout = 0
+        self.dead = False
+        self.closed = False
+        self.commits = 0
+        self.rollbacks = 0
+        self.executed: list[str] = []
+        self.cursors: list[FakeCursor] = []
+
+    def cursor(self):
+        cur = FakeCursor(self)
+        self.cursors.append(cur)
+        return cur
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _factory(created):
+    def _make():
+        conn = FakeConn()
+        created.append(conn)
+        return conn
+
+    return _make
+
+
+def _pool(clock=None, **kwargs):
+    kwargs.setdefault("stats_interval", 10_000)
+    return sql_pool.SqlConnectionPool("test", clock=clock or Clock(), **kwargs)
+
+
+def test_close_returns_connection_for_reuse():
+    created: list[FakeConn] = []
+    pool = _pool()
+
+    first = pool.acquire(_factory(created))
+    first.close()
+    second = pool.acquire(_factory(created))
+
+    assert len(created) == 1
+    assert second._raw is created[0]
+    assert created[0].closed is False
+    assert created[0].rollbacks == 1
+    stats = pool.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_with_block_commits_and_releases_and_closes_cursors():
+    created: list[FakeConn] = []
+    pool = _pool()
+
+    with pool.acquire(_factory(created)) as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT 42")
+
+    assert created[0].commits == 1
+    assert cur.closed is True
+    assert conn.closed is True
+    assert pool.stats()["idle"] == 1
+    with pytest.raises(RuntimeError, match="after it was closed"):
+        conn.cursor()
+
+
+def test_with_block_error_rolls_back_without_masking_exception():
+    created: list[FakeConn] = []
+    pool = _pool()
+
+    with pytest.raises(ValueError):
+        with pool.acquire(_factory(created)):
+            raise ValueError("boom")
+
+    assert created[0].commits == 0
+    assert created[0].rollbacks >= 1
+
+
+def test_release_resets_autocommit_and_timeout():
+    created: list[FakeConn] = []
+    pool = _pool()
+
+    conn = pool.acquire(_factory(created))
+    conn.autocommit = True
+    conn.timeout = 30
+    conn.close()
+
+    assert created[0].autocommit is False
+    assert created[0].timeout == 0
+
+
+def test_release_resets_session_options_before_reuse():
+    created: list[FakeConn] = []
+    pool = _pool()
+
+    conn = pool.acquire(_factory(created))
+    conn.cursor().execute("SET LOCK_TIMEOUT 300000;")
+    conn.close()
+
+    assert created[0].executed == ["SET LOCK_TIMEOUT 300000;", sql_pool.SESSION_RESET_SQL]
+    assert "SET LOCK_TIMEOUT -1" in sql_pool.SESSION_RESET_SQL
+    assert pool.stats()["idle"] == 1
+
+
+def test_failed_session_reset_discards_connection():
+    created: list[FakeConn] = []
+    pool = _pool()
+
+    conn = pool.acquire(_factory(created))
+    created[0].dead = True
+    conn.close()
+
+    assert created[0].closed is True
+    assert pool.stats()["idle"] == 0
+    assert pool.stats()["discarded"] == 1
+
+
+def test_discard_on_release_closes_session_instead_of_pooling():
+    created: list[FakeConn] = []
+    pool = _pool()
+
+    conn = pool.acquire(_factory(created))
+    sql_pool.discard_on_release(conn)
+    conn.close()
+    pool.acquire(_factory(created))
+
+    assert created[0].closed is True
+    assert len(created) == 2
+    assert pool.stats()["discarded"] == 1
+    sql_pool.discard_on_release(FakeConn())  # unpooled connections are ignored
+
+
+def test_stale_idle_connection_is_pinged_and_replaced_when_dead():
+    clock = Clock()
+    created: list[FakeConn] = []
+    pool = _pool(clock, ping_after=30, idle_timeout=600)
+
+    pool.acquire(_factory(created)).close()
+    created[0].dead = True
+    clock.now += 60
+
+    conn = pool.acquire(_factory(created))
+
+    assert len(created) == 2
+    assert conn._raw is created[1]
+    assert created[0].closed is True
+    assert pool.stats()["ping_failures"] == 1
+
+
+def test_recently_used_connection_skips_ping():
+    clock = Clock()
+    created: list[FakeConn] = []
+    pool = _pool(clock, ping_after=30)
+
+    pool.acquire(_factory(created)).close()
+    clock.now += 5
+    pool.acquire(_factory(created))
+
+    assert "SELECT 1" not in created[0].executed
+
+
+def test_idle_connections_are_evicted_after_timeout():
+    clock = Clock()
+    created: list[FakeConn] = []
+    pool = _pool(clock, idle_timeout=60)
+
+    pool.acquire(_factory(created)).close()
+    clock.now += 120
+    pool.acquire(_factory(created))
+
+    assert len(created) == 2
+    assert created[0].closed is True
+    assert pool.stats()["evicted_idle"] == 1
+
+
+def test_exhausted_pool_uses_overflow_connection_that_is_closed_on_release():
+    created: list[FakeConn] = []
+    pool = _pool(max_size=1, checkout_timeout=0)
+
+    held = pool.acquire(_factory(created))
+    extra = pool.acquire(_factory(created))
+    extra.close()
+
+    assert len(created) == 2
+    assert created[1].closed is True
+    assert pool.stats()["overflow"] == 1
+    held.close()
+    assert pool.stats()["idle"] == 1
+
+
+def test_waiting_checkout_gets_released_connection():
+    created: list[FakeConn] = []
+    pool = _pool(max_size=1, checkout_timeout=5, clock=sql_pool.time.monotonic)
+    held = pool.acquire(_factory(created))
+    got: list = []
+
+    worker = threading.Thread(target=lambda: got.append(pool.acquire(_factory(created))))
+    worker.start()
+    held.close()
+    worker.join(timeout=5)
+
+    assert got and got[0]._raw is created[0]
+    assert len(created) == 1
+
+
+def test_factory_failure_frees_reserved_slot():
+    pool = _pool(max_size=1, checkout_timeout=0)
+
+    def _fail():
+        raise RuntimeError("login failed")
+
+    with pytest.raises(RuntimeError):
+        pool.acquire(_fail)
+
+    assert pool.stats()["in_use"] == 0
+    created: list[FakeConn] = []
+    pool.acquire(_factory(created))
+    assert pool.stats()["overflow"] == 0
+
+
+def test_stats_telemetry_emitted_after_interval(monkeypatch):
+    clock = Clock()
+    events: list[dict] = []
+    monkeypatch.setattr(sql_pool, "_emit_telemetry", events.append)
+    pool = sql_pool.SqlConnectionPool("test", clock=clock, stats_interval=60)
+    created: list[FakeConn] = []
+
+    pool.acquire(_factory(created)).close()
+    assert events == []
+    clock.now += 61
+    pool.acquire(_factory(created)).close()
+
+    assert events and events[0]["event"] == "db_pool_stats"
+    assert events[0]["pool"] == "test"
+    assert events[0]["checkouts"] == 2
+
+
+def test_get_conn_with_retries_uses_per_credential_pools(monkeypatch):
+    monkeypatch.setenv("RUN_DB_TESTS", "1")
+    import file_utils
+
+    created: list[FakeConn] = []
+    monkeypatch.setattr(sql_pool, "_pools", {})
+    monkeypatch.setattr(sql_pool, "DB_POOL_ENABLED", True)
+    monkeypatch.setattr(file_utils, "_conn", _factory(created))
+    monkeypatch.setattr(file_utils, "_conn_import", _factory(created))
+
+    file_utils.get_conn_with_retries().close()
+    file_utils.get_conn_with_retries().close()
+    file_utils.get_conn_with_retries(credential="import").close()
+
+    assert len(created) == 2
+    assert set(sql_pool.get_pool_stats()) == {"default", "import"}
+    with pytest.raises(ValueError):
+        file_utils.get_conn_with_retries(credential="nope")
+
+
+def test_pool_disabled_returns_raw_connection(monkeypatch):
+    monkeypatch.setattr(sql_pool, "DB_POOL_ENABLED", False)
+    created: list[FakeConn] = []
+
+    conn = sql_pool.acquire_pooled_connection("default", _factory(created))
+
+    assert conn is created[0]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import os
+
+import stats_columnar
+
+
+def _payload() -> dict:
+    return {
+        "_meta": {"count": 3, "generated_at": "2026-06-18T09:00:00+00:00"},
+        "300": {"GovernorID": "300", "Power": 90, "DKP_SCORE": 1.5, "STATUS": "INCLUDED"},
+        "100": {"GovernorID": "100", "Power": 2**40, "DKP_SCORE": None, "Tags": ["a", 1]},
+        "200": {"GovernorID": "200", "Power": 10, "DKP_SCORE": 0.25, "STATUS": "EXEMPT"},
+    }
+
+
+def _write_json(path, payload) -> None:
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def test_columnar_roundtrip_preserves_rows_and_key_lookup(tmp_path):
+    cache = tmp_path / "player_stats_cache.json"
+    payload = _payload()
+    _write_json(cache, payload)
+    stats_columnar.write_columnar_cache(str(cache), payload)
+
+    table = stats_columnar.open_columnar_cache(str(cache))
+
+    assert table is not None
+    assert table.meta["count"] == 3
+    assert len(table) == 3
+    assert list(table) == ["300", "100", "200"]
+    assert table["100"] == payload["100"]
+    assert table.get("200") == payload["200"]
+    assert table.get("999") is None and "999" not in table
+    assert dict(table.items()) == {k: v for k, v in payload.items() if k != "_meta"}
+    assert [row["GovernorID"] for row in table.values()] == ["300", "100", "200"]
+
+
+def test_stale_or_disabled_columnar_cache_falls_back(tmp_path, monkeypatch):
+    cache = tmp_path / "player_stats_cache.json"
+    payload = _payload()
+    _write_json(cache, payload)
+    stats_columnar.write_columnar_cache(str(cache), payload)
+
+    monkeypatch.setenv("PLAYER_STATS_COLUMNAR", "0")
+    assert stats_columnar.open_columnar_cache(str(cache)) is None
+    monkeypatch.delenv("PLAYER_STATS_COLUMNAR")
+
+    ptr = stats_columnar.pointer_path(str(cache))
+    os.utime(ptr, (1, 1))
+    assert stats_columnar.open_columnar_cache(str(cache)) is None
+
+
+def test_new_generation_prunes_old_files(tmp_path):
+    cache = tmp_path / "player_stats_cache.json"
+    payload = _payload()
+    _write_json(cache, payload)
+    paths = [stats_columnar.write_columnar_cache(str(cache), payload) for _ in range(3)]
+
+    remaining = sorted(p.name for p in tmp_path.glob("player_stats_cache.*.cols"))
+
+    assert remaining == sorted(os.path.basename(p) for p in paths[1:])
+
+
+def test_load_stat_cache_prefers_columnar_generation(tmp_path, monkeypatch):
+    import utils
+
+    cache = tmp_path / "player_stats_cache.json"
+    payload = _payload()
+    _write_json(cache, payload)
+    monkeypatch.setattr(utils, "PLAYER_STATS_CACHE", str(cache))
+    monkeypatch.setattr(utils, "_STAT_CACHE", {})
+    monkeypatch.setattr(utils, "_STAT_CACHE_MTIME", None)
+
+    assert isinstance(utils.load_stat_cache(), dict)
+
+    stats_columnar.write_columnar_cache(str(cache), payload)
+    loaded = utils.load_stat_cache()
+
+    assert isinstance(loaded, stats_columnar.ColumnarStatsTable)
+    assert utils.load_stat_cache() is loaded
+    assert utils.load_stat_row("300.0")["STATUS"] == "INCLUDED"
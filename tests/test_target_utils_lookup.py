@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import file_utils
+import target_utils
+import targets_sql_cache as tsc
+
+
+@pytest.fixture(autouse=True)
+def _fresh_targets_index():
+    tsc.reset_targets_index()
+    yield
+    tsc.reset_targets_index()
+
+
+@pytest.mark.asyncio
+async def test_run_target_lookup_returns_found_target(monkeypatch):
+    target = {
+        "GovernorID": "2441482",
+        "GovernorName": "Alice",
+        "TargetState": "ACTIVE",
+        "KVK_NO": 15,
+    }
+    monkeypatch.setattr(target_utils, "get_targets_for_governor", lambda _gid: dict(target))
+
+    res = await target_utils.run_target_lookup("2441482")
+
+    assert res == {"status": "found", "data": target}
+
+
+@pytest.mark.asyncio
+async def test_run_target_lookup_reports_error_when_lookup_fails(monkeypatch):
+    def failing_lookup(_gid):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(target_utils, "get_targets_for_governor", failing_lookup)
+
+    res = await target_utils.run_target_lookup("2441482")
+
+    assert res is not None
+    assert res["status"] == "error"
+    assert res["message"] == "Internal error retrieving targets by ID"
+
+
+@pytest.mark.asyncio
+async def test_run_target_lookup_serves_repeat_lookups_from_the_in_process_index(
+    monkeypatch, tmp_path
+):
+    cache_path = tmp_path / "player_targets_cache.json"
+    cache_path.write_text(
+        json.dumps(
+            {
+                "_meta": {"kvk_no": 15, "state": "FINAL"},
+                "by_gov": {
+                    "2441482": {"GovernorID": "2441482", "GovernorName": "Alice"},
+                    "777": {"GovernorID": "777", "GovernorName": "Bob"},
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(tsc, "PLAYER_TARGETS_CACHE", str(cache_path))
+    reads = []
+    real_read = tsc._read_json
+    monkeypatch.setattr(tsc, "_read_json", lambda path: reads.append(path) or real_read(path))
+
+    async def no_subprocess(*_args, **_kwargs):
+        raise AssertionError("target lookups must not leave the bot process")
+
+    monkeypatch.setattr(file_utils, "run_maintenance_with_isolation", no_subprocess)
+
+    first = await target_utils.run_target_lookup("2441482")
+    second = await target_utils.run_target_lookup("777")
+
+    assert first["status"] == "found" and first["data"]["GovernorName"] == "Alice"
+    assert second["status"] == "found" and second["data"]["GovernorName"] == "Bob"
+    assert reads == [str(cache_path)]
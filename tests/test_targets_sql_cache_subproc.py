@@ -2,9 +2,22 @@
 # Unit tests to validate that refresh_targets_cache returns a small summary when MAINT_SUBPROC=1.
 
 
+import json
+import threading
+import time
+
+import pytest
+
 import targets_sql_cache as tsc
 
 
+@pytest.fixture(autouse=True)
+def _fresh_targets_index():
+    tsc.reset_targets_index()
+    yield
+    tsc.reset_targets_index()
+
+
 class FakeCursor:
     def close(self):
         return None
@@ -200,3 +213,86 @@ def test_get_targets_for_governor_keeps_cache_when_context_missing(monkeypatch):
 
     assert res is not None
     assert res["TargetState"] == "DRAFT"
+
+
+def _write_cache(path, state="ACTIVE", name="Alice"):
+    path.write_text(
+        json.dumps(
+            {
+                "_meta": {"kvk_no": 15, "state": state},
+                "by_gov": {"123": {"GovernorID": "123", "GovernorName": name}},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_get_targets_for_governor_reuses_index_until_file_changes(monkeypatch, tmp_path):
+    path = tmp_path / "targets.json"
+    _write_cache(path)
+    monkeypatch.setattr(tsc, "PLAYER_TARGETS_CACHE", str(path))
+    reads = []
+    real_read = tsc._read_json
+    monkeypatch.setattr(tsc, "_read_json", lambda p: reads.append(p) or real_read(p))
+
+    assert tsc.get_targets_for_governor(123)["GovernorName"] == "Alice"
+    row = tsc.get_targets_for_governor(123)
+    row["last_kvk"] = {"mutated": True}
+    assert "last_kvk" not in tsc.get_targets_for_governor(123)
+    assert len(reads) == 1
+
+    _write_cache(path, name="Alicia-renamed")
+    assert tsc.get_targets_for_governor(123)["GovernorName"] == "Alicia-renamed"
+    assert len(reads) == 2
+
+
+def test_draft_cache_rechecks_context_at_most_once_per_interval(monkeypatch, tmp_path):
+    path = tmp_path / "targets.json"
+    _write_cache(path, state="DRAFT")
+    monkeypatch.setattr(tsc, "PLAYER_TARGETS_CACHE", str(path))
+    calls = []
+    monkeypatch.setattr(
+        tsc,
+        "get_kvk_context_today",
+        lambda: calls.append(1) or {"kvk_no": 15, "state": "DRAFT"},
+    )
+
+    for _ in range(5):
+        assert tsc.get_targets_for_governor(123) is not None
+    assert len(calls) == 1
+
+
+def test_concurrent_stale_lookups_share_one_refresh(monkeypatch, tmp_path):
+    path = tmp_path / "targets.json"
+    _write_cache(path, state="DRAFT")
+    monkeypatch.setattr(tsc, "PLAYER_TARGETS_CACHE", str(path))
+    monkeypatch.setattr(tsc, "get_kvk_context_today", lambda: {"kvk_no": 15, "state": "ACTIVE"})
+    refreshes = []
+
+    def slow_refresh():
+        refreshes.append(1)
+        time.sleep(0.05)
+        return {
+            "_meta": {"kvk_no": 15, "state": "ACTIVE"},
+            "by_gov": {"123": {"GovernorID": "123", "TargetState": "ACTIVE"}},
+        }
+
+    monkeypatch.setattr(tsc, "refresh_targets_cache", slow_refresh)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(tsc.get_targets_for_governor(123)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(refreshes) == 1
+    assert all(r["TargetState"] == "ACTIVE" for r in results)
+
+
+def test_write_json_is_compact(tmp_path):
+    path = tmp_path / "out.json"
+    tsc._write_json(str(path), {"by_gov": {"1": {"a": 1}}})
+    assert path.read_text(encoding="utf-8") == '{"by_gov":{"1":{"a":1}}}'
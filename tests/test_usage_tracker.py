@@ -196,6 +196,75 @@ async def test_log_queue_full_drops_and_logs_warning():
     assert tracker.queue.qsize() == 1
 
 
+class _FakeJsonlWriter:
+    def __init__(self) -> None:
+        self.records: list[tuple[str, dict]] = []
+
+    def write(self, prefix, obj, *, ts=None) -> None:
+        self.records.append((prefix, obj))
+
+    def flush(self, *, fsync: bool = False) -> int:
+        return 0
+
+
+@pytest.mark.asyncio
+async def test_log_hands_jsonl_line_to_writer_without_tasks(monkeypatch):
+    """log() buffers the JSONL line on the shared writer instead of scheduling a task."""
+    writer = _FakeJsonlWriter()
+    monkeypatch.setattr(usage_tracker_module, "_JSONL_WRITER", writer)
+    tasks_before = len(asyncio.all_tasks())
+    tracker = AsyncUsageTracker()
+
+    executed_at = datetime(2026, 4, 21, 12, 0, tzinfo=UTC)
+    await tracker.log({"command_name": "stats", "executed_at_utc": executed_at})
+
+    assert len(asyncio.all_tasks()) == tasks_before
+    assert writer.records == [
+        ("command_usage_", {"command_name": "stats", "executed_at_utc": executed_at.isoformat()})
+    ]
+    assert tracker.queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_usage_event_writes_metric_and_enqueues_inline(monkeypatch):
+    writer = _FakeJsonlWriter()
+    tracker = AsyncUsageTracker()
+    monkeypatch.setattr(usage_tracker_module, "_JSONL_WRITER", writer)
+    monkeypatch.setattr(usage_tracker_module, "_GLOBAL_TRACKER", tracker)
+    monkeypatch.setattr(usage_tracker_module, "_check_and_maybe_alert", lambda name: None)
+
+    usage_tracker_module.usage_event("sheets_quota", metadata={"sheet": "x"})
+
+    assert [prefix for prefix, _obj in writer.records] == ["metrics_", "command_usage_"]
+    assert writer.records[0][1]["metric"] == "sheets_quota"
+    assert tracker.queue.get_nowait()["command_name"] == "metric:sheets_quota"
+
+
+def test_usage_event_without_loop_only_writes_metric(monkeypatch):
+    writer = _FakeJsonlWriter()
+    tracker = AsyncUsageTracker()
+    monkeypatch.setattr(usage_tracker_module, "_JSONL_WRITER", writer)
+    monkeypatch.setattr(usage_tracker_module, "_GLOBAL_TRACKER", tracker)
+    monkeypatch.setattr(usage_tracker_module, "_check_and_maybe_alert", lambda name: None)
+
+    usage_tracker_module.usage_event("sheets_quota")
+
+    assert [prefix for prefix, _obj in writer.records] == ["metrics_"]
+    assert tracker.queue.qsize() == 0
+
+
+def test_jsonl_streams_are_isolated_from_the_repo_data_dir(monkeypatch, tmp_path):
+    """The conftest writer keeps test records out of data/ and is drained on close."""
+    monkeypatch.setattr(usage_tracker_module, "_check_and_maybe_alert", lambda name: None)
+    writer = usage_tracker_module.get_jsonl_writer()
+    assert writer.directory == str(tmp_path)
+
+    usage_tracker_module.usage_event("isolation_probe")
+    writer.close()
+
+    assert any(name.startswith("metrics_") for name in os.listdir(tmp_path))
+
+
 # ---------------------------------------------------------------------------
 # _coerce_ts tests (now lives in command_usage_dal)
 # ---------------------------------------------------------------------------
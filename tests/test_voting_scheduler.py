@@ -102,6 +102,7 @@ def _stub_empty_survey_scheduler(monkeypatch):
 
     monkeypatch.setattr("voting.scheduler.survey_dal.list_due_closes", list_due_closes)
     monkeypatch.setattr("voting.scheduler.survey_dal.claim_due_reminders", claim_due_reminders)
+    monkeypatch.setattr("voting.scheduler._next_due_cache", None)
 
 
 @pytest.mark.asyncio
@@ -258,3 +259,93 @@ async def test_scheduler_logs_warning_when_survey_reminder_mark_fails(monkeypatc
     assert [audit["action_type"] for audit in audits] == ["ReminderMarkFailed"]
     assert audits[0]["details"] == {"reminder_id": 9, "message_id": 900}
     assert "survey_reminder_mark_failed survey_id=7 reminder_id=9 message_id=900" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_rearming_reminder_claim_lets_running_claim_finish(monkeypatch):
+    import asyncio
+
+    from voting import scheduler
+
+    started = asyncio.Event()
+    release = asyncio.Event()
+    finished = []
+
+    async def next_reminder_due_at(now):
+        return now + timedelta(seconds=0.01)
+
+    async def claim_and_send(_bot, _now, _summary):
+        started.set()
+        await release.wait()
+        finished.append(True)
+
+    monkeypatch.setattr(scheduler.dal, "next_reminder_due_at", next_reminder_due_at)
+    monkeypatch.setattr(scheduler.survey_dal, "next_reminder_due_at", next_reminder_due_at)
+    monkeypatch.setattr(scheduler, "_claim_and_send_reminders", claim_and_send)
+    monkeypatch.setattr(scheduler, "_next_claim", None)
+
+    await scheduler._arm_next_reminder_claim(SimpleNamespace(), datetime.now(UTC))
+    running = scheduler._next_claim
+    await asyncio.wait_for(started.wait(), timeout=2)
+
+    await scheduler._arm_next_reminder_claim(SimpleNamespace(), datetime.now(UTC))
+    release.set()
+    await asyncio.wait_for(running, timeout=2)
+
+    assert running.cancelled() is False
+    assert finished
+    scheduler._next_claim.cancel()
+
+
+@pytest.mark.asyncio
+async def test_next_reminder_due_is_cached_between_polls_until_reminders_change(monkeypatch):
+    from voting import scheduler
+
+    now = datetime(2026, 7, 1, 12, 0, tzinfo=UTC)
+    reads = []
+
+    async def vote_due(at):
+        reads.append(at)
+        return now + timedelta(hours=2)
+
+    async def survey_due(_at):
+        return None
+
+    monkeypatch.setattr(scheduler.dal, "next_reminder_due_at", vote_due)
+    monkeypatch.setattr(scheduler.survey_dal, "next_reminder_due_at", survey_due)
+
+    assert await scheduler._next_reminder_due_at(now) == now + timedelta(hours=2)
+    assert await scheduler._next_reminder_due_at(now + timedelta(minutes=1)) == now + timedelta(
+        hours=2
+    )
+    assert len(reads) == 1
+
+    monkeypatch.setattr(scheduler.dal, "reminder_schedule_generation", 99)
+    await scheduler._next_reminder_due_at(now + timedelta(minutes=2))
+    assert len(reads) == 2
+
+    await scheduler._next_reminder_due_at(now + timedelta(minutes=13))
+    assert len(reads) == 3
+
+
+@pytest.mark.asyncio
+async def test_next_reminder_due_is_reread_when_it_falls_inside_the_next_poll(monkeypatch):
+    from voting import scheduler
+
+    now = datetime(2026, 7, 1, 12, 0, tzinfo=UTC)
+    reads = []
+
+    async def vote_due(at):
+        reads.append(at)
+        return now + timedelta(seconds=90)
+
+    async def survey_due(_at):
+        return None
+
+    monkeypatch.setattr(scheduler.dal, "next_reminder_due_at", vote_due)
+    monkeypatch.setattr(scheduler.survey_dal, "next_reminder_due_at", survey_due)
+
+    await scheduler._next_reminder_due_at(now)
+    await scheduler._next_reminder_due_at(now + timedelta(seconds=45))
+
+    assert len(reads) == 2
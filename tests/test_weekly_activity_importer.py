@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from datetime import UTC, date, datetime
 from io import BytesIO
 
 import pandas as pd
 import pytest
 
+import weekly_activity_importer as wai
 from weekly_activity_importer import _completion_evidence, parse_activity_excel
 
 
@@ -92,3 +94,148 @@ def test_completion_requires_expected_scan_cohort():
 
     with pytest.raises(RuntimeError, match="expected scan cohort"):
         _completion_evidence(parsed, set())
+
+
+WEEK = datetime(2026, 5, 4, tzinfo=UTC)
+
+
+def _day(n: int) -> date:
+    return date(2026, 5, 4 + n)
+
+
+class _DailyCursor:
+    def __init__(self, snapshot_rows, daily_rows=()) -> None:
+        self.snapshot_rows = list(snapshot_rows)
+        self.daily_rows = list(daily_rows)
+        self.executed: list[str] = []
+        self.executemany_calls: list[tuple[str, list[tuple]]] = []
+        self._result: list[tuple] = []
+
+    def execute(self, sql: str, *params):
+        self.executed.append(sql)
+        if "AllianceActivitySnapshotRow" in sql:
+            self._result = self.snapshot_rows
+        elif sql.strip().startswith("SELECT"):
+            self._result = self.daily_rows
+        return self
+
+    def fetchall(self):
+        return self._result
+
+    def executemany(self, sql: str, rows):
+        self.executemany_calls.append((sql, list(rows)))
+
+    def written(self, verb: str) -> list[tuple]:
+        return [row for sql, rows in self.executemany_calls if verb in sql for row in rows]
+
+
+def test_daily_frame_carries_forward_and_clamps_counter_drops():
+    rows = [
+        (1, _day(0), 100, 10),
+        (1, _day(0), 120, 5),  # same day: max of the day wins
+        (1, _day(2), 90, 30),  # building dropped: clamped to 120
+        (1, _day(4), None, 40),
+        (2, _day(3), 7, 0),
+    ]
+
+    frame = wai._daily_activity_frame(rows, WEEK)
+
+    by_gov = {
+        gov: list(zip(g["BuildDonations"], g["TechDonations"], strict=True))
+        for gov, g in frame.groupby("GovernorID")
+    }
+    assert by_gov[1] == [(120, 10), (0, 0), (0, 20), (0, 0), (0, 10), (0, 0), (0, 0)]
+    assert by_gov[2] == [(0, 0), (0, 0), (0, 0), (7, 0), (0, 0), (0, 0), (0, 0)]
+    assert list(frame.loc[frame["GovernorID"] == 1, "AsOfDate"]) == [_day(i) for i in range(7)]
+
+
+def test_full_rebuild_replaces_the_week():
+    cur = _DailyCursor([(1, _day(0), 10, 1), (2, _day(1), 5, 5)])
+
+    written = wai._rebuild_daily_activity_for_week(cur, WEEK)
+
+    assert written == 14
+    assert any(sql.startswith("DELETE") for sql in cur.executed)
+    inserted = cur.written("INSERT")
+    assert len(inserted) == 14
+    assert inserted[0] == (WEEK.replace(tzinfo=None), 1, _day(0), 10, 1)
+
+
+def test_incremental_rebuild_writes_only_changed_days_and_new_governors():
+    snapshot_rows = [(1, _day(0), 10, 1), (1, _day(3), 15, 1), (2, _day(3), 4, 2)]
+    stored = [(1, _day(i), 10 if i == 0 else 0, 1 if i == 0 else 0) for i in range(7)]
+    cur = _DailyCursor(snapshot_rows, stored)
+
+    written = wai._rebuild_daily_activity_for_week(cur, WEEK, incremental=True)
+
+    assert not any(sql.startswith("DELETE") for sql in cur.executed)
+    assert cur.written("DELETE") == []
+    week = WEEK.replace(tzinfo=None)
+    assert cur.written("UPDATE") == [(5, 0, 1, _day(3), week)]
+    inserted = cur.written("INSERT")
+    assert {row[1] for row in inserted} == {2}
+    assert len(inserted) == 7
+    assert (week, 2, _day(3), 4, 2) in inserted
+    assert written == 8
+
+
+def test_incremental_rebuild_without_changes_writes_nothing():
+    snapshot_rows = [(1, _day(0), 10, 1)]
+    stored = [(1, _day(i), 10 if i == 0 else 0, 1 if i == 0 else 0) for i in range(7)]
+    cur = _DailyCursor(snapshot_rows, stored)
+
+    assert wai._rebuild_daily_activity_for_week(cur, WEEK, incremental=True) == 0
+    assert cur.executemany_calls == []
+
+
+def test_incremental_rebuild_on_empty_table_inserts_whole_week():
+    cur = _DailyCursor([(1, _day(5), 3, 3)])
+
+    assert wai._rebuild_daily_activity_for_week(cur, WEEK, incremental=True) == 7
+    assert len(cur.written("INSERT")) == 7
+
+
+def test_incremental_rebuild_deletes_rows_of_governors_no_longer_in_the_week():
+    # Governor 2's snapshot rows were removed (e.g. a bad upload was rolled back).
+    snapshot_rows = [(1, _day(0), 10, 1)]
+    stored = [(1, _day(i), 10 if i == 0 else 0, 1 if i == 0 else 0) for i in range(7)]
+    stored += [(2, _day(i), 4 if i == 1 else 0, 0) for i in range(7)]
+    cur = _DailyCursor(snapshot_rows, stored)
+
+    written = wai._rebuild_daily_activity_for_week(cur, WEEK, incremental=True)
+
+    week = WEEK.replace(tzinfo=None)
+    assert sorted(cur.written("DELETE")) == [(2, _day(i), week) for i in range(7)]
+    assert cur.written("INSERT") == [] and cur.written("UPDATE") == []
+    assert written == 7
+
+
+def test_incremental_rebuild_repairs_days_before_the_latest_snapshot():
+    # A late upload for Tuesday lands after Thursday's: Tuesday and Wednesday change too.
+    snapshot_rows = [(1, _day(0), 10, 0), (1, _day(1), 14, 0), (1, _day(3), 20, 0)]
+    stored = [(1, _day(i), {0: 10, 3: 10}.get(i, 0), 0) for i in range(7)]
+    cur = _DailyCursor(snapshot_rows, stored)
+
+    written = wai._rebuild_daily_activity_for_week(cur, WEEK, incremental=True)
+
+    week = WEEK.replace(tzinfo=None)
+    assert sorted(cur.written("UPDATE"), key=lambda row: row[3]) == [
+        (4, 0, 1, _day(1), week),
+        (6, 0, 1, _day(3), week),
+    ]
+    assert cur.written("INSERT") == [] and cur.written("DELETE") == []
+    assert written == 2
+
+
+def test_incremental_rebuild_fills_days_missing_from_a_partial_week():
+    snapshot_rows = [(1, _day(0), 10, 0), (1, _day(2), 12, 0)]
+    stored = [(1, _day(i), 10 if i == 0 else 0, 0) for i in range(2)]
+    cur = _DailyCursor(snapshot_rows, stored)
+
+    written = wai._rebuild_daily_activity_for_week(cur, WEEK, incremental=True)
+
+    week = WEEK.replace(tzinfo=None)
+    inserted = sorted(cur.written("INSERT"), key=lambda row: row[2])
+    assert inserted == [(week, 1, _day(i), 2 if i == 2 else 0, 0) for i in range(2, 7)]
+    assert all(isinstance(value, int) for row in inserted for value in row[3:])
+    assert written == 5
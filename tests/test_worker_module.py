@@ -12,3 +12,19 @@ def long_sleep(seconds: float):
 async def async_long_sleep(seconds: float):
     await asyncio.sleep(float(seconds))
     return f"async_slept:{seconds}"
+
+
+def raise_value_error(message: str):
+    """Fails with the given message; used to check how worker failures are reported."""
+    raise ValueError(message)
+
+
+def render_png(width: int, height: int) -> bytes:
+    """Tiny Pillow render used by render service tests."""
+    from io import BytesIO
+
+    from PIL import Image
+
+    buf = BytesIO()
+    Image.new("RGBA", (int(width), int(height)), (10, 20, 30, 255)).save(buf, format="PNG")
+    return buf.getvalue()
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+
+import pytest
+
+from core import worker_pool
+
+pytest_plugins = ("pytest_asyncio",)
+
+_MODULE = "tests.test_worker_module"
+
+
+def _pool(**kwargs) -> worker_pool.WarmWorkerPool:
+    kwargs.setdefault("size", 1)
+    kwargs.setdefault("preload", "json")
+    return worker_pool.WarmWorkerPool(**kwargs)
+
+
+def test_frame_roundtrip():
+    buf = io.BytesIO()
+    worker_pool.write_frame(buf, {"type": "job", "args": [b"\x00\x01", 3]})
+    worker_pool.write_frame(buf, {"type": "shutdown"})
+    buf.seek(0)
+
+    assert worker_pool.read_frame(buf) == {"type": "job", "args": [b"\x00\x01", 3]}
+    assert worker_pool.read_frame(buf) == {"type": "shutdown"}
+    assert worker_pool.read_frame(buf) is None
+
+
+@pytest.mark.asyncio
+async def test_call_job_reuses_warm_worker():
+    pool = _pool()
+    try:
+        first = await pool.run(
+            {"kind": "call", "module": _MODULE, "function": "long_sleep", "args": ["0.01"]}
+        )
+        second = await pool.run(
+            {"kind": "call", "module": _MODULE, "function": "async_long_sleep", "args": ["0.01"]}
+        )
+    finally:
+        await pool.shutdown()
+
+    assert first["ok"] is True and first["result"] == "slept:0.01"
+    assert second["ok"] is True and second["result"] == "async_slept:0.01"
+    assert pool.stats()["spawned"] == 1
+
+
+@pytest.mark.asyncio
+async def test_spec_job_returns_worker_result_payload():
+    pool = _pool()
+    try:
+        reply = await pool.run({"kind": "spec", "spec": f"{_MODULE}:long_sleep", "argv": ["0.01"]})
+    finally:
+        await pool.shutdown()
+
+    assert reply["returncode"] == 0
+    assert reply["worker_parsed"]["status"] == "success"
+    assert reply["worker_parsed"]["result"] == "slept:0.01"
+
+
+@pytest.mark.asyncio
+async def test_remote_exception_is_returned_picklable():
+    pool = _pool()
+    try:
+        reply = await pool.run({"kind": "call", "module": "os", "function": "does_not_exist"})
+    finally:
+        await pool.shutdown()
+
+    assert reply["ok"] is False
+    assert isinstance(reply["exc"], AttributeError)
+
+
+@pytest.mark.asyncio
+async def test_allowlist_is_enforced_in_worker(monkeypatch):
+    monkeypatch.setenv("MAINT_SPEC_ALLOWLIST", '["other_mod:fn"]')
+    pool = _pool()
+    try:
+        reply = await pool.run(
+            {"kind": "call", "module": _MODULE, "function": "long_sleep", "args": ["0"]}
+        )
+    finally:
+        await pool.shutdown()
+
+    assert reply["ok"] is False
+    assert reply["error"] == "spec_not_allowed"
+
+
+@pytest.mark.asyncio
+async def test_timeout_kills_worker_and_next_job_gets_fresh_one():
+    pool = _pool()
+    try:
+        with pytest.raises(worker_pool.WorkerJobTimeout):
+            await pool.run(
+                {"kind": "call", "module": _MODULE, "function": "long_sleep", "args": ["10"]},
+                timeout=0.5,
+            )
+        reply = await pool.run(
+            {"kind": "call", "module": _MODULE, "function": "long_sleep", "args": ["0"]}
+        )
+    finally:
+        await pool.shutdown()
+
+    assert reply["ok"] is True
+    assert pool.stats()["spawned"] == 2
+
+
+@pytest.mark.asyncio
+async def test_killed_worker_fails_job_with_worker_crashed():
+    pool = _pool()
+    pids: list[int] = []
+    try:
+        task = asyncio.create_task(
+            pool.run(
+                {"kind": "call", "module": _MODULE, "function": "long_sleep", "args": ["10"]},
+                on_start=pids.append,
+            )
+        )
+        while not pids:
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.2)
+        os.kill(pids[0], 9)
+        with pytest.raises(worker_pool.WorkerCrashed):
+            await task
+    finally:
+        await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_worker_recycled_after_max_jobs():
+    pool = _pool(max_jobs=1)
+    try:
+        for _ in range(2):
+            await pool.run(
+                {"kind": "call", "module": _MODULE, "function": "long_sleep", "args": ["0"]}
+            )
+    finally:
+        await pool.shutdown()
+
+    stats = pool.stats()
+    assert stats["spawned"] == 2
+    assert stats["recycled"] == 2
+
+
+def test_get_worker_pool_keeps_pools_owned_by_other_live_loops(monkeypatch):
+    monkeypatch.setattr(worker_pool, "_pools", {})
+
+    async def _get():
+        return worker_pool.get_worker_pool()
+
+    other = asyncio.new_event_loop()
+    try:
+        first = other.run_until_complete(_get())
+        second = asyncio.run(_get())
+
+        assert second is not first
+        assert first._closed is False
+        assert other.run_until_complete(_get()) is first
+    finally:
+        other.close()
+
+    asyncio.run(_get())
+    assert first._closed is True
+    assert second._closed is True
+
+
+@pytest.mark.asyncio
+async def test_run_callable_subprocess_runs_on_warm_pool_end_to_end(monkeypatch):
+    import json
+
+    import file_utils
+
+    monkeypatch.setenv("MAINT_WORKER_POOL", "1")
+    monkeypatch.setattr(worker_pool, "_pools", {})
+    spawned = []
+    real_exec = asyncio.create_subprocess_exec
+
+    async def _spy_exec(*cmd, **kwargs):
+        spawned.append(cmd)
+        return await real_exec(*cmd, **kwargs)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", _spy_exec)
+    try:
+        ok, out = await file_utils.run_callable_subprocess(_MODULE, "long_sleep", ["0.01"])
+        failed, error = await file_utils.run_callable_subprocess(
+            _MODULE, "raise_value_error", ["bad input"]
+        )
+        stats = worker_pool.get_worker_pool_stats()
+    finally:
+        await worker_pool.shutdown_worker_pool()
+
+    assert ok is True
+    assert json.loads(out)["return"] == "slept:0.01"
+    assert failed is False
+    assert error == "ValueError: bad input"
+    assert stats["jobs"] == 2 and stats["spawned"] == 1
+    # Only the warm worker was started; no per-call callable_worker.py process.
+    assert len(spawned) == 1 and not any("callable_worker.py" in str(c) for c in spawned[0])
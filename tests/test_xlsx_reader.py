@@ -0,0 +1,83 @@
+from datetime import datetime
+from io import BytesIO
+
+from openpyxl import Workbook
+import pandas as pd
+import pytest
+
+from core import xlsx_reader
+
+
+def _workbook_bytes() -> bytes:
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Governor ID", " Name ", "Power", None, "Scanned", "Name"])
+    ws.append([1, "Alice", 10.0, None, datetime(2026, 5, 8, 1, 0), "x"])
+    ws.append([2, None, 12.5, None, None, "y"])
+    ws.append([None, None, None])
+    ws.append(["3", "Carol", "#N/A", None, datetime(2026, 5, 9)])
+    ws.append([None])
+    overall = wb.create_sheet("Overall")
+    overall.append(["MGE results"])
+    overall.append([])
+    overall.append(["Rank", "Player ID", "Player", "Score"])
+    overall.append([1, 123, "Alice", "1,000"])
+    wb.create_sheet("Empty")
+    bio = BytesIO()
+    wb.save(bio)
+    return bio.getvalue()
+
+
+@pytest.mark.parametrize(
+    "sheet_name, header",
+    [("Data", 0), ("Overall", 2), ("Empty", 0), (0, 0), (1, 0)],
+)
+def test_read_sheet_matches_pandas_read_excel(sheet_name, header):
+    content = _workbook_bytes()
+    expected = pd.read_excel(BytesIO(content), sheet_name=sheet_name, header=header)
+
+    actual = xlsx_reader.read_xlsx_sheet(content, sheet_name, header=header, engine="openpyxl")
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_read_sheet_nrows_matches_pandas():
+    content = _workbook_bytes()
+    expected = pd.read_excel(BytesIO(content), sheet_name="Data", nrows=2)
+
+    actual = xlsx_reader.read_xlsx_sheet(content, "Data", nrows=2, engine="openpyxl")
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_workbook_lists_sheets_and_header_without_full_read():
+    with xlsx_reader.open_workbook(_workbook_bytes(), engine="openpyxl") as workbook:
+        assert workbook.sheet_names == ["Data", "Overall", "Empty"]
+        assert workbook.header("Data") == ["Governor ID", " Name ", "Power", "", "Scanned", "Name"]
+        assert workbook.header("Empty") == []
+
+
+def test_missing_sheet_raises_pandas_style_error():
+    with pytest.raises(ValueError, match="Worksheet named 'Nope' not found"):
+        xlsx_reader.read_xlsx_sheet(_workbook_bytes(), "Nope", engine="openpyxl")
+
+
+def test_engine_selection_falls_back_without_calamine(monkeypatch):
+    monkeypatch.setattr(xlsx_reader, "calamine_available", lambda: False)
+    monkeypatch.setenv("XLSX_ENGINE", "calamine")
+    assert xlsx_reader.xlsx_engine() == "openpyxl"
+
+    monkeypatch.setenv("XLSX_ENGINE", "auto")
+    assert xlsx_reader.xlsx_engine() == "openpyxl"
+    assert xlsx_reader.xlsx_engine("pandas") == "pandas"
+
+
+def test_calamine_engine_matches_pandas():
+    pytest.importorskip("python_calamine")
+    content = _workbook_bytes()
+    expected = pd.read_excel(BytesIO(content), sheet_name="Overall", header=2)
+
+    actual = xlsx_reader.read_xlsx_sheet(content, "Overall", header=2, engine="calamine")
+
+    pd.testing.assert_frame_equal(actual, expected)
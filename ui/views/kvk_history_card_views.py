@@ -7,6 +7,7 @@ import logging
 
 import discord
 
+from core.render_service import render_card
 from kvk.models.kvk_history_payload import KvkHistoryPayload, RenderedKvkHistoryCard
 from kvk.rendering.kvk_history_renderer import (
     build_last3_text_fallback,
@@ -132,7 +133,7 @@ class KvkHistoryCardView(discord.ui.View):
         await self._defer_interaction(interaction)
         try:
             if self._summary_bytes is None or self._summary_filename is None:
-                rendered = await asyncio.to_thread(
+                rendered = await render_card(
                     render_kvk_history_summary_card,
                     self.payload,
                     avatar_bytes=self.avatar_bytes,
@@ -173,7 +174,7 @@ class KvkHistoryCardView(discord.ui.View):
         await self._defer_interaction(interaction)
         try:
             if self._trends_bytes is None or self._trends_filename is None:
-                rendered = await asyncio.to_thread(
+                rendered = await render_card(
                     render_kvk_history_trends_card,
                     self.payload,
                     avatar_bytes=self.avatar_bytes,
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from collections.abc import Sequence
 import logging
 
@@ -8,6 +7,7 @@ import discord
 
 from bot_config import KVK_PLAYER_STATS_CHANNEL_ID
 from core.interaction_safety import send_ephemeral
+from core.render_service import render_card
 from decoraters import _is_admin
 from kvk.models.kvk_rankings import (
     HALL_OF_FAME_METRIC_LABELS,
@@ -41,7 +41,7 @@ async def _top10_card_file(payload: RankingPayload) -> discord.File | None:
     if not can_render_current_rankings_top10_card(payload):
         return None
     try:
-        rendered = await asyncio.to_thread(render_current_rankings_top10_card, payload)
+        rendered = await render_card(render_current_rankings_top10_card, payload)
     except Exception:
         logger.exception(
             "kvk_current_rankings_card_render_failed mode=%s metric=%s limit=%s",
@@ -60,7 +60,7 @@ async def _records_top10_card_file(payload: RankingPayload) -> discord.File | No
     if not can_render_hall_of_fame_top10_card(payload):
         return None
     try:
-        rendered = await asyncio.to_thread(render_hall_of_fame_top10_card, payload)
+        rendered = await render_card(render_hall_of_fame_top10_card, payload)
     except Exception:
         logger.exception(
             "kvk_records_card_render_failed metric=%s limit=%s",
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import asyncio
 from io import BytesIO
 import logging
 
 import discord
 
+from core.render_service import render_card
 from kvk.models.kvk_stats_card import KvkStatsCardPayload, RenderedKvkStatsCard
 from kvk.rendering.kvk_stats_card_renderer import render_kvk_more_stats_card
 
@@ -150,7 +150,7 @@ class KvkStatsCardView(discord.ui.View):
         await self._defer_interaction(interaction)
         try:
             if self._more_stats_bytes is None or self._more_stats_filename is None:
-                rendered = await asyncio.to_thread(render_kvk_more_stats_card, self.payload)
+                rendered = await render_card(render_kvk_more_stats_card, self.payload)
                 if rendered is not None:
                     self._more_stats_bytes = rendered.image_bytes.getvalue()
                     self._more_stats_filename = rendered.filename
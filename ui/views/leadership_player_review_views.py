@@ -19,6 +19,7 @@ from core.leadership_player_permissions import (
     authorize_leadership_player_interaction,
     reauthorize_leadership_player_interaction,
 )
+from core.render_service import render_card
 from leadership_player_review import renderer, service
 from leadership_player_review.models import LeadershipPlayerPayload, LookupCandidate, ReviewPage
 from leadership_player_review.record_paging import record_page_count
@@ -68,8 +69,8 @@ def _close_file(file: discord.File | None) -> None:
             pass
 
 
-def _card_file(payload: LeadershipPlayerPayload) -> discord.File:
-    rendered = renderer.render_leadership_player(payload)
+async def _card_file(payload: LeadershipPlayerPayload) -> discord.File:
+    rendered = await render_card(renderer.render_leadership_player, payload)
     return discord.File(BytesIO(rendered.image_bytes), filename=rendered.filename)
 
 
@@ -489,7 +490,7 @@ class LeadershipPlayerView(discord.ui.View):
         try:
             try:
                 render_started = time.perf_counter()
-                file = await asyncio.to_thread(_card_file, payload)
+                file = await _card_file(payload)
                 render_ms = (time.perf_counter() - render_started) * 1000.0
                 if transition_id != self._transition_id:
                     await _audit(
@@ -1044,7 +1045,7 @@ class LeadershipPlayerAmbiguityView(discord.ui.View):
             )
             file: discord.File | None = None
             try:
-                file = await asyncio.to_thread(_card_file, payload)
+                file = await _card_file(payload)
                 current_authorization = await _final_delivery_authorization(
                     interaction,
                     author_id=self.author_id,
@@ -1327,7 +1328,7 @@ async def send_leadership_player_review(
     try:
         try:
             render_started = time.perf_counter()
-            file = await asyncio.to_thread(_card_file, payload)
+            file = await _card_file(payload)
             render_ms = (time.perf_counter() - render_started) * 1000.0
             current_authorization = await _final_delivery_authorization(
                 interaction,
@@ -11,6 +11,7 @@ import logging
 import discord
 
 from core import visual_contract
+from core.render_service import render_card
 from player_self_service import accounts_renderer, accounts_service
 from player_self_service.accounts_models import (
     AccountsPortfolioPayload,
@@ -107,7 +108,7 @@ async def _render_summary(
     display_name: str,
     avatar_bytes: bytes | None = None,
 ) -> discord.File:
-    rendered = await asyncio.to_thread(
+    rendered = await render_card(
         accounts_renderer.render_account_summary_card,
         page,
         display_name=display_name,
@@ -14,6 +14,8 @@ from typing import Any
 import discord
 
 from core import visual_contract
+from core.avatar_cache import fetch_avatar
+from core.render_service import render_card
 from player_self_service import accounts_service
 from player_self_service.accounts_models import AccountsPortfolioPayload
 from player_self_service.governor_dashboard_models import (
@@ -226,10 +228,7 @@ async def _read_avatar_bytes(user: Any, *, expected_user_id: int) -> bytes | Non
     if avatar is None:
         return None
     try:
-        if hasattr(avatar, "with_size"):
-            avatar = avatar.with_size(256)
-        if hasattr(avatar, "read"):
-            return await asyncio.wait_for(avatar.read(), timeout=_AVATAR_READ_TIMEOUT_SECONDS)
+        return await fetch_avatar(avatar, size=256, timeout=_AVATAR_READ_TIMEOUT_SECONDS)
     except asyncio.CancelledError:
         raise
     except Exception:
@@ -1110,7 +1109,7 @@ async def _render_resolution(
                         avatar_bytes = await _read_avatar_bytes(
                             getattr(target, "user", None), expected_user_id=author_id
                         )
-                        rendered_card = await asyncio.to_thread(
+                        rendered_card = await render_card(
                             render_governor_dashboard,
                             payload,
                             avatar_bytes=avatar_bytes,
@@ -15,7 +15,9 @@ import discord
 
 from bot_config import INVENTORY_UPLOAD_CHANNEL_ID
 from core import visual_contract
+from core.avatar_cache import fetch_avatar
 from core.interaction_safety import safe_defer
+from core.render_service import render_card
 from inventory import export_service, reporting_service
 from inventory.models import (
     InventoryExportFormat,
@@ -218,10 +220,7 @@ async def _read_avatar_bytes(user: Any, *, expected_user_id: int) -> bytes | Non
     if avatar is None:
         return None
     try:
-        if hasattr(avatar, "with_size"):
-            avatar = avatar.with_size(256)
-        if hasattr(avatar, "read"):
-            return await asyncio.wait_for(avatar.read(), timeout=_AVATAR_READ_TIMEOUT_SECONDS)
+        return await fetch_avatar(avatar, size=256, timeout=_AVATAR_READ_TIMEOUT_SECONDS)
     except asyncio.CancelledError:
         raise
     except Exception:
@@ -270,7 +269,7 @@ async def _private_error(interaction: discord.Interaction, content: str) -> None
 async def _render_files(
     payload: InventoryReportPayload, *, avatar_bytes: bytes | None
 ) -> list[discord.File]:
-    rendered = await asyncio.to_thread(
+    rendered = await render_card(
         render_inventory_reports,
         payload,
         avatar_bytes=avatar_bytes,
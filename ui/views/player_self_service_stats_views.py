@@ -16,6 +16,7 @@ from typing import Any
 import discord
 
 from core import visual_contract
+from core.avatar_cache import fetch_avatar
 from file_utils import emit_telemetry_event
 from player_self_service.stats_models import (
     PersonalStatsAccessChanged,
@@ -60,9 +61,7 @@ async def _read_avatar_bytes(user: Any, *, author_id: int) -> bytes | None:
     if avatar is None:
         return None
     try:
-        if hasattr(avatar, "with_size"):
-            avatar = avatar.with_size(256)
-        data = await asyncio.wait_for(avatar.read(), timeout=_AVATAR_TIMEOUT_SECONDS)
+        data = await fetch_avatar(avatar, size=256, timeout=_AVATAR_TIMEOUT_SECONDS)
         return data if len(data) <= _AVATAR_MAX_BYTES else None
     except asyncio.CancelledError:
         raise
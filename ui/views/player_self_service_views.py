@@ -12,7 +12,9 @@ from typing import Any
 import discord
 
 from core import visual_contract
+from core.avatar_cache import fetch_avatar
 from core.interaction_safety import safe_defer
+from core.render_service import render_card
 from player_self_service import (
     account_service,
     accounts_renderer,
@@ -85,10 +87,7 @@ async def _read_avatar_bytes(user: object | None, *, expected_user_id: int) -> b
     if avatar is None:
         return None
     try:
-        if hasattr(avatar, "with_size"):
-            avatar = avatar.with_size(256)
-        if hasattr(avatar, "read"):
-            return await asyncio.wait_for(avatar.read(), timeout=_AVATAR_READ_TIMEOUT_SECONDS)
+        return await fetch_avatar(avatar, size=256, timeout=_AVATAR_READ_TIMEOUT_SECONDS)
     except asyncio.CancelledError:
         raise
     except Exception:
@@ -457,7 +456,7 @@ async def _build_page_response(
         if page == PAGE_ACCOUNTS:
             if accounts_payload is None:
                 raise ValueError("Accounts render requires an authorised portfolio payload")
-            rendered = await asyncio.to_thread(
+            rendered = await render_card(
                 accounts_renderer.render_accounts_card,
                 accounts_payload,
                 display_name=display_name,
@@ -466,15 +465,16 @@ async def _build_page_response(
         elif page == PAGE_DASHBOARD:
             if summary is None:
                 raise ValueError("Dashboard render requires a summary")
-            rendered = await asyncio.to_thread(
+            rendered = await render_card(
                 dashboard_card.render_dashboard_card,
                 summary,
                 display_name=display_name,
+                generated_at_utc=datetime.now(UTC),
             )
         elif page == PAGE_REMINDERS:
             if summary is None:
                 raise ValueError("Reminders render requires a summary")
-            rendered = await asyncio.to_thread(
+            rendered = await render_card(
                 reminders_renderer.render_reminders_card,
                 _reminders_payload(summary, display_name=display_name),
                 avatar_bytes=avatar_bytes,
@@ -482,7 +482,7 @@ async def _build_page_response(
         elif page == PAGE_PREFERENCES:
             if preferences_payload is None:
                 raise ValueError("Preferences render requires an authorised payload")
-            rendered = await asyncio.to_thread(
+            rendered = await render_card(
                 preferences_renderer.render_preferences_card,
                 preferences_payload,
                 avatar_bytes=avatar_bytes,
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
 import discord
 
+from core.render_service import render_card
 from prekvk import report_service
 from prekvk.models import PREKVK_PRIMARY_REPORT_LIMITS, PreKvkReportPayload, PreKvkReportSort
 from prekvk.report_image_renderer import render_prekvk_report
@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 
 
 async def _discord_file(payload: PreKvkReportPayload) -> discord.File | None:
-    rendered = await asyncio.to_thread(render_prekvk_report, payload)
+    rendered = await render_card(render_prekvk_report, payload)
     if rendered is None:
         return None
     return discord.File(rendered.image_bytes, filename=rendered.filename)
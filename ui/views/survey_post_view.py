@@ -8,6 +8,7 @@ import discord
 
 from core.interaction_safety import send_ephemeral
 from voting import survey_service
+from voting.card_refresh import survey_card_refresh
 from voting.option_emojis import EMOJI_KIND_CUSTOM_DISCORD, OptionEmoji, option_display_label
 from voting.survey_models import (
     DEFAULT_RATING_MAX_VALUE,
@@ -2294,6 +2295,18 @@ class _SurveyOptionModal(discord.ui.Modal):
 async def _refresh_public_survey_message(
     interaction: discord.Interaction, snapshot: SurveySnapshot
 ) -> None:
+    survey_id = int(snapshot.survey_id)
+    await survey_card_refresh.request(
+        survey_id,
+        snapshot,
+        edit=lambda latest: _edit_public_survey_message(interaction, latest),
+        load_latest=lambda: survey_service.get_survey_snapshot(survey_id),
+    )
+
+
+async def _edit_public_survey_message(
+    interaction: discord.Interaction, snapshot: SurveySnapshot
+) -> bool:
     try:
         channel = interaction.client.get_channel(
             snapshot.channel_id
@@ -2318,6 +2331,8 @@ async def _refresh_public_survey_message(
             actor_discord_user_id=int(interaction.user.id),
             source="survey_response",
         )
+        return False
+    return True
 
 
 def disabled_survey_view(snapshot: SurveySnapshot) -> SurveyPostView:
@@ -7,6 +7,7 @@ import discord
 
 from core.interaction_safety import send_ephemeral
 from voting import service as vote_service
+from voting.card_refresh import vote_card_refresh
 from voting.discord_presentation import build_vote_embed, build_vote_file, no_broad_mentions
 from voting.models import VoteOption, VoteSnapshot
 from voting.option_emojis import EMOJI_KIND_CUSTOM_DISCORD, OptionEmoji, option_display_label
@@ -97,26 +98,15 @@ class _VoteOptionButton(discord.ui.Button):
             await send_ephemeral(interaction, result.message or "This vote could not be recorded.")
             return
 
-        refreshed_view = VotePostView(snapshot)
-        try:
-            if interaction.message is not None:
-                await interaction.message.edit(
-                    embed=build_vote_embed(snapshot),
-                    attachments=[],
-                    files=[build_vote_file(snapshot)],
-                    view=refreshed_view,
-                    allowed_mentions=no_broad_mentions(),
-                )
-        except Exception:
-            logger.exception(
-                "vote_message_edit_failed vote_post_id=%s message_id=%s",
+        message = interaction.message
+        if message is not None:
+            await vote_card_refresh.request(
                 self.vote_post_id,
-                getattr(getattr(interaction, "message", None), "id", None),
-            )
-            await vote_service.record_message_edit_failed(
-                vote_post_id=self.vote_post_id,
-                actor_discord_user_id=int(interaction.user.id),
-                source="button_vote",
+                snapshot,
+                edit=lambda latest: _edit_vote_message(
+                    interaction, message, latest, source="button_vote"
+                ),
+                load_latest=lambda: vote_service.get_vote_snapshot(self.vote_post_id),
             )
 
         await send_ephemeral(interaction, result.message or f"Vote recorded: {self.option_label}")
@@ -240,33 +230,41 @@ class _MultiSelectOptionSelect(discord.ui.Select):
             await send_ephemeral(interaction, result.message or "This vote could not be recorded.")
             return
 
-        try:
-            channel = interaction.client.get_channel(
-                snapshot.channel_id
-            ) or await interaction.client.fetch_channel(snapshot.channel_id)
-            message = (
-                await channel.fetch_message(snapshot.message_id) if snapshot.message_id else None
-            )
-            if message is not None:
-                await message.edit(
-                    embed=build_vote_embed(snapshot),
-                    attachments=[],
-                    files=[build_vote_file(snapshot)],
-                    view=VotePostView(snapshot),
-                    allowed_mentions=no_broad_mentions(),
+        vote_post_id = self.parent_view.vote_post_id
+
+        async def edit_public_message(latest: VoteSnapshot) -> bool:
+            try:
+                channel = interaction.client.get_channel(
+                    latest.channel_id
+                ) or await interaction.client.fetch_channel(latest.channel_id)
+                message = (
+                    await channel.fetch_message(latest.message_id) if latest.message_id else None
                 )
-        except Exception:
-            logger.exception(
-                "vote_multi_select_message_edit_failed vote_post_id=%s message_id=%s",
-                self.parent_view.vote_post_id,
-                snapshot.message_id,
-            )
-            await vote_service.record_message_edit_failed(
-                vote_post_id=self.parent_view.vote_post_id,
-                actor_discord_user_id=int(interaction.user.id),
-                source="multi_select_vote",
+            except Exception:
+                logger.exception(
+                    "vote_multi_select_message_edit_failed vote_post_id=%s message_id=%s",
+                    vote_post_id,
+                    latest.message_id,
+                )
+                await vote_service.record_message_edit_failed(
+                    vote_post_id=vote_post_id,
+                    actor_discord_user_id=int(interaction.user.id),
+                    source="multi_select_vote",
+                )
+                return False
+            if message is None:
+                return True
+            return await _edit_vote_message(
+                interaction, message, latest, source="multi_select_vote"
             )
 
+        await vote_card_refresh.request(
+            vote_post_id,
+            snapshot,
+            edit=edit_public_message,
+            load_latest=lambda: vote_service.get_vote_snapshot(vote_post_id),
+        )
+
         await send_ephemeral(interaction, result.message or "Selections recorded.")
 
 
@@ -286,5 +284,32 @@ class MultiSelectVotePanel(discord.ui.View):
         self.add_item(_MultiSelectOptionSelect(self))
 
 
+async def _edit_vote_message(
+    interaction: discord.Interaction, message, snapshot: VoteSnapshot, *, source: str
+) -> bool:
+    try:
+        await message.edit(
+            embed=build_vote_embed(snapshot),
+            attachments=[],
+            files=[build_vote_file(snapshot)],
+            view=VotePostView(snapshot),
+            allowed_mentions=no_broad_mentions(),
+        )
+    except Exception:
+        logger.exception(
+            "vote_message_edit_failed vote_post_id=%s message_id=%s source=%s",
+            snapshot.vote_post_id,
+            getattr(message, "id", None),
+            source,
+        )
+        await vote_service.record_message_edit_failed(
+            vote_post_id=int(snapshot.vote_post_id),
+            actor_discord_user_id=int(interaction.user.id),
+            source=source,
+        )
+        return False
+    return True
+
+
 def disabled_vote_view(snapshot: VoteSnapshot) -> VotePostView:
     return VotePostView(snapshot, disabled=True)
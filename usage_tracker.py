@@ -9,7 +9,6 @@ from __future__ import annotations
 import asyncio
 from collections import defaultdict, deque
 from datetime import datetime, timedelta
-import json
 import logging
 import os
 import threading
@@ -17,6 +16,7 @@ import time
 from typing import Any, Callable, Dict, Optional
 
 from constants import BASE_DIR
+from core.jsonl_writer import JsonlWriter
 from utils import ensure_aware_utc, utcnow
 
 log = logging.getLogger(__name__)
@@ -26,18 +26,25 @@ os.makedirs(DATA_DIR, exist_ok=True)
 UsageEvent = dict[str, Any]
 
 
-# Daily JSONL paths
-def _jsonl_path_utc() -> str:
-    # Use repository-wide utcnow() helper so filename date is consistent
-    return os.path.join(DATA_DIR, f"command_usage_{utcnow().strftime('%Y%m%d')}.jsonl")
+# Daily JSONL streams (<prefix>YYYYMMDD.jsonl in DATA_DIR)
+_USAGE_PREFIX = "command_usage_"
+_METRICS_PREFIX = "metrics_"
+_ALERTS_PREFIX = "alerts_"
 
+_JSONL_WRITER: JsonlWriter | None = None
+_JSONL_WRITER_LOCK = threading.Lock()
 
-def _metrics_jsonl_path_utc() -> str:
-    return os.path.join(DATA_DIR, f"metrics_{utcnow().strftime('%Y%m%d')}.jsonl")
 
-
-def _alerts_jsonl_path_utc() -> str:
-    return os.path.join(DATA_DIR, f"alerts_{utcnow().strftime('%Y%m%d')}.jsonl")
+def get_jsonl_writer() -> JsonlWriter:
+    """Shared buffered writer for the usage/metrics/alerts JSONL files."""
+    global _JSONL_WRITER
+    writer = _JSONL_WRITER
+    if writer is None:
+        with _JSONL_WRITER_LOCK:
+            if _JSONL_WRITER is None:
+                _JSONL_WRITER = JsonlWriter(DATA_DIR)
+            writer = _JSONL_WRITER
+    return writer
 
 
 class AsyncUsageTracker:
@@ -64,72 +71,27 @@ class AsyncUsageTracker:
         if self._task:
             await self._task
             self._task = None
+        try:
+            await asyncio.to_thread(get_jsonl_writer().flush, fsync=True)
+        except Exception:
+            log.exception("[USAGE] Final JSONL flush failed")
 
     # ---------- public API ----------
     async def log(self, evt: UsageEvent) -> None:
-        # 1) local JSONL (best-effort, offload blocking I/O)
+        self.log_nowait(evt)
+
+    def log_nowait(self, evt: UsageEvent) -> None:
+        """Hand ``evt`` to the JSONL writer and the SQL queue; must run on the tracker's loop."""
+        # 1) local JSONL (buffered; written by the background JSONL writer)
         try:
             # Ensure executed_at_utc is serialisable: if it's a datetime, convert to ISO
             evt_copy = dict(evt)
             ts = evt_copy.get("executed_at_utc")
             if isinstance(ts, datetime):
                 evt_copy["executed_at_utc"] = ensure_aware_utc(ts).isoformat()
-
-            # Offload blocking file write to run_step/run_blocking_in_thread/to_thread (no start_callable_offload)
-            def _sync_write(
-                ecopy: UsageEvent, path_fn: Callable[[], str] = _jsonl_path_utc
-            ) -> None:
-                try:
-                    line = json.dumps(ecopy, separators=(",", ":"), ensure_ascii=False)
-                    with open(path_fn(), "a", encoding="utf-8") as f:
-                        f.write(line + "\n")
-                except Exception:
-                    # Log to the main logger — this runs in a thread/process; ensure exception is surfaced
-                    log.exception("[USAGE] Local JSONL background write failed")
-
-            # Local import to avoid module-level cycles; prefer run_step (standard wrapper),
-            # then run_blocking_in_thread; finally fallback to asyncio.to_thread.
-            try:
-                from file_utils import run_blocking_in_thread, run_step  # type: ignore
-            except Exception:
-                run_step = None
-                run_blocking_in_thread = None
-
-            try:
-                meta = {"command_name": evt_copy.get("command_name")}
-                if run_step is not None:
-                    # schedule run_step (async) fire-and-forget
-                    try:
-                        asyncio.create_task(
-                            run_step(
-                                _sync_write, evt_copy, name="usage_local_jsonl_write", meta=meta
-                            )
-                        )
-                    except Exception:
-                        # fallback to thread helper
-                        if run_blocking_in_thread is not None:
-                            asyncio.create_task(
-                                run_blocking_in_thread(
-                                    _sync_write, evt_copy, name="usage_local_jsonl_write", meta=meta
-                                )
-                            )
-                        else:
-                            asyncio.create_task(asyncio.to_thread(_sync_write, evt_copy))
-                elif run_blocking_in_thread is not None:
-                    asyncio.create_task(
-                        run_blocking_in_thread(
-                            _sync_write, evt_copy, name="usage_local_jsonl_write", meta=meta
-                        )
-                    )
-                else:
-                    # fallback to to_thread as before if helper not available
-                    asyncio.create_task(asyncio.to_thread(_sync_write, evt_copy))
-            except RuntimeError:
-                # If there is no running loop (unlikely inside async usage), do inline write as fallback
-                _sync_write(evt_copy)
-
+            get_jsonl_writer().write(_USAGE_PREFIX, evt_copy)
         except Exception:
-            log.exception("[USAGE] Preparing local JSONL write failed")
+            log.exception("[USAGE] Queueing local JSONL write failed")
 
         # 2) enqueue for SQL
         try:
@@ -229,7 +191,7 @@ def start_usage_tracker() -> "AsyncUsageTracker":
 # -------------------------
 
 # Filename prefixes that usage_tracker writes into DATA_DIR
-_JSONL_PREFIXES = ("command_usage_", "metrics_", "alerts_")
+_JSONL_PREFIXES = (_USAGE_PREFIX, _METRICS_PREFIX, _ALERTS_PREFIX)
 
 
 def prune_usage_jsonl_files(
@@ -340,16 +302,6 @@ def set_alert_callback(fn: Callable[[str, int, int], None]) -> None:
     _alert_callback = fn
 
 
-def _write_jsonl(path: str, obj: Any) -> None:
-    """Helper to append an object to a JSONL file safely."""
-    try:
-        line = json.dumps(obj, default=str, ensure_ascii=False)
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
-    except Exception:
-        log.exception("[USAGE] Failed to write JSONL to %s", path)
-
-
 def _emit_alert(name: str, count: int, window: int) -> None:
     """Emit an alert: log, write alerts JSONL and enqueue an alert-tracking event."""
     ts = utcnow().isoformat()
@@ -358,7 +310,7 @@ def _emit_alert(name: str, count: int, window: int) -> None:
         "[USAGE][ALERT] Metric spike detected: %s (count=%d window_s=%d)", name, count, window
     )
     try:
-        _write_jsonl(_alerts_jsonl_path_utc(), alert)
+        get_jsonl_writer().write(_ALERTS_PREFIX, alert)
     except Exception:
         log.exception("[USAGE] Could not persist alert JSONL")
     # Attempt to enqueue an alert event into the usage tracker so it gets flushed to SQL
@@ -381,13 +333,14 @@ def _emit_alert(name: str, count: int, window: int) -> None:
             "error_text": f"Metric spike alert: {name}={count} in {window}s",
         }
 
-        # schedule async enqueue if loop exists
+        # enqueue directly if we are on a running loop
         try:
-            loop = asyncio.get_running_loop()
-            asyncio.create_task(tracker.log(evt))
+            asyncio.get_running_loop()
         except RuntimeError:
             # No loop: write JSONL as fallback
-            _write_jsonl(_jsonl_path_utc(), evt)
+            get_jsonl_writer().write(_USAGE_PREFIX, evt)
+        else:
+            tracker.log_nowait(evt)
     except Exception:
         log.exception("[USAGE] Failed to record alert event")
 
@@ -451,9 +404,9 @@ def usage_event(name: str, value: int = 1, metadata: Optional[dict] = None) -> N
         "metadata": metadata or {},
         "recorded_at_utc": ts.isoformat(),
     }
-    # Best-effort write to metrics JSONL
+    # Best-effort write to metrics JSONL (buffered, off-thread)
     try:
-        _write_jsonl(_metrics_jsonl_path_utc(), metric)
+        get_jsonl_writer().write(_METRICS_PREFIX, metric)
     except Exception:
         log.exception("[METRIC] Failed to write metric JSONL")
 
@@ -485,12 +438,12 @@ def usage_event(name: str, value: int = 1, metadata: Optional[dict] = None) -> N
             "error_text": None,
         }
         try:
-            # schedule logging to tracker
-            loop = asyncio.get_running_loop()
-            asyncio.create_task(tracker.log(evt))
+            asyncio.get_running_loop()
         except RuntimeError:
-            # no loop: do a thread-based write to JSONL fallback (already persisted above)
+            # no loop: metrics JSONL already has the event
             pass
+        else:
+            tracker.log_nowait(evt)
     except Exception:
         log.exception("[METRIC] Failed to enqueue metric event for %s", name)
 
@@ -522,6 +475,7 @@ def set_alert_thresholds(threshold: int, window_s: int, suppress_s: int = 300) -
 # so they can call usage_tracker.usage_event(...) to record metrics
 __all__ = [
     "AsyncUsageTracker",
+    "get_jsonl_writer",
     "get_usage_tracker",
     "metrics_window_count",
     "prune_usage_jsonl_files",
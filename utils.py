@@ -1,5 +1,6 @@
 # utils.py (modified to prefer run_step when available)
 import asyncio
+from collections.abc import Mapping
 import csv
 from datetime import UTC, datetime, time as _dt_time
 import io
@@ -25,8 +26,8 @@ UTC = UTC
 
 # === Live Queue Setup ===
 # Stats cache (hot reload with mtime guard)
-_STAT_CACHE: dict = {}
-_STAT_CACHE_MTIME: float | None = None
+_STAT_CACHE: Mapping[str, dict] = {}
+_STAT_CACHE_MTIME: tuple[float, float | None] | None = None
 
 live_queue = {
     "message": None,
@@ -283,20 +284,33 @@ async def load_live_queue_async() -> bool:
         return False
 
 
-def load_stat_cache() -> dict:
+def load_stat_cache() -> Mapping[str, dict]:
     """
     Fast, safe loader for player_stats_cache.json.
-    - Caches in memory and auto-reloads when file mtime changes.
+    - Caches in memory and auto-reloads when the file (or its columnar pointer) mtime changes.
+    - Prefers the memory-mapped columnar generation (stats_columnar) when it is at least as new
+      as the JSON file; rows are then decoded on access instead of parsing the whole file.
     - Removes the _meta block.
     - Normalises keys (GovernorID as canonical string) and inner GovernorID.
     - Dedupes by preferring STATUS=='INCLUDED' and later LAST_REFRESH.
     """
     global _STAT_CACHE, _STAT_CACHE_MTIME
     try:
-        mtime = os.path.getmtime(PLAYER_STATS_CACHE)
+        import stats_columnar
+
+        mtime = (
+            os.path.getmtime(PLAYER_STATS_CACHE),
+            stats_columnar.columnar_signature(PLAYER_STATS_CACHE),
+        )
         if _STAT_CACHE and _STAT_CACHE_MTIME == mtime:
             return _STAT_CACHE
 
+        table = stats_columnar.open_columnar_cache(PLAYER_STATS_CACHE)
+        if table is not None:
+            _STAT_CACHE = table
+            _STAT_CACHE_MTIME = mtime
+            return _STAT_CACHE
+
         with open(PLAYER_STATS_CACHE, encoding="utf-8") as f:
             data = json.load(f) or {}
         data.pop("_meta", None)
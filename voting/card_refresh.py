@@ -0,0 +1,194 @@
+"""Coalesced public-card refreshes for vote and survey posts.
+
+Every accepted vote or survey response used to re-render the result PNG and edit the public
+message. Under a burst of votes that is one render plus one Discord edit per click, which
+rate-limits the channel and keeps the event loop busy rendering cards nobody sees.
+
+``CardRefreshCoordinator`` keeps one refresh state per post:
+
+- the first refresh in a quiet period edits immediately (the voter sees their vote land);
+- refreshes requested inside the window only mark the post dirty, and a single trailing edit
+  renders the *latest* snapshot once the window has elapsed;
+- an edit is skipped when the rendered content (the snapshot minus ``updated_at_utc``) matches
+  what was last published;
+- a trailing refresh whose re-read snapshot is no longer ``Open`` is dropped, so it cannot
+  overwrite the card the close path published.
+
+Votes are recorded before the coordinator is involved, so coalescing only delays the public
+card, never the vote itself.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
+import logging
+import os
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+REFRESH_WINDOW_ENV = "VOTE_CARD_REFRESH_WINDOW_SECONDS"
+DEFAULT_REFRESH_WINDOW_SECONDS = 2.0
+# Idle states older than this many windows (and at least this many seconds) are dropped.
+_STATE_IDLE_WINDOWS = 30
+_STATE_IDLE_MIN_SECONDS = 300.0
+
+EditCallable = Callable[[Any], Awaitable[bool]]
+LoadCallable = Callable[[], Awaitable[Any]]
+
+
+def _refresh_window_from_env() -> float:
+    raw = (os.getenv(REFRESH_WINDOW_ENV) or "").strip()
+    if not raw:
+        return DEFAULT_REFRESH_WINDOW_SECONDS
+    try:
+        value = float(raw)
+    except ValueError:
+        logger.warning(
+            "Invalid %s=%r; using %s", REFRESH_WINDOW_ENV, raw, DEFAULT_REFRESH_WINDOW_SECONDS
+        )
+        return DEFAULT_REFRESH_WINDOW_SECONDS
+    return max(0.0, value)
+
+
+def render_signature(snapshot: Any) -> Any:
+    """Return a comparable key for everything the public card renders from ``snapshot``."""
+    try:
+        return replace(snapshot, updated_at_utc=None)
+    except (TypeError, ValueError):
+        return snapshot
+
+
+@dataclass
+class _PostRefreshState:
+    lock: asyncio.Lock
+    last_edit_at: float = float("-inf")
+    last_signature: Any = None
+    dirty: bool = False
+    edit: EditCallable | None = None
+    load_latest: LoadCallable | None = None
+    trailing: asyncio.Task | None = None
+
+
+class CardRefreshCoordinator:
+    """Collapse public-card edits to at most one per ``window_seconds`` per post."""
+
+    def __init__(self, name: str, *, window_seconds: float | None = None) -> None:
+        self.name = name
+        self.window_seconds = (
+            _refresh_window_from_env() if window_seconds is None else max(0.0, window_seconds)
+        )
+        self._states: dict[int, _PostRefreshState] = {}
+        self.edits = 0
+        self.coalesced = 0
+        self.skipped_unchanged = 0
+
+    async def request(
+        self,
+        post_id: int,
+        snapshot: Any,
+        *,
+        edit: EditCallable,
+        load_latest: LoadCallable,
+    ) -> None:
+        """Publish ``snapshot`` now or fold it into the post's pending trailing refresh.
+
+        ``edit`` performs the Discord edit and returns ``False`` when it failed (it owns the
+        failure logging). ``load_latest`` re-reads the post so the trailing edit shows every
+        vote recorded during the window.
+        """
+        if self.window_seconds <= 0:
+            if await edit(snapshot):
+                self.edits += 1
+            return
+
+        key = int(post_id)
+        self._prune(time.monotonic())
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _PostRefreshState(lock=asyncio.Lock())
+        state.edit = edit
+        state.load_latest = load_latest
+
+        if state.trailing is not None or state.lock.locked():
+            self._mark_dirty(key, state)
+            return
+        if time.monotonic() - state.last_edit_at < self.window_seconds:
+            self._mark_dirty(key, state)
+            return
+        async with state.lock:
+            await self._publish(key, state, snapshot)
+
+    def _mark_dirty(self, key: int, state: _PostRefreshState) -> None:
+        self.coalesced += 1
+        state.dirty = True
+        if state.trailing is None:
+            state.trailing = asyncio.create_task(
+                self._run_trailing(key, state), name=f"{self.name}_refresh_{key}"
+            )
+
+    async def _run_trailing(self, key: int, state: _PostRefreshState) -> None:
+        try:
+            while state.dirty:
+                delay = state.last_edit_at + self.window_seconds - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                async with state.lock:
+                    state.dirty = False
+                    load_latest = state.load_latest
+                    if load_latest is None:
+                        return
+                    try:
+                        snapshot = await load_latest()
+                    except Exception:
+                        logger.exception("%s_refresh_snapshot_failed post_id=%s", self.name, key)
+                        return
+                    if snapshot is None:
+                        return
+                    if getattr(snapshot, "status", "Open") != "Open":
+                        logger.debug("%s_refresh_skipped_closed post_id=%s", self.name, key)
+                        return
+                    await self._publish(key, state, snapshot)
+        except Exception:
+            logger.exception("%s_refresh_failed post_id=%s", self.name, key)
+        finally:
+            state.trailing = None
+
+    async def _publish(self, key: int, state: _PostRefreshState, snapshot: Any) -> None:
+        signature = render_signature(snapshot)
+        if state.last_signature is not None and signature == state.last_signature:
+            self.skipped_unchanged += 1
+            logger.debug("%s_refresh_unchanged post_id=%s", self.name, key)
+            return
+        edit = state.edit
+        if edit is None:
+            return
+        state.last_edit_at = time.monotonic()
+        if await edit(snapshot):
+            self.edits += 1
+            state.last_signature = signature
+
+    def _prune(self, now: float) -> None:
+        horizon = max(_STATE_IDLE_MIN_SECONDS, self.window_seconds * _STATE_IDLE_WINDOWS)
+        stale = [
+            key
+            for key, state in self._states.items()
+            if state.trailing is None
+            and not state.lock.locked()
+            and now - state.last_edit_at > horizon
+        ]
+        for key in stale:
+            del self._states[key]
+
+    async def drain(self) -> None:
+        """Wait for pending trailing refreshes (called from bot shutdown and tests)."""
+        tasks = [state.trailing for state in self._states.values() if state.trailing is not None]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+vote_card_refresh = CardRefreshCoordinator("vote_card")
+survey_card_refresh = CardRefreshCoordinator("survey_card")
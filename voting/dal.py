@@ -32,6 +32,15 @@ from voting.vote_modes import (
 
 logger = logging.getLogger(__name__)
 
+# Bumped after every write that can add or move reminder rows; the scheduler re-reads the next
+# due time when it changes instead of querying it on every poll.
+reminder_schedule_generation = 0
+
+
+def _reminder_schedule_changed() -> None:
+    global reminder_schedule_generation
+    reminder_schedule_generation += 1
+
 
 def _naive_utc(value: datetime) -> datetime:
     aware = value.astimezone(UTC) if value.tzinfo else value.replace(tzinfo=UTC)
@@ -387,9 +396,12 @@ async def create_vote_post(req: VoteCreateRequest) -> int:
         )
         return vote_post_id
 
-    vote_post_id = await run_blocking_in_thread(
-        _create_vote_post_sync, _callback, name="vote_create"
-    )
+    try:
+        vote_post_id = await run_blocking_in_thread(
+            _create_vote_post_sync, _callback, name="vote_create"
+        )
+    finally:
+        _reminder_schedule_changed()
     return int(vote_post_id or 0)
 
 
@@ -1264,7 +1276,10 @@ async def update_vote_post(
         )
         return True
 
-    result = await run_blocking_in_thread(_update_vote_post_sync, _callback, name="vote_update")
+    try:
+        result = await run_blocking_in_thread(_update_vote_post_sync, _callback, name="vote_update")
+    finally:
+        _reminder_schedule_changed()
     return bool(result)
 
 
@@ -1308,6 +1323,22 @@ def _claim_due_reminders_sync(callback) -> Any:
     return exec_with_cursor(callback)
 
 
+async def next_reminder_due_at(now_utc: datetime) -> datetime | None:
+    row = await run_one_async(
+        """
+        SELECT MIN(r.DueAtUtc) AS NextDueAtUtc
+        FROM dbo.VotePostReminders r
+        JOIN dbo.VotePosts p ON p.VotePostID = r.VotePostID
+        WHERE p.Status = 'Open'
+          AND p.ClosesAtUtc > ?
+          AND r.SentAtUtc IS NULL
+          AND r.ClaimedAtUtc IS NULL;
+        """,
+        (_naive_utc(now_utc),),
+    )
+    return _aware_utc((row or {}).get("NextDueAtUtc"))
+
+
 async def mark_reminder_sent(reminder_id: int, *, message_id: int, now_utc: datetime) -> bool:
     row = await run_one_async(
         """
@@ -7,6 +7,7 @@ from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
 from core import visual_text
+from core.asset_cache import load_asset
 from voting.models import RenderedVoteCard, VoteSnapshot
 from voting.option_emojis import option_display_label
 from voting.outcomes import vote_outcome
@@ -69,8 +70,7 @@ def _draw_text(
 def _load_background() -> Image.Image:
     for path in (VOTING_BACKGROUND, FALLBACK_BACKGROUND):
         if path.exists():
-            with Image.open(path) as image:
-                return image.convert("RGBA").resize((WIDTH, HEIGHT), Image.Resampling.LANCZOS)
+            return load_asset(path, size=(WIDTH, HEIGHT))
     return Image.new("RGBA", (WIDTH, HEIGHT), (13, 20, 33, 255))
 
 
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
 from datetime import UTC, datetime
 import logging
 from typing import Any
 
 import discord
 
+from reminder_dispatcher import ReminderHandle, get_reminder_dispatcher
 from ui.views.survey_post_view import disabled_survey_view
 from ui.views.vote_post_view import disabled_vote_view
 from voting import dal, survey_dal
@@ -32,6 +34,58 @@ logger = logging.getLogger(__name__)
 
 POLL_INTERVAL_SECONDS = 60
 
+# Dispatcher entry that claims the next reminder on its due tick instead of the next poll.
+_next_claim: ReminderHandle | None = None
+# Re-read the next due time at least this often even when no reminder write was seen, so rows
+# edited outside the bot are still picked up.
+NEXT_DUE_MAX_AGE_SECONDS = 600
+
+
+@dataclass
+class _NextDueCache:
+    due_at: datetime | None
+    read_at: datetime
+    generations: tuple[int, int]
+
+
+_next_due_cache: _NextDueCache | None = None
+
+
+def _reminder_generations() -> tuple[int, int]:
+    return dal.reminder_schedule_generation, survey_dal.reminder_schedule_generation
+
+
+async def _next_reminder_due_at(now: datetime) -> datetime | None:
+    """Return the earliest unclaimed vote or survey reminder, reusing the last read when safe.
+
+    The cached value is reused only while it is still beyond the next poll (so nothing would be
+    armed anyway), no reminder rows were written since, and it is younger than
+    ``NEXT_DUE_MAX_AGE_SECONDS``. Reminders closer than that are re-read on every poll.
+    """
+    global _next_due_cache
+    cached = _next_due_cache
+    generations = _reminder_generations()
+    if (
+        cached is not None
+        and cached.generations == generations
+        and (now - cached.read_at).total_seconds() < NEXT_DUE_MAX_AGE_SECONDS
+        and (
+            cached.due_at is None or (cached.due_at - now).total_seconds() >= POLL_INTERVAL_SECONDS
+        )
+    ):
+        return cached.due_at
+    due_times = [
+        due
+        for due in (
+            await dal.next_reminder_due_at(now),
+            await survey_dal.next_reminder_due_at(now),
+        )
+        if due is not None
+    ]
+    due_at = min(due_times) if due_times else None
+    _next_due_cache = _NextDueCache(due_at=due_at, read_at=now, generations=generations)
+    return due_at
+
 
 async def _fetch_channel(bot: discord.Client, channel_id: int) -> Any | None:
     channel = bot.get_channel(int(channel_id))
@@ -299,13 +353,47 @@ async def run_voting_scheduler_tick(
     for survey_id in await survey_dal.list_due_closes(now):
         await _close_due_survey(bot, survey_id, now)
         summary["survey_closes"] += 1
+    await _claim_and_send_reminders(bot, now, summary)
+    return summary
+
+
+async def _claim_and_send_reminders(
+    bot: discord.Client, now: datetime, summary: dict[str, int]
+) -> None:
     for reminder in await dal.claim_due_reminders(now):
         if await _send_reminder(bot, reminder, now):
             summary["reminders"] += 1
     for reminder in await survey_dal.claim_due_reminders(now):
         if await _send_survey_reminder(bot, reminder, now):
             summary["survey_reminders"] += 1
-    return summary
+
+
+async def _arm_next_reminder_claim(bot: discord.Client, now: datetime) -> None:
+    """Claim the next reminder on its due tick when it falls before the next poll."""
+    global _next_claim
+    due_at = await _next_reminder_due_at(now)
+    # Replace a claim that is still waiting; one already running is left to finish, since
+    # cancelling it could interrupt a reminder between its claim and its send.
+    if _next_claim is not None and not _next_claim.done() and not _next_claim.running():
+        _next_claim.cancel()
+    _next_claim = None
+    if due_at is None:
+        return
+    delay = (due_at - now).total_seconds()
+    if delay <= 0 or delay >= POLL_INTERVAL_SECONDS:
+        return
+
+    async def _claim() -> None:
+        summary = {"reminders": 0, "survey_reminders": 0}
+        await _claim_and_send_reminders(bot, datetime.now(UTC), summary)
+        if summary["reminders"] or summary["survey_reminders"]:
+            logger.info(
+                "vote_scheduler_reminder_claim reminders=%s survey_reminders=%s",
+                summary["reminders"],
+                summary["survey_reminders"],
+            )
+
+    _next_claim = get_reminder_dispatcher().schedule(delay, _claim, name="voting_reminder_claim")
 
 
 async def schedule_voting_lifecycle(bot: discord.Client) -> None:
@@ -329,9 +417,15 @@ async def schedule_voting_lifecycle(bot: discord.Client) -> None:
                     )
             except Exception:
                 logger.exception("vote_scheduler_tick_failed")
+            try:
+                await _arm_next_reminder_claim(bot, datetime.now(UTC))
+            except Exception:
+                logger.exception("vote_scheduler_arm_reminder_claim_failed")
             await asyncio.sleep(POLL_INTERVAL_SECONDS)
     except asyncio.CancelledError:
         logger.info("vote_scheduler_cancelled")
         raise
     finally:
+        if _next_claim is not None and not _next_claim.done() and not _next_claim.running():
+            _next_claim.cancel()
         logger.info("vote_scheduler_stopped")
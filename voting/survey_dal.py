@@ -43,6 +43,16 @@ from voting.survey_models import (
 
 logger = logging.getLogger(__name__)
 
+# Bumped after every write that can add or move reminder rows; the scheduler re-reads the next
+# due time when it changes instead of querying it on every poll.
+reminder_schedule_generation = 0
+
+
+def _reminder_schedule_changed() -> None:
+    global reminder_schedule_generation
+    reminder_schedule_generation += 1
+
+
 SURVEY_RATING_MIGRATION_ID = "20260704_002_add_survey_rating_questions"
 SURVEY_RATING_MIGRATION_MESSAGE = (
     "Survey rating storage is unavailable. Deploy SQL migration "
@@ -743,7 +753,12 @@ async def create_survey(req: SurveyCreateRequest) -> int:
         )
         return survey_id
 
-    survey_id = await run_blocking_in_thread(_create_survey_sync, _callback, name="survey_create")
+    try:
+        survey_id = await run_blocking_in_thread(
+            _create_survey_sync, _callback, name="survey_create"
+        )
+    finally:
+        _reminder_schedule_changed()
     if isinstance(survey_id, VoteValidationError):
         raise survey_id
     return int(survey_id or 0)
@@ -934,7 +949,10 @@ async def update_survey_post(
         )
         return "updated"
 
-    result = await run_blocking_in_thread(_create_survey_sync, _callback, name="survey_update")
+    try:
+        result = await run_blocking_in_thread(_create_survey_sync, _callback, name="survey_update")
+    finally:
+        _reminder_schedule_changed()
     return str(result or "error")
 
 
@@ -2833,6 +2851,22 @@ def _claim_due_reminders_sync(callback) -> Any:
     return exec_with_cursor(callback)
 
 
+async def next_reminder_due_at(now_utc: datetime) -> datetime | None:
+    row = await run_one_async(
+        """
+        SELECT MIN(r.DueAtUtc) AS NextDueAtUtc
+        FROM dbo.SurveyReminders r
+        JOIN dbo.SurveyPosts p ON p.SurveyID = r.SurveyID
+        WHERE p.Status = 'Open'
+          AND p.ClosesAtUtc > ?
+          AND r.SentAtUtc IS NULL
+          AND r.ClaimedAtUtc IS NULL;
+        """,
+        (_naive_utc(now_utc),),
+    )
+    return _aware_utc((row or {}).get("NextDueAtUtc"))
+
+
 async def mark_reminder_sent(reminder_id: int, *, message_id: int, now_utc: datetime) -> bool:
     row = await run_one_async(
         """
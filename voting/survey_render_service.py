@@ -7,6 +7,7 @@ from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
 from core import visual_text
+from core.asset_cache import load_asset
 from voting.option_emojis import option_display_label
 from voting.result_visibility import public_results_hidden
 from voting.survey_models import (
@@ -75,8 +76,7 @@ def _draw_text(
 def _load_background() -> Image.Image:
     for path in (SURVEY_BACKGROUND, FALLBACK_BACKGROUND):
         if path.exists():
-            with Image.open(path) as image:
-                return image.convert("RGBA").resize((WIDTH, HEIGHT), Image.Resampling.LANCZOS)
+            return load_asset(path, size=(WIDTH, HEIGHT))
     return Image.new("RGBA", (WIDTH, HEIGHT), (13, 20, 33, 255))
 
 
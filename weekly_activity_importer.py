@@ -2,13 +2,16 @@
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import hashlib
-import io
 import logging
 
+import numpy as np
 import pandas as pd
 import pyodbc
 
+from core.bulk_load import BULK_LOAD_CHUNK_ROWS, bulk_insert
+from core.xlsx_reader import XlsxWorkbook, open_workbook
 from file_utils import fetch_one_dict
+from sheet_importer import iter_db_row_chunks, to_db_rows
 from utils import ensure_aware_utc
 
 log = logging.getLogger(__name__)
@@ -69,7 +72,7 @@ def _normalize_col_name(x: object) -> str:
     return str(x).strip().replace("\u00a0", " ").lower()
 
 
-def _select_sheet_with_required_columns(xl: pd.ExcelFile) -> str:
+def _select_sheet_with_required_columns(xl: XlsxWorkbook) -> str:
     """
     Select the first worksheet containing the required columns, robust to minor header variations.
     Falls back to the first sheet if none match (the caller will error later with a clear message).
@@ -77,11 +80,11 @@ def _select_sheet_with_required_columns(xl: pd.ExcelFile) -> str:
     required_norms = {k: _normalize_col_name(k) for k in REQUIRED_COLS.keys()}
     for name in xl.sheet_names:
         try:
-            df_head = xl.parse(name, nrows=2)
+            header = xl.header(name)
         except Exception:
             # skip sheets that can't be parsed
             continue
-        cols_norm = {_normalize_col_name(c): c for c in df_head.columns}
+        cols_norm = {_normalize_col_name(c): c for c in header}
         if all(rn in cols_norm for rn in required_norms.values()):
             return name
     # Fallback to first sheet; we'll error later if required cols are missing
@@ -109,12 +112,13 @@ def _find_and_rename_required_columns(df: pd.DataFrame) -> pd.DataFrame:
 
 def parse_activity_excel(content: bytes) -> pd.DataFrame:
     try:
-        xl = pd.ExcelFile(io.BytesIO(content), engine="openpyxl")
+        xl = open_workbook(content)
     except Exception as e:
         raise ValueError(f"Unable to open Excel content: {type(e).__name__}: {e}")
 
-    sheet = _select_sheet_with_required_columns(xl)
-    df = xl.parse(sheet)
+    with xl:
+        sheet = _select_sheet_with_required_columns(xl)
+        df = xl.read_sheet(sheet)
 
     try:
         df = _find_and_rename_required_columns(df)
@@ -198,6 +202,23 @@ def parse_activity_excel(content: bytes) -> pd.DataFrame:
     return df
 
 
+def _snapshot_row_frame(valid_df: pd.DataFrame) -> pd.DataFrame:
+    """AllianceActivitySnapshotRow columns (after SnapshotId) with optional metrics truncated."""
+    frame = pd.DataFrame(
+        {
+            "GovernorID": valid_df["GovernorID"].astype("int64"),
+            "GovernorName": valid_df["GovernorName"],
+            "AllianceTag": valid_df["AllianceTag"],
+        },
+        index=valid_df.index,
+    )
+    for column in ("Power", "KillPoints", "HelpTimes", "RssTrading"):
+        frame[column] = np.trunc(valid_df[column]).astype("Int64")
+    frame["BuildingTotal"] = valid_df["BuildingTotal"].astype("int64")
+    frame["TechDonationTotal"] = valid_df["TechDonationTotal"].astype("int64")
+    return frame
+
+
 def _load_expected_allied_governors(cur, snapshot_ts_utc: datetime) -> set[int]:
     """Return allied governors from the latest complete scan at or before the snapshot."""
     cur.execute(
@@ -326,13 +347,84 @@ def _load_prev_totals(cur, prev_snapshot_id: int | None) -> dict[int, tuple[int,
 # ---- NEW: Week rebuilder (cumulative -> daily deltas) ----------------------
 
 
-def _rebuild_daily_activity_for_week(cur, week_start: datetime) -> int:
+_DAILY_TOTALS = {"BuildingTotal": "BuildDonations", "TechDonationTotal": "TechDonations"}
+_DAILY_KEYS = ["GovernorID", "AsOfDate"]
+
+
+def _as_dates(values: pd.Series) -> pd.Series:
+    return pd.to_datetime(values).dt.date
+
+
+def _daily_activity_frame(rows, week_start: datetime) -> pd.DataFrame:
+    """
+    Turn (GovernorID, AsOfDate, BuildingTotal, TechDonationTotal) snapshot rows into daily
+    deltas for Mon..Sun: one row per governor per day with BuildDonations/TechDonations.
+
+    Per metric: pivot governor x day taking the MAX cumulative of the day, carry missing days
+    forward (0 before the first snapshot), cummax to clamp counter drops, then diff against a
+    Monday baseline of 0.
+    """
+    mon = ensure_aware_utc(week_start).date()
+    days = [mon + timedelta(days=i) for i in range(7)]
+    snap = pd.DataFrame.from_records(
+        [tuple(r) for r in rows], columns=[*_DAILY_KEYS, *_DAILY_TOTALS]
+    )
+    snap["GovernorID"] = snap["GovernorID"].astype("int64")
+    snap["AsOfDate"] = _as_dates(snap["AsOfDate"])
+    for col in _DAILY_TOTALS:
+        snap[col] = pd.to_numeric(snap[col], errors="coerce").fillna(0)
+
+    governors = pd.Index(snap["GovernorID"].unique(), name="GovernorID")
+    out = pd.DataFrame(
+        {
+            "GovernorID": np.repeat(governors.to_numpy(), len(days)),
+            "AsOfDate": np.tile(np.array(days, dtype=object), len(governors)),
+        }
+    )
+    for total, metric in _DAILY_TOTALS.items():
+        cum = (
+            snap.pivot_table(index="GovernorID", columns="AsOfDate", values=total, aggfunc="max")
+            .reindex(index=governors, columns=days)
+            .ffill(axis=1)
+            .fillna(0)
+            .cummax(axis=1)
+        )
+        out[metric] = np.diff(cum.to_numpy(), axis=1, prepend=0).astype("int64").ravel()
+    return out
+
+
+def _load_daily_activity(cur, wk_naive: datetime) -> pd.DataFrame:
+    cur.execute(
+        """
+        SELECT GovernorID, AsOfDate, BuildDonations, TechDonations
+        FROM dbo.AllianceActivityDaily
+        WHERE WeekStartUtc = ?
+    """,
+        wk_naive,
+    )
+    existing = pd.DataFrame.from_records(
+        [tuple(r) for r in cur.fetchall()], columns=[*_DAILY_KEYS, *_DAILY_TOTALS.values()]
+    )
+    existing["GovernorID"] = existing["GovernorID"].astype("int64")
+    existing["AsOfDate"] = _as_dates(existing["AsOfDate"])
+    return existing
+
+
+def _rebuild_daily_activity_for_week(
+    cur, week_start: datetime, *, incremental: bool = False
+) -> int:
     """
-    Recompute daily activity deltas for the whole week [Mon..Sun] for all governors
-    from cumulative snapshot rows, and upsert into dbo.AllianceActivityDaily.
+    Recompute daily activity deltas for the week [Mon..Sun] from cumulative snapshot rows and
+    write them to dbo.AllianceActivityDaily.
+
+    By default the week is replaced (DELETE + INSERT). With ``incremental`` the whole recomputed
+    week is reconciled with the stored rows instead: missing rows are inserted, changed rows
+    updated and stored rows the week no longer produces (a governor whose snapshot rows are gone,
+    stray dates) deleted, so the table ends up exactly as a replace would leave it while an
+    import that only moves a few days writes only those rows.
 
     Accepts aware or naive week_start; converts to naive UTC for SQL usage.
-    Returns number of daily rows written.
+    Returns number of daily rows inserted, updated or deleted.
     """
     wk_naive = ensure_aware_utc(week_start).replace(tzinfo=None)
 
@@ -354,61 +446,64 @@ def _rebuild_daily_activity_for_week(cur, week_start: datetime) -> int:
     if not rows:
         return 0
 
-    # Build a dict: {gov: {date: (build_cum, tech_cum)}}
-    from collections import defaultdict
-    import datetime as _dt
-
-    gmap = defaultdict(dict)
-    for gov, as_of_date, b_cum, t_cum in rows:
-        d = as_of_date  # DATE
-        # take the MAX cumulative per day if multiple imports
-        prev = gmap[gov].get(d)
-        if prev is None:
-            gmap[gov][d] = (int(b_cum or 0), int(t_cum or 0))
-        else:
-            gmap[gov][d] = (max(prev[0], int(b_cum or 0)), max(prev[1], int(t_cum or 0)))
-
-    # Week calendar (mon is a date)
-    mon = ensure_aware_utc(week_start).date()
-    days = [mon + _dt.timedelta(days=i) for i in range(7)]
-
-    # 2) For each governor, generate a non-decreasing cumulative series over the week
-    #    - missing days carry forward previous cumulative (or 0 on Monday)
-    #    - any negative movement is clamped out by monotonic carry-forward
-    to_upsert = []  # (GovernorID, AsOfDate, WeekStartUtc, BuildDonations, TechDonations)
-    for gov, per_day in gmap.items():
-        prev_cum_b = 0  # Monday baseline
-        prev_cum_t = 0
-        for d in days:
-            b_cum, t_cum = per_day.get(d, (prev_cum_b, prev_cum_t))
-            # clamp to previous to enforce monotonic non-decreasing within the week
-            if b_cum < prev_cum_b:
-                b_cum = prev_cum_b
-            if t_cum < prev_cum_t:
-                t_cum = prev_cum_t
-
-            b_delta = b_cum - prev_cum_b
-            t_delta = t_cum - prev_cum_t
-
-            # WeekStartUtc stored in SQL as naive UTC (precomputed)
-            to_upsert.append((int(gov), d, wk_naive, int(b_delta), int(t_delta)))
-
-            prev_cum_b, prev_cum_t = b_cum, t_cum
-
-    # 3) Replace the week in one shot (simple & fast)
-    cur.execute("DELETE FROM dbo.AllianceActivityDaily WHERE WeekStartUtc = ?", wk_naive)
-    if to_upsert:
+    # 2) Daily deltas for every governor seen this week
+    daily = _daily_activity_frame(rows, week_start)
+    metrics = list(_DAILY_TOTALS.values())
+
+    if not incremental:
+        cur.execute("DELETE FROM dbo.AllianceActivityDaily WHERE WeekStartUtc = ?", wk_naive)
+        to_insert = daily
+        to_update = daily.iloc[0:0]
+        to_delete = daily.iloc[0:0]
+    else:
+        existing = _load_daily_activity(cur, wk_naive)
+        merged = daily.merge(
+            existing, on=_DAILY_KEYS, how="outer", suffixes=("", "_old"), indicator=True
+        )
+        is_new = (merged["_merge"] == "left_only").to_numpy()
+        is_gone = (merged["_merge"] == "right_only").to_numpy()
+        changed = np.zeros(len(merged), dtype=bool)
+        for metric in metrics:
+            changed |= merged[metric].to_numpy() != merged[f"{metric}_old"].to_numpy()
+        # The outer join turned the metrics into floats (NaN for rows that are gone).
+        as_ints = dict.fromkeys(metrics, "int64")
+        to_insert = merged.loc[is_new, daily.columns].astype(as_ints)
+        to_update = merged.loc[~is_new & ~is_gone & changed, daily.columns].astype(as_ints)
+        to_delete = merged.loc[is_gone, _DAILY_KEYS]
+
+    # 3) Write only what differs
+    if len(to_delete):
+        cur.fast_executemany = True
+        cur.executemany(
+            """
+            DELETE FROM dbo.AllianceActivityDaily
+            WHERE GovernorID = ? AND AsOfDate = ? AND WeekStartUtc = ?
+        """,
+            [(*row, wk_naive) for row in to_db_rows(to_delete)],
+        )
+    if len(to_update):
         cur.fast_executemany = True
         cur.executemany(
+            """
+            UPDATE dbo.AllianceActivityDaily
+            SET BuildDonations = ?, TechDonations = ?
+            WHERE GovernorID = ? AND AsOfDate = ? AND WeekStartUtc = ?
+        """,
+            [(*row, wk_naive) for row in to_db_rows(to_update[[*metrics, *_DAILY_KEYS]])],
+        )
+    if len(to_insert):
+        bulk_insert(
             """
             INSERT INTO dbo.AllianceActivityDaily
-                (GovernorID, AsOfDate, WeekStartUtc, BuildDonations, TechDonations)
+                (WeekStartUtc, GovernorID, AsOfDate, BuildDonations, TechDonations)
             VALUES (?, ?, ?, ?, ?)
         """,
-            to_upsert,
+            iter_db_row_chunks(to_insert, BULK_LOAD_CHUNK_ROWS, prefix=(wk_naive,)),
+            label="weekly_activity_daily",
+            cursor=cur,
         )
 
-    return len(to_upsert)
+    return len(to_insert) + len(to_update) + len(to_delete)
 
 
 # ---- Ingest ---------------------------------------------------------------
@@ -497,36 +592,24 @@ def ingest_weekly_activity_excel(
                 df.shape[0],
             )
 
-            # Insert rows (fast_executemany for speed)
-            cur.fast_executemany = True
-            rows = []
-            for row in valid_df.itertuples(index=False):
-                rows.append(
-                    (
-                        snapshot_id,
-                        int(row.GovernorID),
-                        row.GovernorName,
-                        row.AllianceTag,
-                        int(row.Power) if pd.notna(row.Power) else None,
-                        int(row.KillPoints) if pd.notna(row.KillPoints) else None,
-                        int(row.HelpTimes) if pd.notna(row.HelpTimes) else None,
-                        int(row.RssTrading) if pd.notna(row.RssTrading) else None,
-                        int(row.BuildingTotal),
-                        int(row.TechDonationTotal),
-                    )
-                )
-            if rows:
-                cur.executemany(
-                    """
-                    INSERT INTO dbo.AllianceActivitySnapshotRow
-                        (SnapshotId, GovernorID, GovernorName, AllianceTag,
-                         Power, KillPoints, HelpTimes, RssTrading,
-                         BuildingTotal, TechDonationTotal)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    rows,
-                )
-            log.debug("Inserted %d snapshot rows for SnapshotId=%s", len(rows), snapshot_id)
+            # Insert rows in chunks, converting the next chunk while one is being sent
+            snapshot_load = bulk_insert(
+                """
+                INSERT INTO dbo.AllianceActivitySnapshotRow
+                    (SnapshotId, GovernorID, GovernorName, AllianceTag,
+                     Power, KillPoints, HelpTimes, RssTrading,
+                     BuildingTotal, TechDonationTotal)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                iter_db_row_chunks(
+                    _snapshot_row_frame(valid_df), BULK_LOAD_CHUNK_ROWS, prefix=(snapshot_id,)
+                ),
+                label="weekly_activity_snapshot",
+                cursor=cur,
+            )
+            log.debug(
+                "Inserted %d snapshot rows for SnapshotId=%s", snapshot_load.rows, snapshot_id
+            )
 
             # Compute deltas vs the previous snapshot (EXCLUDING the current)
             prev_snapshot_id = _get_prev_snapshot_id_excluding(cur, week_start, snapshot_id)
@@ -577,11 +660,9 @@ def ingest_weekly_activity_excel(
             )
 
             # ... after writing AllianceActivityDelta ...
-            # Rebuild daily activity table for the whole week
-            rebuilt = _rebuild_daily_activity_for_week(cur, week_start)
-            log.info(
-                "[ACTIVITY DAILY] Rebuilt %s daily rows for week %s", rebuilt, week_start.date()
-            )
+            # Reconcile the week's daily activity with the snapshots now stored
+            rebuilt = _rebuild_daily_activity_for_week(cur, week_start, incremental=True)
+            log.info("[ACTIVITY DAILY] Wrote %s daily rows for week %s", rebuilt, week_start.date())
 
             cur.execute(
                 """